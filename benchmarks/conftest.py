@@ -0,0 +1,24 @@
+# /benchmarks/conftest.py
+"""Fixtures shared by the benchmark suites of the scholar_flux package.
+
+The benchmark suites require pytest-benchmark and are skipped otherwise.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def record_throughput(benchmark):
+    """Returns a helper that records the number of records processed per second in the extra info of a benchmark.
+
+    The throughput is only recorded when the benchmark collected timing statistics: with `--benchmark-disable`, each
+    benchmarked function runs once without collecting statistics and the throughput is skipped.
+
+    """
+
+    def record(num_records: int) -> None:
+        """Records `num_records` divided by the mean duration of the benchmarked function."""
+        if benchmark.stats:
+            benchmark.extra_info["records_per_second"] = num_records / benchmark.stats.stats.mean
+
+    return record
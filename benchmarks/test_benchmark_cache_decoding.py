@@ -0,0 +1,80 @@
+# /benchmarks/test_benchmark_cache_decoding.py
+"""Benchmarks the time required to decode cached responses with and without the schema tags of the CacheDataEncoder.
+
+Each cached page mirrors the dictionary that the DataCacheManager stores for a ProcessedResponse: the raw response
+content (bytes), the parsed response, and the extracted and processed records. The records are sampled from the mocked
+PLOS page used throughout the test suite and are repeated to reach 500 records per page.
+
+The following decoding strategies are compared:
+
+    - untagged (prefix): The recursive `CacheDataEncoder.decode` used before schema tags, with the default hash prefix.
+    - untagged (no prefix): The recursive decode without a hash prefix, which probes every string as possible base64.
+    - tagged: `JsonDataEncoder.deserialize_tagged`, which only decodes the bytes fields recorded in the schema tag.
+
+The suite requires pytest-benchmark and is skipped otherwise.
+
+Usage:
+    python -m pytest benchmarks/test_benchmark_cache_decoding.py --benchmark-columns=mean,ops
+"""
+from pathlib import Path
+import json
+import pytest
+
+from scholar_flux.utils import CacheDataEncoder, JsonDataEncoder
+
+pytest.importorskip("pytest_benchmark")
+
+NUM_RECORDS = 500
+MOCK_PAGE_PATH = Path(__file__).resolve().parent.parent / "tests" / "mocks" / "plos_page_1_data.json"
+
+
+def create_cached_page(num_records: int) -> dict:
+    """Creates a dictionary with the same structure as the cached processing results of a ProcessedResponse."""
+    parsed_response = json.loads(MOCK_PAGE_PATH.read_text(encoding="utf-8"))
+    docs = parsed_response["response"]["docs"]
+    extracted_records = [dict(docs[i % len(docs)], id=f"{docs[i % len(docs)]['id']}-{i}") for i in range(num_records)]
+    parsed_response["response"]["docs"] = extracted_records
+
+    processed_records = [
+        {key: "; ".join(map(str, value)) if isinstance(value, list) else value for key, value in record.items()}
+        for record in extracted_records
+    ]
+
+    return {
+        "response_hash": "c0ffee" * 10,
+        "status_code": 200,
+        "raw_response": json.dumps(parsed_response).encode("utf-8"),
+        "parsed_response": parsed_response,
+        "extracted_records": extracted_records,
+        "processed_records": processed_records,
+        "metadata": {"numFound": parsed_response["response"]["numFound"], "start": 0},
+    }
+
+
+@pytest.fixture(scope="module")
+def cached_page() -> dict:
+    """Creates a cached page of records to encode and decode."""
+    return create_cached_page(NUM_RECORDS)
+
+
+def decode_untagged(serialized: str, hash_prefix: str | None = None):
+    """Decodes a page serialized without a schema tag by recursively decoding every string."""
+    return CacheDataEncoder.decode(json.loads(serialized), hash_prefix=hash_prefix)
+
+
+@pytest.mark.parametrize("strategy", ["untagged (prefix)", "untagged (no prefix)", "tagged"])
+def test_benchmark_decode_cached_page(benchmark, record_throughput, cached_page, strategy):
+    """Benchmarks the number of cached pages decoded per second with each decoding strategy."""
+    if strategy == "tagged":
+        serialized = JsonDataEncoder.serialize_tagged(cached_page)
+        decoded = benchmark(JsonDataEncoder.deserialize_tagged, serialized)
+    else:
+        hash_prefix = "" if strategy == "untagged (no prefix)" else None
+        serialized = json.dumps(CacheDataEncoder.encode(cached_page, hash_prefix=hash_prefix))
+        decoded = benchmark(decode_untagged, serialized, hash_prefix)
+
+    # the recursive decode without a prefix can misclassify base64-like strings, so only the bytes field is compared
+    assert decoded["raw_response"] == cached_page["raw_response"]
+    if strategy != "untagged (no prefix)":
+        assert decoded == cached_page
+    record_throughput(NUM_RECORDS)
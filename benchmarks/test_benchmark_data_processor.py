@@ -0,0 +1,97 @@
+# /benchmarks/test_benchmark_data_processor.py
+"""Benchmarks the throughput of the DataProcessor and NormalizingDataProcessor in records per second.
+
+Each page contains nested records with 30 record keys spread over shared path prefixes, mirroring the structure of
+scholarly API records (authors, journals, funding, and identifiers). The per-key extraction used before extraction
+plans is benchmarked alongside the compiled plan so that regressions in either can be tracked.
+
+The suite requires pytest-benchmark and is skipped otherwise.
+
+Usage:
+    python -m pytest benchmarks/test_benchmark_data_processor.py --benchmark-columns=mean,ops
+"""
+import pytest
+
+from scholar_flux.data import DataProcessor, NormalizingDataProcessor
+
+pytest.importorskip("pytest_benchmark")
+
+NUM_RECORDS = 1000
+
+
+def create_record(index: int) -> dict:
+    """Creates a nested record with identifiers, authors, journal, funding, and citation fields."""
+    return {
+        "id": f"10.1371/journal.{index}",
+        "title": f"Article {index}",
+        "abstract": ["An abstract", "split across paragraphs"],
+        "publication": {"year": 2020 + index % 5, "month": index % 12 + 1, "type": "journal-article"},
+        "journal": {"name": "PLOS ONE", "issn": "1932-6203", "publisher": {"name": "PLOS", "location": "SF"}},
+        "authors": [{"name": f"Author {index}", "affiliation": {"name": "NYU", "country": "US"}}],
+        "funding": {"agency": {"name": "NIH", "country": "US"}, "award": {"id": f"R01-{index}", "amount": 1000}},
+        "metrics": {"citations": index, "views": index * 10, "downloads": index * 2, "altmetric": {"score": 1.5}},
+        "identifiers": {"doi": f"10.1371/journal.{index}", "pmid": index, "pmcid": f"PMC{index}"},
+        "subjects": {"primary": "Biology", "secondary": ["Genetics", "Genomics"]},
+        "license": {"type": "CC-BY", "url": "https://creativecommons.org/licenses/by/4.0/"},
+    }
+
+
+RECORD_KEYS = [
+    "id",
+    "title",
+    "abstract",
+    "publication.year",
+    "publication.month",
+    "publication.type",
+    "journal.name",
+    "journal.issn",
+    "journal.publisher.name",
+    "journal.publisher.location",
+    "authors.name",
+    "authors.affiliation.name",
+    "authors.affiliation.country",
+    "funding.agency.name",
+    "funding.agency.country",
+    "funding.award.id",
+    "funding.award.amount",
+    "metrics.citations",
+    "metrics.views",
+    "metrics.downloads",
+    "metrics.altmetric.score",
+    "identifiers.doi",
+    "identifiers.pmid",
+    "identifiers.pmcid",
+    "subjects.primary",
+    "subjects.secondary",
+    "license.type",
+    "license.url",
+    "missing.field",
+    "missing.nested.field",
+]
+
+
+class PerKeyDataProcessor(DataProcessor):
+    """A DataProcessor that extracts each record key with a separate walk, as before extraction plans."""
+
+    def process_record(self, record_dict: dict) -> dict:
+        """Extracts each record key from the record separately."""
+        return self.collapse_fields(
+            {key: self.extract_key(record_dict, path[-1], path[:-1]) for key, path in self.record_keys.items()}
+        )
+
+
+@pytest.fixture(scope="module")
+def page() -> list[dict]:
+    """Creates a page of nested records to process."""
+    return [create_record(index) for index in range(NUM_RECORDS)]
+
+
+@pytest.mark.parametrize(
+    "processor_type", [DataProcessor, PerKeyDataProcessor, NormalizingDataProcessor], ids=lambda cls: cls.__name__
+)
+def test_benchmark_process_page(benchmark, record_throughput, page, processor_type):
+    """Benchmarks the number of records processed per second."""
+    processor = processor_type(record_keys=RECORD_KEYS)
+    processed_records = benchmark(processor.process_page, page)
+    assert len(processed_records) == NUM_RECORDS
+    record_throughput(NUM_RECORDS)
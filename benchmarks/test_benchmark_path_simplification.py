@@ -0,0 +1,77 @@
+# /benchmarks/test_benchmark_path_simplification.py
+"""Benchmarks the simplification of a 10,000 record page into rows with the PathNodeIndex.
+
+The page is simplified serially and with a SimplificationPool whose worker processes describe the paths of each batch
+of records. The pool is started before the benchmark so that the reused workers, rather than their start-up, are timed.
+The speed-up of the parallel simplification grows with the number of available CPUs: with at least two CPUs, the
+parallel simplification is also verified to be faster than the serial simplification.
+
+The suite requires pytest-benchmark and is skipped otherwise.
+
+Usage:
+    python -m pytest benchmarks/test_benchmark_path_simplification.py --benchmark-columns=mean,ops
+"""
+import os
+import time
+import pytest
+
+from scholar_flux.utils import PathDiscoverer, PathNodeIndex
+from scholar_flux.utils.paths.simplification_pool import SimplificationPool
+
+pytest.importorskip("pytest_benchmark")
+
+NUM_RECORDS = 10_000
+
+
+def create_record(index: int) -> dict:
+    """Creates a nested record with identifiers, authors, journal, and citation fields."""
+    return {
+        "id": f"10.1371/journal.{index}",
+        "title": f"Article {index}",
+        "publication": {"year": 2020 + index % 5, "type": "journal-article"},
+        "journal": {"name": "PLOS ONE", "publisher": {"name": "PLOS", "location": "SF"}},
+        "authors": [{"name": f"Author {index}", "affiliation": {"name": "NYU"}}, {"name": "Co-Author"}],
+        "metrics": {"citations": index, "views": index * 10},
+        "subjects": ["Genetics", "Genomics"],
+    }
+
+
+@pytest.fixture(scope="module")
+def path_mappings() -> dict:
+    """Discovers the terminal paths of a page of nested records."""
+    return PathDiscoverer([create_record(index) for index in range(NUM_RECORDS)]).discover_path_elements() or {}
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Starts a pool that describes the paths of every page in worker processes."""
+    with SimplificationPool(min_records=0) as pool:
+        PathNodeIndex.normalize_records([create_record(0)], pool=pool)
+        yield pool
+
+
+@pytest.mark.parametrize("parallel", [False, True], ids=["serial", "parallel"])
+def test_benchmark_simplify_to_rows(benchmark, record_throughput, path_mappings, pool, parallel):
+    """Benchmarks the number of records simplified into rows per second."""
+    path_node_index = PathNodeIndex.from_path_mappings(path_mappings, chain_map=True)
+    rows = benchmark(path_node_index.simplify_to_rows, pool=pool if parallel else None)
+    assert len(rows) == NUM_RECORDS
+    record_throughput(NUM_RECORDS)
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="Parallel simplification requires at least two CPUs")
+def test_parallel_simplification_speedup(path_mappings, pool):
+    """Verifies that simplifying the page with the worker processes of the pool is faster than serial simplification."""
+
+    def best_time(pool) -> float:
+        """Returns the fastest of three simplifications of the page into rows."""
+        timings = []
+        for _ in range(3):
+            path_node_index = PathNodeIndex.from_path_mappings(path_mappings, chain_map=True)
+            start = time.perf_counter()
+            path_node_index.simplify_to_rows(pool=pool)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    assert pool.uses_workers(NUM_RECORDS)
+    assert best_time(pool) < best_time(None)
@@ -28,6 +28,7 @@ from scholar_flux.data_storage import (
     InMemoryStorage,
     MongoDBStorage,
     NullStorage,
+    TieredStorage,
 )
 from scholar_flux.data import (
     DataParser,
@@ -44,6 +45,8 @@ from scholar_flux.api import (
     ResponseCoordinator,
     SearchCoordinator,
     MultiSearchCoordinator,
+    AsyncSearchCoordinator,
+    AsyncMultiSearchCoordinator,
     SearchAPIConfig,
     ProviderConfig,
     APIParameterConfig,
@@ -63,6 +66,7 @@ __all__ = [
     "InMemoryStorage",
     "MongoDBStorage",
     "NullStorage",
+    "TieredStorage",
     "DataParser",
     "DataExtractor",
     "DataProcessor",
@@ -75,6 +79,8 @@ __all__ = [
     "ResponseCoordinator",
     "SearchCoordinator",
     "MultiSearchCoordinator",
+    "AsyncSearchCoordinator",
+    "AsyncMultiSearchCoordinator",
     "SearchAPIConfig",
     "ProviderConfig",
     "APIParameterConfig",
@@ -14,6 +14,9 @@ Sub-modules:
                    are not exceeded. The SearchAPI implements rate limiting using the `RateLimiter` and, optionally,
                    ThreadedRateLimiter class to wait a specified interval of time before sending the next request.
 
+Coroutine-based retrieval is available through the AsyncSearchAPI, AsyncSearchCoordinator, and
+AsyncMultiSearchCoordinator, which await provider delays on an asyncio event loop instead of blocking a thread.
+
 In order to use the API one can get started with the SearchCoordinator with minimal effort:
     >>> from scholar_flux.api import SearchCoordinator # imports the most forward facing interface for record retrieval
     >>> search_coordinator = SearchCoordinator(query = 'Turing Machines') # uses PLOS by default
@@ -43,6 +46,8 @@ from scholar_flux.api.models import (
     APIParameterMap,
     APIParameterConfig,
     ResponseMetadataMap,
+    CursorMetadataMap,
+    RateLimitConfig,
     ProviderConfig,
     ProviderRegistry,
     SearchAPIConfig,
@@ -61,22 +66,34 @@ from scholar_flux.api.providers import PROVIDER_DEFAULTS, provider_registry
 # Rate limiting
 from scholar_flux.api.rate_limiting.rate_limiter import RateLimiter
 from scholar_flux.api.rate_limiting.threaded_rate_limiter import ThreadedRateLimiter
+from scholar_flux.api.rate_limiting.reservation_rate_limiter import ReservationRateLimiter
+from scholar_flux.api.rate_limiting.daily_quota_rate_limiter import DailyQuotaRateLimiter
+from scholar_flux.api.rate_limiting.token_bucket_rate_limiter import TokenBucketRateLimiter
+from scholar_flux.api.rate_limiting.sliding_window_rate_limiter import SlidingWindowRateLimiter
 from scholar_flux.api.rate_limiting.retry_handler import RetryHandler
+from scholar_flux.api.rate_limiting.adaptive_rate_limiter import AdaptiveRateLimiter
+from scholar_flux.api.rate_limiting.redis_rate_limiter import RedisRateLimiter
+from scholar_flux.api.rate_limiting.sqlite_rate_limiter import SQLiteRateLimiter
 
 # API interfaces
 from scholar_flux.api.base_api import BaseAPI
 from scholar_flux.api.search_api import SearchAPI
+from scholar_flux.api.async_search_api import AsyncSearchAPI
 
 # Coordinators
 from scholar_flux.api.response_coordinator import ResponseCoordinator
 from scholar_flux.api.base_coordinator import BaseCoordinator
 from scholar_flux.api.search_coordinator import SearchCoordinator
 from scholar_flux.api.multisearch_coordinator import MultiSearchCoordinator
+from scholar_flux.api.async_search_coordinator import AsyncSearchCoordinator
+from scholar_flux.api.async_multisearch_coordinator import AsyncMultiSearchCoordinator
 
 __all__ = [
     "ResponseValidator",
     "APIParameterMap",
     "ResponseMetadataMap",
+    "CursorMetadataMap",
+    "RateLimitConfig",
     "APIParameterConfig",
     "ProviderConfig",
     "PROVIDER_DEFAULTS",
@@ -90,13 +107,23 @@ __all__ = [
     "SearchAPIConfig",
     "RateLimiter",
     "ThreadedRateLimiter",
+    "ReservationRateLimiter",
+    "DailyQuotaRateLimiter",
+    "TokenBucketRateLimiter",
+    "SlidingWindowRateLimiter",
+    "AdaptiveRateLimiter",
+    "RedisRateLimiter",
+    "SQLiteRateLimiter",
     "RetryHandler",
     "BaseAPI",
     "SearchAPI",
+    "AsyncSearchAPI",
     "ResponseCoordinator",
     "BaseCoordinator",
     "SearchCoordinator",
     "MultiSearchCoordinator",
+    "AsyncSearchCoordinator",
+    "AsyncMultiSearchCoordinator",
     "validate_url",
     "validate_email",
 ]
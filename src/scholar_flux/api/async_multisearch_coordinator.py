@@ -0,0 +1,231 @@
+# /api/async_multisearch_coordinator.py
+"""Defines the AsyncMultiSearchCoordinator that orchestrates searches across multiple queries and providers on a single
+asyncio event loop.
+
+Each provider is processed as an independent task that shares the provider's rate limiter from the
+`threaded_rate_limiter_registry`. Because provider delays are awaited rather than slept, hundreds of query and provider
+combinations can be searched concurrently without dedicating an OS thread to each provider.
+
+"""
+from __future__ import annotations
+from typing import Optional, Sequence, AsyncGenerator, Any
+import asyncio
+import logging
+
+from scholar_flux.api.models import SearchResultList, SearchResult, PageListInput
+from scholar_flux.api import SearchCoordinator, APIResponse
+from scholar_flux.api.async_search_coordinator import AsyncSearchCoordinator
+from scholar_flux.api.multisearch_coordinator import MultiSearchCoordinator
+from scholar_flux.exceptions import InvalidCoordinatorParameterException
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMultiSearchCoordinator(MultiSearchCoordinator):
+    """Coroutine-based counterpart of the MultiSearchCoordinator that yields SearchResults as an async generator.
+
+    SearchCoordinators added to the AsyncMultiSearchCoordinator are converted into AsyncSearchCoordinators that reuse
+    the same configuration, session, response coordinator, and caches. As with the MultiSearchCoordinator, requests to
+    the same provider share a single rate limiter, and retrieval for each provider halts early on non-retryable errors.
+
+    Examples:
+        >>> import asyncio
+        >>> from scholar_flux.api import AsyncMultiSearchCoordinator, SearchCoordinator
+        >>> multi_search_coordinator = AsyncMultiSearchCoordinator()
+        >>> multi_search_coordinator.add_coordinators(
+        ...     SearchCoordinator(provider_name=provider, query=query)
+        ...     for query in ('ml', 'nlp')
+        ...     for provider in ('plos', 'arxiv', 'openalex', 'crossref')
+        ... )
+        >>> async def main():
+        ...     async for search_result in multi_search_coordinator.aiter_pages(pages=[1, 2, 3]):
+        ...         print(search_result.provider_name, search_result.query, search_result.page)
+        >>> asyncio.run(main())
+
+    """
+
+    @classmethod
+    def _verify_search_coordinator(cls, search_coordinator: SearchCoordinator):
+        """Helper method that ensures that the current value is an AsyncSearchCoordinator.
+
+        Raises:
+            InvalidCoordinatorParameterException: If the received value is not an AsyncSearchCoordinator instance
+
+        """
+        if not isinstance(search_coordinator, AsyncSearchCoordinator):
+            raise InvalidCoordinatorParameterException(
+                f"Expected an AsyncSearchCoordinator, received type {type(search_coordinator)}"
+            )
+
+    def add(self, search_coordinator: SearchCoordinator):
+        """Adds a new coordinator to the AsyncMultiSearchCoordinator, converting SearchCoordinators when needed.
+
+        Args:
+            search_coordinator (SearchCoordinator):
+                A search coordinator to add. SearchCoordinators are converted into AsyncSearchCoordinators that reuse
+                the original components.
+
+        Raises: InvalidCoordinatorParameterException: If the expected type is not a SearchCoordinator
+
+        """
+        if isinstance(search_coordinator, SearchCoordinator) and not isinstance(
+            search_coordinator, AsyncSearchCoordinator
+        ):
+            search_coordinator = AsyncSearchCoordinator.update(search_coordinator)
+        super().add(search_coordinator)
+
+    async def asearch(
+        self,
+        page: int = 1,
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> SearchResultList:
+        """Asynchronously searches for a single page from each registered query and provider.
+
+        Args:
+            page (int): The page number to request from each API Provider.
+            max_concurrency (Optional[int]): The maximum number of providers to search concurrently.
+            **kwargs: Keyword arguments to pass to `AsyncSearchCoordinator.aiter_pages` for each coordinator.
+
+        Returns:
+            SearchResultList: The list containing all retrieved and processed pages.
+
+        """
+        return await self.asearch_pages(
+            pages=[page] if isinstance(page, int) else page, max_concurrency=max_concurrency, **kwargs
+        )
+
+    async def asearch_pages(
+        self,
+        pages: Sequence[int] | PageListInput,
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> SearchResultList:
+        """Asynchronously searches a sequence of pages from each registered query and provider.
+
+        Args:
+            pages (Sequence[int] | PageListInput): A sequence of page numbers to request from each API Provider.
+            max_concurrency (Optional[int]): The maximum number of providers to search concurrently.
+            **kwargs: Keyword arguments to pass to `AsyncSearchCoordinator.aiter_pages` for each coordinator.
+
+        Returns:
+            SearchResultList: The list containing all retrieved and processed pages in order of completion.
+
+        """
+        search_results = SearchResultList()
+
+        if not self.data:
+            logger.warning(
+                "A coordinator has not yet been registered with the AsyncMultiSearchCoordinator: "
+                "returning an empty list..."
+            )
+            return search_results
+
+        async for search_result in self.aiter_pages(pages, max_concurrency=max_concurrency, **kwargs):
+            search_results.append(search_result)
+
+        logger.debug("Completed asynchronous multi-search coordinated retrieval and processing")
+        return search_results
+
+    async def aiter_pages(
+        self,
+        pages: Sequence[int] | PageListInput,
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncGenerator[SearchResult, None]:
+        """Asynchronous generator that searches all providers concurrently and yields each SearchResult on completion.
+
+        Each provider group runs as a separate task that iterates over its coordinators in sequence, mirroring the
+        threading-by-provider strategy of `MultiSearchCoordinator.iter_pages_threaded` without the need for a thread
+        per provider. Results are yielded as soon as they are processed. If the consumer stops iterating early, the
+        remaining provider tasks are cancelled.
+
+        Args:
+            pages (Sequence[int] | PageListInput): A sequence of page numbers to request from each API Provider.
+            max_concurrency (Optional[int]):
+                The maximum number of providers to search concurrently. All providers are searched concurrently
+                when not specified.
+            **kwargs: Keyword arguments to pass to `AsyncSearchCoordinator.aiter_pages` for each coordinator.
+
+        Yields:
+            SearchResult: The SearchResult for each provider, query, and page as it becomes available.
+
+        """
+        if max_concurrency is not None and (not isinstance(max_concurrency, int) or max_concurrency < 1):
+            raise InvalidCoordinatorParameterException(
+                f"Expected max_concurrency to be a positive integer, received {max_concurrency}"
+            )
+
+        pages = SearchCoordinator._validate_page_list_input(pages)
+        provider_groups = self.group_by_provider()
+
+        if not provider_groups:
+            return
+
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        semaphore = asyncio.Semaphore(max_concurrency or len(provider_groups))
+        sentinel = object()
+
+        async def run_provider_group(provider_name: str, group: dict[str, AsyncSearchCoordinator]) -> None:
+            """Searches each coordinator within a provider group and passes each result to the shared queue."""
+            try:
+                async with semaphore:
+                    async for search_result in self._aprocess_provider_group(group, pages, **kwargs):
+                        await queue.put(search_result)
+                logger.debug(f"Successfully halted retrieval for provider, {provider_name}")
+            except Exception as e:
+                logger.error(f"Encountered an unexpected error during iteration for provider, {provider_name}: {e}")
+            finally:
+                await queue.put(sentinel)
+
+        tasks = [
+            asyncio.create_task(run_provider_group(provider_name, group))  # type: ignore[arg-type]
+            for provider_name, group in provider_groups.items()
+        ]
+
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is sentinel:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _aprocess_provider_group(
+        self,
+        provider_coordinators: dict[str, AsyncSearchCoordinator],
+        pages: Sequence[int] | PageListInput,
+        **kwargs,
+    ) -> AsyncGenerator[SearchResult, None]:
+        """Asynchronous counterpart of `MultiSearchCoordinator._process_provider_group()`.
+
+        Args:
+            provider_coordinators (dict[str, AsyncSearchCoordinator]):
+                A dictionary of all coordinators corresponding to a single provider.
+            pages (Sequence[int] | PageListInput): The page numbers to request from the API Provider.
+            **kwargs: Keyword arguments to pass to the `aiter_pages` method of each coordinator
+
+        Yields:
+            SearchResult: The SearchResult for each query and page of the current provider.
+
+        """
+        last_response: Optional[APIResponse] = None
+        for search_coordinator in provider_coordinators.values():
+            if self._halt_provider_group(last_response, search_coordinator):
+                break
+
+            default_request_delay = search_coordinator.api._rate_limiter.min_interval
+            request_delay = kwargs.pop("request_delay", default_request_delay)
+
+            async for page in search_coordinator.aiter_pages(pages, **kwargs, request_delay=request_delay):
+                if isinstance(page, SearchResult):
+                    last_response = page.response_result
+                yield page
+
+
+__all__ = ["AsyncMultiSearchCoordinator"]
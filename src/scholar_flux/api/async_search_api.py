@@ -0,0 +1,127 @@
+# /api/async_search_api.py
+"""Implements the AsyncSearchAPI that extends the SearchAPI with coroutine-based request retrieval.
+
+The AsyncSearchAPI keeps the parameter building, request preparation, and session handling of the SearchAPI while
+replacing blocking rate-limiter waits with `asyncio.sleep`. Requests are still sent with the configured
+`requests.Session` (or `requests_cache.CachedSession`) so that request caching behaves identically to the SearchAPI, but
+the blocking network call is delegated to a worker thread only for the duration of the call itself.
+
+"""
+from __future__ import annotations
+from typing import Dict, Optional, Any
+import asyncio
+import logging
+import requests
+from requests import Response
+from scholar_flux.api.search_api import SearchAPI
+from scholar_flux.exceptions.api_exceptions import APIParameterException
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSearchAPI(SearchAPI):
+    """An asyncio-compatible SearchAPI that awaits rate limits instead of sleeping within a dedicated thread.
+
+    All configuration options, factory methods (`from_defaults`, `from_settings`, `from_provider_config`, `update`),
+    and synchronous methods are inherited from the SearchAPI. The coroutine methods `asearch`, `amake_request`, and
+    `asend_request` mirror their synchronous counterparts.
+
+    Examples:
+        >>> import asyncio
+        >>> from scholar_flux.api import AsyncSearchAPI
+        >>> api = AsyncSearchAPI.from_defaults(query = 'machine learning', provider_name = 'plos')
+        >>> async def main():
+        ...     # the second request awaits the provider's request delay without blocking the event loop
+        ...     return [await api.asearch(page = page) for page in (1, 2)]
+        >>> responses = asyncio.run(main())
+        >>> responses
+        # OUTPUT: [<Response [200]>, <Response [200]>]
+
+    """
+
+    async def asend_request(
+        self,
+        base_url: str,
+        endpoint: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int | float] = None,
+    ) -> requests.Response:
+        """Sends a GET request to the specified endpoint without blocking the running event loop.
+
+        Args:
+            base_url (str): The base API to send the request to.
+            endpoint (Optional[str]): The endpoint of the API to send the request to.
+            parameters (Optional[Dict[str, Any]]): Optional query parameters for the request.
+            timeout (int): Timeout for the request in seconds.
+
+        Returns:
+            requests.Response: The response object.
+
+        """
+        return await asyncio.to_thread(
+            self.send_request, base_url, endpoint=endpoint, parameters=parameters, timeout=timeout
+        )
+
+    async def asearch(
+        self,
+        page: Optional[int] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        request_delay: Optional[float] = None,
+        endpoint: Optional[str] = None,
+    ) -> Response:
+        """Asynchronous counterpart of `SearchAPI.search()` for retrieving a page or a custom parameter request.
+
+        Args:
+            page (Optional[int]): Page number to query. If provided, parameters are built from the config and this page.
+            parameters (Optional[Dict[str, Any]]):
+                If provided alone, used as the full parameter set for the request.
+                If provided together with `page`, these act as additional or overriding parameters on top of
+                the built config.
+            request_delay (Optional[float]): Overrides the configured request delay for the current request only.
+            endpoint (Optional[str]): An Optional API endpoint to append to base_url.
+
+        Returns:
+            requests.Response: A response object from the API containing articles and metadata
+
+        """
+        if page is None and (parameters is not None or endpoint is not None):
+
+            async with self._rate_limiter.async_rate(
+                self.config.request_delay if request_delay is None else request_delay
+            ):
+                return await self.asend_request(self.base_url, endpoint=endpoint, parameters=parameters)
+
+        elif page is not None:
+            return await self.amake_request(page, parameters, request_delay=request_delay, endpoint=endpoint)
+        else:
+            raise APIParameterException("One of 'page' or 'parameters' must be provided")
+
+    async def amake_request(
+        self,
+        current_page: int,
+        additional_parameters: Optional[dict[str, Any]] = None,
+        request_delay: Optional[float] = None,
+        endpoint: Optional[str] = None,
+    ) -> Response:
+        """Asynchronous counterpart of `SearchAPI.make_request()` that builds parameters and awaits the response.
+
+        Args:
+            current_page (int): The page number to request.
+            additional_parameters Optional[dict]:
+                A dictionary of additional overrides not included in the original SearchAPIConfig
+            request_delay (Optional[float]): Overrides the configured request delay for the current request only.
+            endpoint (Optional[str]): The API endpoint to prepare the request for.
+
+        Returns:
+            requests.Response: The API's response to the request.
+
+        """
+        parameters = self.build_parameters(current_page, additional_parameters=additional_parameters)
+
+        async with self._rate_limiter.async_rate(self.config.request_delay if request_delay is None else request_delay):
+            response = await self.asend_request(self.base_url, endpoint=endpoint, parameters=parameters)
+
+        return response
+
+
+__all__ = ["AsyncSearchAPI"]
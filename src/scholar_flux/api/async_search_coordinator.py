@@ -0,0 +1,438 @@
+# /api/async_search_coordinator.py
+"""Implements the AsyncSearchCoordinator for orchestrating coroutine-based API response retrieval and processing.
+
+The AsyncSearchCoordinator reuses the components of the SearchCoordinator (SearchAPI configuration, ResponseCoordinator,
+RetryHandler, ResponseValidator, and caches) while awaiting rate limits and retries on the event loop. This allows many
+query and provider combinations to be searched concurrently from a single thread without dedicating an OS thread to
+each provider.
+
+"""
+from __future__ import annotations
+from typing import Optional, Sequence, cast, AsyncGenerator
+from requests import Response
+import asyncio
+import logging
+
+from scholar_flux.api import SearchAPI, ResponseCoordinator, ResponseValidator, APIResponse
+from scholar_flux.api.models import (
+    PageListInput,
+    SearchResult,
+    SearchResultList,
+    ProcessedResponse,
+    ErrorResponse,
+    NonResponse,
+)
+from scholar_flux.api.async_search_api import AsyncSearchAPI
+from scholar_flux.api.search_coordinator import SearchCoordinator
+from scholar_flux.api.rate_limiting.retry_handler import RetryHandler
+from scholar_flux.api.workflows import SearchWorkflow
+from scholar_flux.utils.response_protocol import ResponseProtocol
+from scholar_flux.exceptions import (
+    RequestFailedException,
+    APIParameterException,
+    InvalidCoordinatorParameterException,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSearchCoordinator(SearchCoordinator):
+    """Coordinator that retrieves and processes API responses with coroutines instead of blocking calls.
+
+    The AsyncSearchCoordinator is initialized identically to the SearchCoordinator and retains all of its synchronous
+    methods. In addition, it provides the coroutine methods `asearch`, `asearch_page`, `asearch_pages`, and the
+    asynchronous generator, `aiter_pages`. Provider delays and retry backoffs are awaited on the event loop while the
+    parsing, extraction, processing, and caching of each response uses the same ResponseCoordinator pipeline as the
+    SearchCoordinator.
+
+    Note that custom workflows (e.g., the PubMed eSearch -> eFetch workflow) are defined synchronously. When a workflow
+    is active, `asearch` runs the workflow in a worker thread to avoid blocking the event loop.
+
+    Examples:
+        >>> import asyncio
+        >>> from scholar_flux.api import AsyncSearchCoordinator
+        >>> coordinator = AsyncSearchCoordinator(query = 'Intrinsic Motivation', provider_name = 'crossref')
+        >>> async def main():
+        ...     return [result async for result in coordinator.aiter_pages(pages = range(1, 4))]
+        >>> results = asyncio.run(main())
+        >>> results
+        # OUTPUT: [SearchResult(query='Intrinsic Motivation', provider_name='crossref', page=1, ...), ...]
+
+    """
+
+    def _initialize(
+        self,
+        search_api: SearchAPI,
+        response_coordinator: ResponseCoordinator,
+        retry_handler: Optional[RetryHandler] = None,
+        validator: Optional[ResponseValidator] = None,
+        workflow: Optional[SearchWorkflow] = None,
+    ):
+        """Initializes the coordinator while ensuring that the SearchAPI supports coroutine-based requests.
+
+        SearchAPI instances that are not already an AsyncSearchAPI are converted with `AsyncSearchAPI.update`, which
+        reuses the original configuration, session, and rate limiter.
+
+        """
+        if isinstance(search_api, SearchAPI) and not isinstance(search_api, AsyncSearchAPI):
+            search_api = AsyncSearchAPI.update(search_api)
+        super()._initialize(search_api, response_coordinator, retry_handler, validator, workflow)
+
+    @classmethod
+    def _create_search_api(
+        cls,
+        search_api: Optional[SearchAPI] = None,
+        provider_name: Optional[str] = None,
+        query: Optional[str] = None,
+        cache_requests: Optional[bool] = None,
+        **kwargs,
+    ) -> AsyncSearchAPI:
+        """Helper method for creating a new AsyncSearchAPI from its components or an existing SearchAPI.
+
+        Args:
+            search_api (Optional[SearchAPI]): The search API to use for the retrieval of response records from APIs
+            provider_name (Optional[str]): The name of the API provider where requests will be sent.
+            cache_requests: (Optional[bool]): Determines whether or not to cache requests
+            query: (Optional[str]): Query to be used when sending requests when creating an API
+
+        Returns:
+            AsyncSearchAPI: A new AsyncSearchAPI based on the original search api or created entirely anew
+
+        """
+        if not query and search_api is None:
+            raise InvalidCoordinatorParameterException("Either 'query' or 'search_api' must be provided.")
+
+        kwargs["use_cache"] = cache_requests if cache_requests is not None else kwargs.get("use_cache")
+
+        try:
+            api = (
+                AsyncSearchAPI.from_defaults(cast("str", query), provider_name=provider_name, **kwargs)
+                if not search_api
+                else AsyncSearchAPI.update(search_api, query=query, provider_name=provider_name, **kwargs)
+            )
+        except APIParameterException as e:
+            logger.error("Could not initialize the AsyncSearchCoordinator due to an issue creating the SearchAPI.")
+            raise InvalidCoordinatorParameterException(
+                "Could not initialize the AsyncSearchCoordinator due to an API " f"parameter exception. {e}"
+            )
+        return cast("AsyncSearchAPI", api)
+
+    @property
+    def search_api(self) -> AsyncSearchAPI:
+        """Allows the search_api to be used as a property while also allowing for verification."""
+        return cast("AsyncSearchAPI", self._search_api)
+
+    @search_api.setter
+    def search_api(self, search_api: SearchAPI) -> None:
+        """Allows the direct modification of the SearchAPI while ensuring that it supports coroutine-based requests."""
+        if not isinstance(search_api, AsyncSearchAPI):
+            raise InvalidCoordinatorParameterException(
+                f"Expected an AsyncSearchAPI object. Instead received type ({type(search_api)})"
+            )
+        self._search_api = search_api
+
+    async def asearch(
+        self,
+        page: int = 1,
+        from_request_cache: bool = True,
+        from_process_cache: bool = True,
+        use_workflow: Optional[bool] = True,
+        normalize_records: Optional[bool] = None,
+        **api_specific_parameters,
+    ) -> Optional[ProcessedResponse | ErrorResponse]:
+        """Asynchronous counterpart of `SearchCoordinator.search()` for retrieving and processing a single page.
+
+        Args:
+            page (int): The current page number. Used for process caching purposes even if not required by the API
+            from_request_cache (bool): This parameter determines whether to try to retrieve
+                                       the response from the requests-cache storage
+            from_process_cache (bool): This parameter determines whether to attempt to pull
+                                       processed responses from the cache storage
+            use_workflow (bool): Indicates whether to use a workflow if available Workflows are utilized by default.
+            normalize_records (Optional[bool]): Determines whether records should be normalized after processing
+            **api_specific_parameters (SearchAPIConfig): Fields to temporarily override when building the request.
+
+        Returns:
+            Optional[ProcessedResponse | ErrorResponse]:
+                A ProcessedResponse when the response is retrieved and processed successfully. Otherwise, an
+                ErrorResponse or NonResponse that indicates the reason behind the error.
+
+        """
+        try:
+            if use_workflow and self.workflow:
+                # workflows are synchronous: run them in a worker thread to keep the event loop responsive
+                return await asyncio.to_thread(
+                    self.search,
+                    page=page,
+                    from_request_cache=from_request_cache,
+                    from_process_cache=from_process_cache,
+                    use_workflow=use_workflow,
+                    normalize_records=normalize_records,
+                    **api_specific_parameters,
+                )
+            return await self._asearch(
+                page,
+                from_request_cache=from_request_cache,
+                from_process_cache=from_process_cache,
+                normalize_records=normalize_records,
+                **api_specific_parameters,
+            )
+        except Exception as e:
+            logger.error(f"An unexpected error occurred when processing the response: {e}")
+            cursor = self._cursor_from_parameters(api_specific_parameters)
+            is_valid_page = isinstance(page, int) and page >= 0
+            cache_key = self._create_cache_key(page=page, cursor=cursor) if is_valid_page else None
+            return NonResponse.from_error(error=e, message=str(e), cache_key=cache_key)
+
+    async def asearch_page(
+        self,
+        page: int,
+        from_request_cache: bool = True,
+        from_process_cache: bool = True,
+        use_workflow: Optional[bool] = True,
+        **api_specific_parameters,
+    ) -> SearchResult:
+        """Asynchronous counterpart of `SearchCoordinator.search_page()` that wraps the response in a SearchResult.
+
+        Args:
+            page (int): The current page number. Used for process caching purposes even if not required by the API
+            from_request_cache (bool):
+                This parameter determines whether to try to retrieve the response from the requests-cache storage.
+            from_process_cache (bool):
+                This parameter determines whether to attempt to pull processed responses from the cache storage.
+            use_workflow (bool): Indicates whether to use a workflow if available Workflows are utilized by default.
+            **api_specific_parameters (SearchAPIConfig): Fields to temporarily override when building the request.
+
+        Returns:
+            SearchResult: A search result containing the page, provider name, query, and response result.
+
+        """
+        api_response = await self.asearch(
+            page=page,
+            from_request_cache=from_request_cache,
+            from_process_cache=from_process_cache,
+            use_workflow=use_workflow,
+            **api_specific_parameters,
+        )
+        return self._build_search_result(api_response, page, use_workflow=use_workflow)
+
+    async def aiter_pages(
+        self,
+        pages: Sequence[int] | PageListInput,
+        from_request_cache: bool = True,
+        from_process_cache: bool = True,
+        use_workflow: Optional[bool] = True,
+        **api_specific_parameters,
+    ) -> AsyncGenerator[SearchResult, None]:
+        """Asynchronous generator counterpart of `SearchCoordinator.iter_pages()`.
+
+        Pages are requested in sequence, and iteration halts early under the same conditions as `iter_pages` (e.g.,
+        errors or pages containing fewer records than expected).
+
+        Args:
+            pages (Sequence[int] | PageListInput): A sequence of page numbers to request from the API Provider.
+            from_request_cache (bool): This parameter determines whether to try to retrieve the response from the
+                                       requests-cache storage.
+            from_process_cache (bool): This parameter determines whether to attempt to pull processed responses from
+                                       the cache storage.
+            use_workflow (bool): Indicates whether to use a workflow if available Workflows are utilized by default.
+            **api_specific_parameters (SearchAPIConfig): Fields to temporarily override when building the request.
+
+        Yields:
+            SearchResult: The SearchResult for each page as soon as it has been retrieved and processed.
+
+        """
+        page_list_input = self._validate_page_list_input(pages)
+
+        for page in page_list_input.page_numbers:
+
+            search_result = await self.asearch_page(
+                page=page,
+                from_request_cache=from_request_cache,
+                from_process_cache=from_process_cache,
+                use_workflow=use_workflow,
+                **api_specific_parameters,
+            )
+
+            halt = self._process_page_result(search_result.response_result, page)
+
+            yield search_result
+
+            if halt:
+                break
+
+    async def asearch_pages(
+        self,
+        pages: Sequence[int] | PageListInput,
+        from_request_cache: bool = True,
+        from_process_cache: bool = True,
+        use_workflow: Optional[bool] = True,
+        **api_specific_parameters,
+    ) -> SearchResultList:
+        """Asynchronous counterpart of `SearchCoordinator.search_pages()` that collects all pages in a SearchResultList.
+
+        Args:
+            pages (Sequence[int] | PageListInput): A sequence of page numbers to request from the API Provider.
+            from_request_cache (bool): This parameter determines whether to try to retrieve the response from the
+                                       requests-cache storage.
+            from_process_cache (bool): This parameter determines whether to attempt to pull processed responses from
+                                       the cache storage.
+            use_workflow (bool): Indicates whether to use a workflow if available Workflows are utilized by default.
+            **api_specific_parameters (SearchAPIConfig): Fields to temporarily override when building the request.
+
+        Returns:
+            SearchResultList: A list containing the SearchResult for each page that was retrieved.
+
+        """
+        page_results: SearchResultList = SearchResultList()
+
+        try:
+            async for search_result in self.aiter_pages(
+                pages=pages,
+                from_request_cache=from_request_cache,
+                from_process_cache=from_process_cache,
+                use_workflow=use_workflow,
+                **api_specific_parameters,
+            ):
+                page_results.append(search_result)
+
+        except Exception as e:
+            logger.error(f"An unexpected error occurred when processing the response: {e}")
+
+        return page_results
+
+    async def _asearch(
+        self,
+        page: Optional[int] = 1,
+        from_request_cache: bool = True,
+        from_process_cache: bool = True,
+        normalize_records: Optional[bool] = None,
+        **api_specific_parameters,
+    ) -> Optional[ProcessedResponse | ErrorResponse]:
+        """Asynchronous counterpart of `SearchCoordinator._search()`.
+
+        The response is retrieved on the event loop, and the parsing, extraction, processing, and caching steps are run
+        in a worker thread, as these steps are CPU-bound or depend on blocking storage clients.
+
+        """
+        api_response = await self._afetch_api_response(
+            page, from_request_cache=from_request_cache, **api_specific_parameters
+        )
+
+        self._log_response_source(api_response.response, page, api_response.cache_key)
+
+        if isinstance(api_response, NonResponse):
+            return api_response
+
+        return await asyncio.to_thread(
+            self._process_response,
+            response=cast("ResponseProtocol", api_response.response),
+            cache_key=cast("str", api_response.cache_key),
+            from_process_cache=from_process_cache,
+            normalize_records=normalize_records,
+        )
+
+    async def afetch(
+        self,
+        page: Optional[int],
+        from_request_cache: bool = True,
+        raise_on_error: bool = False,
+        **api_specific_parameters,
+    ) -> Optional[Response | ResponseProtocol]:
+        """Asynchronous counterpart of `SearchCoordinator.fetch()` for retrieving the raw response or a cached request.
+
+        Args:
+            page (Optional[int]): The page number to retrieve from the cache.
+            from_request_cache (bool): This parameter determines whether to try to fetch a valid response from cache.
+            raise_on_error (bool): Indicates whether to raise a RequestFailedException when retrieval fails.
+            **api_specific_parameters (SearchAPIConfig): Fields to temporarily override when building the request.
+
+        Returns:
+            Optional[Response]: The response object if available, otherwise None.
+
+        """
+        current_page = str(page) if page is not None else f" for {self.api.base_url}"
+        try:
+
+            if from_request_cache:
+                if response := self.get_cached_request(page, **api_specific_parameters):
+                    return response
+            else:
+                self._delete_cached_request(page, **api_specific_parameters)
+                await self._arespect_retry_after()
+
+            return await self.arobust_request(page, **api_specific_parameters)
+        except RequestFailedException as e:
+            msg = f"Failed to fetch page {current_page}"
+            err = f"{msg}: {e}" if str(e) else msg
+            logger.warning(err)
+            if raise_on_error:
+                raise RequestFailedException(err)
+        return None
+
+    async def _arespect_retry_after(self) -> None:
+        """Asynchronous counterpart of `_respect_retry_after()` that awaits the `Retry-After` delay when present."""
+        if retry_after := self._get_retry_after_wait():
+            delay, timestamp = retry_after
+            await self.api._rate_limiter._async_wait(delay, timestamp)
+
+    async def arobust_request(
+        self, page: Optional[int], **api_specific_parameters
+    ) -> Optional[Response | ResponseProtocol]:
+        """Asynchronous counterpart of `SearchCoordinator.robust_request()` that awaits retries on failure.
+
+        Args:
+            page (Optional[int]):
+                The page number to retrieve. If missing, this implementation relies on `api_specific_parameters` to
+                retrieve data from an API.
+            **api_specific_parameters: Optional Additional parameters to pass to the AsyncSearchAPI
+
+        Returns:
+            Optional[Response]: The request object if available, otherwise None.
+
+        """
+        try:
+            response = await self.retry_handler.aexecute_with_retry(
+                self.search_api.asearch,
+                self.validator.validate_response,
+                page=page,
+                **api_specific_parameters,
+            )
+
+        except RequestFailedException as e:
+            msg = f"Failed to get a valid response from the {self.search_api.provider_name} API"
+            err = f"{msg}: {e}" if str(e) else msg
+            logger.error(err)
+            raise RequestFailedException(err) from e
+
+        if getattr(response, "from_cache", False):
+            logger.info(f"Retrieved cached response for query: {self.search_api.query} and page: {page}")
+        return response
+
+    async def _afetch_api_response(
+        self, page: Optional[int], from_request_cache: bool = True, **api_specific_parameters
+    ) -> APIResponse:
+        """Asynchronous counterpart of `SearchCoordinator._fetch_api_response()`.
+
+        Returns:
+            APIResponse | NonResponse: A data class containing the response and cache key when successfully retrieved,
+                                       and a NonResponse otherwise when retrieval is unsuccessful due to an error.
+
+        """
+        cursor = self._cursor_from_parameters(api_specific_parameters)
+        cache_key = self._create_cache_key(page, cursor=cursor) if page is not None else None
+        try:
+            response = await self.afetch(
+                page, from_request_cache=from_request_cache, raise_on_error=True, **api_specific_parameters
+            )
+            if not cache_key and response and response.url:
+                cache_key = self._create_cache_key(page=None, url=response.url)
+        except RequestFailedException as e:
+            return NonResponse.from_error(error=e, message=str(e), cache_key=cache_key)
+
+        if not response:
+            logger.info(f"Response retrieval for cache key {cache_key} was unsuccessful.")
+        return APIResponse(response=response, cache_key=cache_key)
+
+
+__all__ = ["AsyncSearchCoordinator"]
@@ -9,6 +9,7 @@ Core Models:
                        to the requirements for each API.
     - APIParameterConfig: Encapsulates the created APIParameterMap as well as the methods used to create each request.
     - SearchAPIConfig: Defines the core logic to abstract the creation of requests with parameters specific to each API.
+    - RateLimitConfig: Selects the rate limiting strategy (fixed interval, token bucket, sliding window) for a provider.
     - ProviderConfig: Allows users to define each of the defaults and mappings settings needed to create a Search API.
     - ProviderRegistry: A customized dictionary mapping provider names to their dynamically retrieved configuration.
     - ProcessedResponse: Indicates a successfully retrieved and processed response from an API provider.
@@ -20,7 +21,8 @@ Core Models:
 from scholar_flux.api.models.reconstructed_response import ReconstructedResponse
 from scholar_flux.api.models.base_parameters import BaseAPIParameterMap, APISpecificParameter
 from scholar_flux.api.models.api_parameters import APIParameterMap, APIParameterConfig
-from scholar_flux.api.models.response_metadata_map import ResponseMetadataMap
+from scholar_flux.api.models.response_metadata_map import ResponseMetadataMap, CursorMetadataMap
+from scholar_flux.api.models.rate_limit_config import RateLimitConfig
 from scholar_flux.api.models.provider_config import ProviderConfig
 from scholar_flux.api.models.provider_registry import ProviderRegistry
 from scholar_flux.api.models.base_provider_dict import BaseProviderDict
@@ -47,6 +49,8 @@ __all__ = [
     "APIParameterMap",
     "APIParameterConfig",
     "ResponseMetadataMap",
+    "CursorMetadataMap",
+    "RateLimitConfig",
     "BaseFieldMap",
     "AcademicFieldMap",
     "ProviderConfig",
@@ -39,6 +39,8 @@ class APIParameterMap(BaseAPIParameterMap):
         api_key_required (bool): Indicates whether an API key is required.
         auto_calculate_page (bool): If True, calculates start index from page; if False, passes page number directly.
         zero_indexed_pagination (bool): If True, treats 0 as an allowed page value when retrieving data from APIs.
+        cursor (Optional[str]): The API-specific parameter name for cursor-based (deep) pagination when supported.
+        initial_cursor (Optional[str]): The cursor value that requests the first page of a cursor-paginated search.
         api_specific_parameters (Dict[str, str]): Additional universal to API-specific parameter mappings.
 
     """
@@ -211,14 +213,19 @@ class APIParameterConfig:
         query: Optional[str],
         page: Optional[int],
         records_per_page: int,
+        cursor: Optional[str] = None,
         **api_specific_parameters,
     ) -> Dict[str, Any]:
         """Builds the dictionary of request parameters using the current parameter map and provided values at runtime.
 
+        When a `cursor` is provided, the cursor replaces the start index: providers such as Crossref and OpenAlex
+        reject requests that combine cursors with offsets or page numbers.
+
         Args:
             query (Optional[str]): The search query string.
             page (Optional[int]): The page number for pagination (1-based).
             records_per_page (int): Number of records to fetch per page.
+            cursor (Optional[str]): The cursor used to request the next page of a cursor-paginated search.
             **api_specific_parameters: Additional API-specific parameters to include.
 
         Returns:
@@ -226,14 +233,21 @@ class APIParameterConfig:
                 The fully constructed API request parameters dictionary, with keys as API-specific parameter names and
                 values as provided.
 
+        Raises:
+            APIParameterException: If a cursor is provided but the parameter map does not support cursor pagination.
+
         """
-        start_index = self._calculate_start_index(page, records_per_page)
+        if cursor is not None and not self.parameter_map.cursor:
+            raise APIParameterException("A cursor was provided, but the current API does not support cursor pagination")
+
+        start_index = self._calculate_start_index(page, records_per_page) if cursor is None else None
 
         # Base parameters mapped to API-specific names
         parameters = {
             self.parameter_map.query: query,
             self.parameter_map.start: start_index,
             self.parameter_map.records_per_page: records_per_page,
+            self.parameter_map.cursor: cursor,
         }
 
         parameters = self._get_api_specific_parameters(parameters, **api_specific_parameters)
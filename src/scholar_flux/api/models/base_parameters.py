@@ -90,6 +90,8 @@ class BaseAPIParameterMap(BaseModel):
         page_required (bool): If True, indicates that a page is required.
         auto_calculate_page (bool): If True, calculates start index from page; if False, passes page number directly.
         zero_indexed_pagination (bool): Treats page=0 as an allowed page value when retrieving data from the API.
+        cursor (Optional[str]): The API-specific parameter name for cursor-based (deep) pagination when supported.
+        initial_cursor (Optional[str]): The cursor value that requests the first page of a cursor-paginated search.
         api_specific_parameters (Dict[str, APISpecificParameter]): Additional API-specific parameter mappings.
 
     """
@@ -101,6 +103,8 @@ class BaseAPIParameterMap(BaseModel):
     api_key_required: bool = False
     auto_calculate_page: bool = True
     zero_indexed_pagination: bool = False
+    cursor: Optional[str] = None
+    initial_cursor: Optional[str] = None
     api_specific_parameters: Dict[str, APISpecificParameter] = Field(default_factory=dict)
 
     def update(self, other: BaseAPIParameterMap | Dict[str, Any]) -> BaseAPIParameterMap:
@@ -151,7 +155,15 @@ class BaseAPIParameterMap(BaseModel):
             parameter
             for parameter in self.model_dump()
             if parameter
-            not in ("api_key_required", "auto_calculate_page", "api_specific_parameters", "zero_indexed_pagination")
+            not in (
+                "api_key_required",
+                "auto_calculate_page",
+                "api_specific_parameters",
+                "zero_indexed_pagination",
+                "initial_cursor",
+            )
+            # cursors are only listed for APIs that support cursor pagination
+            and not (parameter == "cursor" and self.cursor is None)
         ]
 
         parameters += list(self.api_specific_parameters.keys())
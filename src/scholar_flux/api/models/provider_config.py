@@ -7,16 +7,20 @@ providers, as well as basic defaults necessary for interaction.
 
 """
 from pydantic import BaseModel, field_validator, ConfigDict, Field
-from typing import Optional, ClassVar, Any
+from typing import Optional, ClassVar, Any, TYPE_CHECKING
 from scholar_flux.api.validators import validate_url, normalize_url
 from scholar_flux.api.models.base_parameters import BaseAPIParameterMap
 from scholar_flux.api.normalization.base_field_map import BaseFieldMap
 from scholar_flux.api.models.response_metadata_map import ResponseMetadataMap
+from scholar_flux.api.models.rate_limit_config import RateLimitConfig
 from scholar_flux.exceptions.api_exceptions import APIParameterException
 from scholar_flux.utils.repr_utils import generate_repr_from_string
 
 import logging
 
+if TYPE_CHECKING:
+    from scholar_flux.api.rate_limiting.rate_limiter import RateLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +43,9 @@ class ProviderConfig(BaseModel):
         request_delay (float):
             Indicates exactly how many seconds to wait before sending successive requests. Note that the requested
             interval may vary based on the API provider.
+        rate_limit (Optional[RateLimitConfig]):
+            An optional rate limiting strategy (e.g., a token bucket allowing bursts or a daily quota) used when
+            creating rate limiters for the provider. The `request_delay` is used as the sustained request interval.
         api_key_env_var (Optional[str]):
             Indicates the environment variable to look for if the API requires or accepts API keys.
         docs_url (Optional[str]):
@@ -80,6 +87,9 @@ class ProviderConfig(BaseModel):
     )
     records_per_page: int = Field(default=20, ge=0, le=1000, description="Number of records per page (1-1000)")
     request_delay: float = Field(default=6.1, ge=0, description="Minimum delay between requests in seconds")
+    rate_limit: Optional[RateLimitConfig] = Field(
+        default=None, description="Rate limiting strategy used when creating rate limiters for the provider"
+    )
     api_key_env_var: Optional[str] = Field(
         default=None, description="The API Key environment variable to read from the system environment, if specified"
     )
@@ -149,6 +159,26 @@ class ProviderConfig(BaseModel):
         """
         return normalize_url(url, normalize_https=normalize_https)
 
+    def create_rate_limiter(self, threaded: bool = False, min_interval: Optional[float | int] = None) -> "RateLimiter":
+        """Creates a new rate limiter for the provider using the `rate_limit` strategy and `request_delay`.
+
+        Args:
+            threaded (bool): Indicates whether a thread-safe rate limiter should be created.
+            min_interval (Optional[float | int]):
+                An optional interval between requests that overrides the `request_delay` of the provider (e.g., the
+                request delay of a `SearchAPIConfig`).
+
+        Returns:
+            RateLimiter:
+                A rate limiter implementing the provider's rate limiting strategy if specified. Otherwise, a
+                `RateLimiter` (or `ThreadedRateLimiter` if `threaded=True`) using the `request_delay` is returned.
+
+        """
+        rate_limit = self.rate_limit or RateLimitConfig()
+        return rate_limit.create_rate_limiter(
+            self.request_delay if min_interval is None else min_interval, threaded=threaded
+        )
+
     def structure(self, flatten: bool = False, show_value_attributes: bool = True) -> str:
         """Helper method that shows the current structure of the ProviderConfig."""
         class_name = self.__class__.__name__
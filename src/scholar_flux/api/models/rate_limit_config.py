@@ -0,0 +1,97 @@
+# /api/models/rate_limit_config.py
+"""The scholar_flux.api.models.rate_limit_config module implements the RateLimitConfig used to select a rate limiting
+strategy for each provider.
+
+A `RateLimitConfig` can be attached to a `ProviderConfig` to indicate how the provider's rate limiter should be built.
+The provider's `request_delay` defines the sustained rate, while the strategy defines whether bursts are allowed and
+whether a daily request quota is enforced.
+
+"""
+from __future__ import annotations
+from pydantic import BaseModel, Field
+from typing import Optional, Literal, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scholar_flux.api.rate_limiting.rate_limiter import RateLimiter
+
+
+class RateLimitConfig(BaseModel):
+    """Defines the rate limiting strategy used for a provider.
+
+    Strategies:
+        - fixed_interval: Spaces each request by at least `request_delay` seconds (the default behavior).
+        - token_bucket: Allows bursts of up to `burst` requests while replenishing one request every `request_delay`.
+        - sliding_window: Allows up to `burst` requests within any window of `burst * request_delay` seconds.
+        - adaptive: Starts at `request_delay` and adjusts the interval from the `X-RateLimit-*` headers, `Retry-After`
+          headers, and 429 responses received from the provider within `min_request_delay` and `max_request_delay`.
+
+    Any strategy can additionally enforce a `daily_limit` that is counted per UTC day.
+
+    Args:
+        strategy (Literal['fixed_interval', 'token_bucket', 'sliding_window', 'adaptive']):
+            The rate limiting strategy to use.
+        burst (Optional[int]):
+            The maximum number of requests that can be sent in immediate succession for the `token_bucket` and
+            `sliding_window` strategies. Defaults to a single request (no bursts) when not specified.
+        daily_limit (Optional[int]): The maximum number of requests allowed per UTC day.
+        min_request_delay (Optional[float]): The smallest interval the `adaptive` strategy can relax to.
+        max_request_delay (Optional[float]): The largest interval the `adaptive` strategy can tighten to.
+
+    Example:
+        >>> from scholar_flux.api.models import RateLimitConfig
+        >>> # 10 requests per second with bursts of up to 10 requests when `request_delay=0.1`
+        >>> rate_limit = RateLimitConfig(strategy='token_bucket', burst=10)
+        >>> rate_limit.create_rate_limiter(0.1)
+        # OUTPUT: TokenBucketRateLimiter(min_interval=0.1, burst=10, daily_limit=None)
+
+    """
+
+    strategy: Literal["fixed_interval", "token_bucket", "sliding_window", "adaptive"] = Field(
+        default="fixed_interval", description="The strategy used to limit the rate of requests"
+    )
+    burst: Optional[int] = Field(default=None, ge=1, description="Maximum number of requests sent in succession")
+    daily_limit: Optional[int] = Field(default=None, ge=1, description="Maximum number of requests per UTC day")
+    min_request_delay: Optional[float] = Field(default=None, ge=0, description="Lower bound for adaptive intervals")
+    max_request_delay: Optional[float] = Field(default=None, ge=0, description="Upper bound for adaptive intervals")
+
+    def create_rate_limiter(self, min_interval: Optional[float | int] = None, threaded: bool = False) -> RateLimiter:
+        """Creates a new rate limiter that implements the current strategy.
+
+        Args:
+            min_interval (Optional[float | int]): The request delay used as the sustained interval between requests.
+            threaded (bool):
+                Indicates whether a thread-safe rate limiter is required for the `fixed_interval` strategy. All other
+                strategies and daily quotas always use thread-safe rate limiters.
+
+        Returns:
+            RateLimiter: A rate limiter implementing the current strategy
+
+        """
+        # imported at runtime: the rate_limiting module loads the provider registry, which depends on this model
+        from scholar_flux.api.rate_limiting import (
+            RateLimiter,
+            ThreadedRateLimiter,
+            DailyQuotaRateLimiter,
+            AdaptiveRateLimiter,
+            TokenBucketRateLimiter,
+            SlidingWindowRateLimiter,
+        )
+
+        burst = self.burst or 1
+        if self.strategy == "token_bucket":
+            return TokenBucketRateLimiter(min_interval, burst=burst, daily_limit=self.daily_limit)
+        if self.strategy == "sliding_window":
+            return SlidingWindowRateLimiter(min_interval, max_requests=burst, daily_limit=self.daily_limit)
+        if self.strategy == "adaptive":
+            return AdaptiveRateLimiter(
+                min_interval,
+                lower_bound=self.min_request_delay or 0,
+                upper_bound=self.max_request_delay,
+                daily_limit=self.daily_limit,
+            )
+        if self.daily_limit is not None:
+            return DailyQuotaRateLimiter(min_interval, daily_limit=self.daily_limit)
+        return ThreadedRateLimiter(min_interval) if threaded else RateLimiter(min_interval)
+
+
+__all__ = ["RateLimitConfig"]
@@ -107,7 +107,7 @@ class RateLimiterRegistry(BaseProviderDict):
 
         """
         # If a rate limiter exists for the current key, return it
-        if rate_limiter := self.data.get(key):
+        if rate_limiter := self.get(key):
             return rate_limiter
 
         # otherwise, create a new rate limiter
@@ -121,6 +121,8 @@ class RateLimiterRegistry(BaseProviderDict):
         The minimum interval for the provider is chosen based on the following order of priority:
 
         1. If the provider exists in the `provider_registry`, use the `request_delay` from its configuration settings.
+           When the provider's config defines a `rate_limit` strategy, a rate limiter implementing the strategy
+           (e.g., a `TokenBucketRateLimiter` or `DailyQuotaRateLimiter`) is created.
         2. Otherwise, use the `default_request_delay` parameter if it is a float or integer.
         3. If a provider doesn't exist in the registry and `default_request_delay` isn't specified, use the
            `RateLimiter.DEFAULT_MIN_INTERVAL` class parameter.
@@ -137,14 +139,11 @@ class RateLimiterRegistry(BaseProviderDict):
                 self.rate_limiter._validate(default_request_delay)
 
             if provider_config := api_providers.provider_registry.get(provider_name):
-                # Otherwise, create a new rate limiter from the `provider_registry`
-                request_delay = provider_config.request_delay
+                # Otherwise, create a new rate limiter from the `provider_registry` using its rate limiting strategy
+                rate_limiter = provider_config.create_rate_limiter(threaded=self.threaded)
             else:
-                # Default to `default_request_delay` when possible
-                request_delay = default_request_delay
-
-            # Creates a new rate limiter with the `RateLimiter.default_request_delay` or `default_request_delay` if available
-            rate_limiter = self.rate_limiter(request_delay)
+                # Creates a new rate limiter with the `RateLimiter.default_request_delay` or `default_request_delay`
+                rate_limiter = self.rate_limiter(default_request_delay)
 
             # adds the rate limiter to the registry
             self.add(provider_name, rate_limiter)
@@ -190,11 +189,9 @@ class RateLimiterRegistry(BaseProviderDict):
             RateLimiterRegistry: A new registry containing default provider rate limiters
 
         """
-        Limiter = ThreadedRateLimiter if threaded else RateLimiter
-
         return cls(
             {
-                provider_name: Limiter(provider_config.request_delay)
+                provider_name: provider_config.create_rate_limiter(threaded=threaded)
                 for provider_name, provider_config in api_providers.provider_registry.items()
             },
             threaded=threaded,
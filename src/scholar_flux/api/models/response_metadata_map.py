@@ -188,4 +188,65 @@ class ResponseMetadataMap(BaseModel):
         return self.process_metadata(*args, **kwargs)
 
 
-__all__ = ["ResponseMetadataMap"]
+class CursorMetadataMap(ResponseMetadataMap):
+    """Extends the `ResponseMetadataMap` to additionally extract the cursor of the next page from response metadata.
+
+    APIs that support cursor pagination (e.g., Crossref and OpenAlex) return an opaque cursor with each response that
+    is sent in place of an offset to request the next page of results. The extracted cursor is recorded in processed
+    metadata as `next_cursor`.
+
+    Args:
+        total_query_hits:
+            Field name containing the total number of results for a query (used to determine if more pages exist)
+        records_per_page: Field name indicating the number of records on the current page
+        next_cursor: Field name containing the cursor used to request the next page of results
+
+    Example:
+        >>> from scholar_flux.api.models.response_metadata_map import CursorMetadataMap
+        >>> metadata_map = CursorMetadataMap(total_query_hits="meta.count", next_cursor="meta.next_cursor")
+        >>> metadata = {"meta": {"count": 1500, "next_cursor": "IlsxMDAuMDE0Nl0i"}, "results": [...]}
+        >>> metadata_map.process_metadata(metadata)
+        # OUTPUT: {'total_query_hits': 1500, 'records_per_page': None, 'next_cursor': 'IlsxMDAuMDE0Nl0i'}
+
+    """
+
+    next_cursor: Optional[str] = None
+
+    def calculate_next_cursor(self, metadata: dict[str, Any]) -> Optional[str]:
+        """Extract the cursor used to request the next page of results from response metadata.
+
+        Args:
+            metadata (dict[str, Any]):
+                A mapping containing response metadata (typically from ProcessedResponse.metadata)
+
+        Returns:
+            Optional[str]: The next cursor as a string if available and non-empty, otherwise None
+
+        Example:
+            >>> from scholar_flux.api.models.response_metadata_map import CursorMetadataMap
+            >>> metadata_map = CursorMetadataMap(next_cursor="meta.next_cursor")
+            >>> metadata = {"meta": {"count": 1500, "next_cursor": "IlsxMDAuMDE0Nl0i"}, "results": [...]}
+            >>> metadata_map.calculate_next_cursor(metadata)
+            # OUTPUT: 'IlsxMDAuMDE0Nl0i'
+
+        """
+        key = self.next_cursor or ""
+        value = self._extract_key(metadata, key)
+        return str(value) if value not in (None, "") and not isinstance(value, (dict, list)) else None
+
+    def process_metadata(self, metadata: dict[str, Any]) -> dict[str, Any]:
+        """Processes the total query hits and records per page alongside the cursor of the next page.
+
+        Args:
+            metadata (dict[str, Any]):
+                A mapping containing response metadata (typically from ProcessedResponse.metadata)
+
+        Returns:
+            metadata (dict[str, Any]):
+                A mapped dictionary of processed metadata fields including the `next_cursor`.
+
+        """
+        return super().process_metadata(metadata) | {"next_cursor": self.calculate_next_cursor(metadata)}
+
+
+__all__ = ["ResponseMetadataMap", "CursorMetadataMap"]
@@ -16,10 +16,19 @@ Classes:
         request or the sending/retrieval of a response.
 
 """
-from typing import Optional, Dict, List, Any, MutableMapping
+from typing import Optional, Dict, List, Any, Callable, FrozenSet, Iterable, Mapping, MutableMapping
 from scholar_flux.exceptions import InvalidResponseReconstructionException, RecordNormalizationException
 from typing_extensions import Self
-from pydantic import BaseModel, field_serializer, field_validator
+from pydantic import (
+    BaseModel,
+    PrivateAttr,
+    TypeAdapter,
+    ValidatorFunctionWrapHandler,
+    computed_field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 from scholar_flux.api.models.reconstructed_response import ReconstructedResponse
 from scholar_flux.utils.helpers import generate_iso_timestamp, parse_iso_timestamp, format_iso_timestamp, coerce_int
 from scholar_flux.utils import CacheDataEncoder, generate_repr, generate_repr_from_string, truncate
@@ -38,6 +47,16 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+# the stages of a ProcessedResponse that can be omitted from cache and recomputed when first accessed
+DEFERRABLE_STAGES: FrozenSet[str] = frozenset({"parsed_response", "extracted_records", "normalized_records"})
+
+# validates the deferrable stages of a ProcessedResponse, which are held as private attributes instead of fields
+_STAGE_ADAPTERS: Dict[str, TypeAdapter] = {
+    "parsed_response": TypeAdapter(Optional[Any]),
+    "extracted_records": TypeAdapter(Optional[List[dict[str, Any]] | List[dict[str | int, Any]]]),
+    "normalized_records": TypeAdapter(Optional[List[dict[str, Any]]]),
+}
+
 
 class APIResponse(BaseModel):
     """A Response wrapper for responses of different types that allows consistency when using several possible backends.
@@ -288,7 +307,8 @@ class APIResponse(BaseModel):
 
         """
 
-        model_kwargs = {field: kwargs.pop(field, None) for field in cls.model_fields if field in kwargs}
+        model_fields = set(cls.model_fields) | set(cls.model_computed_fields)
+        model_kwargs = {field: kwargs.pop(field, None) for field in model_fields if field in kwargs}
 
         response = (
             ReconstructedResponse.build(response, **kwargs) if not isinstance(response, requests.Response) else response
@@ -596,6 +616,11 @@ class ErrorResponse(APIResponse):
         """Provided for type hinting + compatibility."""
         return None
 
+    @property
+    def next_cursor(self) -> None:
+        """Provided for type hinting + compatibility."""
+        return None
+
     @property
     def data(self) -> None:
         """Provided for type hinting + compatibility."""
@@ -704,16 +729,153 @@ class ProcessedResponse(APIResponse):
     3. processed records (aliased as data),
     4. and any additional messages An error field is provided for compatibility with the ErrorResponse class.
 
+    When rebuilt from a cached page that omits the parsed response, extracted records, or normalized records, these
+    stages can be deferred with `defer_stages()` and are recomputed once, when any deferred stage is first accessed.
+    The deferrable stages are held as private attributes and exposed with properties that are serialized as computed
+    fields, so that dumping or comparing responses also recomputes deferred stages.
+
     """
 
-    parsed_response: Optional[Any] = None
-    extracted_records: Optional[List[dict[str, Any]] | List[dict[str | int, Any]]] = None
     processed_records: Optional[List[dict[str, Any]] | List[dict[str | int, Any]]] = None
-    normalized_records: Optional[List[dict[str, Any]]] = None
     metadata: Optional[dict[str, Any] | dict[str, Any]] = None
     processed_metadata: Optional[dict[str, Any]] = None
     message: Optional[str] = None
 
+    # deferrable stages are held privately and exposed (and serialized) with the properties defined below
+    _parsed_response: Optional[Any] = PrivateAttr(default=None)
+    _extracted_records: Optional[List[dict[str, Any]] | List[dict[str | int, Any]]] = PrivateAttr(default=None)
+    _normalized_records: Optional[List[dict[str, Any]]] = PrivateAttr(default=None)
+
+    # stages omitted from cache that are recomputed by the loader when first accessed
+    _deferred_stages: FrozenSet[str] = PrivateAttr(default=frozenset())
+    _stage_loader: Optional[Callable[[], Dict[str, Any]]] = PrivateAttr(default=None)
+
+    def __init__(
+        self,
+        *,
+        parsed_response: Optional[Any] = None,
+        extracted_records: Optional[List[dict[str, Any]] | List[dict[str | int, Any]]] = None,
+        normalized_records: Optional[List[dict[str, Any]]] = None,
+        **data: Any,
+    ) -> None:
+        """Initializes the response, validating the deferrable stages alongside the fields of the response."""
+        stages: Dict[str, Any] = dict(
+            parsed_response=parsed_response, extracted_records=extracted_records, normalized_records=normalized_records
+        )
+        super().__init__(**data, **stages)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _assign_stages(cls, data: Any, handler: ValidatorFunctionWrapHandler) -> Self:
+        """Validates the deferrable stages provided on creation and assigns each stage to its private attribute."""
+        stages = {}
+        if isinstance(data, dict) and not DEFERRABLE_STAGES.isdisjoint(data):
+            data = dict(data)
+            stages = {
+                stage: adapter.validate_python(data.pop(stage))
+                for stage, adapter in _STAGE_ADAPTERS.items()
+                if stage in data
+            }
+
+        processed_response = handler(data)
+        for stage, value in stages.items():
+            setattr(processed_response, f"_{stage}", value)
+        return processed_response
+
+    def _get_stage(self, stage: str) -> Any:
+        """Helper method that recomputes deferred stages, if needed, before returning the value of a stage."""
+        if stage in self._deferred_stages:
+            self.load_deferred_stages()
+        return getattr(self, f"_{stage}")
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def parsed_response(self) -> Optional[Any]:
+        """The response content parsed into a structured format. Recomputed on first access when deferred."""
+        return self._get_stage("parsed_response")
+
+    @parsed_response.setter
+    def parsed_response(self, parsed_response: Optional[Any]) -> None:
+        """Assigns the parsed response."""
+        self._parsed_response = parsed_response
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def extracted_records(self) -> Optional[List[dict[str, Any]] | List[dict[str | int, Any]]]:
+        """The records extracted from the parsed response. Recomputed on first access when deferred."""
+        return self._get_stage("extracted_records")
+
+    @extracted_records.setter
+    def extracted_records(self, extracted_records: Optional[List[dict[str, Any]] | List[dict[str | int, Any]]]) -> None:
+        """Assigns the extracted records."""
+        self._extracted_records = extracted_records
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def normalized_records(self) -> Optional[List[dict[str, Any]]]:
+        """The processed records normalized into a common structure. Recomputed on first access when deferred."""
+        return self._get_stage("normalized_records")
+
+    @normalized_records.setter
+    def normalized_records(self, normalized_records: Optional[List[dict[str, Any]]]) -> None:
+        """Assigns the normalized records."""
+        self._normalized_records = normalized_records
+
+    def defer_stages(self, stages: Iterable[str], loader: Callable[[], Dict[str, Any]]) -> None:
+        """Defers the computation of stages that were not cached until any of the stages is first accessed.
+
+        Args:
+            stages (Iterable[str]): The stages to defer. Stages other than those in `DEFERRABLE_STAGES` are ignored.
+            loader (Callable[[], Dict[str, Any]]): A callable that returns a dictionary of the recomputed stages.
+
+        """
+        self._deferred_stages = DEFERRABLE_STAGES.intersection(stages)
+        self._stage_loader = loader if self._deferred_stages else None
+
+    @property
+    def deferred_stages(self) -> FrozenSet[str]:
+        """The stages that have yet to be recomputed from the response."""
+        return self._deferred_stages
+
+    def load_deferred_stages(self) -> None:
+        """Recomputes all deferred stages. Stages that were assigned since they were deferred are left unchanged."""
+        loader, stages = self._stage_loader, self._deferred_stages
+        if loader is None:
+            return
+
+        # cleared beforehand so that the loader can access the current response without recursion
+        self._stage_loader, self._deferred_stages = None, frozenset()
+        recomputed = loader() or {}
+        for stage in stages:
+            if getattr(self, f"_{stage}") is None:
+                setattr(self, f"_{stage}", recomputed.get(stage))
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> Self:
+        """Copies the response, assigning updated stages to their private attributes instead of the model fields.
+
+        Args:
+            update (Optional[Mapping[str, Any]]): Values that replace the fields (and stages) of the copied response.
+            deep (bool): Whether to create a deep copy of the response.
+
+        Returns:
+            Self: The copied response.
+
+        """
+        stages = {}
+        if update and not DEFERRABLE_STAGES.isdisjoint(update):
+            update = dict(update)
+            stages = {stage: update.pop(stage) for stage in _STAGE_ADAPTERS if stage in update}
+
+        processed_response = super().model_copy(update=update, deep=deep)
+        for stage, value in stages.items():
+            setattr(processed_response, f"_{stage}", value)
+        return processed_response
+
+    def __getstate__(self) -> dict[Any, Any]:
+        """Recomputes deferred stages so that the loader, which is local to the current process, is not pickled."""
+        self.load_deferred_stages()
+        return super().__getstate__()
+
     @property
     def data(self) -> Optional[List[dict[str, Any]] | List[dict[str | int, Any]]]:
         """Alias to the processed_records attribute that holds a list of dictionaries, when available."""
@@ -754,6 +916,21 @@ class ProcessedResponse(APIResponse):
         processed_metadata = self.processed_metadata or {}
         return coerce_int(processed_metadata.get("records_per_page"))
 
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """Returns the cursor used to request the next page of results from providers that support cursor pagination.
+
+        This method retrieves the `next_cursor` variable from the `processed_metadata` attribute, and if metadata
+        hasn't yet been processed, this method will then call `process_metadata()` manually to ensure that the field is
+        available.
+
+        """
+        if not self.processed_metadata:
+            self.process_metadata()
+
+        processed_metadata = self.processed_metadata or {}
+        return processed_metadata.get("next_cursor")
+
     def process_metadata(
         self, metadata_map: Optional[ResponseMetadataMap] = None, update_metadata: Optional[bool] = None
     ) -> Optional[dict[str, Any]]:
@@ -21,6 +21,7 @@ from scholar_flux.api.normalization import BaseFieldMap
 from scholar_flux.api.models import ResponseMetadataMap
 from scholar_flux.exceptions import RecordNormalizationException
 from scholar_flux.api.providers import provider_registry
+from scholar_flux.utils.columnar import columns_to_arrow
 from typing import Optional, Any, MutableSequence, Iterable, Literal
 from requests import Response
 from pydantic import BaseModel, Field, AliasChoices
@@ -43,6 +44,8 @@ class SearchResult(BaseModel):
         response_result (Optional[ProcessedResponse | ErrorResponse]):
             The response result containing the specifics of the data retrieved from the response
             or the error messages recorded if the request is not successful.
+        cursor (Optional[str]):
+            The cursor used to request the current page when pages are retrieved with cursor pagination.
 
     For convenience, the properties of the `response_result` are referenced as properties of
     the SearchResult, including: `response`, `parsed_response`, `processed_records`, etc.
@@ -53,6 +56,7 @@ class SearchResult(BaseModel):
     provider_name: str
     page: int = Field(..., ge=0, validation_alias=AliasChoices("page", "page_number"))
     response_result: Optional[ProcessedResponse | ErrorResponse] = None
+    cursor: Optional[str] = None
 
     def __bool__(self) -> bool:
         """Makes the SearchResult truthy for ProcessedResponses and False for ErrorResponses/None."""
@@ -127,6 +131,11 @@ class SearchResult(BaseModel):
         """Returns the number of records sent on the current page according to the API-specific metadata field."""
         return self.response_result.records_per_page if self.response_result else None
 
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """Returns the cursor that requests the page following the current page when cursor pagination is supported."""
+        return self.response_result.next_cursor if self.response_result else None
+
     @property
     def processed_records(self) -> Optional[list[dict[Any, Any]]]:
         """Contains the processed records from the APIResponse processing step after a successfully received response
@@ -330,6 +339,8 @@ class SearchResultList(list[SearchResult]):
         - SearchResultList.filter: Removes NonResponses and ErrorResponses from the list of SearchResults
         - SearchResultList.filter: Removes NonResponses and ErrorResponses from the list of SearchResults
         - SearchResultList.join: Combines all records from ProcessedResponses into a list of dictionary-based records
+        - SearchResultList.to_columns: Combines all records from ProcessedResponses into a dictionary of columns
+        - SearchResultList.to_arrow: Combines all records from ProcessedResponses into a `pyarrow.Table`
 
     Note Attempts to add other classes to the SearchResultList other than SearchResults will raise a TypeError.
 
@@ -399,6 +410,72 @@ class SearchResultList(list[SearchResult]):
             self._resolve_record(record, item, include) for item in self for record in self._get_records(item) if record
         ]
 
+    def to_columns(
+        self, include: Optional[set[Literal["query", "provider_name", "page"]]] = None
+    ) -> dict[str, list[Any]]:
+        """Combines all successfully processed API responses into a dictionary of columns that can be loaded into
+        column-oriented tools such as Arrow and Polars.
+
+        The columns contain the same records as `SearchResultList.join`, but the records of each page are copied into
+        columns directly instead of creating a new dictionary for each record, and the fields of each page (e.g.
+        `provider_name` and `page`) are retrieved once per page. Records that do not contain a field are assigned None
+        within the column of the field.
+
+        Args:
+            include (Optional[set[Literal['query', 'provider_name', 'page']]]):
+                Optionally adds the specified model fields as columns. Possible fields include `provider_name`,
+                `query`, and `page`. By default, `provider_name` and `page` are added.
+
+        Returns:
+            dict[str, list[Any]]: A dictionary mapping each field to the list of its values across all records.
+
+        Example:
+            >>> columns = search_results.to_columns(include={'provider_name', 'page'})
+            >>> import polars as pl
+            >>> df = pl.DataFrame(columns)
+
+        """
+        fields: set[str] = set(include if include is not None else ("provider_name", "page"))
+        pages = [
+            (records, item.model_dump(include=fields))
+            for item in self
+            if (records := [record for record in self._get_records(item) if record])
+        ]
+
+        # columns are ordered by the first appearance of each field, followed by the fields of each page
+        column_names: dict[Any, None] = {}
+        for records, page_fields in pages:
+            for record in records:
+                column_names.update(dict.fromkeys(record))
+        column_names.update(dict.fromkeys(pages[0][1] if pages else sorted(fields)))
+
+        columns: dict[Any, list[Any]] = {name: [] for name in column_names}
+        for records, page_fields in pages:
+            for name, column in columns.items():
+                if name in page_fields:
+                    # the fields of the page take precedence over record fields of the same name, as in `join`
+                    column.extend([page_fields[name]] * len(records))
+                else:
+                    column.extend([record.get(name) for record in records])
+        return columns
+
+    def to_arrow(self, include: Optional[set[Literal["query", "provider_name", "page"]]] = None) -> Any:
+        """Combines all successfully processed API responses into a `pyarrow.Table`.
+
+        Args:
+            include (Optional[set[Literal['query', 'provider_name', 'page']]]):
+                Optionally adds the specified model fields as columns. Possible fields include `provider_name`,
+                `query`, and `page`. By default, `provider_name` and `page` are added.
+
+        Returns:
+            pyarrow.Table: A table containing a column for each field of the combined records.
+
+        Raises:
+            PyArrowImportError: If the optional `pyarrow` package is not installed.
+
+        """
+        return columns_to_arrow(self.to_columns(include))
+
     @classmethod
     def _get_records(cls, item: SearchResult) -> list[dict[str, Any]] | list[dict[str | int, Any]]:
         """Extracts a list of records (dictionaries) from a SearchResult."""
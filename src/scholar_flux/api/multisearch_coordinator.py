@@ -6,9 +6,10 @@ This implementation uses shared rate limiting to ensure that rate limits to diff
 
 """
 from __future__ import annotations
-from typing import Optional, Generator, Sequence, Iterable
+from typing import Optional, Generator, Sequence, Iterable, Any
 from concurrent.futures import ThreadPoolExecutor
-import concurrent.futures
+import threading
+import queue
 import logging
 
 from collections import UserDict, defaultdict
@@ -17,6 +18,7 @@ from scholar_flux.utils import generate_repr_from_string
 from scholar_flux.api.models import SearchResultList, SearchResult, PageListInput
 from scholar_flux.api.rate_limiting import threaded_rate_limiter_registry
 from scholar_flux.api import SearchAPI, SearchCoordinator, ErrorResponse, APIResponse, NonResponse
+from scholar_flux.sessions import SessionPool
 from scholar_flux.exceptions import InvalidCoordinatorParameterException
 
 
@@ -38,6 +40,15 @@ class MultiSearchCoordinator(UserDict):
     For new, unregistered providers, users can override the `MultiSearchCoordinator.DEFAULT_THREADED_REQUEST_DELAY`
     class variable to adjust the shared request_delay.
 
+    When a `SessionPool` is provided, coordinators requesting the same host with the same cache backend are also assigned
+    a shared session on `add()` so that keep-alive connections opened for one query are reused by all other queries to
+    the same host. The shared session is a copy created by the pool, so the coordinator's original session is unchanged.
+
+    Args:
+        session_pool (Optional[SessionPool]):
+            An optional pool used to share a single session per host and cache backend between all coordinators added
+            to the MultiSearchCoordinator. When not provided, each coordinator continues to use its own session.
+
     # Examples:
 
         >>> from scholar_flux import MultiSearchCoordinator, SearchCoordinator, RecursiveDataProcessor
@@ -71,19 +82,35 @@ class MultiSearchCoordinator(UserDict):
         >>> # Extracts successfully processed records into a list of records where each record is a dictionary
         >>> record_dict = filtered_pages.join() # retrieves a list of records
         >>> print(record_dict)  # Output will be a flattened list of all records
+        >>>
+        >>> # Share connections between coordinators requesting the same host
+        >>> from scholar_flux.sessions import SessionPool
+        >>> pooled_coordinator = MultiSearchCoordinator(session_pool=SessionPool(pool_maxsize=16))
+        >>> pooled_coordinator.add_coordinators(coordinators)
+        >>> assert len({coordinator.api.session for coordinator in pooled_coordinator.coordinators}) <= 4
 
     """
 
     DEFAULT_THREADED_REQUEST_DELAY: float | int = 6.0
+    DEFAULT_MAX_BUFFERED_RESULTS: int = 16
+    QUEUE_POLL_INTERVAL: float = 0.1
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, session_pool: Optional[SessionPool] = None, **kwargs):
         """Initializes the MultiSearchCoordinator, allowing positional and keyword arguments to be specified when
         creating the MultiSearchCoordinator.
 
         The initialization of the MultiSearchCoordinator operates similarly to that of a regular dict with the caveat
         that values are statically typed as SearchCoordinator instances.
 
+        Args:
+            session_pool (Optional[SessionPool]): An optional pool used to share sessions between coordinators by host.
+
         """
+        if session_pool is not None and not isinstance(session_pool, SessionPool):
+            raise InvalidCoordinatorParameterException(
+                f"Expected a SessionPool for the `session_pool` parameter, received type {type(session_pool)}"
+            )
+        self.session_pool = session_pool
         super().__init__(*args, **kwargs)
 
     def __setitem__(
@@ -134,6 +161,7 @@ class MultiSearchCoordinator(UserDict):
         """
         self._verify_search_coordinator(search_coordinator)
         search_coordinator = self._normalize_rate_limiter(search_coordinator)
+        search_coordinator = self._share_session(search_coordinator)
         key = self._create_key(search_coordinator)
 
         # skipping re-evaluation via __setitem___
@@ -348,7 +376,11 @@ class MultiSearchCoordinator(UserDict):
                 provider_generator_dict.pop(provider_name)
 
     def iter_pages_threaded(
-        self, pages: Sequence[int] | PageListInput, max_workers: Optional[int] = None, **kwargs
+        self,
+        pages: Sequence[int] | PageListInput,
+        max_workers: Optional[int] = None,
+        max_buffered_results: Optional[int] = None,
+        **kwargs,
     ) -> Generator[SearchResult, None, None]:
         """Threading by provider to respect rate limits Helper method that implements threading to simultaneously
         retrieve a sequence of generator functions for retrieving and processing records from each combination of
@@ -358,11 +390,20 @@ class MultiSearchCoordinator(UserDict):
         should halt for each API provider, accounting for errors, timeouts, and less than the expected amount of
         records before filtering records with pre-specified criteria.
 
+        Results are streamed: each worker thread pushes every SearchResult onto a bounded queue as soon as the page is
+        processed, and the generator yields each result immediately. When the consumer falls behind and the queue is
+        full, workers pause before requesting further pages (backpressure), limiting the number of pages held in memory
+        to roughly `max_buffered_results`. If the consumer stops iterating early, workers halt after their current page.
+
         Note, that as threading is performed by provider, this method will not differ significantly in speed from
         the `MultiSearchCoordinator.iter_pages` method if only a single provider has been specified.
 
         Args:
             pages (Sequence[int] | PageListInput): A sequence of page numbers to request from the API Provider.
+            max_workers (Optional[int]): The number of worker threads. Defaults to the number of providers (up to 8).
+            max_buffered_results (Optional[int]):
+                The maximum number of processed results that can await consumption before workers pause.
+                Defaults to `MultiSearchCoordinator.DEFAULT_MAX_BUFFERED_RESULTS`.
             from_request_cache (bool): This parameter determines whether to try to retrieve the response from the
                                        requests-cache storage.
             from_process_cache (bool): This parameter determines whether to attempt to pull processed responses from
@@ -376,7 +417,15 @@ class MultiSearchCoordinator(UserDict):
                           (provider_name), and the result of the search containing a ProcessedResponse, an ErrorResponse,
                           or None (api response)
 
+        Raises:
+            InvalidCoordinatorParameterException: If `max_buffered_results` is not a positive integer
+
         """
+        buffer_size = max_buffered_results if max_buffered_results is not None else self.DEFAULT_MAX_BUFFERED_RESULTS
+        if not isinstance(buffer_size, int) or buffer_size < 1:
+            raise InvalidCoordinatorParameterException(
+                f"Expected max_buffered_results to be a positive integer, received {max_buffered_results}"
+            )
 
         provider_groups = self.group_by_provider()
 
@@ -391,14 +440,83 @@ class MultiSearchCoordinator(UserDict):
             for provider_name, group in provider_groups.items()
         }
 
+        result_queue: queue.Queue[Any] = queue.Queue(maxsize=buffer_size)
+        stop_event = threading.Event()
+        sentinel = object()
+
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = [
-                executor.submit(list, self._process_page_generator(provider_name, generator))
-                for provider_name, generator in provider_generator_dict.items()
-            ]
+            for provider_name, generator in provider_generator_dict.items():
+                executor.submit(
+                    self._stream_page_generator, provider_name, generator, result_queue, stop_event, sentinel
+                )
 
-            for future in concurrent.futures.as_completed(futures):
-                yield from future.result()
+            try:
+                remaining = len(provider_generator_dict)
+                while remaining:
+                    search_result = result_queue.get()
+                    if search_result is sentinel:
+                        remaining -= 1
+                        continue
+                    yield search_result
+            finally:
+                # signals workers to halt when the consumer stops early: workers finish at most their current page
+                stop_event.set()
+
+    @classmethod
+    def _stream_page_generator(
+        cls,
+        provider_name: str,
+        generator: Generator[SearchResult, None, None],
+        result_queue: queue.Queue,
+        stop_event: threading.Event,
+        sentinel: object,
+    ) -> None:
+        """Helper method that consumes a provider generator within a worker thread, pushing each SearchResult onto a
+        bounded queue as it becomes available.
+
+        The next page is only requested after the previous result has been placed in the queue, so a full queue pauses
+        the worker. A sentinel is always placed in the queue after the generator is exhausted or halted.
+
+        Args:
+            provider_name (str): The name of the current provider
+            generator (Generator[SearchResult, None, None]):
+                A generator that returns a SearchResult upon the successful retrieval of the next page
+            result_queue (queue.Queue): The bounded queue shared between worker threads and the consumer
+            stop_event (threading.Event): An event indicating that the consumer has stopped iterating
+            sentinel (object): The object placed in the queue to indicate that the worker has finished
+
+        """
+        page_generator = cls._process_page_generator(provider_name, generator)
+        try:
+            # workers queued behind others may start after the consumer has already stopped iterating
+            while not stop_event.is_set():
+                search_result = next(page_generator, sentinel)
+                if search_result is sentinel or not cls._put_until_stopped(result_queue, search_result, stop_event):
+                    break
+        finally:
+            page_generator.close()
+            cls._put_until_stopped(result_queue, sentinel, stop_event)
+
+    @classmethod
+    def _put_until_stopped(cls, result_queue: queue.Queue, item: Any, stop_event: threading.Event) -> bool:
+        """Helper method that blocks until an item is placed in a bounded queue or iteration is stopped.
+
+        Args:
+            result_queue (queue.Queue): The bounded queue to place the item into
+            item (Any): The item to add to the queue
+            stop_event (threading.Event): An event indicating that the consumer has stopped iterating
+
+        Returns:
+            bool: True if the item was added to the queue, False if the consumer stopped before space was available.
+
+        """
+        while not stop_event.is_set():
+            try:
+                result_queue.put(item, timeout=cls.QUEUE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
 
     @classmethod
     def _process_page_generator(
@@ -451,20 +569,7 @@ class MultiSearchCoordinator(UserDict):
         # will be used to flag non-retryable error codes from the provider for early stopping across queries if needed
         last_response: Optional[APIResponse] = None
         for search_coordinator in provider_coordinators.values():
-            provider_name = ProviderConfig._normalize_name(search_coordinator.api.provider_name)
-
-            if (
-                isinstance(last_response, ErrorResponse)
-                and not isinstance(last_response, NonResponse)
-                and isinstance(last_response.status_code, int)
-                and last_response != 200
-                and last_response.status_code not in search_coordinator.retry_handler.retry_statuses
-            ):
-                # breaks if a non-retryable status code is encountered.
-                logger.warning(
-                    f"Encountered a non-retryable response during retrieval: {last_response}. "
-                    f"Halting retrieval for provider, {provider_name}"
-                )
+            if self._halt_provider_group(last_response, search_coordinator):
                 break
 
             # retrieve the rate from within the threaded rate limiter
@@ -477,6 +582,34 @@ class MultiSearchCoordinator(UserDict):
                     last_response = page.response_result
                 yield page
 
+    @classmethod
+    def _halt_provider_group(cls, last_response: Optional[APIResponse], search_coordinator: SearchCoordinator) -> bool:
+        """Helper method that determines whether retrieval for a provider group should halt before the next coordinator.
+
+        Args:
+            last_response (Optional[APIResponse]): The last response received from the current provider.
+            search_coordinator (SearchCoordinator): The next coordinator scheduled to retrieve data from the provider.
+
+        Returns:
+            bool: True if the last response contains a non-retryable error status code, and False otherwise.
+
+        """
+        if (
+            isinstance(last_response, ErrorResponse)
+            and not isinstance(last_response, NonResponse)
+            and isinstance(last_response.status_code, int)
+            and last_response != 200
+            and last_response.status_code not in search_coordinator.retry_handler.retry_statuses
+        ):
+            provider_name = ProviderConfig._normalize_name(search_coordinator.api.provider_name)
+            # breaks if a non-retryable status code is encountered.
+            logger.warning(
+                f"Encountered a non-retryable response during retrieval: {last_response}. "
+                f"Halting retrieval for provider, {provider_name}"
+            )
+            return True
+        return False
+
     def current_providers(self) -> set[str]:
         """Extracts a set of names corresponding to the each API provider assigned to the MultiSearchCoordinator."""
         return {ProviderConfig._normalize_name(coordinator.api.provider_name) for coordinator in self.data.values()}
@@ -515,6 +648,19 @@ class MultiSearchCoordinator(UserDict):
             search_coordinator.api = SearchAPI.update(search_coordinator.api, rate_limiter=threaded_rate_limiter)
         return search_coordinator
 
+    def _share_session(self, search_coordinator: SearchCoordinator) -> SearchCoordinator:
+        """Helper method that assigns the shared session for the host of the coordinator's base URL when a
+        `SessionPool` is available."""
+        if self.session_pool is None:
+            return search_coordinator
+
+        api = search_coordinator.api
+        shared_session = self.session_pool.get_or_create(api.base_url, api.session)
+
+        if shared_session is not api.session:
+            search_coordinator.api = SearchAPI.update(api, session=shared_session)
+        return search_coordinator
+
     @classmethod
     def _create_key(cls, search_coordinator: SearchCoordinator):
         """Create a hashed key from a coordinator using the provider name, query, and structure of the
@@ -19,7 +19,7 @@ Direct addition for auth headers may be added in the future when needed.
 from scholar_flux.api.models.provider_config import ProviderConfig
 from scholar_flux.api.models.base_parameters import BaseAPIParameterMap, APISpecificParameter
 from scholar_flux.api.validators import validate_and_process_email
-from scholar_flux.api.models.response_metadata_map import ResponseMetadataMap
+from scholar_flux.api.models.response_metadata_map import CursorMetadataMap
 from scholar_flux.api.normalization.crossref_field_map import field_map
 
 provider = ProviderConfig(
@@ -30,6 +30,8 @@ provider = ProviderConfig(
         api_key_parameter=None,
         api_key_required=False,
         auto_calculate_page=True,
+        cursor="cursor",
+        initial_cursor="*",
         api_specific_parameters=dict(
             mailto=APISpecificParameter(
                 name="mailto",
@@ -39,7 +41,9 @@ provider = ProviderConfig(
             ),
         ),
     ),
-    metadata_map=ResponseMetadataMap(total_query_hits="total-results", records_per_page="items-per-page"),
+    metadata_map=CursorMetadataMap(
+        total_query_hits="total-results", records_per_page="items-per-page", next_cursor="next-cursor"
+    ),
     field_map=field_map,
     provider_name="crossref",
     base_url="https://api.crossref.org/works",
@@ -2,7 +2,7 @@
 """Defines the core configuration necessary to interact with the OpenAlex API using the scholar_flux package."""
 from scholar_flux.api.models.provider_config import ProviderConfig
 from scholar_flux.api.models.base_parameters import BaseAPIParameterMap
-from scholar_flux.api.models.response_metadata_map import ResponseMetadataMap
+from scholar_flux.api.models.response_metadata_map import CursorMetadataMap
 from scholar_flux.api.normalization.open_alex_field_map import field_map
 
 provider = ProviderConfig(
@@ -14,8 +14,10 @@ provider = ProviderConfig(
         api_key_required=False,
         auto_calculate_page=False,
         zero_indexed_pagination=False,
+        cursor="cursor",
+        initial_cursor="*",
     ),
-    metadata_map=ResponseMetadataMap(total_query_hits="count", records_per_page="per_page"),
+    metadata_map=CursorMetadataMap(total_query_hits="count", records_per_page="per_page", next_cursor="next_cursor"),
     field_map=field_map,
     provider_name="openalex",
     base_url="https://api.openalex.org/works",
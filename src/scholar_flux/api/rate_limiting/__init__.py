@@ -11,6 +11,20 @@ Modules:
     **threaded_rate_limiter**:
         Inherits from the basic RateLimiter class to account for multithreading scenarios that require the same
         resource. The usage is the same, but it is thread-safe.
+    **reservation_rate_limiter**:
+        Implements the reservation logic and optional daily quota shared by the quota-aware rate limiters below.
+    **daily_quota_rate_limiter**:
+        Extends the ReservationRateLimiter to enforce a quota on the number of requests sent per UTC day.
+    **token_bucket_rate_limiter**:
+        Implements a token bucket that allows short bursts of requests while maintaining a sustained request rate.
+    **sliding_window_rate_limiter**:
+        Implements a sliding-window log that allows a maximum number of requests within any rolling window.
+    **adaptive_rate_limiter**:
+        Adjusts the interval between requests using the rate limit headers and status codes sent by providers.
+    **redis_rate_limiter**:
+        Shares reserved time slots across processes and hosts using Redis (requires the optional `redis` dependency).
+    **sqlite_rate_limiter**:
+        Shares reserved time slots across processes on a single host using a SQLite database file.
     **retry_handler**:
         Basic implementation that defines a period of time to wait in between requests that are unsuccessful.
         This class is used to automatically retry failed requests until successful or the maximum retry limit has
@@ -21,6 +35,20 @@ Classes:
         The most basic rate limiter used for throttling requests using a constant interval
     **ThreadedRateLimiter**:
         A thread-safe implementation that inherits from the RateLimiter to apply in multithreading
+    **ReservationRateLimiter**:
+        A thread-safe base class that reserves time slots under a lock and enforces an optional daily request quota
+    **DailyQuotaRateLimiter**:
+        A thread-safe rate limiter that additionally enforces a daily request quota
+    **TokenBucketRateLimiter**:
+        A thread-safe token bucket rate limiter with burst support
+    **SlidingWindowRateLimiter**:
+        A thread-safe rate limiter that limits the number of requests within a rolling window
+    **AdaptiveRateLimiter**:
+        A thread-safe rate limiter that tightens or relaxes its interval based on provider feedback (AIMD)
+    **RedisRateLimiter**:
+        A distributed rate limiter that throttles requests across processes and hosts sharing a Redis server
+    **SQLiteRateLimiter**:
+        A multi-process rate limiter that throttles requests across processes sharing a SQLite database file
     **RetryHandler**:
         Used to define the period of time to wait before sending a failed request with applications of max backoff and
         backoff_factor to assist in dynamically timing requests on successive request failures.
@@ -48,7 +76,14 @@ Example usage:
 """
 from scholar_flux.api.rate_limiting.rate_limiter import RateLimiter
 from scholar_flux.api.rate_limiting.threaded_rate_limiter import ThreadedRateLimiter
+from scholar_flux.api.rate_limiting.reservation_rate_limiter import ReservationRateLimiter
+from scholar_flux.api.rate_limiting.daily_quota_rate_limiter import DailyQuotaRateLimiter
+from scholar_flux.api.rate_limiting.token_bucket_rate_limiter import TokenBucketRateLimiter
+from scholar_flux.api.rate_limiting.sliding_window_rate_limiter import SlidingWindowRateLimiter
 from scholar_flux.api.rate_limiting.retry_handler import RetryHandler
+from scholar_flux.api.rate_limiting.adaptive_rate_limiter import AdaptiveRateLimiter
+from scholar_flux.api.rate_limiting.redis_rate_limiter import RedisRateLimiter
+from scholar_flux.api.rate_limiting.sqlite_rate_limiter import SQLiteRateLimiter
 from scholar_flux.api.models.rate_limiter_registry import RateLimiterRegistry
 
 rate_limiter_registry = RateLimiterRegistry.from_defaults(threaded=False)
@@ -57,6 +92,13 @@ threaded_rate_limiter_registry = RateLimiterRegistry.from_defaults(threaded=True
 __all__ = [
     "RateLimiter",
     "ThreadedRateLimiter",
+    "ReservationRateLimiter",
+    "DailyQuotaRateLimiter",
+    "TokenBucketRateLimiter",
+    "SlidingWindowRateLimiter",
+    "AdaptiveRateLimiter",
+    "RedisRateLimiter",
+    "SQLiteRateLimiter",
     "RetryHandler",
     "rate_limiter_registry",
     "threaded_rate_limiter_registry",
@@ -0,0 +1,205 @@
+# /api/rate_limiting/adaptive_rate_limiter.py
+"""The scholar_flux.api.rate_limiting.adaptive_rate_limiter module implements the AdaptiveRateLimiter.
+
+Rather than relying on a conservative, fixed `request_delay`, the `AdaptiveRateLimiter` adjusts its interval from the
+feedback that providers send with each response:
+
+- `X-RateLimit-Remaining` and `X-RateLimit-Reset` (or the `RateLimit-*` equivalents) pace the remaining quota evenly
+  until the quota resets.
+- `Retry-After` headers pause all calls until the indicated time has passed.
+- `429` (Too Many Requests) responses multiplicatively increase the interval, while successful responses without
+  rate limit headers additively decrease it (AIMD), always within the configured bounds.
+
+"""
+from __future__ import annotations
+import time
+from typing import Optional, Mapping
+import requests
+from scholar_flux.api.rate_limiting.rate_limiter import RateLimiter
+from scholar_flux.api.rate_limiting.reservation_rate_limiter import ReservationRateLimiter
+from scholar_flux.api.rate_limiting.retry_handler import RetryHandler
+from scholar_flux.exceptions import APIParameterException
+from scholar_flux.utils.response_protocol import ResponseProtocol
+from scholar_flux.utils.helpers import get_first_available_key
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveRateLimiter(ReservationRateLimiter):
+    """Thread-safe rate limiter that tightens or relaxes its interval based on the responses received from a provider.
+
+    The current interval is stored in `min_interval` and always remains between `lower_bound` and `upper_bound`. After
+    each response is received, `observe()` updates the interval:
+
+    1. A `429` status code multiplies the interval by `increase_factor` (multiplicative increase). Intervals smaller
+       than `DEFAULT_BACKOFF_STEP` (e.g., an initial interval of 0) are increased from `DEFAULT_BACKOFF_STEP` instead.
+    2. `X-RateLimit-Remaining`/`X-RateLimit-Reset` headers set the interval to the time until the reset divided by the
+       number of remaining requests. When no requests remain, calls are paused until the reset.
+    3. A `Retry-After` header pauses calls until the indicated number of seconds has elapsed.
+    4. Other successful responses decrease the interval by `decrease_step` seconds (additive decrease).
+
+    Because the interval is driven by response feedback, intervals passed to `wait()` or `rate()` (e.g., the
+    `request_delay` of a `SearchAPI`) are ignored in favor of the adaptive interval.
+
+    Args:
+        min_interval (Optional[float | int]): The initial interval between calls.
+        lower_bound (float | int): The smallest interval the limiter can relax to.
+        upper_bound (Optional[float | int]):
+            The largest interval the limiter can tighten to. Defaults to `AdaptiveRateLimiter.DEFAULT_UPPER_BOUND` or
+            the initial interval, whichever is larger.
+        increase_factor (float | int): The factor used to multiply the interval when a 429 response is received.
+        decrease_step (Optional[float | int]):
+            The number of seconds subtracted from the interval after each successful response. Defaults to 5% of the
+            initial interval.
+        daily_limit (Optional[int]): An optional maximum number of calls allowed per UTC day.
+
+    Examples:
+        >>> from scholar_flux.api import SearchAPI, AdaptiveRateLimiter
+        >>> rate_limiter = AdaptiveRateLimiter(min_interval=6.1, lower_bound=0.5)
+        >>> api = SearchAPI.update(SearchAPI(query='machine learning', provider_name='plos'), rate_limiter=rate_limiter)
+        >>> response = api.search(page=1)
+        >>> # the interval is relaxed or tightened after each response depending on the headers and status code
+        >>> rate_limiter.min_interval
+        # OUTPUT: 5.795
+
+    """
+
+    DEFAULT_UPPER_BOUND: float = 60.0
+    DEFAULT_DECREASE_RATIO: float = 0.05
+    # the smallest interval (in seconds) that is multiplied by `increase_factor` when a 429 response is received
+    DEFAULT_BACKOFF_STEP: float = 0.1
+    THROTTLED_STATUSES: frozenset[int] = frozenset({429})
+    REMAINING_HEADERS: tuple[str, ...] = ("x-ratelimit-remaining", "ratelimit-remaining")
+    RESET_HEADERS: tuple[str, ...] = ("x-ratelimit-reset", "ratelimit-reset")
+    LIMIT_HEADERS: tuple[str, ...] = ("x-ratelimit-limit", "ratelimit-limit")
+
+    def __init__(
+        self,
+        min_interval: Optional[float | int] = None,
+        lower_bound: float | int = 0,
+        upper_bound: Optional[float | int] = None,
+        increase_factor: float | int = 2,
+        decrease_step: Optional[float | int] = None,
+        daily_limit: Optional[int] = None,
+    ):
+        """Initializes the adaptive rate limiter with its initial interval, bounds, and AIMD settings."""
+        super().__init__(min_interval, daily_limit=daily_limit)
+        self.lower_bound = self._validate(lower_bound)
+        self.upper_bound = self._validate(
+            upper_bound if upper_bound is not None else max(self.DEFAULT_UPPER_BOUND, self.min_interval)
+        )
+
+        if self.lower_bound > self.upper_bound:
+            raise APIParameterException(
+                f"`lower_bound` ({self.lower_bound}) must not exceed `upper_bound` ({self.upper_bound})"
+            )
+
+        if not isinstance(increase_factor, (int, float)) or increase_factor < 1:
+            raise APIParameterException(f"`increase_factor` must be a number >= 1. Received value, '{increase_factor}'")
+
+        self.increase_factor = increase_factor
+        self.decrease_step = self._validate(
+            decrease_step if decrease_step is not None else self.min_interval * self.DEFAULT_DECREASE_RATIO
+        )
+        self.min_interval = self._clamp(self.min_interval)
+        self.limit: Optional[int] = None
+        self.throttled_responses: int = 0
+        self._blocked_until: Optional[float] = None
+
+    def _clamp(self, interval: float | int) -> float | int:
+        """Helper method that restricts an interval to the range between `lower_bound` and `upper_bound`."""
+        return min(max(interval, self.lower_bound), self.upper_bound)
+
+    def _reserve_slot(self, min_interval: float | int) -> Optional[float]:
+        """Reserves the next slot using the adaptive interval, deferring the slot while calls are paused."""
+        now = time.time()
+        slot = RateLimiter._reserve(self, self.min_interval) or now
+
+        if self._blocked_until is not None and self._blocked_until > slot:
+            slot = self._blocked_until
+            self._last_call = slot
+
+        return slot if slot > now else None
+
+    @classmethod
+    def _header_value(cls, headers: Mapping, keys: tuple[str, ...]) -> Optional[float]:
+        """Helper method that extracts the first available numeric header value from a set of candidate keys."""
+        value = get_first_available_key(headers, keys, case_sensitive=False)
+        try:
+            return float(value) if value is not None else None
+        except (TypeError, ValueError):
+            logger.debug(f"Could not parse the rate limit header value, '{value}' as a number")
+            return None
+
+    @classmethod
+    def _parse_reset(cls, reset: float, now: float) -> float:
+        """Converts a reset header into the number of seconds until reset, accounting for epoch timestamps."""
+        # values larger than a year in seconds are interpreted as epoch timestamps rather than a delay
+        return max(reset - now, 0) if reset > 365 * 24 * 60 * 60 else reset
+
+    def observe(self, response: Optional[requests.Response | ResponseProtocol]) -> None:
+        """Updates the adaptive interval using the status code and rate limit headers of a response.
+
+        Args:
+            response (Optional[requests.Response | ResponseProtocol]): The response received from the provider.
+
+        """
+        if response is None:
+            return
+
+        headers = {k: v for k, v in (getattr(response, "headers", None) or {}).items() if v is not None}
+        status_code = getattr(response, "status_code", None)
+        retry_after = RetryHandler.get_retry_after(response)
+        remaining = self._header_value(headers, self.REMAINING_HEADERS)
+        reset = self._header_value(headers, self.RESET_HEADERS)
+        limit = self._header_value(headers, self.LIMIT_HEADERS)
+
+        with self._lock:
+            now = time.time()
+            previous_interval = self.min_interval
+
+            if limit is not None:
+                self.limit = int(limit)
+
+            if status_code in self.THROTTLED_STATUSES:
+                self.throttled_responses += 1
+                backoff_interval = max(self.min_interval, self.decrease_step, self.DEFAULT_BACKOFF_STEP)
+                self.min_interval = self._clamp(backoff_interval * self.increase_factor)
+            elif remaining is not None and reset is not None:
+                seconds_until_reset = self._parse_reset(reset, now)
+                if remaining < 1:
+                    self._pause_until(now + seconds_until_reset)
+                else:
+                    self.min_interval = self._clamp(seconds_until_reset / remaining)
+            elif status_code is not None and 200 <= status_code < 300:
+                self.min_interval = self._clamp(self.min_interval - self.decrease_step)
+
+            if retry_after:
+                self._pause_until(now + retry_after)
+
+            if self.min_interval != previous_interval:
+                logger.debug(
+                    f"AdaptiveRateLimiter: adjusted the interval from {previous_interval:.3f}s "
+                    f"to {self.min_interval:.3f}s"
+                )
+
+    def _pause_until(self, timestamp: float) -> None:
+        """Helper method that defers all calls until the provided timestamp. Must be called while holding the lock."""
+        self._blocked_until = max(self._blocked_until or timestamp, timestamp)
+        logger.info(f"AdaptiveRateLimiter: pausing requests for {timestamp - time.time():.2f}s")
+
+    def __repr__(self) -> str:
+        """Shows the class name, current interval, and bounds of the current rate limiter."""
+        class_name = self.__class__.__name__
+        attributes = dict(
+            min_interval=self.min_interval,
+            lower_bound=self.lower_bound,
+            upper_bound=self.upper_bound,
+            daily_limit=self.daily_limit,
+        )
+        return generate_repr_from_string(class_name, attributes, flatten=True)
+
+
+__all__ = ["AdaptiveRateLimiter"]
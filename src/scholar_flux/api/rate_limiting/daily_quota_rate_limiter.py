@@ -0,0 +1,40 @@
+# /api/rate_limiting/daily_quota_rate_limiter.py
+"""The scholar_flux.api.rate_limiting.daily_quota_rate_limiter module implements the DailyQuotaRateLimiter.
+
+Several providers enforce a daily request budget in addition to a per-second rate limit. The `DailyQuotaRateLimiter`
+counts the requests reserved on the current (UTC) calendar day and raises a `RateLimitExceededException` instead of
+sending requests that would exceed the provider's daily budget.
+
+"""
+from __future__ import annotations
+from scholar_flux.api.rate_limiting.reservation_rate_limiter import ReservationRateLimiter
+
+
+class DailyQuotaRateLimiter(ReservationRateLimiter):
+    """Thread-safe rate limiter that spaces calls by `min_interval` and enforces an optional daily request quota.
+
+    The quota is counted per UTC calendar day and resets at midnight (UTC). When the quota has been exhausted, calls to
+    `wait()` raise a `RateLimitExceededException` rather than sleeping until the following day. The quota and the
+    reservation logic are inherited from the `ReservationRateLimiter` base class, which is shared with the
+    `TokenBucketRateLimiter` and `SlidingWindowRateLimiter`.
+
+    Args:
+        min_interval (Optional[float | int]):
+            The minimum number of seconds that must elapse between successive calls.
+        daily_limit (Optional[int]):
+            The maximum number of calls allowed per UTC day. The quota is not enforced when `daily_limit` is None.
+
+    Examples:
+        >>> from scholar_flux.api.rate_limiting import DailyQuotaRateLimiter
+        >>> rate_limiter = DailyQuotaRateLimiter(min_interval=0.1, daily_limit=2)
+        >>> rate_limiter.wait()
+        >>> rate_limiter.wait()
+        >>> rate_limiter.remaining_quota
+        # OUTPUT: 0
+        >>> rate_limiter.wait()
+        # OUTPUT: RateLimitExceededException: The daily quota of 2 requests has been exhausted...
+
+    """
+
+
+__all__ = ["DailyQuotaRateLimiter"]
@@ -6,13 +6,14 @@ provider does not exceed the limit within the specified time interval.
 
 """
 from __future__ import annotations
-from contextlib import contextmanager
+from contextlib import contextmanager, asynccontextmanager
 from typing_extensions import Self
+import asyncio
 import time
 from functools import wraps
 from scholar_flux.exceptions import APIParameterException
 from scholar_flux.utils.repr_utils import generate_repr_from_string
-from typing import Optional, Iterator
+from typing import Optional, Iterator, AsyncIterator
 import logging
 
 logger = logging.getLogger(__name__)
@@ -49,6 +50,10 @@ class RateLimiter:
         >>> # Or simply call the `wait` method directly:
         >>> rate_limiter.wait()
         >>> response = requests.get("http://httpbin.org/get")
+        >>> # Within coroutines, `async_wait` yields to the event loop instead of blocking with `time.sleep`:
+        >>> async def fetch():
+        ...     async with rate_limiter:
+        ...         return await asyncio.to_thread(requests.get, "http://httpbin.org/get")
 
     """
 
@@ -121,10 +126,76 @@ class RateLimiter:
             else (self.min_interval if self.min_interval is not None else self.DEFAULT_MIN_INTERVAL)
         )
 
-        if self._last_call is not None and min_interval:
-            self._wait(min_interval, self._last_call)
-        # record the time we actually proceed
-        self._last_call = time.time()
+        # reserve the next available slot, then sleep until the slot is reached
+        slot = self._reserve(min_interval)
+        if slot is not None:
+            self._wait(min_interval, slot - min_interval)
+
+    def _reserve(self, min_interval: float | int) -> Optional[float]:
+        """Helper method that reserves the next time slot at which a call can proceed without exceeding the rate limit.
+
+        The reserved slot is recorded as the time of the last call so that subsequent callers queue behind it. Because
+        only the reservation itself updates shared state, callers can compute their slot atomically and then wait for
+        the slot separately (e.g., outside of a lock or after yielding to the event loop).
+
+        Args:
+            min_interval (float | int): The minimum time that must elapse between successive calls.
+
+        Returns:
+            Optional[float]:
+                The timestamp (seconds since the epoch) at which the current call is allowed to proceed. None is
+                returned when the call can proceed immediately because no prior call was recorded or the interval is 0.
+
+        """
+        now = time.time()
+        if self._last_call is None or not min_interval:
+            # retains slots that were already reserved by other callers
+            self._last_call = max(now, self._last_call or now)
+            return None
+
+        slot = max(now, self._last_call + min_interval)
+        self._last_call = slot
+        return slot
+
+    async def async_wait(self, min_interval: Optional[float | int] = None) -> None:
+        """Asynchronous counterpart of `wait()` that suspends the current coroutine until at least `min_interval` has
+        passed since the last call.
+
+        Rather than blocking the thread with `time.sleep`, this method reserves the next available slot and then awaits
+        `asyncio.sleep` so that other coroutines sharing the event loop can continue to run in the meantime.
+
+        Args:
+            min_interval (Optional[float | int] = None):
+                The minimum time to wait until another call is sent. Uses `min_interval` attribute when not provided.
+
+        Exceptions:
+            APIParameterException: Occurs if the value provided is either not an integer/float or is less than 0
+
+        """
+        min_interval = self._validate(
+            min_interval
+            if min_interval is not None
+            else (self.min_interval if self.min_interval is not None else self.DEFAULT_MIN_INTERVAL)
+        )
+        slot = self._reserve(min_interval)
+        if slot is not None:
+            await self._async_wait(min_interval, slot - min_interval)
+
+    @staticmethod
+    async def _async_wait(min_interval: float | int, last_call: float | int) -> None:
+        """Asynchronous counterpart of `_wait()` that awaits `asyncio.sleep` for the time remaining in the interval.
+
+        Args:
+            min_interval (float | int): The minimum time to wait until another call is sent.
+            last_call (float | int): The start time. In context, the previously recorded time when
+                                    the function was called
+
+        """
+        remaining = min_interval - (time.time() - last_call)
+
+        if remaining > 0:
+            logger.info(f"RateLimiter: awaiting {remaining:.2f}s to respect rate limit")
+            await asyncio.sleep(remaining)
 
     @staticmethod
     def _wait(min_interval: float | int, last_call: float | int):
@@ -195,27 +266,51 @@ class RateLimiter:
         """Exits the context manager after the execution of the wrapped function."""
         return False
 
+    async def __aenter__(self):
+        """Enables a `RateLimiter` instance to be used as an asynchronous context manager within coroutines.
+
+        Example:
+        >>> async with limiter:
+        ...     await do_slow_call()
+
+        """
+        await self.async_wait()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Exits the asynchronous context manager after the execution of the awaited call."""
+        return False
+
     @contextmanager
     def rate(self, min_interval: float | int) -> Iterator[Self]:
-        """Temporarily adjusts the minimum interval between function calls or requests when used with a context manager.
+        """Waits using a temporary minimum interval between function calls or requests when used with a context manager.
 
-        After the context manager exits, the original minimum interval value is then reassigned its previous value,
-        and the time of the last call is recorded.
+        The interval only applies to the current call: the `min_interval` attribute is never modified, so callers
+        sharing the same rate limiter with different delays do not interfere with each other.
 
         Args:
             min_interval: Indicates the minimum interval to be temporarily used during the call
 
         Yields:
-            RateLimiter: The original rate limiter with a temporarily changed minimum interval
+            RateLimiter: The original rate limiter after the interval has elapsed
 
         """
-        current_min_interval = self.min_interval
-        try:
-            self.wait(min_interval)
-            yield self
+        self.wait(min_interval)
+        yield self
 
-        finally:
-            self.min_interval = current_min_interval
+    @asynccontextmanager
+    async def async_rate(self, min_interval: float | int) -> AsyncIterator[Self]:
+        """Asynchronous counterpart of `rate()` that waits for the provided interval without modifying `min_interval`.
+
+        Args:
+            min_interval: Indicates the minimum interval to be used for the current call only
+
+        Yields:
+            RateLimiter: The original rate limiter after the interval has elapsed
+
+        """
+        await self.async_wait(min_interval)
+        yield self
 
     def __repr__(self) -> str:
         """Defines the string representation of the RateLimiter/subclasses to show the class name and `min_interval`."""
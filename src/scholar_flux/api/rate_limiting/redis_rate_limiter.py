@@ -0,0 +1,206 @@
+# /api/rate_limiting/redis_rate_limiter.py
+"""The scholar_flux.api.rate_limiting.redis_rate_limiter module implements a distributed, Redis-backed rate limiter.
+
+The `RateLimiter` and `ThreadedRateLimiter` only coordinate callers inside of a single interpreter. When several
+processes or hosts send requests to the same provider, each process would otherwise apply its own interval and the
+combined request rate could exceed the provider's limit. The `RedisRateLimiter` stores the last reserved time slot for
+each provider in Redis so that every process sharing the same key queues behind the same reservations.
+
+Reservations are computed atomically on the Redis server with a Lua script. When scripting is unavailable (e.g.,
+with Redis-compatible servers or test doubles without Lua support), an optimistic `WATCH`/`MULTI` transaction is
+used instead.
+
+"""
+from __future__ import annotations
+from typing import Any, Optional, TYPE_CHECKING
+from scholar_flux.api.rate_limiting.threaded_rate_limiter import ThreadedRateLimiter
+from scholar_flux.exceptions import APIParameterException, RedisImportError
+from scholar_flux.utils import config_settings
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    import redis
+    from redis.exceptions import ResponseError, WatchError
+else:
+    try:
+        import redis
+        from redis.exceptions import ResponseError, WatchError
+    except ImportError:
+        redis = None
+        ResponseError = Exception
+        WatchError = Exception
+
+
+class RedisRateLimiter(ThreadedRateLimiter):
+    """Distributed rate limiter that shares reserved time slots across processes and hosts using Redis.
+
+    Each limiter reads and updates a single Redis key (`<namespace>:<name>`) holding the last reserved slot in
+    milliseconds since the epoch. Reserving a slot is atomic on the server, so any number of processes using the same
+    key are spaced by at least `min_interval` seconds. Callers sleep locally after the reservation, and the key expires
+    shortly after the last reserved slot has passed so that idle providers do not leave stale state behind.
+
+    The limiter has the same `wait()`/`rate()`/`async_wait()` interface as the `RateLimiter` and can be used anywhere
+    that a `ThreadedRateLimiter` is accepted (e.g., `SearchAPI.update(api, rate_limiter=...)`).
+
+    Note that slots are computed from the clock of each calling host, so hosts sharing a key should have synchronized
+    clocks (e.g., via NTP).
+
+    Args:
+        name (str):
+            The name of the rate-limited resource, typically the provider name. Limiters using the same name and
+            namespace share reservations.
+        min_interval (Optional[float | int]):
+            The minimum number of seconds that must elapse between successive calls across all processes.
+        namespace (Optional[str]):
+            The prefix used for the Redis key. Defaults to `RedisRateLimiter.DEFAULT_NAMESPACE`.
+        redis_client (Optional[redis.Redis]):
+            An existing Redis client. When not provided, a client is created from `DEFAULT_CONFIG` and `redis_config`.
+        **redis_config:
+            Additional parameters used to create the Redis client (e.g., host, port, db).
+
+    Raises:
+        RedisImportError: If a client is not provided and the `redis` package is not installed.
+        APIParameterException: If the `name` is empty or `min_interval` is invalid.
+
+    Examples:
+        >>> from scholar_flux.api import RedisRateLimiter, SearchAPI
+        >>> rate_limiter = RedisRateLimiter('plos', min_interval=6.1)
+        >>> api = SearchAPI.update(SearchAPI.from_defaults(query='ocean acidification', provider_name='plos'),
+        ...                        rate_limiter=rate_limiter)
+        >>> # the second request waits for the slot reserved by any process sharing the 'plos' key
+        >>> response_1 = api.search(page=1)
+        >>> response_2 = api.search(page=2)
+
+    """
+
+    DEFAULT_NAMESPACE: str = "SFAPI:rate_limit"
+    DEFAULT_CONFIG: dict = {
+        "host": config_settings.config.get("SCHOLAR_FLUX_REDIS_HOST") or "localhost",
+        "port": config_settings.config.get("SCHOLAR_FLUX_REDIS_PORT") or 6379,
+    }
+    # milliseconds that a reservation is retained after its slot and interval have passed
+    EXPIRATION_MARGIN: int = 1000
+    RESERVATION_SCRIPT: str = """
+    local last = tonumber(redis.call('GET', KEYS[1]))
+    local now = tonumber(ARGV[1])
+    local interval = tonumber(ARGV[2])
+    local slot = now
+    if last then
+        if interval > 0 then slot = math.max(now, last + interval) else slot = math.max(now, last) end
+    end
+    redis.call('SET', KEYS[1], slot, 'PX', slot - now + interval + tonumber(ARGV[3]))
+    if last and interval > 0 then return slot end
+    return -1
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_interval: Optional[float | int] = None,
+        namespace: Optional[str] = None,
+        redis_client: Optional[redis.Redis] = None,
+        **redis_config: Any,
+    ):
+        """Initializes the distributed rate limiter and the Redis client used to share reservations."""
+        super().__init__(min_interval)
+
+        if not isinstance(name, str) or not name.strip():
+            raise APIParameterException(f"The `name` of a RedisRateLimiter must be a non-empty string. Received '{name}'")
+
+        if redis_client is None:
+            # optional dependencies set to None if not available
+            if redis is None:
+                raise RedisImportError
+            redis_client = redis.Redis(**(self.DEFAULT_CONFIG | redis_config))
+
+        self.name = name.strip()
+        self.namespace = namespace or self.DEFAULT_NAMESPACE
+        self.client = redis_client
+        self._script: Optional[Any] = None
+        self._use_script: bool = True
+
+    @property
+    def key(self) -> str:
+        """The Redis key that holds the last reserved slot shared by all limiters with the same namespace and name."""
+        return f"{self.namespace}:{self.name}"
+
+    def _reserve(self, min_interval: float | int) -> Optional[float]:
+        """Atomically reserves the next available slot in Redis and returns the time at which the call can proceed.
+
+        Args:
+            min_interval (float | int): The minimum time that must elapse between successive calls.
+
+        Returns:
+            Optional[float]:
+                The timestamp (seconds since the epoch) of the reserved slot, or None when the call can proceed
+                immediately because no prior reservation exists or the interval is 0.
+
+        """
+        now_ms = int(time.time() * 1000)
+        interval_ms = int(round(min_interval * 1000))
+
+        with self._lock:
+            slot_ms = self._reserve_with_script(now_ms, interval_ms) if self._use_script else None
+            if slot_ms is None:
+                slot_ms = self._reserve_with_transaction(now_ms, interval_ms)
+
+        self._last_call = max(now_ms, slot_ms) / 1000
+        return slot_ms / 1000 if slot_ms >= 0 else None
+
+    def _reserve_with_script(self, now_ms: int, interval_ms: int) -> Optional[int]:
+        """Helper method that reserves a slot using the Lua reservation script.
+
+        Returns:
+            Optional[int]:
+                The reserved slot in milliseconds (-1 for immediate calls), or None if the server does not support
+                scripting. In the latter case, subsequent reservations use the transaction-based fallback.
+
+        """
+        try:
+            if self._script is None:
+                self._script = self.client.register_script(self.RESERVATION_SCRIPT)
+            return int(self._script(keys=[self.key], args=[now_ms, interval_ms, self.EXPIRATION_MARGIN]))
+        except ResponseError as e:
+            if "unknown command" not in str(e).lower():
+                raise
+            logger.warning(
+                "Lua scripting is not supported by the Redis server. Falling back to WATCH/MULTI transactions."
+            )
+            self._use_script = False
+            return None
+
+    def _reserve_with_transaction(self, now_ms: int, interval_ms: int) -> int:
+        """Helper method that reserves a slot with an optimistic `WATCH`/`MULTI` transaction, retrying on conflicts."""
+        with self.client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(self.key)
+                    last = pipe.get(self.key)
+                    last_ms = int(float(last)) if last is not None else None
+                    slot_ms = now_ms if last_ms is None else max(now_ms, last_ms + interval_ms)
+                    pipe.multi()
+                    pipe.set(self.key, slot_ms, px=slot_ms - now_ms + interval_ms + self.EXPIRATION_MARGIN)
+                    pipe.execute()
+                    return slot_ms if last_ms is not None and interval_ms > 0 else -1
+                except WatchError:
+                    # another process reserved a slot in the meantime: retry with the updated reservation
+                    continue
+
+    def reset(self) -> None:
+        """Removes the shared reservation so that the next call across all processes can proceed immediately."""
+        with self._lock:
+            self.client.delete(self.key)
+            self._last_call = None
+
+    def __repr__(self) -> str:
+        """Shows the class name, the shared key, and the `min_interval` of the distributed rate limiter."""
+        class_name = self.__class__.__name__
+        attributes = dict(key=self.key, min_interval=self.min_interval)
+        return generate_repr_from_string(class_name, attributes, flatten=True)
+
+
+__all__ = ["RedisRateLimiter"]
@@ -0,0 +1,110 @@
+# /api/rate_limiting/reservation_rate_limiter.py
+"""The scholar_flux.api.rate_limiting.reservation_rate_limiter module implements the ReservationRateLimiter base class.
+
+The `ReservationRateLimiter` holds the reservation logic shared by the `DailyQuotaRateLimiter`,
+`TokenBucketRateLimiter`, `SlidingWindowRateLimiter`, and `AdaptiveRateLimiter`: each call is counted against an
+optional daily quota and reserves its time slot while holding the lock. Subclasses only define how slots are reserved
+by overriding `_reserve_slot()`.
+
+"""
+from __future__ import annotations
+from datetime import datetime, timezone, date
+from typing import Optional
+from scholar_flux.api.rate_limiting.rate_limiter import RateLimiter
+from scholar_flux.api.rate_limiting.threaded_rate_limiter import ThreadedRateLimiter
+from scholar_flux.exceptions import APIParameterException, RateLimitExceededException
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ReservationRateLimiter(ThreadedRateLimiter):
+    """Thread-safe base class for rate limiters that reserve slots under a lock with an optional daily quota.
+
+    Each call to `wait()` first counts the call against the daily quota (when `daily_limit` is set) and then reserves
+    a time slot using `_reserve_slot()`. Both steps occur while holding the lock, and callers sleep until their slot
+    outside of the lock. The quota is counted per UTC calendar day and resets at midnight (UTC). When the quota has been
+    exhausted, calls raise a `RateLimitExceededException` rather than sleeping until the following day.
+
+    By default, slots are spaced by at least `min_interval` seconds. Subclasses override `_reserve_slot()` to implement
+    alternative strategies such as token buckets or sliding windows.
+
+    Args:
+        min_interval (Optional[float | int]):
+            The minimum number of seconds that must elapse between successive calls.
+        daily_limit (Optional[int]):
+            The maximum number of calls allowed per UTC day. The quota is not enforced when `daily_limit` is None.
+
+    """
+
+    def __init__(self, min_interval: Optional[float | int] = None, daily_limit: Optional[int] = None):
+        """Initializes the rate limiter with a minimum interval and an optional daily quota."""
+        super().__init__(min_interval)
+        self.daily_limit = self._validate_limit(daily_limit, "daily_limit") if daily_limit is not None else None
+        self._quota_date: Optional[date] = None
+        self._quota_count: int = 0
+
+    @staticmethod
+    def _validate_limit(limit: int, name: str) -> int:
+        """Helper that verifies that a request count (e.g., a quota or burst size) is a positive integer."""
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            raise APIParameterException(f"`{name}` must be a positive integer. Received value, '{limit}'")
+        return limit
+
+    @staticmethod
+    def _current_date() -> date:
+        """Returns the current UTC date that the daily quota is counted against."""
+        return datetime.now(timezone.utc).date()
+
+    @property
+    def remaining_quota(self) -> Optional[int]:
+        """The number of calls remaining for the current UTC day, or None when a daily quota is not enforced."""
+        if self.daily_limit is None:
+            return None
+        used = self._quota_count if self._quota_date == self._current_date() else 0
+        return max(self.daily_limit - used, 0)
+
+    def _consume_quota(self) -> None:
+        """Helper method that counts the current call against the daily quota.
+
+        Raises:
+            RateLimitExceededException: If the daily quota has already been exhausted for the current UTC day.
+
+        """
+        if self.daily_limit is None:
+            return
+
+        today = self._current_date()
+        if self._quota_date != today:
+            self._quota_date, self._quota_count = today, 0
+
+        if self._quota_count >= self.daily_limit:
+            raise RateLimitExceededException(
+                f"The daily quota of {self.daily_limit} requests has been exhausted for {today.isoformat()} (UTC)"
+            )
+        self._quota_count += 1
+
+    def _reserve(self, min_interval: float | int) -> Optional[float]:
+        """Counts the call against the daily quota and reserves the next available slot while holding the lock."""
+        with self._lock:
+            self._consume_quota()
+            return self._reserve_slot(min_interval)
+
+    def _reserve_slot(self, min_interval: float | int) -> Optional[float]:
+        """Reserves the next time slot for the current call. Must be called while holding the lock.
+
+        By default, slots are spaced by at least `min_interval` seconds. Subclasses override this method to implement
+        alternative strategies.
+
+        """
+        return RateLimiter._reserve(self, min_interval)
+
+    def __repr__(self) -> str:
+        """Shows the class name, `min_interval`, and `daily_limit` of the current rate limiter."""
+        class_name = self.__class__.__name__
+        attributes = dict(min_interval=self.min_interval, daily_limit=self.daily_limit)
+        return generate_repr_from_string(class_name, attributes, flatten=True)
+
+
+__all__ = ["ReservationRateLimiter"]
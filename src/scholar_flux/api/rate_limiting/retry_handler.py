@@ -7,6 +7,7 @@ successful or the maximum retry limit has been reached.
 
 """
 from email.utils import parsedate_to_datetime
+import asyncio
 import time
 import requests
 import datetime
@@ -15,7 +16,7 @@ from scholar_flux.exceptions import RequestFailedException, InvalidResponseExcep
 from scholar_flux.utils.response_protocol import ResponseProtocol
 from scholar_flux.utils.helpers import get_first_available_key, parse_iso_timestamp
 from scholar_flux.utils.repr_utils import generate_repr
-from typing import Optional, Callable, Mapping
+from typing import Optional, Callable, Mapping, Awaitable
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +136,76 @@ class RetryHandler:
             err = f"{msg}: {e}" if str(e) else f"{msg}."
             raise RequestFailedException(err) from e
 
+    async def aexecute_with_retry(
+        self,
+        request_func: Callable[..., Awaitable],
+        validator_func: Optional[Callable] = None,
+        *args,
+        **kwargs,
+    ) -> Optional[requests.Response | ResponseProtocol]:
+        """Asynchronous counterpart of `execute_with_retry()` that awaits the request function and retry delays.
+
+        The retry criteria, validation, and error handling are identical to those of `execute_with_retry`, but the
+        delay between attempts uses `asyncio.sleep` so that the event loop is free to run other searches.
+
+        Args:
+            request_func: A coroutine function used to send the request.
+            validator_func: A function that takes a response and returns True if valid.
+            *args: Positional arguments for the request function.
+            **kwargs: Arbitrary keyword arguments for the request function.
+
+        Returns:
+            requests.Response: The response received, or None if no valid response was obtained.
+
+        Raises:
+            RequestFailedException: When a request raises an exception for whatever reason
+            InvalidResponseException: When the number of retries has been exceeded and self.raise_on_error is True
+
+        """
+        attempts = 0
+
+        validator_func = validator_func or self._default_validator_func
+
+        response = None
+        msg = None
+
+        try:
+            while attempts <= self.max_retries:
+                response = await request_func(*args, **kwargs)
+
+                if validator_func(response):
+                    break
+
+                if not (
+                    isinstance(response, requests.Response) or isinstance(response, ResponseProtocol)
+                ) or not self.should_retry(response):
+                    msg = "Received an invalid or non-retryable response."
+                    self.log_retry_warning(msg)
+                    if self.raise_on_error:
+                        raise InvalidResponseException(response, msg)
+                    break
+
+                attempts += 1
+                if attempts <= self.max_retries:
+                    delay = self.calculate_retry_delay(attempts, response)
+                    self.log_retry_attempt(delay, response.status_code)
+                    await asyncio.sleep(delay)
+            else:
+                msg = "Max retries exceeded without a valid response."
+                self.log_retry_warning(msg)
+
+                if self.raise_on_error:
+                    raise InvalidResponseException(response, msg)
+
+            return response
+
+        except InvalidResponseException:
+            raise
+        except Exception as e:
+            msg = f"A valid response could not be retrieved after {attempts} attempts"
+            err = f"{msg}: {e}" if str(e) else f"{msg}."
+            raise RequestFailedException(err) from e
+
     @classmethod
     def _default_validator_func(cls, response: requests.Response | ResponseProtocol) -> bool:
         """Defines a basic default validator that verifies type and status code.
@@ -0,0 +1,87 @@
+# /api/rate_limiting/sliding_window_rate_limiter.py
+"""The scholar_flux.api.rate_limiting.sliding_window_rate_limiter module implements the SlidingWindowRateLimiter.
+
+The `SlidingWindowRateLimiter` records the time of the most recent requests and ensures that no more than
+`max_requests` requests are sent within any window of `max_requests * min_interval` seconds.
+
+"""
+from __future__ import annotations
+import time
+from collections import deque
+from typing import Optional
+from typing_extensions import Self
+from scholar_flux.api.rate_limiting.reservation_rate_limiter import ReservationRateLimiter
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+
+
+class SlidingWindowRateLimiter(ReservationRateLimiter):
+    """Thread-safe sliding-window-log rate limiter that allows up to `max_requests` calls within a rolling window.
+
+    The limiter keeps a log of the last `max_requests` reserved slots. A new call may proceed once the oldest call in
+    the log falls outside of the window. The window length is derived from the interval and the number of requests
+    (`max_requests * min_interval`) so that the average rate always matches the `request_delay` of a `SearchAPI`.
+
+    Args:
+        min_interval (Optional[float | int]): The average number of seconds between calls within the window.
+        max_requests (int): The maximum number of calls allowed within a single window.
+        daily_limit (Optional[int]): An optional maximum number of calls allowed per UTC day.
+
+    Examples:
+        >>> from scholar_flux.api.rate_limiting import SlidingWindowRateLimiter
+        >>> # allows at most 10 requests in any one-second window
+        >>> rate_limiter = SlidingWindowRateLimiter.from_rate(max_requests=10, period=1)
+        >>> rate_limiter.window
+        # OUTPUT: 1.0
+
+    """
+
+    def __init__(
+        self, min_interval: Optional[float | int] = None, max_requests: int = 1, daily_limit: Optional[int] = None
+    ):
+        """Initializes the sliding window with the average interval, requests per window, and optional daily quota."""
+        super().__init__(min_interval, daily_limit=daily_limit)
+        self.max_requests = self._validate_limit(max_requests, "max_requests")
+        self._request_log: deque[float] = deque(maxlen=self.max_requests)
+
+    @classmethod
+    def from_rate(cls, max_requests: int, period: float | int = 1, daily_limit: Optional[int] = None) -> Self:
+        """Creates a sliding window limiter that allows `max_requests` requests within any `period` seconds.
+
+        Args:
+            max_requests (int): The number of requests allowed within each window.
+            period (float | int): The length of the window in seconds.
+            daily_limit (Optional[int]): An optional maximum number of calls allowed per UTC day.
+
+        Returns:
+            SlidingWindowRateLimiter: A rate limiter with `min_interval = period / max_requests`
+
+        """
+        max_requests = cls._validate_limit(max_requests, "max_requests")
+        return cls(cls._validate(period) / max_requests, max_requests=max_requests, daily_limit=daily_limit)
+
+    @property
+    def window(self) -> float:
+        """The length of the rolling window in seconds, using the default interval when `min_interval` is missing."""
+        min_interval = self.min_interval if self.min_interval is not None else self.DEFAULT_MIN_INTERVAL
+        return self.max_requests * min_interval
+
+    def _reserve_slot(self, min_interval: float | int) -> Optional[float]:
+        """Reserves the earliest slot at which fewer than `max_requests` calls fall within the current window."""
+        now = time.time()
+        slot = now
+        if len(self._request_log) == self.max_requests:
+            slot = max(now, self._request_log[0] + self.max_requests * min_interval)
+
+        # the log is bounded by `max_requests`: the oldest slot is discarded automatically
+        self._request_log.append(slot)
+        self._last_call = slot
+        return slot if slot > now else None
+
+    def __repr__(self) -> str:
+        """Shows the class name, `min_interval`, `max_requests`, and `daily_limit` of the current rate limiter."""
+        class_name = self.__class__.__name__
+        attributes = dict(min_interval=self.min_interval, max_requests=self.max_requests, daily_limit=self.daily_limit)
+        return generate_repr_from_string(class_name, attributes, flatten=True)
+
+
+__all__ = ["SlidingWindowRateLimiter"]
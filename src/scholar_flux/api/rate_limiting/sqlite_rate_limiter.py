@@ -0,0 +1,148 @@
+# /api/rate_limiting/sqlite_rate_limiter.py
+"""The scholar_flux.api.rate_limiting.sqlite_rate_limiter module implements a multi-process rate limiter using SQLite.
+
+The `SQLiteRateLimiter` is the single-host counterpart of the `RedisRateLimiter`: the last reserved time slot of each
+rate-limited resource is stored in a SQLite database file that is shared by all processes on the same machine. SQLite's
+file locking ensures that only one process reserves a slot at a time, so no additional services or dependencies are
+required to throttle requests across several worker processes.
+
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Optional
+from scholar_flux.api.rate_limiting.threaded_rate_limiter import ThreadedRateLimiter
+from scholar_flux.exceptions import APIParameterException
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+from scholar_flux.package_metadata import get_default_writable_directory
+import sqlite3
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteRateLimiter(ThreadedRateLimiter):
+    """Multi-process rate limiter that shares reserved time slots between processes through a SQLite database file.
+
+    Each reservation opens a short `BEGIN IMMEDIATE` transaction that acquires the database's write lock, reads the last
+    reserved slot for the current `name`, records the next slot, and commits. The caller then sleeps outside of the
+    transaction until its slot is reached, so processes never hold the lock while waiting.
+
+    Args:
+        name (str):
+            The name of the rate-limited resource, typically the provider name. Limiters using the same name and
+            database file share reservations.
+        min_interval (Optional[float | int]):
+            The minimum number of seconds that must elapse between successive calls across all processes.
+        db_path (Optional[str | Path]):
+            The path of the SQLite database file. Defaults to `rate_limits.sqlite` in the package's writable directory.
+        timeout (float):
+            The number of seconds to wait for the database lock held by other processes before raising an error.
+
+    Examples:
+        >>> from scholar_flux.api import SQLiteRateLimiter
+        >>> rate_limiter = SQLiteRateLimiter('plos', min_interval=6.1, db_path='/tmp/rate_limits.sqlite')
+        >>> # every process using the same file and name waits for the slots reserved by the others
+        >>> with rate_limiter:
+        ...     pass
+
+    """
+
+    DEFAULT_FILENAME: str = "rate_limits.sqlite"
+    DEFAULT_TIMEOUT: float = 30.0
+    TABLE_NAME: str = "rate_limit_reservations"
+
+    def __init__(
+        self,
+        name: str,
+        min_interval: Optional[float | int] = None,
+        db_path: Optional[str | Path] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Initializes the rate limiter and creates the reservation table when it does not already exist."""
+        super().__init__(min_interval)
+
+        if not isinstance(name, str) or not name.strip():
+            raise APIParameterException(
+                f"The `name` of a SQLiteRateLimiter must be a non-empty string. Received '{name}'"
+            )
+
+        self.name = name.strip()
+        self.db_path = Path(db_path) if db_path is not None else self._default_path()
+        self.timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
+        self._initialize_table()
+
+    @classmethod
+    def _default_path(cls) -> Path:
+        """Resolves the default location of the shared database file within the package's writable directory."""
+        return get_default_writable_directory("package_cache") / cls.DEFAULT_FILENAME
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens a connection in autocommit mode so that transactions can be started explicitly with BEGIN IMMEDIATE."""
+        return sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+
+    def _initialize_table(self) -> None:
+        """Creates the table that maps the name of each rate-limited resource to its last reserved slot."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connect()
+        try:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (name TEXT PRIMARY KEY, last_call REAL NOT NULL)"
+            )
+        finally:
+            connection.close()
+
+    def _reserve(self, min_interval: float | int) -> Optional[float]:
+        """Reserves the next available slot within an immediate (write-locked) SQLite transaction.
+
+        Args:
+            min_interval (float | int): The minimum time that must elapse between successive calls.
+
+        Returns:
+            Optional[float]:
+                The timestamp (seconds since the epoch) of the reserved slot, or None when the call can proceed
+                immediately because no prior reservation exists or the interval is 0.
+
+        """
+        with self._lock:
+            connection = self._connect()
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+                row = connection.execute(
+                    f"SELECT last_call FROM {self.TABLE_NAME} WHERE name = ?", (self.name,)
+                ).fetchone()
+                now = time.time()
+                last_call = row[0] if row else None
+                slot = now if last_call is None else max(now, last_call + min_interval)
+                connection.execute(
+                    f"INSERT OR REPLACE INTO {self.TABLE_NAME} (name, last_call) VALUES (?, ?)", (self.name, slot)
+                )
+                connection.execute("COMMIT")
+            except sqlite3.Error:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                raise
+            finally:
+                connection.close()
+
+        self._last_call = slot
+        return slot if last_call is not None and min_interval else None
+
+    def reset(self) -> None:
+        """Removes the shared reservation so that the next call across all processes can proceed immediately."""
+        with self._lock:
+            connection = self._connect()
+            try:
+                connection.execute(f"DELETE FROM {self.TABLE_NAME} WHERE name = ?", (self.name,))
+            finally:
+                connection.close()
+            self._last_call = None
+
+    def __repr__(self) -> str:
+        """Shows the class name, the resource name, the database path, and the `min_interval` of the rate limiter."""
+        class_name = self.__class__.__name__
+        attributes = dict(name=self.name, db_path=str(self.db_path), min_interval=self.min_interval)
+        return generate_repr_from_string(class_name, attributes, flatten=True)
+
+
+__all__ = ["SQLiteRateLimiter"]
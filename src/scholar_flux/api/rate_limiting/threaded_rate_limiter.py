@@ -6,11 +6,8 @@ multithreaded scenarios to ensure that provider rate limits are not exceeded wit
 
 """
 from __future__ import annotations
-from contextlib import contextmanager
-import time
-from typing_extensions import Self
 from scholar_flux.api.rate_limiting.rate_limiter import RateLimiter
-from typing import Optional, Iterator
+from typing import Optional
 import threading
 
 
@@ -20,6 +17,10 @@ class ThreadedRateLimiter(RateLimiter):
     Inherits all functionality from RateLimiter but adds thread synchronization to prevent race conditions when multiple
     threads access the same limiter instance.
 
+    The limiter is reservation-based: each caller atomically reserves the next available time slot while holding the
+    lock, releases the lock, and only then sleeps until its slot is reached. Threads therefore never sleep while
+    holding the lock, and per-call intervals passed to `wait()` or `rate()` never modify the shared `min_interval`.
+
     """
 
     def __init__(self, min_interval: Optional[float | int] = None):
@@ -28,46 +29,10 @@ class ThreadedRateLimiter(RateLimiter):
         # Add thread synchronization
         self._lock = threading.Lock()
 
-    def wait(self, min_interval: Optional[float | int] = None) -> None:
-        """Thread-safe version of wait() that prevents race conditions."""
-        min_interval = self._validate(
-            min_interval
-            if min_interval is not None
-            else (self.min_interval if self.min_interval is not None else self.DEFAULT_MIN_INTERVAL)
-        )
-
-        # Synchronize access to _last_call and timing logic
-        with self._lock:
-            if self._last_call is not None and min_interval:
-                self._wait(min_interval, self._last_call)
-            # Record the time we actually proceed
-            self._last_call = time.time()
-
-    @contextmanager
-    def rate(self, min_interval: float | int) -> Iterator[Self]:
-        """Thread-safe version of rate() context manager.
-
-        Args:
-            min_interval: The minimum interval to temporarily use during the call
-
-        Yields:
-            ThreadSafeRateLimiter: The rate limiter with temporarily changed interval
-
-        """
-        # Synchronize min_interval changes
+    def _reserve(self, min_interval: float | int) -> Optional[float]:
+        """Thread-safe version of `_reserve()` that reserves the next available slot while holding the lock."""
         with self._lock:
-            current_min_interval = self.min_interval
-            self.min_interval = self._validate(min_interval)
-
-        try:
-            self.wait()  # Uses its own locking internally
-            yield self
-
-        finally:
-
-            # Restore original min_interval atomically
-            with self._lock:
-                self.min_interval = current_min_interval
+            return super()._reserve(min_interval)
 
 
 __all__ = ["ThreadedRateLimiter"]
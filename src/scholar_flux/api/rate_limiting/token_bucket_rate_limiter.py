@@ -0,0 +1,92 @@
+# /api/rate_limiting/token_bucket_rate_limiter.py
+"""The scholar_flux.api.rate_limiting.token_bucket_rate_limiter module implements the TokenBucketRateLimiter.
+
+Providers such as PubMed allow a number of requests per second rather than a fixed delay between each request. The
+`TokenBucketRateLimiter` allows short bursts of up to `burst` requests while keeping the sustained rate at one request
+per `min_interval` seconds.
+
+"""
+from __future__ import annotations
+import time
+from typing import Optional
+from typing_extensions import Self
+from scholar_flux.api.rate_limiting.reservation_rate_limiter import ReservationRateLimiter
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+
+
+class TokenBucketRateLimiter(ReservationRateLimiter):
+    """Thread-safe token bucket rate limiter that allows bursts of requests up to a fixed capacity.
+
+    Tokens are replenished at a rate of one token every `min_interval` seconds, and the bucket holds at most `burst`
+    tokens. Each call consumes a token and only waits when the bucket is empty. Slots are reserved using the generic
+    cell rate algorithm, so each call computes its slot in constant time and sleeps outside of the lock.
+
+    The interval passed to `wait(min_interval)` or `rate(min_interval)` is used as the replenishment interval for the
+    current call, so the `request_delay` of a `SearchAPI` defines the sustained rate while `burst` defines how many
+    requests can be sent in immediate succession.
+
+    Args:
+        min_interval (Optional[float | int]): The number of seconds required to replenish a single token.
+        burst (int): The maximum number of tokens held by the bucket (i.e., the maximum burst size).
+        daily_limit (Optional[int]): An optional maximum number of calls allowed per UTC day.
+
+    Examples:
+        >>> from scholar_flux.api.rate_limiting import TokenBucketRateLimiter
+        >>> # allows 10 requests per second with bursts of up to 10 requests
+        >>> rate_limiter = TokenBucketRateLimiter.from_rate(max_requests=10, period=1)
+        >>> rate_limiter
+        # OUTPUT: TokenBucketRateLimiter(min_interval=0.1, burst=10, daily_limit=None)
+        >>> for _ in range(10):
+        ...     rate_limiter.wait() # the first 10 calls proceed without waiting
+
+    """
+
+    def __init__(self, min_interval: Optional[float | int] = None, burst: int = 1, daily_limit: Optional[int] = None):
+        """Initializes the token bucket with the replenishment interval, burst capacity, and optional daily quota."""
+        super().__init__(min_interval, daily_limit=daily_limit)
+        self.burst = self._validate_limit(burst, "burst")
+        self._theoretical_arrival: Optional[float] = None
+
+    @classmethod
+    def from_rate(
+        cls, max_requests: int, period: float | int = 1, burst: Optional[int] = None, daily_limit: Optional[int] = None
+    ) -> Self:
+        """Creates a token bucket that allows `max_requests` requests per `period` seconds.
+
+        Args:
+            max_requests (int): The number of requests allowed within each period.
+            period (float | int): The length of the period in seconds.
+            burst (Optional[int]): The maximum burst size. Defaults to `max_requests`.
+            daily_limit (Optional[int]): An optional maximum number of calls allowed per UTC day.
+
+        Returns:
+            TokenBucketRateLimiter: A rate limiter with `min_interval = period / max_requests`
+
+        """
+        max_requests = cls._validate_limit(max_requests, "max_requests")
+        min_interval = cls._validate(period) / max_requests
+        return cls(min_interval, burst=burst if burst is not None else max_requests, daily_limit=daily_limit)
+
+    def _reserve_slot(self, min_interval: float | int) -> Optional[float]:
+        """Reserves the earliest slot at which a token is available using the generic cell rate algorithm.
+
+        The theoretical arrival time advances by `min_interval` with each call. A call may proceed up to
+        `(burst - 1) * min_interval` seconds ahead of its theoretical arrival time, which is equivalent to consuming
+        one of the tokens accumulated in the bucket.
+
+        """
+        now = time.time()
+        theoretical_arrival = max(self._theoretical_arrival or now, now)
+        slot = max(now, theoretical_arrival - (self.burst - 1) * min_interval)
+        self._theoretical_arrival = theoretical_arrival + min_interval
+        self._last_call = slot
+        return slot if slot > now else None
+
+    def __repr__(self) -> str:
+        """Shows the class name, `min_interval`, `burst`, and `daily_limit` of the current rate limiter."""
+        class_name = self.__class__.__name__
+        attributes = dict(min_interval=self.min_interval, burst=self.burst, daily_limit=self.daily_limit)
+        return generate_repr_from_string(class_name, attributes, flatten=True)
+
+
+__all__ = ["TokenBucketRateLimiter"]
@@ -7,7 +7,7 @@ The ResponseCoordinator relies on dependency injection to modify the processing
 
 """
 from __future__ import annotations
-from scholar_flux.data_storage import DataCacheManager
+from scholar_flux.data_storage import DataCacheManager, CachePolicy
 
 from scholar_flux.data.base_parser import BaseDataParser
 from scholar_flux.data.data_parser import DataParser
@@ -31,7 +31,7 @@ from scholar_flux.exceptions.data_exceptions import (
 )
 
 
-from scholar_flux.utils.repr_utils import generate_repr_from_string, generate_repr
+from scholar_flux.utils.repr_utils import generate_repr_from_string
 from scholar_flux.utils.helpers import generate_iso_timestamp, coerce_str
 from scholar_flux.utils.response_protocol import ResponseProtocol
 from scholar_flux.exceptions.coordinator_exceptions import (
@@ -39,7 +39,8 @@ from scholar_flux.exceptions.coordinator_exceptions import (
 )
 from scholar_flux.exceptions import StorageCacheException, MissingResponseException
 from requests.exceptions import RequestException
-from typing import Optional, Dict, List, Any, cast
+from typing import Optional, Dict, List, Any, Sequence, cast
+from functools import partial
 from requests import Response
 
 import logging
@@ -66,6 +67,10 @@ class ResponseCoordinator:
     The coordinator orchestration process operates mainly through the ResponseCoordinator.handle_response
     method that sequentially calls the parser, extractor, processor, and cache_manager.
 
+    When the `CachePolicy` of the cache manager omits the parsed response, extracted records, or normalized records
+    from cache, these stages are recomputed from the cached response with the current parser and extractor when they
+    are first accessed on a ProcessedResponse retrieved from cache.
+
     Example workflow:
 
         >>> from scholar_flux.api import SearchAPI, ResponseCoordinator
@@ -378,26 +383,37 @@ class ResponseCoordinator:
                 logger.debug("A cache key was not specified. Attempting to create a cache key from the response...")
                 cache_key = self.cache_manager.generate_fallback_cache_key(cast(ResponseProtocol, response_obj))
 
-            # determine if the cache key created manually or directly from the response hash exists
-            if not self.cache_manager.verify_cache(cache_key):
-                return None
-
-            # attempts to retrieve a cached response
-            cached = self.cache_manager.retrieve(cache_key)
+            # checks whether the cache key exists and retrieves the cached response with a single storage lookup
+            is_cached, cached = self.cache_manager.get_if_present(cache_key)
 
-            if not (cached and self.cache_manager.cache_is_valid(cache_key, response_obj, cached)):
+            if not (is_cached and cached and self.cache_manager.cache_is_valid(cache_key, response_obj, cached)):
                 return None
 
             if not self._validate_cached_schema(cached, validate_fingerprint):
+                # discards copies held in memory (e.g. by a TieredStorage) that were processed with another schema
+                self.cache_manager.invalidate(cache_key)
                 return None
 
             logger.info(f"retrieved response '{cache_key}' from cache")
 
-            return self._rebuild_processed_response(
+            processed_response = self._rebuild_processed_response(
                 cache_key=cache_key,
                 response=response_obj,
                 cached_response=cached,
             )
+
+            # stages omitted by the cache policy are recomputed from the response only when accessed
+            if omitted_stages := CachePolicy.omitted(cached):
+                processed_response.defer_stages(
+                    omitted_stages,
+                    partial(
+                        self._recompute_stages,
+                        processed_response.response,
+                        omitted_stages,
+                        processed_records=processed_response.processed_records,
+                    ),
+                )
+            return processed_response
         except (
             StorageCacheException,
             MissingResponseException,
@@ -441,6 +457,48 @@ class ResponseCoordinator:
             created_at=cached_response.get("created_at"),  # will perform internal validation
         )
 
+    def _recompute_stages(
+        self,
+        response: Optional[Response | ResponseProtocol],
+        stages: Sequence[str],
+        processed_records: Optional[List[Dict[Any, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Helper method that recomputes the stages of a cached response that were omitted by the cache policy.
+
+        Args:
+            response (Optional[Response | ResponseProtocol]): The original or reconstructed response to parse.
+            stages (Sequence[str]): The omitted stages to recompute.
+            processed_records (Optional[List[Dict[Any, Any]]]): The cached records used to recompute normalized records.
+
+        Returns:
+            Dict[str, Any]: A dictionary of the recomputed stages. Stages that could not be recomputed are omitted.
+
+        """
+        recomputed: Dict[str, Any] = {}
+        if response is None:
+            logger.warning(f"The omitted stages, {list(stages)}, cannot be recomputed without a response")
+            return recomputed
+
+        try:
+            if "parsed_response" in stages or "extracted_records" in stages:
+                parsed_response_data = self.parser(response)
+                extracted_records, _ = self.extractor(parsed_response_data) if parsed_response_data else (None, None)
+                recomputed |= dict(parsed_response=parsed_response_data, extracted_records=extracted_records)
+
+            if "normalized_records" in stages:
+                processed_response = ProcessedResponse(response=response, processed_records=processed_records)
+                recomputed["normalized_records"] = (
+                    try_call(
+                        processed_response.normalize,
+                        suppress=(RecordNormalizationException, TypeError, ValueError),
+                    )
+                    or None
+                )
+        except (DataParsingException, DataExtractionException, FieldNotFoundException) as e:
+            logger.warning(f"Could not recompute the omitted stages, {list(stages)}, of a cached response: {e}")
+
+        return recomputed
+
     def _validate_cached_schema(
         self,
         cached_response: dict[str, Any],
@@ -611,8 +669,6 @@ class ResponseCoordinator:
 
         creation_timestamp = generate_iso_timestamp()
 
-        serialized_response = APIResponse.serialize_response(response)
-
         processed_response = ProcessedResponse(
             cache_key=cache_key,
             response=response,
@@ -646,9 +702,10 @@ class ResponseCoordinator:
                 extracted_records=extracted_records,
                 processed_records=processed_records,
                 normalized_records=normalized_records,
-                serialized_response=serialized_response,
                 schema=self.schema_fingerprint(),
                 created_at=creation_timestamp,
+                # serialized when the record is written: off of the request thread when write-behind is enabled
+                deferred_fields=dict(serialized_response=partial(APIResponse.serialize_response, response)),
             )
         logger.info("Data processed for %s", cache_key)
 
@@ -696,7 +753,7 @@ class ResponseCoordinator:
             parser=self.parser.__class__.__name__ + "(...)",
             extractor=self.extractor.__class__.__name__ + "(...)",
             processor=self.processor.__class__.__name__ + "(...)",
-            cache_manager=generate_repr(self.cache_manager, show_value_attributes=False, flatten=True),
+            cache_manager=self.cache_manager.structure(flatten=True, show_value_attributes=False),
         )
 
         return generate_repr_from_string(class_name, components, flatten=True)
@@ -18,6 +18,7 @@ from scholar_flux import masker as default_masker
 from scholar_flux.utils import config_settings
 from scholar_flux.api.models import BaseAPIParameterMap
 from scholar_flux.api import BaseAPI, APIParameterConfig, APIParameterMap, SearchAPIConfig, RateLimiter
+from scholar_flux.api.rate_limiting import AdaptiveRateLimiter
 from scholar_flux.api.providers import provider_registry
 from scholar_flux.api.models import ProviderConfig
 from scholar_flux.exceptions.api_exceptions import (
@@ -175,7 +176,7 @@ class SearchAPI(BaseAPI):
         self.config = config
         self.query = query
         self.last_request: Optional[float] = None
-        self._rate_limiter: RateLimiter = rate_limiter or RateLimiter(min_interval=self.config.request_delay)
+        self._rate_limiter: RateLimiter = rate_limiter or self._create_rate_limiter(self.config)
         self.masker: SensitiveDataMasker = masker or default_masker
 
         # prefer the rate limit derived from the RateLimiter if provided explicitly when neither matches
@@ -194,6 +195,26 @@ class SearchAPI(BaseAPI):
             logger.warning("An API key is required but was not provided")
         logger.debug("Initialized a new SearchAPI Session Successfully.")
 
+    @classmethod
+    def _create_rate_limiter(cls, config: SearchAPIConfig) -> RateLimiter:
+        """Helper method that creates a rate limiter using the request delay of the current configuration.
+
+        When the provider is registered, the rate limiter is created with `ProviderConfig.create_rate_limiter`, which
+        applies the provider's `rate_limit` strategy (e.g., a token bucket or daily quota) when defined, using the
+        configured `request_delay`. Otherwise a basic `RateLimiter` is created.
+
+        Args:
+            config (SearchAPIConfig): The configuration containing the provider name and request delay to use.
+
+        Returns:
+            RateLimiter: A new rate limiter for the SearchAPI
+
+        """
+        provider_config = provider_registry.get(config.provider_name)
+        if provider_config:
+            return provider_config.create_rate_limiter(min_interval=config.request_delay)
+        return RateLimiter(min_interval=config.request_delay)
+
     @classmethod
     def update(
         cls,
@@ -228,7 +249,9 @@ class SearchAPI(BaseAPI):
 
 
         Returns:
-            SearchAPI: A newly constructed SearchAPI with the chosen/validated settings
+            SearchAPI:
+                A newly constructed SearchAPI with the chosen/validated settings. Subclasses of the current class, such
+                as the `AsyncSearchAPI`, retain their type (e.g., `SearchAPI.update(async_search_api)`).
 
         """
         if not isinstance(search_api, SearchAPI):
@@ -256,7 +279,9 @@ class SearchAPI(BaseAPI):
                 search_api.parameter_config if search_api.config.provider_name == config.provider_name else None
             )
 
-        return SearchAPI.from_settings(
+        # subclasses of the current class are preserved, while other SearchAPIs are converted into the current class
+        search_api_type = type(search_api) if isinstance(search_api, cls) else cls
+        return search_api_type.from_settings(
             query or search_api.query,
             config,
             parameter_config,
@@ -725,6 +750,7 @@ class SearchAPI(BaseAPI):
         parameters: Optional[Dict[str, Any]] = None,
         request_delay: Optional[float] = None,
         endpoint: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> Response:
         """Public method to perform a search for the selected page with the current API configuration.
 
@@ -741,6 +767,9 @@ class SearchAPI(BaseAPI):
                 the built config.
             request_delay (Optional[float]): Overrides the configured request delay for the current request only.
             endpoint (Optional[str]): An Optional API endpoint to append to base_url.
+            rate_limiter (Optional[RateLimiter]):
+                Overrides the rate limiter of the SearchAPI for the current request only. This allows concurrent
+                callers to throttle requests with a thread-safe limiter without reassigning the shared rate limiter.
 
         Returns:
             requests.Response: A response object from the API containing articles and metadata
@@ -748,12 +777,16 @@ class SearchAPI(BaseAPI):
         """
 
         if page is None and (parameters is not None or endpoint is not None):
-
-            with self._rate_limiter.rate(self.config.request_delay if request_delay is None else request_delay):
-                return self.send_request(self.base_url, endpoint=endpoint, parameters=parameters)
+            rate_limiter = rate_limiter or self._rate_limiter
+            with rate_limiter.rate(self.config.request_delay if request_delay is None else request_delay):
+                return self.send_request(
+                    self.base_url, endpoint=endpoint, parameters=parameters, rate_limiter=rate_limiter
+                )
 
         elif page is not None:
-            return self.make_request(page, parameters, request_delay=request_delay, endpoint=endpoint)
+            return self.make_request(
+                page, parameters, request_delay=request_delay, endpoint=endpoint, rate_limiter=rate_limiter
+            )
         else:
             raise APIParameterException("One of 'page' or 'parameters' must be provided")
 
@@ -806,6 +839,7 @@ class SearchAPI(BaseAPI):
         additional_parameters: Optional[dict[str, Any]] = None,
         request_delay: Optional[float] = None,
         endpoint: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> Response:
         """Constructs and sends a request to the chosen api:
 
@@ -816,16 +850,53 @@ class SearchAPI(BaseAPI):
                 A dictionary of additional overrides not included in the original SearchAPIConfig
             request_delay (Optional[float]): Overrides the configured request delay for the current request only.
             endpoint (Optional[str]): The API endpoint to prepare the request for.
+            rate_limiter (Optional[RateLimiter]): Overrides the rate limiter of the SearchAPI for the current request.
         Returns:
             requests.Response: The API's response to the request.
 
         """
 
         parameters = self.build_parameters(current_page, additional_parameters=additional_parameters)
+        rate_limiter = rate_limiter or self._rate_limiter
+
+        with rate_limiter.rate(self.config.request_delay if request_delay is None else request_delay):
+            response = self.send_request(
+                self.base_url, endpoint=endpoint, parameters=parameters, rate_limiter=rate_limiter
+            )
+
+        return response
+
+    def send_request(
+        self,
+        base_url: str,
+        endpoint: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int | float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> requests.Response:
+        """Sends a GET request to the specified endpoint and reports the response to adaptive rate limiters.
+
+        When the request is rate limited with an `AdaptiveRateLimiter`, the status code and rate limit headers of each
+        response that was not retrieved from the request cache are used to adjust the interval before the next request.
+
+        Args:
+            base_url (str): The base API to send the request to.
+            endpoint (Optional[str]): The endpoint of the API to send the request to.
+            parameters (Optional[Dict[str, Any]]): Optional query parameters for the request.
+            timeout (int): Timeout for the request in seconds.
+            rate_limiter (Optional[RateLimiter]):
+                The rate limiter that the request was throttled with, if it was throttled with a limiter other than
+                the rate limiter of the SearchAPI (e.g., a per-request override).
+
+        Returns:
+            requests.Response: The response object.
 
-        with self._rate_limiter.rate(self.config.request_delay if request_delay is None else request_delay):
-            response = self.send_request(self.base_url, endpoint=endpoint, parameters=parameters)
+        """
+        response = super().send_request(base_url, endpoint=endpoint, parameters=parameters, timeout=timeout)
 
+        rate_limiter = rate_limiter or self._rate_limiter
+        if isinstance(rate_limiter, AdaptiveRateLimiter) and not getattr(response, "from_cache", False):
+            rate_limiter.observe(response)
         return response
 
     def prepare_request(
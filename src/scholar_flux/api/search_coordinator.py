@@ -1,12 +1,18 @@
 # /api/search_coordinator.py
 """Implements the SearchCoordinator for orchestrating single/multi-page API response retrieval and record processing."""
 from __future__ import annotations
-from typing import List, Dict, Optional, Any, Sequence, cast, Generator
+from typing import List, Dict, Optional, Any, Sequence, Iterable, Iterator, cast, Generator
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import contextmanager
+from collections import deque
 from requests import PreparedRequest, Response
 from pydantic import ValidationError
+import hashlib
 import logging
 
 from scholar_flux.api.rate_limiting.retry_handler import RetryHandler
+from scholar_flux.api.rate_limiting.rate_limiter import RateLimiter
+from scholar_flux.api.rate_limiting.threaded_rate_limiter import ThreadedRateLimiter
 from scholar_flux import DataCacheManager
 from scholar_flux.api import (
     SearchAPI,
@@ -57,6 +63,8 @@ class SearchCoordinator(BaseCoordinator):
 
     """
 
+    DEFAULT_FAN_OUT_WORKERS: int = 8
+
     def __init__(
         self,
         search_api: Optional[SearchAPI] = None,
@@ -400,7 +408,9 @@ class SearchCoordinator(BaseCoordinator):
         except Exception as e:
             logger.error(f"An unexpected error occurred when processing the response: {e}")
             # `page` input could have a type issue, so create a cache key only if valid
-            cache_key = self._create_cache_key(page=page) if isinstance(page, int) and page >= 0 else None
+            cursor = self._cursor_from_parameters(api_specific_parameters)
+            is_valid_page = isinstance(page, int) and page >= 0
+            cache_key = self._create_cache_key(page=page, cursor=cursor) if is_valid_page else None
             return NonResponse.from_error(error=e, message=str(e), cache_key=cache_key)
 
     def parameter_search(
@@ -455,6 +465,11 @@ class SearchCoordinator(BaseCoordinator):
         from_request_cache: bool = True,
         from_process_cache: bool = True,
         use_workflow: Optional[bool] = True,
+        prefetch: Optional[int] = None,
+        fan_out: bool = False,
+        max_workers: Optional[int] = None,
+        use_cursor: bool = False,
+        cursor: Optional[str] = None,
         **api_specific_parameters,
     ) -> SearchResultList:
         """Public method for retrieving and processing records from the API specifying the page and records per page in
@@ -480,6 +495,23 @@ class SearchCoordinator(BaseCoordinator):
                 This parameter determines whether to attempt to pull processed responses from the cache storage.
             use_workflow (bool):
                 Indicates whether to use a workflow if available Workflows are utilized by default.
+            prefetch (Optional[int]):
+                The number of pages to request ahead of the page that is currently being processed. When provided,
+                requests for upcoming pages are sent while earlier pages are processed in the background (see
+                `iter_pages`). Pages are retrieved and processed serially by default.
+            fan_out (bool):
+                When True, the total number of query hits reported by the first page is used to plan the remaining
+                pages, which are then requested concurrently. Requests are still spaced by the provider's rate limiter,
+                so retrieval is bounded by the allowed request rate rather than by the time needed to process each page.
+                When the total number of hits is unavailable, the remaining pages are retrieved in sequence.
+            max_workers (Optional[int]):
+                The maximum number of pages to retrieve concurrently when `fan_out=True`. Defaults to
+                `SearchCoordinator.DEFAULT_FAN_OUT_WORKERS`.
+            use_cursor (bool):
+                Indicates whether pages should be requested with cursor pagination when supported by the provider
+                (see `iter_pages`). Cursor pages are always retrieved in sequence.
+            cursor (Optional[str]):
+                The cursor of the first page to request. Enables cursor pagination when provided.
             **api_specific_parameters (SearchAPIConfig):
                 Fields to temporarily override when building the request.
 
@@ -500,30 +532,273 @@ class SearchCoordinator(BaseCoordinator):
         """
         page_results: SearchResultList = SearchResultList()
 
+        # looks up the processing cache for every requested page in one batch rather than once per page
+        with self._prefetch_cached_pages(pages, from_process_cache=from_process_cache):
+            if fan_out:
+                if use_workflow and self.workflow:
+                    logger.info("Pages are retrieved serially when a workflow is used. Skipping the page fan-out...")
+                elif use_cursor or cursor is not None:
+                    logger.info("Cursor pages depend on the previous response. Skipping the page fan-out...")
+                else:
+                    return self._fan_out_pages(
+                        pages,
+                        max_workers=max_workers,
+                        from_request_cache=from_request_cache,
+                        from_process_cache=from_process_cache,
+                        prefetch=prefetch,
+                        **api_specific_parameters,
+                    )
+
+            try:
+
+                search_results = self.iter_pages(
+                    pages=pages,
+                    from_request_cache=from_request_cache,
+                    from_process_cache=from_process_cache,
+                    use_workflow=use_workflow,
+                    prefetch=prefetch,
+                    use_cursor=use_cursor,
+                    cursor=cursor,
+                    **api_specific_parameters,
+                )
+
+                for search_result in search_results:
+                    page_results.append(search_result)
+
+            except Exception as e:
+                logger.error(f"An unexpected error occurred when processing the response: {e}")
+
+        return page_results
+
+    def _fan_out_pages(
+        self,
+        pages: Sequence[int] | PageListInput,
+        max_workers: Optional[int] = None,
+        from_request_cache: bool = True,
+        from_process_cache: bool = True,
+        prefetch: Optional[int] = None,
+        **api_specific_parameters,
+    ) -> SearchResultList:
+        """Helper method that retrieves the first page and then requests the remaining pages concurrently.
+
+        The total number of query hits reported by the first page determines how many of the remaining pages contain
+        records. Only those pages are dispatched to a thread pool, and a thread-safe rate limiter spaces the requests so
+        that the provider's rate limit is respected. After retrieval, results are re-ordered by page and the halting
+        logic used by `iter_pages` is applied, so the returned list matches the result of sequential retrieval.
+
+        Args:
+            pages (Sequence[int] | PageListInput): A sequence of page numbers to request from the API Provider.
+            max_workers (Optional[int]): The maximum number of pages to retrieve concurrently.
+            from_request_cache (bool): Indicates whether to attempt to retrieve the response from the requests-cache.
+            from_process_cache (bool): Indicates whether to attempt to pull processed responses from the cache.
+            prefetch (Optional[int]): Used to pipeline the remaining pages if the total number of hits is unavailable.
+            **api_specific_parameters (SearchAPIConfig): Fields to temporarily override when building the request.
+
+        Returns:
+            SearchResultList: The search results for each retrieved page in page order.
+
+        """
+        page_results: SearchResultList = SearchResultList()
+
         try:
+            workers = self._validate_max_workers(max_workers)
+            page_numbers = list(self._validate_page_list_input(pages).page_numbers)
+            if not page_numbers:
+                return page_results
+
+            first_page, *remaining_pages = page_numbers
 
-            search_results = self.iter_pages(
-                pages=pages,
+            first_result = self.search_page(
+                page=first_page,
                 from_request_cache=from_request_cache,
                 from_process_cache=from_process_cache,
-                use_workflow=use_workflow,
+                use_workflow=False,
                 **api_specific_parameters,
             )
+            page_results.append(first_result)
+
+            if self._process_page_result(first_result.response_result, first_page) or not remaining_pages:
+                return page_results
+
+            planned_pages = self._plan_fan_out_pages(first_result.response_result, first_page, remaining_pages)
 
-            for search_result in search_results:
+            if planned_pages is None:
+                logger.info(
+                    f"The total number of query hits is unavailable for the provider, {self.api.provider_name}. "
+                    "Retrieving the remaining pages in sequence..."
+                )
+                page_results.extend(
+                    list(
+                        self.iter_pages(
+                            remaining_pages,
+                            from_request_cache=from_request_cache,
+                            from_process_cache=from_process_cache,
+                            use_workflow=False,
+                            prefetch=prefetch,
+                            **api_specific_parameters,
+                        )
+                    )
+                )
+                return page_results
+
+            if not planned_pages:
+                return page_results
+
+            with self._thread_safe_rate_limiter() as rate_limiter, ThreadPoolExecutor(
+                max_workers=min(workers, len(planned_pages)), thread_name_prefix=f"{self.api.provider_name}-fan-out"
+            ) as executor:
+                page_futures = [
+                    executor.submit(
+                        self.search_page,
+                        page=page,
+                        from_request_cache=from_request_cache,
+                        from_process_cache=from_process_cache,
+                        use_workflow=False,
+                        rate_limiter=rate_limiter,
+                        **api_specific_parameters,
+                    )
+                    for page in planned_pages
+                ]
+
+            for index, (page, future) in enumerate(zip(planned_pages, page_futures)):
+                search_result = future.result()
                 page_results.append(search_result)
+                if self._process_page_result(search_result.response_result, page):
+                    if discarded := len(planned_pages) - index - 1:
+                        logger.info(f"Discarding {discarded} page(s) retrieved after page {page}")
+                    break
 
+        except InvalidCoordinatorParameterException:
+            raise
         except Exception as e:
             logger.error(f"An unexpected error occurred when processing the response: {e}")
 
         return page_results
 
+    def _plan_fan_out_pages(
+        self,
+        response_result: Optional[ProcessedResponse | ErrorResponse],
+        page: int,
+        remaining_pages: Sequence[int],
+    ) -> Optional[list[int]]:
+        """Helper method that uses the total number of query hits from a page to determine which pages contain records.
+
+        Args:
+            response_result (Optional[ProcessedResponse | ErrorResponse]): The response received for `page`.
+            page (int): The page number of the response used to plan the remaining pages.
+            remaining_pages (Sequence[int]): The requested pages that follow the current page.
+
+        Returns:
+            Optional[list[int]]:
+                The requested pages that are expected to contain records, or None if the total number of query hits
+                or the number of records per page is unavailable.
+
+        """
+        records_per_page = self.search_api.config.records_per_page
+        total_hits = response_result.total_query_hits if isinstance(response_result, ProcessedResponse) else None
+
+        if total_hits is None or not records_per_page:
+            return None
+
+        last_page = page + ResponseMetadataMap._calculate_pages_remaining(page, total_hits, records_per_page)
+        return [remaining_page for remaining_page in remaining_pages if page < remaining_page <= last_page]
+
+    @contextmanager
+    def _prefetch_cached_pages(
+        self, pages: Sequence[int] | PageListInput, from_process_cache: bool = True
+    ) -> Iterator[int]:
+        """Context manager that retrieves the processing cache entries of each requested page in a single batch.
+
+        The cache keys of all pages are retrieved from the cache storage with one `retrieve_many` call before any
+        page is requested, so that replaying cached pages does not require a separate storage lookup for each page.
+        Prefetched entries that were not used by the time the context exits are discarded.
+
+        Args:
+            pages (Sequence[int] | PageListInput): The page numbers that will be requested within the context.
+            from_process_cache (bool): Indicates whether processed responses will be pulled from the cache.
+
+        Yields:
+            int: The number of requested pages that were found in the processing cache.
+
+        """
+        cache_manager = self.response_coordinator.cache_manager
+        cache_keys: list[str] = []
+        cached_pages = 0
+
+        if from_process_cache and cache_manager:
+            try:
+                page_numbers = self._validate_page_list_input(pages).page_numbers
+                cache_keys = [self._create_cache_key(page) for page in page_numbers]
+                cached_pages = cache_manager.prefetch(cache_keys)
+                logger.debug(f"Prefetched {cached_pages} of {len(cache_keys)} pages from the processing cache")
+            except (StorageCacheException, InvalidCoordinatorParameterException) as e:
+                # pages are looked up individually instead when the batched lookup is unsuccessful
+                logger.warning(f"Could not prefetch the processing cache for the requested pages: {e}")
+                cache_keys = []
+
+        try:
+            yield cached_pages
+        finally:
+            if cache_keys:
+                cache_manager.discard_prefetched(cache_keys)
+
+    @contextmanager
+    def _thread_safe_rate_limiter(self) -> Iterator[RateLimiter]:
+        """Context manager that provides a thread-safe rate limiter to pass explicitly to concurrent page requests.
+
+        Rate limiters that are already thread-safe are used as is. Otherwise, a `ThreadedRateLimiter` continues from the
+        time of the last request, and the time of the last request is carried back to the original rate limiter on exit.
+        The rate limiter assigned to the SearchAPI is never replaced, so other callers sharing the SearchAPI are not
+        affected by the concurrent requests.
+
+        Yields:
+            RateLimiter: The thread-safe rate limiter to pass to each request sent within the context.
+
+        """
+        rate_limiter = self.api._rate_limiter
+        if isinstance(rate_limiter, ThreadedRateLimiter):
+            yield rate_limiter
+            return
+
+        threaded_rate_limiter = ThreadedRateLimiter(rate_limiter.min_interval)
+        threaded_rate_limiter._last_call = rate_limiter._last_call
+        try:
+            yield threaded_rate_limiter
+        finally:
+            if threaded_rate_limiter._last_call is not None:
+                rate_limiter._last_call = max(rate_limiter._last_call or 0, threaded_rate_limiter._last_call)
+
+    @classmethod
+    def _validate_max_workers(cls, max_workers: Optional[int]) -> int:
+        """Helper method that verifies that the maximum number of concurrent page requests is a positive integer.
+
+        Args:
+            max_workers (Optional[int]): The maximum number of pages to retrieve concurrently.
+
+        Returns:
+            int: The validated number of workers, defaulting to `SearchCoordinator.DEFAULT_FAN_OUT_WORKERS`.
+
+        Raises:
+            InvalidCoordinatorParameterException: If `max_workers` is not a positive integer.
+
+        """
+        if max_workers is None:
+            return cls.DEFAULT_FAN_OUT_WORKERS
+        if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+            raise InvalidCoordinatorParameterException(
+                f"Expected `max_workers` to be a positive integer. Received {max_workers!r}"
+            )
+        return max_workers
+
     def iter_pages(
         self,
         pages: Sequence[int] | PageListInput,
         from_request_cache: bool = True,
         from_process_cache: bool = True,
         use_workflow: Optional[bool] = True,
+        prefetch: Optional[int] = None,
+        use_cursor: bool = False,
+        cursor: Optional[str] = None,
         **api_specific_parameters,
     ) -> Generator[SearchResult, None, None]:
         """Helper method that creates a generator function for retrieving and processing records from the API Provider
@@ -534,6 +809,19 @@ class SearchCoordinator(BaseCoordinator):
         This method is directly used by SearchCoordinator.search_pages to provide a clean interface that abstracts
         the complexity of iterators and is also provided for convenience when iteration is more preferable.
 
+        By default, each page is requested, processed, and cached before the next request is sent. When `prefetch` is
+        provided, iteration is pipelined instead: the request for the next page is sent as soon as the rate limiter
+        allows while the previous page is parsed, extracted, and processed in a background worker. Results are still
+        yielded in page order, and the halting logic is applied to each page before it is yielded. When a page signals
+        that retrieval should halt, speculative pages that were requested ahead of it are cancelled or discarded.
+
+        For providers that support cursor pagination (e.g., Crossref and OpenAlex), `use_cursor=True` requests each
+        page with the cursor returned by the previous response instead of an offset or page number. This avoids the
+        offset limits that providers apply to deep pagination. The page numbers then label consecutive cursor pages,
+        each SearchResult records the `cursor` used to request it, and iteration halts once a response no longer
+        returns a `next_cursor`. Because each request depends on the previous response, cursor pages are retrieved
+        serially.
+
         Args:
             pages (Sequence[int] | PageListInput): A sequence of page numbers to request from the API Provider.
             from_request_cache (bool): This parameter determines whether to try to retrieve the response from the
@@ -541,6 +829,14 @@ class SearchCoordinator(BaseCoordinator):
             from_process_cache (bool): This parameter determines whether to attempt to pull processed responses from
                                        the cache storage.
             use_workflow (bool): Indicates whether to use a workflow if available Workflows are utilized by default.
+            prefetch (Optional[int]): The maximum number of pages to request ahead of the page that is currently being
+                                      processed. Pages are retrieved serially when `prefetch` is None or 0. Because
+                                      workflows send dependent requests for each page, iteration remains serial when
+                                      a workflow is used.
+            use_cursor (bool): Indicates whether pages should be requested using cursor pagination.
+            cursor (Optional[str]): The cursor of the first page to request. Enables cursor pagination when provided
+                                    and defaults to the `initial_cursor` of the parameter map otherwise. The
+                                    `next_cursor` of the last SearchResult can be used to resume a previous search.
 
             **api_specific_parameters (SearchAPIConfig): Fields to temporarily override when building the request.
 
@@ -550,10 +846,42 @@ class SearchCoordinator(BaseCoordinator):
                           (provider_name), and the result of the search containing a ProcessedResponse,
                           an ErrorResponse, or None (api response)
 
+        Raises:
+            InvalidCoordinatorParameterException:
+                If `pages` or `prefetch` is invalid or if cursor pagination is not supported by the current API.
+
         """
 
         # preprocesses the iterable or sequence of pages to reduce redundancy and validate beforehand
         page_list_input = self._validate_page_list_input(pages)
+        prefetch = self._validate_prefetch(prefetch)
+
+        if use_cursor or cursor is not None:
+            if prefetch:
+                logger.info("Cursor pages depend on the previous response and are retrieved serially...")
+            yield from self._iter_pages_by_cursor(
+                page_list_input.page_numbers,
+                cursor=cursor,
+                from_request_cache=from_request_cache,
+                from_process_cache=from_process_cache,
+                use_workflow=use_workflow,
+                **api_specific_parameters,
+            )
+            return
+
+        if prefetch and use_workflow and self.workflow:
+            logger.info("Pages are retrieved serially when a workflow is used. Skipping page prefetching...")
+            prefetch = 0
+
+        if prefetch:
+            yield from self._iter_pages_pipelined(
+                page_list_input.page_numbers,
+                prefetch=prefetch,
+                from_request_cache=from_request_cache,
+                from_process_cache=from_process_cache,
+                **api_specific_parameters,
+            )
+            return
 
         for page in page_list_input.page_numbers:
 
@@ -572,6 +900,233 @@ class SearchCoordinator(BaseCoordinator):
             if halt:
                 break
 
+    def _iter_pages_by_cursor(
+        self,
+        page_numbers: Iterable[int],
+        cursor: Optional[str] = None,
+        from_request_cache: bool = True,
+        from_process_cache: bool = True,
+        use_workflow: Optional[bool] = True,
+        parameters: Optional[Dict[str, Any]] = None,
+        **api_specific_parameters,
+    ) -> Generator[SearchResult, None, None]:
+        """Helper method that retrieves consecutive pages using the cursor returned by each previous response.
+
+        Args:
+            page_numbers (Iterable[int]): The page numbers used to label each consecutive cursor page.
+            cursor (Optional[str]): The cursor of the first page. Defaults to the `initial_cursor` of the parameter map.
+            from_request_cache (bool): Indicates whether to attempt to retrieve the response from the requests-cache.
+            from_process_cache (bool): Indicates whether to attempt to pull processed responses from the cache.
+            use_workflow (bool): Indicates whether to use a workflow if available.
+            parameters (Optional[Dict[str, Any]]): Additional request parameters to send alongside the cursor.
+            **api_specific_parameters (SearchAPIConfig): Fields to temporarily override when building the request.
+
+        Yields:
+            SearchResult: The result for each page, including the cursor used to request the page.
+
+        Raises:
+            InvalidCoordinatorParameterException: If the current API does not support cursor pagination.
+
+        """
+        parameter_map = self.api.parameter_config.map
+        current_cursor = cursor if cursor is not None else parameter_map.initial_cursor
+
+        if not parameter_map.cursor or current_cursor is None:
+            raise InvalidCoordinatorParameterException(
+                f"Cursor pagination is not supported for the provider, {self.api.provider_name}. Specify the `cursor` "
+                "and `initial_cursor` fields of the APIParameterMap to enable cursor pagination."
+            )
+
+        for page in page_numbers:
+            search_result = self.search_page(
+                page=page,
+                from_request_cache=from_request_cache,
+                from_process_cache=from_process_cache,
+                use_workflow=use_workflow,
+                parameters=(parameters or {}) | {"cursor": current_cursor},
+                **api_specific_parameters,
+            )
+            search_result.cursor = current_cursor
+
+            halt = self._process_page_result(search_result.response_result, page)
+            next_cursor = search_result.next_cursor
+
+            if not halt and not next_cursor:
+                logger.warning(
+                    f"The response for page {page} did not contain a cursor for the next page. "
+                    "Halting multi-page retrieval..."
+                )
+                halt = True
+
+            yield search_result
+
+            if halt or not next_cursor:
+                break
+
+            current_cursor = next_cursor
+
+    def _iter_pages_pipelined(
+        self,
+        page_numbers: Iterable[int],
+        prefetch: int,
+        from_request_cache: bool = True,
+        from_process_cache: bool = True,
+        normalize_records: Optional[bool] = None,
+        **api_specific_parameters,
+    ) -> Generator[SearchResult, None, None]:
+        """Helper method that overlaps the retrieval of upcoming pages with the processing of previous pages.
+
+        Responses are fetched on the calling thread so that the rate limiter spaces requests exactly as it does for
+        serial retrieval. Each response is then handed to a single background worker that processes and caches pages
+        in the order they were received, so the parser, extractor, processor, and cache manager are never used by more
+        than one thread at a time. At most `prefetch` pages are requested ahead of the oldest page that has not yet
+        been yielded.
+
+        Args:
+            page_numbers (Iterable[int]): The validated page numbers to request in order.
+            prefetch (int): The maximum number of pages to request ahead of the oldest page that has not been yielded.
+            from_request_cache (bool): Indicates whether to attempt to retrieve the response from the requests-cache.
+            from_process_cache (bool): Indicates whether to attempt to pull processed responses from the cache.
+            normalize_records (Optional[bool]): Determines whether records should be normalized after processing.
+            **api_specific_parameters (SearchAPIConfig): Fields to temporarily override when building the request.
+
+        Yields:
+            SearchResult: The result for each page in the order the pages were requested.
+
+        """
+        pending: deque[tuple[int, Future[Optional[ProcessedResponse | ErrorResponse]]]] = deque()
+        remaining_pages = iter(page_numbers)
+        exhausted = False
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.api.provider_name}-prefetch")
+        try:
+            while pending or not exhausted:
+                # sends the next request while earlier pages are processed, unless enough pages are already pending
+                if not exhausted and (not pending or (not pending[0][1].done() and len(pending) <= prefetch)):
+                    page = next(remaining_pages, None)
+                    if page is None:
+                        exhausted = True
+                        continue
+
+                    api_response = self._fetch_page_response(
+                        page, from_request_cache=from_request_cache, **api_specific_parameters
+                    )
+                    pending.append(
+                        (
+                            page,
+                            executor.submit(
+                                self._process_page_response,
+                                api_response,
+                                page,
+                                from_process_cache=from_process_cache,
+                                normalize_records=normalize_records,
+                            ),
+                        )
+                    )
+                    continue
+
+                page, future = pending.popleft()
+                search_result = self._build_search_result(future.result(), page, use_workflow=False)
+                halt = self._process_page_result(search_result.response_result, page)
+
+                yield search_result
+
+                if halt:
+                    if pending:
+                        logger.info(
+                            f"Discarding {len(pending)} prefetched page(s) after page {page} for the provider, "
+                            f"{self.api.provider_name}"
+                        )
+                    break
+        finally:
+            # pages that haven't started processing are cancelled while the page in progress is allowed to finish
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_page_response(
+        self, page: int, from_request_cache: bool = True, **api_specific_parameters
+    ) -> APIResponse:
+        """Helper method that fetches the response for a page, converting unexpected errors into a NonResponse.
+
+        Args:
+            page (int): The page number to request.
+            from_request_cache (bool): Indicates whether to attempt to retrieve the response from the requests-cache.
+            **api_specific_parameters (SearchAPIConfig): Fields to temporarily override when building the request.
+
+        Returns:
+            APIResponse: The fetched response and its cache key, or a NonResponse if the response is unavailable.
+
+        """
+        try:
+            api_response = self._fetch_api_response(
+                page, from_request_cache=from_request_cache, **api_specific_parameters
+            )
+            self._log_response_source(api_response.response, page, api_response.cache_key)
+            return api_response
+        except Exception as e:
+            logger.error(f"An unexpected error occurred when retrieving the response: {e}")
+            cursor = self._cursor_from_parameters(api_specific_parameters)
+            return NonResponse.from_error(
+                error=e, message=str(e), cache_key=self._create_cache_key(page=page, cursor=cursor)
+            )
+
+    def _process_page_response(
+        self,
+        api_response: APIResponse,
+        page: int,
+        from_process_cache: bool = True,
+        normalize_records: Optional[bool] = None,
+    ) -> Optional[ProcessedResponse | ErrorResponse]:
+        """Helper method that processes a fetched page, converting unexpected errors into a NonResponse.
+
+        Args:
+            api_response (APIResponse): The response and cache key returned by `_fetch_page_response`.
+            page (int): The page number associated with the response.
+            from_process_cache (bool): Indicates whether to attempt to pull processed responses from the cache.
+            normalize_records (Optional[bool]): Determines whether records should be normalized after processing.
+
+        Returns:
+            Optional[ProcessedResponse | ErrorResponse]: The processed response or an ErrorResponse/NonResponse.
+
+        """
+        # if there is no data to process within the response, return it as is
+        if isinstance(api_response, NonResponse):
+            return api_response
+
+        try:
+            return self._process_response(
+                response=cast(ResponseProtocol, api_response.response),
+                cache_key=cast(str, api_response.cache_key),
+                from_process_cache=from_process_cache,
+                normalize_records=normalize_records,
+            )
+        except Exception as e:
+            logger.error(f"An unexpected error occurred when processing the response: {e}")
+            return NonResponse.from_error(error=e, message=str(e), cache_key=api_response.cache_key)
+
+    @classmethod
+    def _validate_prefetch(cls, prefetch: Optional[int]) -> int:
+        """Helper method that verifies that the number of pages to prefetch is a non-negative integer.
+
+        Args:
+            prefetch (Optional[int]): The number of pages to request ahead of the page currently being processed.
+
+        Returns:
+            int: The validated number of pages to prefetch, where 0 indicates that pages are retrieved serially.
+
+        Raises:
+            InvalidCoordinatorParameterException: If `prefetch` is not a non-negative integer.
+
+        """
+        if prefetch is None:
+            return 0
+        if not isinstance(prefetch, int) or isinstance(prefetch, bool) or prefetch < 0:
+            raise InvalidCoordinatorParameterException(
+                f"Expected `prefetch` to be a non-negative integer. Received {prefetch!r}"
+            )
+        return prefetch
+
     def search_page(
         self,
         page: int,
@@ -626,6 +1181,28 @@ class SearchCoordinator(BaseCoordinator):
             **api_specific_parameters,
         )
 
+        return self._build_search_result(api_response, page, use_workflow=use_workflow)
+
+    def _build_search_result(
+        self,
+        api_response: Optional[ProcessedResponse | ErrorResponse],
+        page: int,
+        use_workflow: Optional[bool] = True,
+    ) -> SearchResult:
+        """Helper method for wrapping a page response in a `SearchResult` labeled with its provider, query, and page.
+
+        When a workflow is active, the provider name is resolved from the URL of the response, as workflows can retrieve
+        the final response from a provider other than the one configured on the SearchAPI.
+
+        Args:
+            api_response (Optional[ProcessedResponse | ErrorResponse]): The result of the search for the current page.
+            page (int): The page number associated with the response.
+            use_workflow (bool): Indicates whether a workflow was used to retrieve the response.
+
+        Returns:
+            SearchResult: A search result containing the page, provider name, query, and response result.
+
+        """
         # for workflow resolution where needed
         if self.workflow and use_workflow:
             provider_url = api_response.url if api_response is not None else None
@@ -834,6 +1411,20 @@ class SearchCoordinator(BaseCoordinator):
 
     def _respect_retry_after(self) -> None:
         """Helper method that respects `retry_after` field before requests exceed dynamic API rate limits."""
+        if retry_after := self._get_retry_after_wait():
+            delay, timestamp = retry_after
+            # waits for a max of `delay` seconds without updating the `_last_called` timestamp
+            self.api._rate_limiter._wait(delay, timestamp)
+
+    def _get_retry_after_wait(self) -> Optional[tuple[float | int, float]]:
+        """Helper method that extracts the `retry_after` delay and the time it applies from, using the last response.
+
+        Returns:
+            Optional[tuple[float | int, float]]:
+                A tuple containing the delay in seconds and the timestamp that the delay is measured from when the
+                last response to the current URL contains a `Retry-After` header. Otherwise None.
+
+        """
 
         # If the current URL has not changed from the last request, attempt to extract a Retry-After parameter directly
         if (
@@ -867,8 +1458,8 @@ class SearchCoordinator(BaseCoordinator):
             # parse the datetime into a numeric timestamp
             timestamp = created_date.timestamp() if created_date else None
             if delay and timestamp:
-                # waits for a max of `delay` seconds without updating the `_last_called` timestamp
-                self.api._rate_limiter._wait(delay, timestamp)
+                return delay, timestamp
+        return None
 
     def robust_request(self, page: Optional[int], **api_specific_parameters) -> Optional[Response | ResponseProtocol]:
         """Constructs and sends a request to the current API. Fetches a response from the current API.
@@ -963,7 +1554,8 @@ class SearchCoordinator(BaseCoordinator):
                                        unsuccessful due to an error.
 
         """
-        cache_key = self._create_cache_key(page) if page is not None else None
+        cursor = self._cursor_from_parameters(api_specific_parameters)
+        cache_key = self._create_cache_key(page, cursor=cursor) if page is not None else None
         try:
             response = self.fetch(
                 page, from_request_cache=from_request_cache, raise_on_error=True, **api_specific_parameters
@@ -1063,13 +1655,15 @@ class SearchCoordinator(BaseCoordinator):
             PreparedRequest: The prepared request object to send to the api
 
         """
+        # rate limiter overrides only apply to sending the request and are never included as request parameters
+        kwargs.pop("rate_limiter", None)
         parameters = self.api._validate_parameters((kwargs.pop("parameters", {}))) | kwargs
         endpoint = parameters.pop("endpoint", None)
         request = self.search_api.prepare_search(page, parameters, endpoint=endpoint)
         return request
 
     # Cache Management
-    def _create_cache_key(self, page: Optional[int], url: Optional[str] = None) -> str:
+    def _create_cache_key(self, page: Optional[int], url: Optional[str] = None, cursor: Optional[str] = None) -> str:
         """Combines information about the query type and current page to create an identifier for the current query.
 
         The cache key is generated using the current page argument, as well as the provider_name, query, and
@@ -1078,9 +1672,14 @@ class SearchCoordinator(BaseCoordinator):
         with hashlib's sha256 implementation (via `DataCacheManager._cache_key_from_url`) when possible. As a result,
         consistency in cache key formation is guaranteed for the same input.
 
+        When pages are requested with cursor pagination, the page number only labels the position of the page within
+        the current traversal. A digest of the cursor is then appended so that pages requested with different cursors
+        (e.g., when resuming a previous search) never share a cache key with each other or with offset-based pages.
+
         Args:
             page (Optional[int]): The current page number. None for parameter-based searches.
             url (Optional[str]): The request URL for parameter-based cache keys. Used when page is None.
+            cursor (Optional[str]): The cursor used to request the page when cursor pagination is active.
 
          Returns:
              str: A unique cache key based on the provided parameters.
@@ -1088,9 +1687,22 @@ class SearchCoordinator(BaseCoordinator):
         """
         if not page and url is not None and validate_url(url, verbose=False):
             return DataCacheManager._cache_key_from_url(url)
-        return (
-            f"{self.search_api.provider_name}_{self.search_api.query}_{page}_{self.search_api.records_per_page}".lower()
-        )
+        cache_key = f"{self.search_api.provider_name}_{self.search_api.query}_{page}_{self.search_api.records_per_page}"
+        if cursor is not None:
+            cache_key += f"_{hashlib.sha256(str(cursor).encode()).hexdigest()[:16]}"
+        return cache_key.lower()
+
+    @staticmethod
+    def _cursor_from_parameters(api_specific_parameters: Dict[str, Any]) -> Optional[str]:
+        """Helper method that retrieves the cursor from the flat or nested parameters of a request, if provided.
+
+        As with `_prepare_request`, flat keyword arguments take precedence over the nested `parameters` dictionary.
+
+        """
+        parameters = api_specific_parameters.get("parameters")
+        nested_cursor = parameters.get("cursor") if isinstance(parameters, dict) else None
+        cursor = api_specific_parameters.get("cursor", nested_cursor)
+        return str(cursor) if cursor is not None else None
 
     def _get_request_key(self, page: Optional[int], **kwargs) -> Optional[str]:
         """Creates a request key from the requests session cache if available.
@@ -74,6 +74,7 @@ from scholar_flux.data.data_extractor import DataExtractor
 from scholar_flux.data.base_parser import BaseDataParser
 from scholar_flux.data.data_parser import DataParser
 from scholar_flux.data.abc_processor import ABCDataProcessor
+from scholar_flux.data.extraction_plan import ExtractionPlan
 from scholar_flux.data.data_processor import DataProcessor
 from scholar_flux.data.normalizing_data_processor import NormalizingDataProcessor
 from scholar_flux.data.pass_through_data_processor import PassThroughDataProcessor
@@ -87,6 +88,7 @@ __all__ = [
     "BaseDataParser",
     "DataParser",
     "ABCDataProcessor",
+    "ExtractionPlan",
     "DataProcessor",
     "NormalizingDataProcessor",
     "PassThroughDataProcessor",
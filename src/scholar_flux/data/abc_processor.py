@@ -10,6 +10,7 @@ from typing import Optional, Tuple, Any
 from typing_extensions import Self
 from abc import ABC, abstractmethod
 from scholar_flux.utils.repr_utils import generate_repr
+from scholar_flux.utils.columnar import records_to_columns, columns_to_arrow
 from scholar_flux.exceptions import DataValidationException
 import copy
 import threading
@@ -100,6 +101,43 @@ class ABCDataProcessor(ABC):
         """
         return self.process_page(*args, **kwargs)
 
+    def process_columns(self, *args, **kwargs) -> dict[Any, list] | Any:
+        """Processes a page of records into columns for column-oriented tools such as Arrow and Polars.
+
+        By default, this method is a convenience that processes the page with `process_page` and then transposes the
+        processed records into a dictionary that maps each field to the list of its values across all records. Records
+        that do not contain a field are assigned None within the column of the field. Subclasses can override this
+        method to fill each column directly while records are processed (e.g. `DataProcessor.process_columns`).
+
+        Args:
+            *args: Positional arguments passed to `process_page` (generally the list of records to process)
+            **kwargs:
+                Keyword arguments passed to `process_page` (e.g. `keep_keys` or `ignore_keys`), apart from `arrow`
+                (bool), which indicates whether to return a `pyarrow.Table` instead of a dictionary of columns.
+
+        Returns:
+            dict[Any, list] | pyarrow.Table: The processed records as columns, or as an Arrow table if `arrow=True`.
+
+        Raises:
+            PyArrowImportError: If `arrow=True` and the optional `pyarrow` package is not installed.
+
+        Example:
+            >>> from scholar_flux.data import DataProcessor
+            >>> processor = DataProcessor(record_keys=['id', 'school.department'])
+            >>> processor.process_columns([{'id': 1, 'school': {'department': 'History'}}, {'id': 2}])
+            # OUTPUT: {'id': [1, 2], 'school.department': ['History', None]}
+
+        """
+        # the signature accepts any arguments so that subclasses can list the parameters of their `process_page`
+        arrow = kwargs.pop("arrow", False)
+        columns = records_to_columns(self.process_page(*args, **kwargs), fields=self._column_fields())
+        return columns_to_arrow(columns) if arrow else columns
+
+    def _column_fields(self) -> Optional[list]:
+        """Helper method that lists the fields of processed records when known in advance, so that each page yields the
+        same columns. If None, the columns are inferred from the fields of the processed records."""
+        return None
+
     @classmethod
     def _validate_inputs(
         cls,
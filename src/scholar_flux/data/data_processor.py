@@ -5,13 +5,19 @@ retrieval by using the list of record_keys that point to the paths of fields to
 JSON dictionary records.
 
 The data processor can be used to filter records based on conditions and extract nested key-value pairs within each
-record to ensure that relevant records and fields from records are retained
+record to ensure that relevant records and fields from records are retained.
+
+Record keys are compiled into an ExtractionPlan on first use so that each record is walked once to extract all fields
+instead of retrieving each key with a separate walk along its nested path. The fields extracted by the plan are also
+appended directly to the columns returned by `DataProcessor.process_columns`.
 
 """
-from typing import Any, Optional, Mapping
+from typing import Any, Iterator, Optional, Mapping
 from scholar_flux.utils import get_nested_data, as_list_1d, unlist_1d, nested_key_exists, PathUtils
 
 from scholar_flux.data import ABCDataProcessor
+from scholar_flux.data.extraction_plan import ExtractionPlan
+from scholar_flux.utils.columnar import columns_to_arrow
 from scholar_flux.exceptions import DataProcessingException, DataValidationException
 
 import logging
@@ -139,6 +145,19 @@ class DataProcessor(ABCDataProcessor):
         """Helper method that processes record paths and delimits strings into lists where applicable."""
         return record_path.split(".") if isinstance(record_path, str) else as_list_1d(record_path)
 
+    @property
+    def extraction_plan(self) -> ExtractionPlan:
+        """The plan compiled from the current record keys and used to extract all fields of each record in one walk.
+
+        The plan is compiled on first use and recompiled whenever the record keys are changed.
+
+        """
+        # the plan is callable, which also excludes it from the representation and schema fingerprint of the processor
+        plan: Optional[ExtractionPlan] = self.__dict__.get("_extraction_plan")
+        if plan is None or not plan.matches(self.record_keys):
+            plan = self._extraction_plan = ExtractionPlan(self.record_keys)
+        return plan
+
     @staticmethod
     def extract_key(
         record: dict | list | None,
@@ -195,27 +214,59 @@ class DataProcessor(ABCDataProcessor):
             logger.debug("A record is empty: skipping,,,")
             # Simplified record data processing using dictionary comprehension
 
-        processed_record_dict = (
-            {key: self.extract_key(record_dict, path[-1], path[:-1]) for key, path in self.record_keys.items()}
-            if self.record_keys
-            else {}
-        )
+        # extracts every record key in a single walk, equivalent to calling `extract_key` for each key and path
+        processed_record_dict = self.extraction_plan(record_dict) if self.record_keys else {}
 
         return self.collapse_fields(processed_record_dict)
 
+    def _column_fields(self) -> Optional[list]:
+        """Helper method that lists the record keys as the columns of processed pages, including empty pages."""
+        return list(self.record_keys) if self.record_keys else None
+
     def collapse_fields(self, processed_record_dict: dict) -> dict[str, list[str | int] | str | int]:
         """Helper method for joining lists of data into a singular string for flattening."""
         if processed_record_dict and self.value_delimiter is not None:
-            return {
-                k: (
-                    self.value_delimiter.join(str(i) for i in field_item)
-                    if field_item is not None and isinstance(field_item, (list, tuple)) and len(field_item) > 1
-                    else unlist_1d(field_item)
-                )
-                for k, field_item in processed_record_dict.items()
-            }
+            collapse_field = self._collapse_field
+            return {k: collapse_field(field_item) for k, field_item in processed_record_dict.items()}
         return {k: unlist_1d(v) for k, v in processed_record_dict.items()}
 
+    def _collapse_field(self, field_item: Optional[list]) -> Any:
+        """Helper method that joins a list of values with the value delimiter or unlists single values."""
+        if self.value_delimiter is not None and isinstance(field_item, (list, tuple)) and len(field_item) > 1:
+            return self.value_delimiter.join(str(i) for i in field_item)
+        return unlist_1d(field_item)
+
+    def _resolve_filters(
+        self,
+        ignore_keys: Optional[list[str]] = None,
+        keep_keys: Optional[list[str]] = None,
+        regex: Optional[bool] = None,
+    ) -> tuple[Optional[list[str]], Optional[list[str]], Optional[bool]]:
+        """Helper method that falls back to the filters of the processor for each missing override and validates them."""
+        keep_keys = keep_keys or self.keep_keys
+        ignore_keys = ignore_keys or self.ignore_keys
+        regex = regex if regex is not None else self.regex
+
+        self._validate_inputs(
+            ignore_keys, keep_keys, regex, record_keys=self.record_keys, value_delimiter=self.value_delimiter
+        )
+        return ignore_keys, keep_keys, regex
+
+    def _filter_records(
+        self,
+        parsed_records: list[dict[str | int, Any]],
+        ignore_keys: Optional[list[str]],
+        keep_keys: Optional[list[str]],
+        regex: Optional[bool],
+    ) -> Iterator[dict[str | int, Any]]:
+        """Helper method that yields each record that passes the resolved filters of the processor."""
+        return (
+            record_dict
+            for record_dict in parsed_records
+            if self.record_filter(record_dict, keep_keys, regex) is not False
+            and self.record_filter(record_dict, ignore_keys, regex) is not True
+        )
+
     def process_page(
         self,
         parsed_records: list[dict[str | int, Any]],
@@ -236,21 +287,13 @@ class DataProcessor(ABCDataProcessor):
 
         """
 
-        keep_keys = keep_keys or self.keep_keys
-        ignore_keys = ignore_keys or self.ignore_keys
-        regex = regex if regex is not None else self.regex
-
-        self._validate_inputs(
-            ignore_keys, keep_keys, regex, record_keys=self.record_keys, value_delimiter=self.value_delimiter
-        )
+        ignore_keys, keep_keys, regex = self._resolve_filters(ignore_keys, keep_keys, regex)
 
         # processes each individual record dict
         try:
             processed_record_dict_list = [
                 self.process_record(record_dict)
-                for record_dict in parsed_records
-                if self.record_filter(record_dict, keep_keys, regex) is not False
-                and self.record_filter(record_dict, ignore_keys, regex) is not True
+                for record_dict in self._filter_records(parsed_records, ignore_keys, keep_keys, regex)
             ]
 
             logger.debug(f"total included records - {len(processed_record_dict_list)}")
@@ -260,6 +303,63 @@ class DataProcessor(ABCDataProcessor):
         except Exception as e:
             raise DataProcessingException(f"An unexpected error occurred during data processing: {e}")
 
+    def process_columns(
+        self,
+        parsed_records: list[dict[str | int, Any]],
+        ignore_keys: Optional[list[str]] = None,
+        keep_keys: Optional[list[str]] = None,
+        regex: Optional[bool] = None,
+        arrow: bool = False,
+    ) -> dict[Any, list] | Any:
+        """Processes a page of records into columns for column-oriented tools such as Arrow and Polars.
+
+        Records are filtered as in `process_page`, and the fields of each record are appended to the column of each
+        record key as the record is processed instead of transposing a list of processed records afterward. Unless
+        `process_record` is overridden, the fields extracted with the `extraction_plan` are appended to each column
+        without creating a processed dictionary for each record.
+
+        Args:
+            parsed_records (list[dict[str | int, Any]]): The records to process and/or filter
+            ignore_keys (Optional[list[str]]): Optional overrides that identify records to ignore based on the absence
+                                               of specific keys or regex patterns.
+            keep_keys (Optional[list[str]]): Optional overrides identifying records to keep based on the absence of
+                                             specific keys or regex patterns.
+            regex: (Optional[bool]): Used to determine whether or not to filter records using regular expressions
+            arrow (bool): Whether to return a `pyarrow.Table` instead of a dictionary of columns.
+
+        Returns:
+            dict[Any, list] | pyarrow.Table: The processed records as columns, or as an Arrow table if `arrow=True`.
+
+        Raises:
+            PyArrowImportError: If `arrow=True` and the optional `pyarrow` package is not installed.
+
+        """
+        if not self.record_keys:
+            return super().process_columns(parsed_records, ignore_keys, keep_keys, regex, arrow=arrow)
+
+        ignore_keys, keep_keys, regex = self._resolve_filters(ignore_keys, keep_keys, regex)
+        columns: dict[Any, list] = {key: [] for key in self.record_keys}
+
+        try:
+            filtered_records = self._filter_records(parsed_records, ignore_keys, keep_keys, regex)
+            if type(self).process_record is DataProcessor.process_record:
+                # the plan extracts fields in the order of the record keys, matching the order of the columns
+                extraction_plan, collapse_field = self.extraction_plan, self._collapse_field
+                appenders = [column.append for column in columns.values()]
+                for record_dict in filtered_records:
+                    for append, field_item in zip(appenders, extraction_plan(record_dict).values()):
+                        append(collapse_field(field_item))
+            else:
+                for record_dict in filtered_records:
+                    processed_record_dict = self.process_record(record_dict)
+                    for key, column in columns.items():
+                        column.append(processed_record_dict.get(key))
+        except Exception as e:
+            raise DataProcessingException(f"An unexpected error occurred during data processing: {e}")
+
+        logger.debug(f"total included records - {len(next(iter(columns.values())))}")
+        return columns_to_arrow(columns) if arrow else columns
+
     def record_filter(
         self,
         record_dict: Mapping[str | int, Any],
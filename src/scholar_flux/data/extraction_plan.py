@@ -0,0 +1,147 @@
+# /data/extraction_plan.py
+"""The scholar_flux.data.extraction_plan module implements the ExtractionPlan that the DataProcessor uses to extract the
+fields of each record in a single pass.
+
+Extracting each record key separately requires a separate walk along the nested path of every key along with the
+construction of the flattened name of each path. The ExtractionPlan instead compiles the record keys of a processor once
+into a prefix tree of shared path segments, where each node holds the keys to extract from the value found at its path
+and the flattened name of each path is computed in advance. Each record is then walked once to fill all output fields.
+
+Extraction follows the same rules as `DataProcessor.extract_key`:
+
+    - Flattened keys (e.g. `'school.department'`) found directly within a record take precedence over nested paths.
+    - Single-element lists holding a dictionary are unwrapped when the next segment of a path is not a list index.
+    - Values are nested in lists, and missing or empty values are returned as None.
+
+Classes:
+    ExtractionPlan: Compiles record keys into a prefix tree used to extract all fields of a record in a single walk.
+
+"""
+from __future__ import annotations
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from functools import cached_property
+from scholar_flux.utils import as_list_1d, PathUtils
+from scholar_flux.utils.helpers import flatten
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# marks paths that could not be found within a record
+_MISSING = object()
+
+
+class _PlanNode:
+    """A node of the prefix tree that holds the fields extracted at the path of the node and its child segments."""
+
+    __slots__ = ("children", "fields")
+
+    def __init__(self) -> None:
+        """Initializes a node without fields or children."""
+        # the output key, the final key of the path, and the flattened path of each field extracted at this node
+        self.fields: List[Tuple[str | int, Any, Optional[str]]] = []
+        self.children: Dict[Any, _PlanNode] = {}
+
+
+class ExtractionPlan:
+    """Compiles a dictionary of output keys to record paths into a prefix tree that extracts all fields of a record with
+    a single walk of each shared path.
+
+    Args:
+        record_keys (Mapping[str | int, list[str | int]]):
+            A dictionary mapping each output key to the path of the field to extract, as prepared by the DataProcessor.
+
+    Examples:
+        >>> from scholar_flux.data.extraction_plan import ExtractionPlan
+        >>> plan = ExtractionPlan({'id': ['id'], 'department': ['school', 'department'], 'name': ['school', 'name']})
+        >>> plan({'id': 1, 'school': {'department': 'Mathematics', 'name': 'NYU'}})
+        # OUTPUT: {'id': [1], 'department': ['Mathematics'], 'name': ['NYU']}
+
+    """
+
+    def __init__(self, record_keys: Mapping[str | int, List[str | int]]) -> None:
+        """Compiles the prefix tree from the paths of each output key."""
+        # a snapshot of the record keys, used to determine whether the plan is outdated
+        self.record_keys: Dict[str | int, List[str | int]] = {key: list(path) for key, path in record_keys.items()}
+        self.root = _PlanNode()
+
+        for output_key, path in self.record_keys.items():
+            *prefix, key = path
+            node = self.root
+            for segment in prefix:
+                node = node.children.setdefault(segment, _PlanNode())
+            # flattened keys are only checked for nested paths, as in `DataProcessor.extract_key`
+            node.fields.append((output_key, key, PathUtils.path_str(path) if prefix else None))
+
+        logger.debug(f"Compiled an extraction plan for {len(self.record_keys)} record keys")
+
+    @property
+    def paths(self) -> List[List[str | int]]:
+        """The path of each record key in the order that output fields are extracted."""
+        return list(self.record_keys.values())
+
+    @cached_property
+    def flat_keys(self) -> Dict[str | int, str]:
+        """The flattened key of each output key, without list indices, used to extract fields from flattened records."""
+        return {
+            output_key: PathUtils.path_str(PathUtils.remove_path_indices(path) or path)
+            for output_key, path in self.record_keys.items()
+        }
+
+    def matches(self, record_keys: Mapping[str | int, List[str | int]]) -> bool:
+        """Indicates whether the plan was compiled from the same record keys."""
+        return self.record_keys == record_keys
+
+    def extract(self, record: Any) -> Dict[str | int, Optional[list]]:
+        """Extracts the value of each output key from a record.
+
+        Args:
+            record (Any): The record (generally a nested dictionary) to extract fields from.
+
+        Returns:
+            Dict[str | int, Optional[list]]:
+                A dictionary mapping each output key to the list of values found at its path, or None if not found.
+
+        """
+        extracted: Dict[str | int, Optional[list]] = dict.fromkeys(self.record_keys)
+        if record is not None:
+            self._walk(self.root, record, record if isinstance(record, Mapping) else None, extracted, is_root=True)
+        return extracted
+
+    def __call__(self, record: Any) -> Dict[str | int, Optional[list]]:
+        """Extracts the value of each output key from a record. Alias of `ExtractionPlan.extract`."""
+        return self.extract(record)
+
+    @classmethod
+    def _walk(
+        cls,
+        node: _PlanNode,
+        value: Any,
+        record: Optional[Mapping],
+        extracted: Dict[str | int, Optional[list]],
+        is_root: bool = False,
+    ) -> None:
+        """Helper method that fills the fields of a node from its value and descends into each child segment."""
+        for output_key, key, flat_key in node.fields:
+            if flat_key is not None and record is not None and flat_key in record:
+                extracted[output_key] = as_list_1d(record[flat_key])
+            elif isinstance(value, Mapping):
+                extracted[output_key] = as_list_1d(value.get(key, [])) or None
+
+        for segment, child in node.children.items():
+            # single-element lists of dictionaries are unwrapped before segments that are not list indices
+            current = value if is_root or isinstance(segment, int) else flatten(value)
+            if isinstance(current, (dict, list)):
+                try:
+                    current = current[segment]
+                except (KeyError, IndexError, TypeError):
+                    current = _MISSING
+            # values that are not dictionaries or lists are passed along unchanged, as in `get_nested_data`
+            cls._walk(child, current, record, extracted)
+
+    def __repr__(self) -> str:
+        """Shows the number of record keys and top-level segments of the current plan."""
+        return f"{self.__class__.__name__}(record_keys={len(self.record_keys)}, segments={len(self.root.children)})"
+
+
+__all__ = ["ExtractionPlan"]
@@ -128,15 +128,19 @@ class NormalizingDataProcessor(DataProcessor):
         if not self.record_keys:
             return {}
 
+        # the paths and flattened keys of each record key are compiled once and reused across records
+        extraction_plan = self.extraction_plan
+
         # Step 1: Flatten the record if needed
         if not is_nested_json(record_dict):
             flattened_record: dict[str, Any] | dict[str | int, Any] = record_dict
         else:
             # Flatten the entire record using traversal_paths for efficiency
-            record_keys_paths = list(self.record_keys.values())
             flattened_record = (
                 self.recursive_processor.process_and_flatten(
-                    obj=record_dict, traversal_paths=record_keys_paths, traverse_lists=self.traverse_lists or False
+                    obj=record_dict,
+                    traversal_paths=extraction_plan.paths,
+                    traverse_lists=self.traverse_lists or False,
                 )
                 or {}
             )
@@ -147,11 +151,8 @@ class NormalizingDataProcessor(DataProcessor):
                 return self.collapse_fields({key: None for key in self.record_keys})
 
         processed_record_dict = {}
-        for output_key, path in self.record_keys.items():
-            # Get the expected flattened key (without indices)
-            flattened_key = self._as_normalized_key(path)
-
-            # Try to get the value from flattened record
+        for output_key, flattened_key in extraction_plan.flat_keys.items():
+            # Try to get the value from the flattened record using the expected flattened key (without indices)
             value = flattened_record.get(flattened_key or "") if isinstance(flattened_record, dict) else None
 
             processed_record_dict[output_key] = value
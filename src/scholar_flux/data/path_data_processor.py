@@ -8,9 +8,11 @@ nested paths while formatting the output based on its specification.
 """
 
 from typing import Any, Optional, Union
-from scholar_flux.utils import PathNodeIndex, ProcessingPath, PathDiscoverer, as_list_1d, generate_repr
+from typing_extensions import Self
+from scholar_flux.utils import PathNodeIndex, ProcessingPath, PathDiscoverer, as_list_1d, is_nested, generate_repr
+from scholar_flux.utils.paths.simplification_pool import SimplificationPool
 from scholar_flux.data.abc_processor import ABCDataProcessor
-from scholar_flux.exceptions import DataProcessingException, DataValidationException
+from scholar_flux.exceptions import DataProcessingException, DataValidationException, PathDiscoveryError
 import threading
 
 import re
@@ -37,6 +39,19 @@ class PathDataProcessor(ABCDataProcessor):
         >>> print(result)
         # OUTPUT: [{'id': '1', 'a.b': 'c'}, {'id': '2', 'b.f': 'e'}, {'id': '2', 'c.h': 'g'}]
 
+    Large pages can be simplified in parallel by creating the processor with `parallel=True`. The processor then owns
+    a SimplificationPool whose worker processes are started on the first page with at least `min_records` records and
+    are reused for each subsequent page:
+
+        >>> parallel_processor = PathDataProcessor(parallel=True)
+        >>> parallel_processor.simplification_pool
+        # OUTPUT: SimplificationPool(max_workers=8, min_records=1000, batch_size=250, running=False)
+
+    The worker processes are shut down with `close()`, or on exit when the processor is used as a context manager:
+
+        >>> with PathDataProcessor(parallel=True) as parallel_processor:
+        ...     records = parallel_processor(data)
+
     """
 
     def __init__(
@@ -47,8 +62,14 @@ class PathDataProcessor(ABCDataProcessor):
         keep_keys: Optional[list[str]] = None,
         regex: Optional[bool] = True,
         use_cache: Optional[bool] = True,
+        parallel: bool = False,
     ) -> None:
-        """Initializes the data processor with JSON data and optional parameters for processing."""
+        """Initializes the data processor with JSON data and optional parameters for processing.
+
+        If `parallel=True`, the processor creates a SimplificationPool used to simplify large pages of records into
+        rows with a persistent pool of worker processes.
+
+        """
         super().__init__()
         self._validate_inputs(ignore_keys, keep_keys, regex, value_delimiter=value_delimiter)
         self.value_delimiter = value_delimiter
@@ -56,6 +77,7 @@ class PathDataProcessor(ABCDataProcessor):
         self.ignore_keys = ignore_keys or None
         self.keep_keys = keep_keys or None
         self.use_cache = use_cache or False
+        self.simplification_pool = SimplificationPool() if parallel else None
         self.path_node_index = PathNodeIndex(use_cache=self.use_cache)
 
         self.json_data = json_data
@@ -67,13 +89,25 @@ class PathDataProcessor(ABCDataProcessor):
         """Property indicating whether the underlying path node index uses a cache of weakreferences to nodes."""
         return self.path_node_index.node_map.use_cache
 
-    def load_data(self, json_data: Optional[dict | list[dict]] = None) -> bool:
+    def load_data(
+        self,
+        json_data: Optional[dict | list[dict]] = None,
+        keep_keys: Optional[list[str]] = None,
+        ignore_keys: Optional[list[str]] = None,
+        regex: Optional[bool] = None,
+    ) -> bool:
         """Attempts to load a data dictionary or list, contingent on it having at least one non-missing record to load
         from. If `json_data` is missing or the json input is equal to the current `json_data` attribute, then the
         `json_data` attribute will not be updated from the json input.
 
+        When `keep_keys` or `ignore_keys` are provided, records that would be dropped by the record filter are pruned
+        during path discovery and are not loaded into the index.
+
         Args:
             json_data (Optional[dict | list[dict]]): The json data to be loaded as an attribute
+            keep_keys (Optional[list[str]]): Patterns of paths that each loaded record must contain.
+            ignore_keys (Optional[list[str]]): Patterns of paths that loaded records must not contain.
+            regex (Optional[bool]): Whether the keys are matched as regular expressions. Defaults to `self.regex`.
         Returns:
             bool: Indicates whether the data was successfully loaded (True) or not (False)
 
@@ -88,7 +122,7 @@ class PathDataProcessor(ABCDataProcessor):
                 self.json_data = json_data
 
             logger.debug("Discovering paths")
-            discovered_paths = PathDiscoverer(self.json_data).discover_path_elements(inplace=False)
+            discovered_paths = self._discover_paths(keep_keys, ignore_keys, regex)
             logger.debug("Creating a node index")
 
             self.path_node_index = PathNodeIndex.from_path_mappings(
@@ -102,6 +136,61 @@ class PathDataProcessor(ABCDataProcessor):
                 f"processed and loaded into an index: {e}"
             )
 
+    def _discover_paths(
+        self,
+        keep_keys: Optional[list[str]] = None,
+        ignore_keys: Optional[list[str]] = None,
+        regex: Optional[bool] = None,
+    ) -> Optional[dict[ProcessingPath, Any]]:
+        """Helper method that discovers the terminal paths of the current JSON data.
+
+        When the data is a list of nested records and keys are known, each record is discovered separately: the
+        traversal of a record stops at its first path matching `ignore_keys`, and records without a path matching
+        `keep_keys` are dropped before nodes are created for their paths.
+
+        """
+        discoverer = PathDiscoverer(self.json_data)
+        keep_pattern = self._record_pattern(keep_keys, regex)
+        ignore_pattern = self._record_pattern(ignore_keys, regex)
+
+        if (
+            not (keep_pattern or ignore_pattern)
+            or not isinstance(self.json_data, list)
+            or not any(is_nested(record) and record for record in self.json_data)
+        ):
+            return discoverer.discover_path_elements(inplace=False)
+
+        discovered_paths: dict[ProcessingPath, Any] = {}
+        try:
+            for record_index, record in enumerate(self.json_data):
+                record_path = ProcessingPath(str(record_index), ("list",), delimiter=PathDiscoverer.DEFAULT_DELIMITER)
+                record_elements = (
+                    discoverer.iter_path_elements(record, record_path)
+                    if is_nested(record) and record
+                    else iter([(record_path, record)])
+                )
+
+                record_paths: dict[ProcessingPath, Any] = {}
+                for path, value in record_elements:
+                    if ignore_pattern and re.search(ignore_pattern, path.to_string()):
+                        # stopping the traversal skips the remaining paths of the ignored record
+                        record_paths.clear()
+                        break
+                    record_paths[path] = value
+
+                if record_paths and (
+                    not keep_pattern or any(re.search(keep_pattern, path.to_string()) for path in record_paths)
+                ):
+                    discovered_paths.update(record_paths)
+                else:
+                    logger.debug(f"Pruned the record at index {record_index} during path discovery")
+
+        except (ValueError, TypeError) as e:
+            logger.error(f"An error was encountered during path discovery: {e}")
+            raise PathDiscoveryError from e
+
+        return discovered_paths
+
     def process_record(
         self,
         record_index: int,
@@ -146,9 +235,12 @@ class PathDataProcessor(ABCDataProcessor):
         self._validate_inputs(ignore_keys, keep_keys, regex, value_delimiter=self.value_delimiter)
 
         try:
+            keep_keys = keep_keys or self.keep_keys
+            ignore_keys = ignore_keys or self.ignore_keys
+
             if parsed_records is not None:
                 logger.debug("Processing next page..")
-                self.load_data(parsed_records)
+                self.load_data(parsed_records, keep_keys=keep_keys, ignore_keys=ignore_keys, regex=regex)
             elif self.json_data:
                 logger.debug("Processing existing page..")
             else:
@@ -157,9 +249,6 @@ class PathDataProcessor(ABCDataProcessor):
             if self.path_node_index is None:
                 raise ValueError("JSON data could not be loaded into the processing path index successfully")
 
-            keep_keys = keep_keys or self.keep_keys
-            ignore_keys = ignore_keys or self.ignore_keys
-
             for record_index in self.path_node_index.record_indices:
                 self.process_record(
                     record_index,
@@ -171,7 +260,9 @@ class PathDataProcessor(ABCDataProcessor):
             if combine_keys:
                 self.path_node_index.combine_keys()
             # Process each record in the JSON data
-            processed_data = self.path_node_index.simplify_to_rows(object_delimiter=self.value_delimiter)
+            processed_data = self.path_node_index.simplify_to_rows(
+                object_delimiter=self.value_delimiter, pool=self.simplification_pool
+            )
 
             return processed_data
         except DataProcessingException as e:
@@ -189,16 +280,23 @@ class PathDataProcessor(ABCDataProcessor):
         if not record_keys:
             return False
 
-        regex = regex if regex is not None else self.regex
-        use_regex = regex if regex is not None else False
-
-        record_pattern = "|".join(record_keys if use_regex else map(re.escape, as_list_1d(record_keys)))
+        record_pattern = self._record_pattern(record_keys, regex)
 
         contains_record_pattern = (
             any(re.search(record_pattern, path.to_string()) for path in record_dict) if record_pattern else None
         )
         return bool(contains_record_pattern)
 
+    def _record_pattern(self, record_keys: Optional[list[str]] = None, regex: Optional[bool] = None) -> Optional[str]:
+        """Helper method that joins the keys used to filter records into a single pattern."""
+        if not record_keys:
+            return None
+
+        regex = regex if regex is not None else self.regex
+        use_regex = regex if regex is not None else False
+
+        return "|".join(record_keys if use_regex else map(re.escape, as_list_1d(record_keys)))
+
     def discover_keys(self) -> Optional[dict[str, Any]]:
         """Discovers all keys within the JSON data."""
         return {str(node.path): node for node in self.path_node_index.nodes}
@@ -210,9 +308,26 @@ class PathDataProcessor(ABCDataProcessor):
 
         """
         return generate_repr(
-            self, flatten=flatten, show_value_attributes=show_value_attributes, exclude={"json_data", "use_cache"}
+            self,
+            flatten=flatten,
+            show_value_attributes=show_value_attributes,
+            exclude={"json_data", "use_cache", "simplification_pool"},
         )
 
+    def close(self) -> None:
+        """Shuts down the worker processes of the SimplificationPool of the processor, if any. The workers are started
+        again if another large page is processed afterward."""
+        if self.simplification_pool is not None:
+            self.simplification_pool.close()
+
+    def __enter__(self) -> Self:
+        """Returns the processor for use within a context manager that shuts down its worker processes on exit."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Shuts down the worker processes of the SimplificationPool of the processor, if any."""
+        self.close()
+
     def __call__(self, *args, **kwargs) -> list[dict]:
         """Convenience method that calls process_page while also locking the class for processing while a single page is
         processed.
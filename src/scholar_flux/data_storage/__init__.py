@@ -12,9 +12,17 @@ Core components:
     - MongoStorage: Contains the core methods used to interact with the Mongo DB database. By default, this class
                     attempts to Mongo DB on localhost on port 27017.
     - InMemoryStorage: The default storage method - simply saves processed request content and responses to a
-                       temporary dictionary that is deleted when the python session is stopped
+                       temporary dictionary that is deleted when the python session is stopped. The storage can
+                       optionally be bounded with LRU/LFU eviction and entries can expire after a TTL
     - NullStorage: A No-Op storage method that is used to effectively turn off the use of storage.
                    This module is included for compatibility with the static typing used throughout the package
+    - TieredStorage: Places a bounded in-process InMemoryStorage (L1) in front of a Redis, MongoDB, or SQL storage (L2)
+                     with read-through/write-through semantics and optional write-behind to L2
+    - WriteBehindQueue: Queues cache writes and writes them to a storage in batches on a background thread
+    - RecordStore: Stores the records of cached pages once by content hash so that overlapping pages only hold references
+    - CachePolicy: Selects the stages of processed responses (parsed, extracted, processed, normalized) that are cached
+    - CacheCodec: Serializes and optionally compresses cached records into versioned binary payloads (msgpack/orjson
+                  with zlib/lzma/zstd) for the Redis, MongoDB, and SQL storages
 
 In addition, Exceptions for missing dependencies are set to return storage-specific errors if a storage
 is initialized without the necessary dependencies:
@@ -39,12 +47,17 @@ from scholar_flux.exceptions import (
 
 
 from scholar_flux.data_storage.abc_storage import ABCStorage
+from scholar_flux.data_storage.cache_codec import CacheCodec
 from scholar_flux.data_storage.data_cache_manager import DataCacheManager
 from scholar_flux.data_storage.sql_storage import SQLAlchemyStorage
 from scholar_flux.data_storage.in_memory_storage import InMemoryStorage
 from scholar_flux.data_storage.redis_storage import RedisStorage
 from scholar_flux.data_storage.mongodb_storage import MongoDBStorage
 from scholar_flux.data_storage.null_storage import NullStorage
+from scholar_flux.data_storage.tiered_storage import TieredStorage
+from scholar_flux.data_storage.write_behind import WriteBehindQueue
+from scholar_flux.data_storage.record_store import RecordStore
+from scholar_flux.data_storage.cache_policy import CachePolicy
 
 __all__ = [
     "OptionalDependencyImportError",
@@ -53,9 +66,14 @@ __all__ = [
     "SQLAlchemyImportError",
     "DataCacheManager",
     "ABCStorage",
+    "CacheCodec",
     "SQLAlchemyStorage",
     "InMemoryStorage",
     "RedisStorage",
     "MongoDBStorage",
     "NullStorage",
+    "TieredStorage",
+    "WriteBehindQueue",
+    "RecordStore",
+    "CachePolicy",
 ]
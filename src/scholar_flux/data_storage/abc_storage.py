@@ -8,7 +8,7 @@ scholar_flux implements the ABCStorage with subclasses for SQLite (through SQLAl
 cache and can be further extended to duckdb and other abstractions supported by SQLAlchemy.
 
 """
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Iterable, Iterator, Mapping, Optional, Tuple
 from typing_extensions import Self, Type
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
@@ -54,6 +54,69 @@ class ABCStorage(ABC):
         """Core method for retrieving a page of records from the cache."""
         raise NotImplementedError
 
+    def get_if_present(self, key: str) -> Tuple[bool, Optional[Any]]:
+        """Retrieves a cached record and indicates whether the key was found with a single storage lookup.
+
+        Backends that communicate with external services should override this method so that the existence check
+        and retrieval are performed in a single round trip. By default, this method falls back to `verify_cache`
+        followed by `retrieve` for compatibility with storage implementations that do not yet implement fused reads.
+
+        Args:
+            key (str): The key used to fetch the stored data from cache.
+
+        Returns:
+            Tuple[bool, Optional[Any]]:
+                A tuple containing a boolean that indicates whether the key exists and the cached value (or None).
+
+        """
+        if not self.verify_cache(key):
+            return False, None
+        return True, self.retrieve(key)
+
+    def retrieve_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieves the cached records associated with each key in the provided sequence of keys.
+
+        Backends that communicate with external services should override this method to retrieve all records in a
+        single batched round trip. By default, each key is retrieved individually with `get_if_present`.
+
+        Args:
+            keys (Iterable[str]): The keys used to fetch the stored data from cache.
+
+        Returns:
+            Dict[str, Any]: A dictionary mapping each key that was found to its cached value. Missing keys are omitted.
+
+        """
+        records = {}
+        for key in dict.fromkeys(keys):
+            is_cached, data = self.get_if_present(key)
+            if is_cached:
+                records[key] = data
+        return records
+
+    def update_many(self, records: Mapping[str, Any]) -> None:
+        """Updates the cache with each key-value pair in the provided mapping.
+
+        By default, each record is stored individually with `update`.
+
+        Args:
+            records (Mapping[str, Any]): A mapping of keys to the data that should be stored for each key.
+
+        """
+        for key, data in records.items():
+            self.update(key, data)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Deletes the cached records associated with each key in the provided sequence of keys.
+
+        By default, each record is deleted individually with `delete`.
+
+        Args:
+            keys (Iterable[str]): The keys associated with the records to delete from the cache.
+
+        """
+        for key in keys:
+            self.delete(key)
+
     @abstractmethod
     def retrieve_all(self, *args, **kwargs) -> Optional[Dict[str, Any]]:
         """Core method for retrieving all pages of records from the cache."""
@@ -64,6 +127,36 @@ class ABCStorage(ABC):
         """Core method for retrieving all keys from the cache."""
         raise NotImplementedError
 
+    def iter_all(self, batch_size: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """Iterates over each key-value pair of the records stored under the current namespace.
+
+        Backends that support server-side cursors should override this method to stream records in batches instead of
+        loading every record into memory. By default, the records are loaded at once with `retrieve_all`.
+
+        Args:
+            batch_size (Optional[int]): The number of records to fetch from the backend at a time, where supported.
+
+        Yields:
+            Tuple[str, Any]: The key and cached value of each record.
+
+        """
+        yield from (self.retrieve_all() or {}).items()
+
+    def iter_keys(self, batch_size: Optional[int] = None) -> Iterator[str]:
+        """Iterates over the keys of the records stored under the current namespace.
+
+        Backends that support server-side cursors should override this method to stream keys in batches. By default,
+        the keys are loaded at once with `retrieve_keys`.
+
+        Args:
+            batch_size (Optional[int]): The number of keys to fetch from the backend at a time, where supported.
+
+        Yields:
+            str: The key of each record.
+
+        """
+        yield from self.retrieve_keys() or []
+
     @abstractmethod
     def update(self, *args, **kwargs) -> None:
         """Core method for updating the cache with new records."""
@@ -74,6 +167,19 @@ class ABCStorage(ABC):
         """Core method for deleting a page from the cache."""
         raise NotImplementedError
 
+    def invalidate(self, key: str) -> None:
+        """Discards any copy of a cached record that is held locally in front of the storage backend.
+
+        Storages such as the TieredStorage hold copies of records in memory to avoid round trips to their backend.
+        Invalidating a key forces the next lookup to retrieve the record from the backend without deleting it there.
+        By default, storages do not hold local copies, and this method has no effect.
+
+        Args:
+            key (str): The key associated with the record to invalidate.
+
+        """
+        pass
+
     @abstractmethod
     def delete_all(self, *args, **kwargs) -> None:
         """Core method for deleting all pages of records from the cache."""
@@ -95,6 +201,21 @@ class ABCStorage(ABC):
         """Helper method for cloning the structure and configuration of future implementations."""
         raise NotImplementedError
 
+    def with_namespace(self, namespace: str) -> Self:
+        """Creates a clone of the current storage that reads and writes records under a different namespace.
+
+        Args:
+            namespace (str): The namespace used by the new storage.
+
+        Returns:
+            Self: A storage with the same configuration (and backend, for server-based storages) as the current storage.
+
+        """
+        self._validate_prefix(namespace, required=True)
+        storage = self.clone()
+        storage.namespace = namespace
+        return storage
+
     def _prefix(self, key: str) -> str:
         """prefixes a namespace to the given `key`:
 
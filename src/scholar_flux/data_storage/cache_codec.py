@@ -0,0 +1,294 @@
+# /data_storage/cache_codec.py
+"""The scholar_flux.data_storage.cache_codec module implements the CacheCodec used to serialize and compress the data
+that storage backends write to a cache.
+
+By default, storages write cached data as JSON, and bytes are base64-encoded by the `CacheDataEncoder`. Cached
+responses from APIs such as PubMed and Springer Nature often contain hundreds of kilobytes of XML or JSON, so the
+`CacheCodec` can instead write a compact binary payload:
+
+    - `json`: The standard library JSON serializer, using the `CacheDataEncoder` to encode nested bytes.
+    - `orjson`: A faster JSON serializer (requires the optional `orjson` package).
+    - `msgpack`: A binary format that stores bytes natively without base64 (requires the optional `msgpack` package).
+
+Payloads that exceed `min_compress_size` bytes are then compressed with `zlib` or `lzma` (standard library), or with
+`zstd` (requires the optional `zstandard` package).
+
+Each binary payload begins with a versioned header that records the serializer and compression used to write it.
+Payloads are always decoded with the format recorded in their header, and payloads without a header are decoded as the
+plain JSON strings written by previous versions. As a result, the codec of a storage can be changed at any time without
+invalidating existing cache entries.
+
+Classes:
+    CacheCodec: Serializes and compresses cached data into versioned payloads and decodes them back into Python objects.
+
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, TYPE_CHECKING
+from collections.abc import Sequence, Set
+import logging
+import lzma
+import zlib
+
+from scholar_flux.utils.encoder import JsonDataEncoder
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+from scholar_flux.exceptions import CacheCodecException, OptionalDependencyImportError
+
+if TYPE_CHECKING:
+    import orjson
+    import msgpack
+    import zstandard
+else:
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    try:
+        import msgpack
+    except ImportError:
+        msgpack = None
+
+    try:
+        import zstandard
+    except ImportError:
+        zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+class CacheCodec:
+    """Serializes and compresses cached data into self-describing binary payloads for storage backends.
+
+    The header of each payload is composed of the `MAGIC` prefix, the format `VERSION`, and the identifiers of the
+    serializer and compression used to write the payload. Decoding only depends on this header, so entries written with
+    any codec configuration (or with the plain JSON format used by previous versions) can be read by every codec.
+
+    Args:
+        serializer (str): The serializer used to convert data into bytes: 'json', 'orjson', or 'msgpack'.
+        compression (Optional[str]): The compression applied to serialized data: 'zlib', 'lzma', 'zstd', or None.
+        compression_level (Optional[int]):
+            The compression level passed to the compressor. If None, the default level of each compressor is used.
+        min_compress_size (Optional[int]):
+            The minimum size of a serialized payload in bytes before compression is applied. Smaller payloads rarely
+            benefit from compression. Defaults to `CacheCodec.DEFAULT_MIN_COMPRESS_SIZE`.
+
+    Raises:
+        CacheCodecException: If an unknown serializer or compression is specified
+        OptionalDependencyImportError: If the package required by the serializer or compression is not installed
+
+    Examples:
+        >>> from scholar_flux.data_storage import CacheCodec, RedisStorage
+        >>> codec = CacheCodec(serializer='msgpack', compression='zlib')
+        >>> payload = codec.encode({'record': b'<xml>...</xml>', 'page': 1})
+        >>> CacheCodec.decode(payload)
+        # OUTPUT: {'record': b'<xml>...</xml>', 'page': 1}
+        >>> redis_storage = RedisStorage(namespace='compressed', codec=codec)
+
+    """
+
+    MAGIC: bytes = b"SFC"
+    VERSION: int = 1
+    DEFAULT_MIN_COMPRESS_SIZE: int = 1024
+
+    # the identifiers written to the header of each payload. Identifiers must never be reused for other formats.
+    SERIALIZERS: Dict[str, int] = {"json": 1, "orjson": 2, "msgpack": 3}
+    COMPRESSIONS: Dict[str, int] = {"none": 0, "zlib": 1, "lzma": 2, "zstd": 3}
+
+    def __init__(
+        self,
+        serializer: str = "json",
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        min_compress_size: Optional[int] = None,
+    ) -> None:
+        """Initializes the codec and verifies that the selected serializer and compression are available."""
+        self.serializer = self._validate_option(serializer, self.SERIALIZERS, "serializer")
+        self.compression = self._validate_option(compression or "none", self.COMPRESSIONS, "compression")
+        self.compression_level = compression_level
+        self.min_compress_size = min_compress_size if min_compress_size is not None else self.DEFAULT_MIN_COMPRESS_SIZE
+
+    @classmethod
+    def _validate_option(cls, option: str, options: Mapping[str, int], option_type: str) -> str:
+        """Helper method that verifies that a serializer or compression option is known and its dependency installed."""
+        option = option.lower() if isinstance(option, str) else option
+        if option not in options:
+            raise CacheCodecException(f"Unknown {option_type} '{option}'. Expected one of {list(options)}")
+
+        dependencies = {"orjson": orjson, "msgpack": msgpack, "zstd": zstandard}
+        if option in dependencies and dependencies[option] is None:
+            package = "zstandard" if option == "zstd" else option
+            raise OptionalDependencyImportError(
+                f"Optional Dependency: The '{package}' package is required for the '{option}' {option_type}."
+            )
+        return option
+
+    @property
+    def is_binary(self) -> bool:
+        """Indicates whether the codec writes headed binary payloads instead of plain JSON strings.
+
+        A codec that uses the 'json' serializer without compression writes the same JSON strings as previous versions.
+
+        """
+        return self.serializer != "json" or self.compression != "none"
+
+    def encode(self, data: Any) -> str | bytes:
+        """Serializes and optionally compresses data into a payload for storage.
+
+        Args:
+            data (Any): The data to serialize and store in a cache.
+
+        Returns:
+            str | bytes:
+                A binary payload prefixed by its header. Codecs that are not binary (`is_binary=False`) return the
+                plain JSON string written by previous versions for compatibility with existing cache readers.
+
+        Raises:
+            CacheCodecException: If the data cannot be serialized with the current serializer
+
+        """
+        try:
+            if not self.is_binary:
+                return JsonDataEncoder.serialize(data)
+
+            serialized = self._serialize(self.serializer, data)
+            compression = self.compression if len(serialized) >= self.min_compress_size else "none"
+            format_ids = [self.VERSION, self.SERIALIZERS[self.serializer], self.COMPRESSIONS[compression]]
+            header = self.MAGIC + bytes(format_ids)
+            return header + self._compress(compression, serialized, self.compression_level)
+        except CacheCodecException:
+            raise
+        except Exception as e:
+            raise CacheCodecException(f"Could not encode data of type {type(data)} with the {self}: {e}") from e
+
+    @classmethod
+    def decode(cls, payload: str | bytes | bytearray | memoryview) -> Any:
+        """Decodes a payload written by any codec (or a plain JSON string written by previous versions).
+
+        Args:
+            payload (str | bytes | bytearray | memoryview): The payload retrieved from a cache.
+
+        Returns:
+            Any: The original data that was encoded into the payload.
+
+        Raises:
+            CacheCodecException: If the payload was written with an unsupported format version, serializer, or
+                                 compression, or if the payload is corrupt.
+
+        """
+        if isinstance(payload, (bytearray, memoryview)):
+            payload = bytes(payload)
+
+        if not cls.is_encoded(payload):
+            # payloads without a header are JSON strings written by previous versions or by non-binary codecs
+            return JsonDataEncoder.deserialize(payload.decode() if isinstance(payload, bytes) else payload)
+
+        assert isinstance(payload, bytes)
+        version, serializer, compression = cls.parse_header(payload)
+        try:
+            serialized = cls._decompress(compression, payload[len(cls.MAGIC) + 3 :])
+            return cls._deserialize(serializer, serialized)
+        except Exception as e:
+            raise CacheCodecException(
+                f"Could not decode a payload written with the '{serializer}' serializer and '{compression}' "
+                f"compression (version {version}): {e}"
+            ) from e
+
+    @classmethod
+    def is_encoded(cls, payload: Any) -> bool:
+        """Indicates whether a payload begins with the header written by a binary codec."""
+        return isinstance(payload, bytes) and payload.startswith(cls.MAGIC) and len(payload) >= len(cls.MAGIC) + 3
+
+    @classmethod
+    def parse_header(cls, payload: bytes) -> Tuple[int, str, str]:
+        """Parses the format version, serializer, and compression from the header of a binary payload.
+
+        Args:
+            payload (bytes): A payload written by a binary codec.
+
+        Returns:
+            Tuple[int, str, str]: The format version, serializer name, and compression name of the payload.
+
+        Raises:
+            CacheCodecException: If the header is missing or uses an unsupported version or format identifier
+
+        """
+        if not cls.is_encoded(payload):
+            raise CacheCodecException("The payload does not begin with a cache codec header")
+
+        version, serializer_id, compression_id = payload[len(cls.MAGIC) : len(cls.MAGIC) + 3]
+        if version > cls.VERSION:
+            raise CacheCodecException(
+                f"The payload was written with version {version} of the cache codec format, but only versions up to "
+                f"{cls.VERSION} are supported"
+            )
+
+        serializers = {identifier: name for name, identifier in cls.SERIALIZERS.items()}
+        compressions = {identifier: name for name, identifier in cls.COMPRESSIONS.items()}
+        if serializer_id not in serializers or compression_id not in compressions:
+            raise CacheCodecException(
+                f"The payload header contains an unknown serializer ({serializer_id}) or compression ({compression_id})"
+            )
+        return version, serializers[serializer_id], compressions[compression_id]
+
+    @staticmethod
+    def _msgpack_default(obj: Any) -> Any:
+        """Converts non-builtin mappings and collections into types that can be packed with msgpack."""
+        if isinstance(obj, Mapping):
+            return dict(obj)
+        if isinstance(obj, (Set, Sequence)) and not isinstance(obj, (str, bytes)):
+            return list(obj)
+        raise TypeError(f"Object of type {type(obj)} cannot be serialized with msgpack")
+
+    @classmethod
+    def _serialize(cls, serializer: str, data: Any) -> bytes:
+        """Helper method that serializes data into bytes with the named serializer."""
+        if serializer == "msgpack":
+            return msgpack.packb(data, default=cls._msgpack_default, use_bin_type=True)
+        if serializer == "orjson":
+            return orjson.dumps(JsonDataEncoder.encode_tagged(data), option=orjson.OPT_NON_STR_KEYS)
+        return JsonDataEncoder.serialize_tagged(data).encode("utf-8")
+
+    @classmethod
+    def _deserialize(cls, serializer: str, serialized: bytes) -> Any:
+        """Helper method that deserializes bytes written by the named serializer."""
+        if serializer == "msgpack":
+            cls._validate_option(serializer, cls.SERIALIZERS, "serializer")
+            return msgpack.unpackb(serialized, raw=False, strict_map_key=False)
+        if serializer == "orjson" and orjson is not None:
+            return JsonDataEncoder.decode_tagged(orjson.loads(serialized))
+        # orjson payloads are standard JSON and can be read with the standard library if orjson is unavailable
+        return JsonDataEncoder.deserialize_tagged(serialized.decode("utf-8"))
+
+    @classmethod
+    def _compress(cls, compression: str, data: bytes, level: Optional[int] = None) -> bytes:
+        """Helper method that compresses bytes with the named compression."""
+        compressors: Dict[str, Callable[[bytes], bytes]] = {
+            "none": lambda b: b,
+            "zlib": lambda b: zlib.compress(b, level if level is not None else -1),
+            "lzma": lambda b: lzma.compress(b, preset=level),
+            "zstd": lambda b: zstandard.ZstdCompressor(level=level if level is not None else 3).compress(b),
+        }
+        return compressors[compression](data)
+
+    @classmethod
+    def _decompress(cls, compression: str, data: bytes) -> bytes:
+        """Helper method that decompresses bytes written with the named compression."""
+        if compression == "zstd":
+            cls._validate_option(compression, cls.COMPRESSIONS, "compression")
+            return zstandard.ZstdDecompressor().decompress(data)
+        if compression == "zlib":
+            return zlib.decompress(data)
+        if compression == "lzma":
+            return lzma.decompress(data)
+        return data
+
+    def __eq__(self, other: Any) -> bool:
+        """Codecs are equal when they encode data with the same serializer, compression, and compression options."""
+        return isinstance(other, CacheCodec) and vars(self) == vars(other)
+
+    def __repr__(self) -> str:
+        """Shows the serializer, compression, and compression options of the current codec."""
+        return generate_repr_from_string(self.__class__.__name__, vars(self), flatten=True)
+
+
+__all__ = ["CacheCodec"]
@@ -0,0 +1,147 @@
+# /data_storage/cache_policy.py
+"""The scholar_flux.data_storage.cache_policy module implements the CachePolicy that determines which stages of a
+processed response are persisted by the DataCacheManager.
+
+By default, each cached page holds the raw content of the response, the parsed response, the extracted records, the
+processed records, and (when available) the normalized records alongside the serialized response. Consumers that only
+read processed or normalized records can instead persist a subset of these stages to reduce the volume of each cache
+write and the time spent deserializing each cached page.
+
+Stages that are not persisted are recorded on the cached page and can be recomputed lazily from the serialized response
+when they are accessed. The `ResponseCoordinator` defers parsing and extraction until the `parsed_response` or
+`extracted_records` of a `ProcessedResponse` rebuilt from cache is first accessed.
+
+Classes:
+    CachePolicy: Selects the stages of processed responses that are written to the cache storage.
+
+"""
+from __future__ import annotations
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+import logging
+
+from scholar_flux.exceptions import StorageCacheException
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+
+logger = logging.getLogger(__name__)
+
+
+class CachePolicy:
+    """Selects the stages of processed responses that are written to the cache storage.
+
+    Args:
+        stages (Optional[Iterable[str]]):
+            The stages to persist. Each stage must be one of `CachePolicy.STAGES`, and `processed_records` is always
+            persisted as cached pages are only valid when their processed records are available. By default, all
+            stages are persisted.
+
+    Examples:
+        >>> from scholar_flux.data_storage import CachePolicy, DataCacheManager
+        >>> cache_policy = CachePolicy.records_only()
+        >>> cache_policy
+        # OUTPUT: CachePolicy(stages=('processed_records', 'normalized_records'))
+        >>> cache_manager = DataCacheManager(cache_policy=cache_policy)
+
+    """
+
+    # the stages of processed responses that can be omitted from cached pages
+    STAGES: Tuple[str, ...] = (
+        "raw_response",
+        "parsed_response",
+        "extracted_records",
+        "processed_records",
+        "normalized_records",
+    )
+    # stages that must always be persisted for cached pages to be considered valid
+    REQUIRED_STAGES: FrozenSet[str] = frozenset({"processed_records"})
+    # the field of a cached page that lists the stages that were available but not persisted
+    OMITTED_FIELD: str = "omitted_stages"
+
+    def __init__(self, stages: Optional[Iterable[str]] = None) -> None:
+        """Initializes the cache policy with the stages of processed responses to persist."""
+        self.stages: Tuple[str, ...] = self._validate_stages(stages) if stages is not None else self.STAGES
+
+    @classmethod
+    def _validate_stages(cls, stages: Iterable[str]) -> Tuple[str, ...]:
+        """Helper method that verifies that each stage is known and that all required stages are persisted."""
+        if isinstance(stages, str):
+            stages = [stages]
+
+        selected = set(stages) | cls.REQUIRED_STAGES
+        if unknown_stages := selected.difference(cls.STAGES):
+            raise StorageCacheException(
+                f"Unknown processing stages, {sorted(unknown_stages)}. Expected a subset of {list(cls.STAGES)}"
+            )
+        return tuple(stage for stage in cls.STAGES if stage in selected)
+
+    @classmethod
+    def configure(cls, cache_policy: Optional[CachePolicy | Iterable[str]] = None) -> CachePolicy:
+        """Creates a cache policy from the stages to persist, or validates an existing cache policy.
+
+        Args:
+            cache_policy (Optional[CachePolicy | Iterable[str]]):
+                An existing cache policy or the stages to persist. All stages are persisted when not provided.
+
+        Returns:
+            CachePolicy: The cache policy to use.
+
+        Raises:
+            StorageCacheException: If the cache policy is of an unexpected type or lists unknown stages.
+
+        """
+        if isinstance(cache_policy, CachePolicy):
+            return cache_policy
+        if cache_policy is not None and not isinstance(cache_policy, Iterable):
+            raise StorageCacheException(f"Expected a CachePolicy or a list of stages. Received {type(cache_policy)}")
+        return cls(cache_policy)
+
+    @classmethod
+    def records_only(cls) -> CachePolicy:
+        """Creates a cache policy that only persists the processed and normalized records of each response."""
+        return cls(("processed_records", "normalized_records"))
+
+    @property
+    def omitted_stages(self) -> Tuple[str, ...]:
+        """The stages of processed responses that are not persisted."""
+        return tuple(stage for stage in self.STAGES if stage not in self.stages)
+
+    def persists(self, stage: str) -> bool:
+        """Indicates whether a stage of processed responses is persisted under the current policy."""
+        return stage in self.stages
+
+    def apply(self, cache_record: Mapping[str, Any]) -> Dict[str, Any]:
+        """Removes the stages that are not persisted from a cached page.
+
+        Stages that were available (i.e., not None) but are not persisted are listed under the `OMITTED_FIELD` of the
+        cached page so that they can be recomputed when accessed.
+
+        Args:
+            cache_record (Mapping[str, Any]): The cached page containing each stage of a processed response.
+
+        Returns:
+            Dict[str, Any]: A copy of the cached page that only contains the persisted stages.
+
+        """
+        omitted = [stage for stage in self.omitted_stages if cache_record.get(stage) is not None]
+        if not omitted:
+            return dict(cache_record)
+
+        cache_record = {field: value for field, value in cache_record.items() if field not in omitted}
+        return cache_record | {self.OMITTED_FIELD: omitted}
+
+    @classmethod
+    def omitted(cls, cached_response: Optional[Mapping[str, Any]]) -> Tuple[str, ...]:
+        """Lists the stages that were available but not persisted when a cached page was written."""
+        if not isinstance(cached_response, Mapping):
+            return ()
+        return tuple(cached_response.get(cls.OMITTED_FIELD) or ())
+
+    def __eq__(self, other: Any) -> bool:
+        """Cache policies are equal when they persist the same stages."""
+        return isinstance(other, CachePolicy) and self.stages == other.stages
+
+    def __repr__(self) -> str:
+        """Shows the stages persisted by the current cache policy."""
+        return generate_repr_from_string(self.__class__.__name__, dict(stages=self.stages), flatten=True)
+
+
+__all__ = ["CachePolicy"]
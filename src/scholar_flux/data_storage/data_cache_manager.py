@@ -9,7 +9,8 @@ from the ABCStorage class.
 from __future__ import annotations
 import hashlib
 import logging
-from typing import Any, Dict, Optional, Literal
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Literal, Tuple
+from functools import partial
 from urllib.parse import urlparse
 from requests import Response
 from scholar_flux.data_storage.abc_storage import ABCStorage
@@ -18,6 +19,10 @@ from scholar_flux.data_storage.in_memory_storage import InMemoryStorage
 from scholar_flux.data_storage.mongodb_storage import MongoDBStorage
 from scholar_flux.data_storage.redis_storage import RedisStorage
 from scholar_flux.data_storage.sql_storage import SQLAlchemyStorage
+from scholar_flux.data_storage.tiered_storage import TieredStorage
+from scholar_flux.data_storage.write_behind import WriteBehindQueue
+from scholar_flux.data_storage.record_store import RecordStore
+from scholar_flux.data_storage.cache_policy import CachePolicy
 from scholar_flux.utils.repr_utils import generate_repr
 from scholar_flux.utils.response_protocol import ResponseProtocol
 from scholar_flux.exceptions import (
@@ -39,6 +44,14 @@ class DataCacheManager:
 
     Args:
         - cache_storage: Optional; A dictionary to store cached data. Defaults to using In-Memory Storage .
+        - write_behind: Optional; Whether to queue cache updates and write them to the cache storage in batches on a
+                        background thread. A preconfigured WriteBehindQueue for the cache storage can also be provided.
+        - record_store: Optional; Whether to store each record once by content hash so that cached pages only hold
+                        references to their records. Records are held under a separate namespace of the cache storage
+                        and are queued alongside cached pages when write-behind is enabled. A RecordStore using a
+                        separate storage can also be provided.
+        - cache_policy: Optional; The stages of processed responses to persist (a CachePolicy or a list of stages).
+                        All stages are persisted by default.
 
     Methods:
         - generate_fallback_cache_key(response): Generates a unique fallback cache key based on the response URL and status code.
@@ -46,6 +59,12 @@ class DataCacheManager:
         - cache_is_valid(cache_key, response=None, cached_response=None): Determines whether the cached data for a given key is still valid.
         - update_cache(cache_key, response, store_raw=False, metadata=None, parsed_response=None, processed_records=None): Updates the cache storage with new data.
         - retrieve(cache_key): Retrieves data from the cache storage based on the cache key.
+        - get_if_present(cache_key): Checks whether the cache key exists and retrieves its data in a single lookup.
+        - retrieve_many(cache_keys): Retrieves data for several cache keys from the cache storage in a single batch.
+        - prefetch(cache_keys): Retrieves several cache keys in a single batch ahead of subsequent lookups.
+        - invalidate(cache_key): Discards locally held copies of cached data so that it is retrieved from storage again.
+        - flush(): Writes all queued cache updates to the cache storage when write-behind is enabled.
+        - prune_records(): Deletes deduplicated records that are no longer referenced by any cached page.
         - retrieve_from_response(response): Retrieves data from the cache storage based on the response if within cache.
 
     Examples:
@@ -67,9 +86,25 @@ class DataCacheManager:
 
     """
 
-    def __init__(self, cache_storage: Optional[ABCStorage] = None) -> None:
+    def __init__(
+        self,
+        cache_storage: Optional[ABCStorage] = None,
+        write_behind: bool | WriteBehindQueue = False,
+        record_store: bool | RecordStore = False,
+        cache_policy: Optional[CachePolicy | Iterable[str]] = None,
+    ) -> None:
         """Initializes the DataCacheManager with the selected cache storage."""
         self.cache_storage: ABCStorage = cache_storage if cache_storage is not None else InMemoryStorage()
+        # when configured, cache updates are queued and written to storage by a background thread
+        self.write_behind: Optional[WriteBehindQueue] = WriteBehindQueue.configure(write_behind, self.cache_storage)
+        # when configured, cached pages reference records that are stored once by content hash
+        self.record_store: Optional[RecordStore] = RecordStore.configure(
+            record_store, self.cache_storage, write_behind=self.write_behind
+        )
+        # determines which stages of processed responses are written to storage
+        self.cache_policy: CachePolicy = CachePolicy.configure(cache_policy)
+        # lookups retrieved in a batch ahead of time with `prefetch`, consumed on first use by `get_if_present`
+        self._prefetched: Dict[str, Tuple[bool, Optional[Dict[str, Any]]]] = {}
 
     def verify_cache(self, cache_key: Optional[str]) -> bool:
         """Checks if the provided cache_key exists in the cache storage.
@@ -86,7 +121,9 @@ class DataCacheManager:
             return False
 
         # Check if the cache_key is a valid and exists in the storage
-        if self.cache_storage.verify_cache(cache_key):
+        if (self.write_behind is not None and cache_key in self.write_behind) or self.cache_storage.verify_cache(
+            cache_key
+        ):
             logger.info(f"Cache hit for key: {cache_key}")
             return True
         logger.info(f"No cached data for key: '{cache_key}'")
@@ -115,10 +152,12 @@ class DataCacheManager:
 
         """
 
-        if not cached_response and not self.verify_cache(cache_key):
-            return False
+        if not cached_response:
+            is_cached, cached_response = self.get_if_present(cache_key)
+            if not is_cached:
+                return False
 
-        current_cached_response = cached_response or self.retrieve(cache_key) or {}
+        current_cached_response = cached_response or {}
 
         if not self._verify_cached_response(cache_key, current_cached_response):
             return False
@@ -139,10 +178,15 @@ class DataCacheManager:
         metadata: Optional[Dict[str, Any]] = None,
         extracted_records: Optional[Any] = None,
         processed_records: Optional[Any] = None,
+        deferred_fields: Optional[Mapping[str, Callable[[], Any]]] = None,
         **kwargs,
     ) -> None:
         """Updates the cache storage with new data.
 
+        Stages of the processed response that are not persisted under the current `cache_policy` are omitted from the
+        cached record. When write-behind is enabled, the update is queued and the cached record (including the hash of the response
+        and any `deferred_fields`) is computed and written by a background thread.
+
         Args:
             cache_key: A unique identifier for the cached data.
             response: (requests.Response | ResponseProtocol) The API response or response-like object.
@@ -150,24 +194,99 @@ class DataCacheManager:
             metadata: (Optional) Additional metadata associated with the cached data. Defaults to None.
             parsed_response: (Optional) The response data parsed into a structured format. Defaults to None.
             processed_records: (Optional) The response data processed for specific use. Defaults to None.
+            deferred_fields: (Optional) A mapping of additional fields to callables that compute each field when the
+                             cached record is written.
             kwargs: Optional additional hashable dictionary fields that can be stored using sql cattrs encodings or in-memory cache.
 
         """
-        self.cache_storage.update(
-            cache_key,
+        self._prefetched.pop(cache_key, None)
+        if self.write_behind is not None:
+            # queued records are built later: snapshots prevent later changes by the caller from leaking into the cache
+            parsed_response, metadata, extracted_records, processed_records = (
+                self._snapshot(field) for field in (parsed_response, metadata, extracted_records, processed_records)
+            )
+
+        build_record = partial(
+            self._build_cache_record,
+            response,
+            store_raw=store_raw,
+            deferred_fields=deferred_fields,
+            parsed_response=parsed_response,
+            extracted_records=extracted_records,
+            processed_records=processed_records,
+            metadata=metadata,
+            record_store=self.record_store,
+            cache_policy=self.cache_policy,
+            **kwargs,
+        )
+
+        if self.write_behind is not None:
+            self.write_behind.put_deferred(cache_key, build_record)
+            logger.debug(f"Cache update queued for key: {cache_key}")
+            return
+
+        self.cache_storage.update(cache_key, build_record())
+        logger.debug(f"Cache updated for key: {cache_key}")
+
+    @staticmethod
+    def _snapshot(value: Any) -> Any:
+        """Helper method that shallow copies dictionaries and lists of records so that queued records are not affected
+        by changes made to the original fields after the cache update is queued."""
+        if isinstance(value, dict):
+            return value.copy()
+        if isinstance(value, list):
+            return [record.copy() if isinstance(record, dict) else record for record in value]
+        return value
+
+    @classmethod
+    def _build_cache_record(
+        cls,
+        response: Response | ResponseProtocol,
+        store_raw: bool = False,
+        deferred_fields: Optional[Mapping[str, Callable[[], Any]]] = None,
+        record_store: Optional[RecordStore] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        **fields,
+    ) -> Dict[str, Any]:
+        """Helper method that creates the dictionary of response data and processing results written to storage.
+
+        When a cache policy is provided, stages of the processed response that are not persisted are omitted.
+        When a record store is provided, the records of the response are written to the record store, and the
+        dictionary holds references to each record instead.
+
+        """
+        cache_record = (
             {
-                "response_hash": self.generate_response_hash(response),
+                "response_hash": cls.generate_response_hash(response),
                 "status_code": response.status_code,
                 "raw_response": response.content if store_raw else None,
-                "parsed_response": parsed_response,
-                "extracted_records": extracted_records,
-                "processed_records": processed_records,
-                "metadata": metadata,
             }
-            | dict(**kwargs),
+            | fields
+            | {field: compute_field() for field, compute_field in (deferred_fields or {}).items()}
         )
+        if cache_policy is not None:
+            cache_record = cache_policy.apply(cache_record)
+        return record_store.deduplicate(cache_record) if record_store is not None else cache_record
 
-        logger.debug(f"Cache updated for key: {cache_key}")
+    def _resolve_records(
+        self, cache_key: str, result: Optional[Dict[str, Any]]
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Helper method that resolves the record references of a cached page, if any.
+
+        Returns:
+            Tuple[bool, Optional[Dict[str, Any]]]:
+                A tuple indicating whether the cached page could be resolved and the resolved page. Pages referencing
+                records that are no longer available are treated as cache misses.
+
+        """
+        if self.record_store is None or not self.record_store.is_deduplicated(result):
+            return True, result
+
+        resolved = self.record_store.resolve(result)
+        if resolved is None:
+            logger.info(f"The records referenced by the cache key, {cache_key}, are no longer available")
+            return False, None
+        return True, resolved
 
     def retrieve(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Retrieves data from the cache storage based on the cache key.
@@ -180,7 +299,11 @@ class DataCacheManager:
 
         """
         try:
-            result = self.cache_storage.retrieve(cache_key) or {}
+            is_pending, pending_result = (
+                self.write_behind.get_if_present(cache_key) if self.write_behind is not None else (False, None)
+            )
+            result = (pending_result if is_pending else self.cache_storage.retrieve(cache_key)) or {}
+            result = self._resolve_records(cache_key, result)[1] or {}
             if result:
                 logger.debug(f"Retrieved record for key {cache_key}...")
             else:
@@ -191,6 +314,108 @@ class DataCacheManager:
             logger.error(msg)
             raise StorageCacheException(msg) from e
 
+    def get_if_present(self, cache_key: Optional[str]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Checks whether the cache key exists and retrieves its data from the cache storage with a single lookup.
+
+        Unlike calling `verify_cache` followed by `retrieve`, this method only performs one round trip to storage
+        backends such as Redis, MongoDB, and SQL databases.
+
+        Args:
+            cache_key: A unique identifier for the cached data.
+
+        Returns:
+            Tuple[bool, Optional[Dict[str, Any]]]:
+                A tuple indicating whether the cache key exists and the cached data corresponding to the key if found.
+
+        Raises:
+            StorageCacheException: If an unexpected error occurs during retrieval from the cache storage.
+
+        """
+        if cache_key is None:
+            logger.warning("Cache key is None: No cache lookup was performed.")
+            return False, None
+
+        try:
+            prefetched = self._prefetched.pop(cache_key, None)
+            is_cached, result = (
+                self.write_behind.get_if_present(cache_key) if self.write_behind is not None else (False, None)
+            )
+            if not is_cached:
+                is_cached, result = (
+                    prefetched if prefetched is not None else self.cache_storage.get_if_present(cache_key)
+                )
+            if is_cached:
+                is_cached, result = self._resolve_records(cache_key, result)
+        except Exception as e:
+            msg = f"Error encountered during attempted retrieval from cache: {e}"
+            logger.error(msg)
+            raise StorageCacheException(msg) from e
+
+        if is_cached:
+            logger.info(f"Cache hit for key: {cache_key}")
+        else:
+            logger.info(f"No cached data for key: '{cache_key}'")
+        return is_cached, result
+
+    def retrieve_many(self, cache_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieves data for each of the provided cache keys from the cache storage with a single batched lookup.
+
+        Args:
+            cache_keys: The unique identifiers for the cached data.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: A dictionary mapping each cache key that was found to its cached data.
+
+        Raises:
+            StorageCacheException: If an unexpected error occurs during retrieval from the cache storage.
+
+        """
+        cache_keys = list(cache_keys)
+        try:
+            pending = self.write_behind.retrieve_many(cache_keys) if self.write_behind is not None else {}
+            missing = [cache_key for cache_key in cache_keys if cache_key not in pending]
+            results = (self.cache_storage.retrieve_many(missing) if missing else {}) | pending
+            if self.record_store is not None:
+                # the records referenced by every page are retrieved with a single bulk lookup
+                results = self.record_store.resolve_many(results)
+            logger.debug(f"Retrieved {len(results)} of {len(cache_keys)} records from cache...")
+            return results
+        except Exception as e:
+            msg = f"Error encountered during attempted retrieval from cache: {e}"
+            logger.error(msg)
+            raise StorageCacheException(msg) from e
+
+    def prefetch(self, cache_keys: Iterable[str]) -> int:
+        """Retrieves each cache key in a single batch so that subsequent lookups do not require a round trip to storage.
+
+        Each prefetched lookup (including misses) is consumed by the next call to `get_if_present` for the same key.
+        Lookups for keys that are later updated or deleted are discarded, and `discard_prefetched` should be called
+        once the prefetched keys are no longer needed.
+
+        Args:
+            cache_keys: The unique identifiers of the cached data that are expected to be looked up next.
+
+        Returns:
+            int: The number of cache keys that were found in the cache storage.
+
+        Raises:
+            StorageCacheException: If an unexpected error occurs during retrieval from the cache storage.
+
+        """
+        cache_keys = list(cache_keys)
+        results = self.retrieve_many(cache_keys)
+        self._prefetched.update({key: (key in results, results.get(key)) for key in cache_keys})
+        return len(results)
+
+    def discard_prefetched(self, cache_keys: Optional[Iterable[str]] = None) -> None:
+        """Removes unused prefetched lookups for the provided cache keys or for all keys if `cache_keys` is None."""
+        if cache_keys is None:
+            self._prefetched.clear()
+            return
+
+        for cache_key in cache_keys:
+            self._prefetched.pop(cache_key, None)
+
     def retrieve_from_response(self, response: Response | ResponseProtocol) -> Optional[Dict[str, Any]]:
         """Retrieves data from the cache storage based on the response if within cache.
 
@@ -215,12 +440,58 @@ class DataCacheManager:
 
         """
         logger.debug(f"deleting the record for cache key: {cache_key}")
+        self._prefetched.pop(cache_key, None)
         try:
-            self.cache_storage.delete(cache_key)
+            if self.write_behind is not None:
+                self.write_behind.delete_many([cache_key])
+            else:
+                self.cache_storage.delete(cache_key)
             logger.debug("Cache key deleted successfully")
         except KeyError:
             logger.warning(f"A record for the cache key: '{cache_key}', did not exist...")
 
+    def flush(self) -> None:
+        """Writes all queued cache updates to the cache storage on the calling thread when write-behind is enabled."""
+        if self.write_behind is not None:
+            self.write_behind.flush()
+        # queued pages queue their records when written, so records are flushed afterward
+        if self.record_store is not None:
+            self.record_store.flush()
+
+    def close(self) -> None:
+        """Writes all queued cache updates and stops the background threads used to write them, if any."""
+        if self.write_behind is not None:
+            self.write_behind.close()
+        if self.record_store is not None:
+            self.record_store.close()
+
+    def prune_records(self) -> int:
+        """Deletes the deduplicated records that are no longer referenced by any page within the cache storage.
+
+        Records are not deleted when the pages referencing them are deleted. This method collects those records
+        by comparing the records of the record store against the references of every cached page.
+
+        Returns:
+            int: The number of records that were deleted, or 0 if records are not deduplicated.
+
+        """
+        if self.record_store is None:
+            return 0
+        self.flush()
+        return self.record_store.prune(entry for _, entry in self.cache_storage.iter_all())
+
+    def invalidate(self, cache_key: str) -> None:
+        """Discards prefetched and locally held copies of the data for a cache key without deleting it from storage.
+
+        With a TieredStorage, the next lookup for the cache key will retrieve the data from the L2 storage.
+
+        Args:
+            cache_key: A unique identifier for the cached data.
+
+        """
+        self._prefetched.pop(cache_key, None)
+        self.cache_storage.invalidate(cache_key)
+
     @classmethod
     def generate_fallback_cache_key(cls, response: Response | ResponseProtocol, use_parameters: bool = True) -> str:
         """Generates a unique fallback cache key based on the response URL and status code.
@@ -344,7 +615,7 @@ class DataCacheManager:
     def with_storage(
         cls,
         cache_storage: Optional[
-            Literal["redis", "sql", "sqlalchemy", "mongodb", "pymongo", "inmemory", "memory", "null"]
+            Literal["redis", "sql", "sqlalchemy", "mongodb", "pymongo", "inmemory", "memory", "tiered", "null"]
         ] = None,
         *args,
         **kwargs,
@@ -358,6 +629,14 @@ class DataCacheManager:
         Note that sql is shorthand for the SQLAlchemy cache storage and uses `SQLite. Compatible implementations of
         other storage devices can by used instead via SQLAlchemy as well (e.g. DuckDB).
 
+        Example:
+            >>> from scholar_flux.data_storage import DataCacheManager
+            >>> # an in-memory cache that holds up to 1000 processed pages for at most an hour each
+            >>> cache_manager = DataCacheManager.with_storage('memory', max_entries=1000, ttl=3600)
+            >>> # a redis cache fronted by an in-process cache of the 500 most recently used pages
+            >>> from scholar_flux.data_storage import RedisStorage
+            >>> cache_manager = DataCacheManager.with_storage('tiered', RedisStorage(), max_entries=500)
+
         Returns:
             DataCacheManager: The current class initialized the chosen storage
 
@@ -375,12 +654,14 @@ class DataCacheManager:
                 return cls(MongoDBStorage(*args, **kwargs))
             case "redis":
                 return cls(RedisStorage(*args, **kwargs))
+            case "tiered":
+                return cls(TieredStorage(*args, **kwargs))
             case "null" | None:
                 return cls.null()
             case _:
                 raise StorageCacheException(
                     "The chosen storage device does not exist. Expected one of the following:"
-                    " ['redis', 'sql', 'mongodb', 'inmemory', 'null']"
+                    " ['redis', 'sql', 'mongodb', 'inmemory', 'tiered', 'null']"
                 )
 
     def __bool__(self) -> bool:
@@ -429,19 +710,45 @@ class DataCacheManager:
 
         """
 
-        return generate_repr(self, flatten=flatten, show_value_attributes=show_value_attributes)
+        # optional components are only shown when configured to keep the representation of other managers unchanged
+        exclude = {"_prefetched"} | {
+            attribute for attribute in ("write_behind", "record_store") if getattr(self, attribute) is None
+        }
+        if not self.cache_policy.omitted_stages:
+            exclude.add("cache_policy")
+        return generate_repr(self, exclude=exclude, flatten=flatten, show_value_attributes=show_value_attributes)
 
     def __copy__(self) -> DataCacheManager:
         """Helper method for creating a new instance of the current DataCacheManager."""
         cls = self.__class__
         storage = copy.copy(self.cache_storage)
-        return cls(cache_storage=storage)
+        write_behind = self.write_behind.clone(storage) if self.write_behind is not None else False
+        return cls(
+            cache_storage=storage,
+            write_behind=write_behind,
+            record_store=self._clone_record_store(storage),
+            cache_policy=self.cache_policy,
+        )
 
     def clone(self) -> DataCacheManager:
         """Helper method for creating a newly cloned instance of the current DataCacheManager."""
         cls = self.__class__
-        storage_cls = self.cache_storage
-        return cls(storage_cls.clone())
+        storage = self.cache_storage.clone()
+        write_behind = self.write_behind.clone(storage) if self.write_behind is not None else False
+        return cls(
+            storage,
+            write_behind=write_behind,
+            record_store=self._clone_record_store(storage),
+            cache_policy=self.cache_policy,
+        )
+
+    def _clone_record_store(self, storage: ABCStorage) -> RecordStore | bool:
+        """Helper method that clones the record store, reusing the new cache storage if records share its storage."""
+        if self.record_store is None:
+            return False
+        if self.record_store.storage is self.cache_storage:
+            return self.record_store.clone(storage)
+        return self.record_store.clone(self.record_store.storage.clone())
 
     def __deepcopy__(self, memo) -> DataCacheManager:
         """Helper method for creating a new DataCacheManager with the same configuration as the original
@@ -3,16 +3,24 @@
 cache storage with an in-memory dictionary.
 
 The InMemoryStorage class implements the basic CRUD operations and convenience methods used to perform operations.
+The storage is unbounded by default and can optionally be bounded by the number of entries and/or their estimated
+size in bytes. When bounded, least-recently-used (LRU) or least-frequently-used (LFU) entries are evicted to make room
+for new entries, and entries can optionally expire after a time-to-live (TTL).
 
 """
 
 from __future__ import annotations
-from typing import Any, List, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Iterable, List, Dict, Optional, Literal
 import logging
+import pickle
+import sys
 import threading
+import time
 
 logger = logging.getLogger(__name__)
 from scholar_flux.data_storage.abc_storage import ABCStorage
+from scholar_flux.exceptions import StorageCacheException
 from scholar_flux.utils.repr_utils import generate_repr_from_string
 
 
@@ -23,9 +31,24 @@ class InMemoryStorage(ABCStorage):
     the scholar_flux.DataCacheManager. Methods are provided to delete from the cache, update the cache with new data,
     and retrieve data from the cache.
 
+    By default, the storage grows without bounds. For long-running processes, `max_entries` and `max_bytes` bound the
+    storage: once either limit is exceeded, entries are evicted in least-recently-used (`lru`) or
+    least-frequently-used (`lfu`) order. When a `ttl` is specified, expired entries are removed lazily when they are
+    accessed and periodically (every `cleanup_interval` seconds) when new entries are written. All bookkeeping occurs
+    under the same `lock` used for each storage operation.
+
     Args:
         namespace (Optional[str]): Prefix for cache keys. Defaults to None.
-        ttl (Optional[int]): Ignored. Included for interface compatibility; not implemented.
+        ttl (Optional[int | float]): The number of seconds after which each entry expires. Entries never expire if None.
+        raise_on_error (Optional[bool]): Ignored. Included for interface compatibility; not implemented.
+        max_entries (Optional[int]): The maximum number of entries to hold before evicting entries.
+        max_bytes (Optional[int]):
+            The maximum total size of all entries in bytes. The size of each entry is estimated from its pickled size
+            when written. Entries larger than `max_bytes` are not stored.
+        eviction_policy (Literal['lru', 'lfu']): The order used to evict entries once a limit is exceeded.
+        cleanup_interval (Optional[int | float]):
+            The minimum number of seconds between sweeps that remove all expired entries on write. Defaults to
+            `InMemoryStorage.DEFAULT_CLEANUP_INTERVAL`.
         **kwargs (Dict): Ignored. Included for interface compatibility; not implemented.
 
     Examples:
@@ -51,45 +74,146 @@ class InMemoryStorage(ABCStorage):
         >>> memory_storage.delete_all() # deletes all records from the namespace
         >>> memory_storage.retrieve_keys() # Will now be empty
         >>> memory_storage.retrieve_all() # Will also be empty
+        ### Bounding the storage to 1000 entries that each expire after an hour:
+        >>> bounded_storage = InMemoryStorage(max_entries=1000, ttl=3600, eviction_policy='lfu')
+        >>> bounded_storage.update('record_page_1', {'id':52, 'article': 'A name to remember'})
+        >>> bounded_storage.retrieve('record_page_1')
+        # OUTPUT: {'id': 52, 'article': 'A name to remember'}
+        >>> bounded_storage.statistics
+        # OUTPUT: {'hits': 1, 'misses': 0, 'evictions': 0, 'expirations': 0, 'entries': 1, 'bytes': 0}
 
     """
 
     # for compatibility with other storage backends
     DEFAULT_NAMESPACE: Optional[str] = None
     DEFAULT_RAISE_ON_ERROR: bool = False
+    DEFAULT_EVICTION_POLICY: Literal["lru", "lfu"] = "lru"
+    DEFAULT_CLEANUP_INTERVAL: float = 60.0
 
     def __init__(
         self,
         namespace: Optional[str] = None,
-        ttl: Optional[int] = None,
+        ttl: Optional[int | float] = None,
         raise_on_error: Optional[bool] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction_policy: Optional[Literal["lru", "lfu"]] = None,
+        cleanup_interval: Optional[int | float] = None,
         **kwargs,
     ) -> None:
-        """Initialize a basic, dictionary-like  memory_cache using a namespace.
+        """Initialize a dictionary-like memory_cache using a namespace and optional size and expiration limits.
 
-        Note that `ttl` and `**kwargs` are provided for interface compatibility, and specifying any of these as
-        arguments will not affect processing or cache initialization.
+        Note that `raise_on_error` and `**kwargs` are provided for interface compatibility, and specifying any of these
+        as arguments will not affect processing or cache initialization.
+
+        Raises:
+            StorageCacheException: If a limit, the ttl, or the eviction policy is invalid
 
         """
         self.namespace = namespace if namespace is not None else self.DEFAULT_NAMESPACE
 
-        if ttl is not None:
-            logger.warning("The parameter, `ttl` is not enforced in InMemoryStorage. Skipping.")
         if raise_on_error is not None:
             logger.warning("The parameter, `raise_on_error` is not enforced in InMemoryStorage. Skipping.")
-        self.ttl = None
         self.raise_on_error = False
+        self.ttl = self._validate_duration(ttl, "ttl")
+        self.max_entries = self._validate_count(max_entries, "max_entries")
+        self.max_bytes = self._validate_count(max_bytes, "max_bytes")
+        self.eviction_policy = self._validate_eviction_policy(eviction_policy or self.DEFAULT_EVICTION_POLICY)
+        self.cleanup_interval = self._validate_duration(
+            cleanup_interval if cleanup_interval is not None else self.DEFAULT_CLEANUP_INTERVAL, "cleanup_interval"
+        )
         self.lock = threading.Lock()
 
         self._validate_prefix(namespace, required=False)
         self._initialize()
 
+    @staticmethod
+    def _validate_duration(value: Optional[int | float], parameter: str) -> Optional[int | float]:
+        """Helper method that verifies that durations are positive numbers (in seconds) when provided."""
+        if value is not None and (not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0):
+            raise StorageCacheException(
+                f"The parameter, `{parameter}` must be a positive number or None. Received {value}"
+            )
+        return value
+
+    @staticmethod
+    def _validate_count(value: Optional[int], parameter: str) -> Optional[int]:
+        """Helper method that verifies that entry and byte limits are positive integers when provided."""
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value <= 0):
+            raise StorageCacheException(
+                f"The parameter, `{parameter}` must be a positive integer or None. Received {value}"
+            )
+        return value
+
+    @staticmethod
+    def _validate_eviction_policy(eviction_policy: str) -> Literal["lru", "lfu"]:
+        """Helper method that verifies that the eviction policy is either `lru` or `lfu`."""
+        policy = eviction_policy.lower() if isinstance(eviction_policy, str) else eviction_policy
+        if policy not in ("lru", "lfu"):
+            raise StorageCacheException(
+                f"The eviction_policy must be one of ['lru', 'lfu']. Received {eviction_policy}"
+            )
+        return "lfu" if policy == "lfu" else "lru"
+
+    @property
+    def bounded(self) -> bool:
+        """Indicates whether the storage evicts entries once `max_entries` or `max_bytes` is exceeded."""
+        return self.max_entries is not None or self.max_bytes is not None
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Returns the hit, miss, eviction, and expiration counters alongside the current number and size of entries.
+
+        Sizes are only estimated (and included in `bytes`) when `max_bytes` is specified.
+
+        """
+        with self.lock:
+            return dict(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self.memory_cache),
+                bytes=self._total_bytes,
+            )
+
+    def with_namespace(self, namespace: str) -> InMemoryStorage:
+        """Creates an empty InMemoryStorage with the same configuration that stores records under another namespace.
+
+        Args:
+            namespace (str): The namespace used by the new storage.
+
+        Returns:
+            InMemoryStorage: A new storage that does not share or copy the entries of the current storage.
+
+        """
+        self._validate_prefix(namespace, required=True)
+        return self.__class__(
+            namespace=namespace,
+            ttl=self.ttl,
+            max_entries=self.max_entries,
+            max_bytes=self.max_bytes,
+            eviction_policy=self.eviction_policy,
+            cleanup_interval=self.cleanup_interval,
+        )
+
     def clone(self) -> InMemoryStorage:
-        """Helper method for creating a new InMemoryStorage with the same configuration."""
+        """Helper method for creating a new InMemoryStorage with the same configuration and entries."""
         cls = self.__class__
-        storage = cls(namespace=self.namespace)
+        storage = cls(
+            namespace=self.namespace,
+            ttl=self.ttl,
+            max_entries=self.max_entries,
+            max_bytes=self.max_bytes,
+            eviction_policy=self.eviction_policy,
+            cleanup_interval=self.cleanup_interval,
+        )
         with self.lock:
             storage.memory_cache = self.memory_cache.copy()
+            storage._expires_at = self._expires_at.copy()
+            storage._sizes = self._sizes.copy()
+            storage._frequencies = self._frequencies.copy()
+            storage._total_bytes = self._total_bytes
         return storage
 
     def _initialize(self, **kwargs) -> None:
@@ -100,7 +224,96 @@ class InMemoryStorage(ABCStorage):
         """
         logger.debug("Initializing in-memory cache...")
         with self.lock:
-            self.memory_cache: dict = {} | kwargs
+            # insertion order doubles as the recency order used for LRU eviction
+            self.memory_cache: OrderedDict = OrderedDict(kwargs)
+            self._expires_at: dict[str, float] = {}
+            self._sizes: dict[str, int] = {}
+            self._frequencies: dict[str, int] = {}
+            self._total_bytes = 0
+            self._hits = self._misses = self._evictions = self._expirations = 0
+            self._last_cleanup = time.monotonic()
+
+    @staticmethod
+    def _estimate_size(data: Any) -> int:
+        """Estimates the size of an entry in bytes from its pickled size, falling back to `sys.getsizeof`."""
+        try:
+            return len(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return sys.getsizeof(data)
+
+    def _is_expired(self, namespace_key: str, now: Optional[float] = None) -> bool:
+        """Helper method that checks whether an entry has outlived its TTL. Must be called while holding the lock."""
+        expires_at = self._expires_at.get(namespace_key)
+        return expires_at is not None and expires_at <= (now if now is not None else time.monotonic())
+
+    def _remove(self, namespace_key: str) -> Any:
+        """Helper method that removes an entry and its bookkeeping. Must be called while holding the lock."""
+        self._expires_at.pop(namespace_key, None)
+        self._frequencies.pop(namespace_key, None)
+        self._total_bytes -= self._sizes.pop(namespace_key, 0)
+        return self.memory_cache.pop(namespace_key, None)
+
+    def _purge_expired(self) -> int:
+        """Helper method that removes all expired entries. Must be called while holding the lock."""
+        now = time.monotonic()
+        self._last_cleanup = now
+        expired_keys = [key for key in self._expires_at if self._is_expired(key, now)]
+        for key in expired_keys:
+            self._remove(key)
+        self._expirations += len(expired_keys)
+        return len(expired_keys)
+
+    def purge_expired(self) -> int:
+        """Removes all entries that have outlived the TTL of the storage.
+
+        Returns:
+            int: The number of expired entries that were removed
+
+        """
+        with self.lock:
+            removed = self._purge_expired()
+        if removed:
+            logger.debug(f"Removed {removed} expired entries from the in-memory cache.")
+        return removed
+
+    def _select_eviction_key(self, newest_key: str) -> str:
+        """Helper method that selects the next entry to evict. Must be called while holding the lock.
+
+        The most recently written entry is never selected, so new entries are not evicted before they can be used.
+
+        """
+        candidates = (key for key in self.memory_cache if key != newest_key)
+        if self.eviction_policy == "lfu":
+            # ties are broken by recency: the least recently used of the least frequently used entries is evicted
+            return min(candidates, key=lambda key: self._frequencies.get(key, 0))
+        return next(candidates)
+
+    def _evict(self, newest_key: str) -> None:
+        """Helper method that evicts entries until the storage is within its limits. Must be called with the lock."""
+        while len(self.memory_cache) > 1 and (
+            (self.max_entries is not None and len(self.memory_cache) > self.max_entries)
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            key = self._select_eviction_key(newest_key)
+            self._remove(key)
+            self._evictions += 1
+            logger.debug(f"Evicted the key, {key}, from the in-memory cache ({self.eviction_policy})")
+
+    def _get(self, namespace_key: str) -> Optional[Any]:
+        """Helper method that retrieves an entry, expiring it lazily and recording its use. Must be called with the
+        lock."""
+        if namespace_key in self.memory_cache and self._is_expired(namespace_key):
+            self._remove(namespace_key)
+            self._expirations += 1
+
+        if namespace_key not in self.memory_cache:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self.memory_cache.move_to_end(namespace_key)
+        self._frequencies[namespace_key] = self._frequencies.get(namespace_key, 0) + 1
+        return self.memory_cache[namespace_key]
 
     def retrieve(self, key: str) -> Optional[Any]:
         """Attempts to retrieve a response containing the specified cache key within the current namespace.
@@ -114,7 +327,41 @@ class InMemoryStorage(ABCStorage):
         """
         namespace_key = self._prefix(key)
         with self.lock:
-            return self.memory_cache.get(namespace_key)
+            return self._get(namespace_key)
+
+    def get_if_present(self, key: str) -> tuple[bool, Optional[Any]]:
+        """Retrieves a cached entry and indicates whether it exists within a single lock acquisition.
+
+        Args:
+            key (str): The key used to fetch the stored data from cache.
+
+        Returns:
+            tuple[bool, Optional[Any]]: Whether the key exists (and has not expired) and its value if found.
+
+        """
+        namespace_key = self._prefix(key)
+        with self.lock:
+            data = self._get(namespace_key)
+            return namespace_key in self.memory_cache, data
+
+    def retrieve_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieves each cache key found within the current namespace within a single lock acquisition.
+
+        Args:
+            keys (Iterable[str]): The keys used to fetch the stored data from cache.
+
+        Returns:
+            Dict[str, Any]: A dictionary mapping each key that was found to its cached value.
+
+        """
+        namespace_keys = {key: self._prefix(key) for key in keys}
+        records = {}
+        with self.lock:
+            for key, namespace_key in namespace_keys.items():
+                data = self._get(namespace_key)
+                if namespace_key in self.memory_cache:
+                    records[key] = data
+        return records
 
     def retrieve_all(self) -> Optional[Dict[str, Any]]:
         """Retrieves all cache key-response mappings found within the current namespace.
@@ -124,6 +371,8 @@ class InMemoryStorage(ABCStorage):
 
         """
         with self.lock:
+            if self._expires_at:
+                self._purge_expired()
             return {k: v for k, v in self.memory_cache.items() if not self.namespace or k.startswith(self.namespace)}
 
     def retrieve_keys(self) -> Optional[List[str]]:
@@ -134,19 +383,48 @@ class InMemoryStorage(ABCStorage):
 
         """
         with self.lock:
+            if self._expires_at:
+                self._purge_expired()
             return [key for key in self.memory_cache if not self.namespace or key.startswith(self.namespace)] or []
 
     def update(self, key: str, data: Any) -> None:
         """Attempts to update the data associated with a specific cache key in the namespace.
 
+        When the storage is bounded, entries are evicted after the update until the storage is within its limits.
+
         Args:
             key (str): The key of the key-value pair
             data (Any): The data to be associated with the key
 
         """
         namespace_key = self._prefix(key)
+        size = self._estimate_size(data) if self.max_bytes is not None else 0
+
+        if self.max_bytes is not None and size > self.max_bytes:
+            logger.warning(
+                f"The entry for the key, {namespace_key}, ({size} bytes) exceeds the max_bytes limit of the "
+                f"in-memory cache ({self.max_bytes} bytes). Skipping."
+            )
+            return
+
         with self.lock:
+            now = time.monotonic()
+            if self._expires_at and now - self._last_cleanup >= (self.cleanup_interval or 0):
+                self._purge_expired()
+
+            # overwritten entries become the most recently used and retain their use counts
+            frequency = self._frequencies.get(namespace_key, 0)
+            self._remove(namespace_key)
             self.memory_cache[namespace_key] = data
+            self._frequencies[namespace_key] = frequency + 1
+            if size:
+                self._sizes[namespace_key] = size
+                self._total_bytes += size
+            if self.ttl is not None:
+                self._expires_at[namespace_key] = now + self.ttl
+
+            if self.bounded:
+                self._evict(namespace_key)
 
     def delete(self, key: str) -> None:
         """Attempts to delete the selected cache key if found within the current namespace.
@@ -158,7 +436,7 @@ class InMemoryStorage(ABCStorage):
         namespace_key = self._prefix(key)
 
         with self.lock:
-            key = self.memory_cache.pop(namespace_key, None)
+            key = self._remove(namespace_key)
 
         if key is not None:
             logger.debug(f"Key: {key} deleted successfully")
@@ -173,12 +451,16 @@ class InMemoryStorage(ABCStorage):
                 n = len(self.memory_cache)
                 if not self.namespace:
                     self.memory_cache.clear()
+                    self._expires_at.clear()
+                    self._sizes.clear()
+                    self._frequencies.clear()
+                    self._total_bytes = 0
                 else:
-                    filtered_cache = {k: v for k, v in self.memory_cache.items() if not k.startswith(self.namespace)}
-                    self.memory_cache.clear()
-                    self.memory_cache.update(filtered_cache)
+                    namespace_keys = [k for k in self.memory_cache if k.startswith(self.namespace)]
+                    for namespace_key in namespace_keys:
+                        self._remove(namespace_key)
 
-                    n -= len(filtered_cache)
+                    n = len(namespace_keys)
 
             logger.debug(f"Deleted {n} records.")
 
@@ -197,6 +479,9 @@ class InMemoryStorage(ABCStorage):
         """
         namespace_key = self._prefix(key)
         with self.lock:
+            if namespace_key in self.memory_cache and self._is_expired(namespace_key):
+                self._remove(namespace_key)
+                self._expirations += 1
             return namespace_key in self.memory_cache
 
     @classmethod
@@ -214,7 +499,12 @@ class InMemoryStorage(ABCStorage):
         what is being cached."""
         class_name = self.__class__.__name__
         str_memory_cache = f"dict(n={len(self.memory_cache)})"
-        class_attribute_dict = dict(namespace=self.namespace, memory_cache=str_memory_cache)
+        class_attribute_dict: dict[str, Any] = dict(namespace=self.namespace, memory_cache=str_memory_cache)
+        # limits are only shown when configured to keep the representation of unbounded storages unchanged
+        limits = dict(ttl=self.ttl, max_entries=self.max_entries, max_bytes=self.max_bytes)
+        class_attribute_dict |= {limit: value for limit, value in limits.items() if value is not None}
+        if self.bounded:
+            class_attribute_dict["eviction_policy"] = self.eviction_policy
         return generate_repr_from_string(
             class_name,
             attribute_dict=class_attribute_dict,
@@ -9,7 +9,7 @@ within the database for later CRUD operations.
 
 """
 from __future__ import annotations
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
 from scholar_flux.exceptions import (
     MongoDBImportError,
@@ -18,13 +18,16 @@ from scholar_flux.exceptions import (
     CacheUpdateException,
     CacheDeletionException,
     CacheVerificationException,
+    CacheCodecException,
 )
 
 from scholar_flux.data_storage.abc_storage import ABCStorage
+from scholar_flux.data_storage.cache_codec import CacheCodec
 from scholar_flux.utils import config_settings  # provides the loaded global environment configuration
 
 import threading
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -32,16 +35,17 @@ from datetime import datetime, timedelta, timezone
 
 if TYPE_CHECKING:
     import pymongo
-    from pymongo import MongoClient
+    from pymongo import MongoClient, UpdateOne
     from pymongo.errors import DuplicateKeyError, PyMongoError, ServerSelectionTimeoutError, ConnectionFailure
 else:
     try:
         import pymongo
-        from pymongo import MongoClient
+        from pymongo import MongoClient, UpdateOne
         from pymongo.errors import DuplicateKeyError, PyMongoError, ServerSelectionTimeoutError, ConnectionFailure
     except ImportError:
         pymongo = None
         MongoClient = None
+        UpdateOne = None
         ServerSelectionTimeoutError = Exception
         ConnectionFailure = Exception
         DuplicateKeyError = Exception
@@ -94,12 +98,16 @@ class MongoDBStorage(ABCStorage):
     DEFAULT_NAMESPACE: Optional[str] = None
     DEFAULT_RAISE_ON_ERROR: bool = False
 
+    # the number of documents fetched from the server per batch when iterating over records
+    DEFAULT_BATCH_SIZE: int = 500
+
     def __init__(
         self,
         host: Optional[str] = None,
         namespace: Optional[str] = None,
         ttl: Optional[float | int] = None,
         raise_on_error: Optional[bool] = None,
+        codec: Optional[CacheCodec] = None,
         **mongo_config,
     ):
         """Initialize the Mongo DB storage backend and connect to the Mongo DB server.
@@ -129,6 +137,9 @@ class MongoDBStorage(ABCStorage):
             raise_on_error (Optional[bool]):
                 Determines whether an error should be raised when encountering unexpected issues when interacting with
                 MongoDB. If `None`, the `raise_on_error` attribute defaults to `MongoDBStorage.DEFAULT_RAISE_ON_ERROR`.
+            codec (Optional[CacheCodec]):
+                The codec used to serialize and optionally compress records. Records written with a binary codec are
+                stored as a binary `payload` field. Defaults to storing each record as a BSON document in `data`.
 
             **mongo_config (Dict[Any, Any]):
                 Configuration parameters required to connect to the Mongo DB server.
@@ -157,10 +168,13 @@ class MongoDBStorage(ABCStorage):
             [("expireAt", 1)],
             expireAfterSeconds=0,  # Use value in each document to determine whether or not to remove record
         )
+        # supports key lookups and the anchored prefix scans used to filter records by namespace on the server
+        self.collection.create_index([("key", 1)])
 
         self._validate_prefix(namespace, required=False)
 
         self.ttl = ttl
+        self.codec = codec or CacheCodec()
         self.lock = threading.Lock()
 
     def clone(self) -> MongoDBStorage:
@@ -171,7 +185,7 @@ class MongoDBStorage(ABCStorage):
 
         """
         cls = self.__class__
-        return cls(namespace=self.namespace, ttl=self.ttl, **self.config)
+        return cls(namespace=self.namespace, ttl=self.ttl, codec=self.codec, **self.config)
 
     def retrieve(self, key: str) -> Optional[Any]:
         """Retrieve the value associated with the provided key from cache.
@@ -187,6 +201,24 @@ class MongoDBStorage(ABCStorage):
         Raises:
             PyMongoError: If there is an error retrieving the record
 
+        """
+        _, cache_data = self.get_if_present(key)
+        return cache_data
+
+    def get_if_present(self, key: str) -> Tuple[bool, Optional[Any]]:
+        """Retrieve the value associated with the provided key and whether the key exists with a single query.
+
+        Args:
+            key (str):
+                The key used to fetch the stored data from cache.
+
+        Returns:
+            Tuple[bool, Optional[Any]]:
+                A tuple indicating whether the key was found and the deserialized JSON object if successful.
+
+        Raises:
+            PyMongoError: If there is an error retrieving the record
+
         """
         try:
             namespace_key = self._prefix(key)
@@ -194,16 +226,59 @@ class MongoDBStorage(ABCStorage):
                 cache_data = self.collection.find_one({"key": namespace_key})
 
             if cache_data:
-                return {k: v for k, v in cache_data["data"].items() if k not in ("_id", "key")}
+                return True, self._load_document(cache_data)
 
-        except PyMongoError as e:
+        except (PyMongoError, CacheCodecException) as e:
             msg = f"Error during attempted retrieval of key {key} (namespace = '{self.namespace}'): {e}"
             self._handle_storage_exception(
                 exception=e, operation_exception_type=CacheRetrievalException if self.raise_on_error else None, msg=msg
             )
 
         logger.info(f"Record for key {key} (namespace = '{self.namespace}') not found...")
-        return None
+        return False, None
+
+    def retrieve_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve the values associated with each of the provided keys with a single `$in` query.
+
+        Args:
+            keys (Iterable[str]): The keys used to fetch the stored data from cache.
+
+        Returns:
+            Dict[str, Any]: A dictionary mapping each key that was found to its deserialized JSON object.
+
+        Raises:
+            PyMongoError: If there is an error retrieving the records
+
+        """
+        keys = list(dict.fromkeys(keys))
+        try:
+            namespace_keys = {self._prefix(key): key for key in keys}
+            with self.lock:
+                cache_data = list(
+                    self.collection.find({"key": {"$in": list(namespace_keys)}}, {"key": 1, "data": 1, "payload": 1})
+                )
+
+            return {
+                namespace_keys[document["key"]]: self._load_document(document)
+                for document in cache_data
+                if document.get("key") in namespace_keys
+            }
+
+        except (PyMongoError, CacheCodecException) as e:
+            msg = f"Error during attempted retrieval of {len(keys)} keys (namespace = '{self.namespace}'): {e}"
+            self._handle_storage_exception(
+                exception=e, operation_exception_type=CacheRetrievalException if self.raise_on_error else None, msg=msg
+            )
+        return {}
+
+    def _namespace_filter(self) -> Dict[str, Any]:
+        """Helper method that creates the query filter used to match the records of the current namespace.
+
+        Namespaced keys are matched with an anchored prefix regex that MongoDB resolves as a range scan on the `key`
+        index instead of a collection scan.
+
+        """
+        return {"key": {"$regex": f"^{re.escape(self.namespace)}:"}} if self.namespace else {}
 
     def retrieve_all(self) -> Dict[str, Any]:
         """Retrieve all records from cache that match the current namespace prefix.
@@ -215,28 +290,42 @@ class MongoDBStorage(ABCStorage):
             PyMongoError: If there is an error during the retrieval of records under the namespace.
 
         """
-        cache = {}
+        cache = dict(self.iter_all())
+        if not cache:
+            logger.info("Records not found...")
+        return cache
+
+    def iter_all(self, batch_size: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """Iterate over all records from cache that match the current namespace prefix using a server-side cursor.
+
+        Records are filtered by namespace on the server and fetched in batches, so memory use remains constant
+        regardless of the number of records in the namespace.
+
+        Args:
+            batch_size (Optional[int]):
+                The number of documents to fetch from the server at a time. Defaults to `DEFAULT_BATCH_SIZE`.
+
+        Yields:
+            Tuple[str, Any]: The key and JSON deserialized object of each record.
+
+        Raises:
+            PyMongoError: If there is an error during the retrieval of records under the namespace.
+
+        """
         try:
             with self.lock:
-                cache_data = self.collection.find({}, {"key": 1, "data": 1, "_id": 0})
-            if not cache_data:
-                logger.info("Records not found...")
-            else:
-                cache = {
-                    data["key"]: {k: v for k, v in data.items() if k not in ("_id", "key")}
-                    for data in cache_data
-                    if data.get("key") and (not self.namespace or data.get("key", "").startswith(self.namespace))
-                }
-        except PyMongoError as e:
+                cursor = self.collection.find(self._namespace_filter(), {"key": 1, "data": 1, "payload": 1, "_id": 0})
+            for document in cursor.batch_size(batch_size or self.DEFAULT_BATCH_SIZE):
+                if document.get("key"):
+                    yield document["key"], self._load_document(document)
+        except (PyMongoError, CacheCodecException) as e:
             msg = f"Error during attempted retrieval of records from namespace '{self.namespace}': {e}"
             self._handle_storage_exception(
                 exception=e, operation_exception_type=CacheRetrievalException if self.raise_on_error else None, msg=msg
             )
 
-        return cache
-
     def retrieve_keys(self) -> List[str]:
-        """Retrieve all keys for records from cache.
+        """Retrieve all keys for records from cache that match the current namespace prefix.
 
         Returns:
             list[str]: A list of all keys saved via MongoDB.
@@ -245,19 +334,33 @@ class MongoDBStorage(ABCStorage):
             PyMongoError: If there is an error retrieving the record key.
 
         """
-        keys = []
+        return list(self.iter_keys())
+
+    def iter_keys(self, batch_size: Optional[int] = None) -> Iterator[str]:
+        """Iterate over the keys of all records that match the current namespace prefix using a server-side cursor.
+
+        Args:
+            batch_size (Optional[int]):
+                The number of keys to fetch from the server at a time. Defaults to `DEFAULT_BATCH_SIZE`.
+
+        Yields:
+            str: The key of each record under the current namespace.
+
+        Raises:
+            PyMongoError: If there is an error retrieving the record keys.
+
+        """
         try:
             with self.lock:
-                keys = self.collection.distinct("key")
-
-            if self.namespace:
-                keys = [key for key in keys if key.startswith(f"{self.namespace}:")]
+                cursor = self.collection.find(self._namespace_filter(), {"key": 1, "_id": 0})
+            for document in cursor.batch_size(batch_size or self.DEFAULT_BATCH_SIZE):
+                if document.get("key"):
+                    yield document["key"]
         except PyMongoError as e:
             msg = f"Error during attempted retrieval of all keys from namespace '{self.namespace}': {e}"
             self._handle_storage_exception(
                 exception=e, operation_exception_type=CacheRetrievalException if self.raise_on_error else None, msg=msg
             )
-        return keys
 
     def update(self, key: str, data: Any):
         """Update the cache by storing associated value with provided key.
@@ -275,16 +378,11 @@ class MongoDBStorage(ABCStorage):
         """
         try:
             namespace_key = self._prefix(key)
-            data_dict = {"key": namespace_key, "data": data}
-            if self.ttl is not None:
-                data_dict["expireAt"] = datetime.now(timezone.utc) + timedelta(seconds=self.ttl)
+            update = self._upsert_document(namespace_key, data)
 
-            is_cached = self.verify_cache(namespace_key)
+            # a single upsert inserts new records and overwrites existing records without a prior existence check
             with self.lock:
-                if not is_cached:
-                    self.collection.update_one({"key": namespace_key}, {"$set": data_dict}, upsert=True)
-                else:
-                    self.collection.replace_one({"key": namespace_key}, data_dict, upsert=True)
+                self.collection.update_one({"key": namespace_key}, update, upsert=True)
             logger.debug(f"Cache updated for key: {key} (namespace = '{self.namespace}')")
 
         except DuplicateKeyError as e:
@@ -295,6 +393,61 @@ class MongoDBStorage(ABCStorage):
                 exception=e, operation_exception_type=CacheUpdateException if self.raise_on_error else None, msg=msg
             )
 
+    def update_many(self, records: Mapping[str, Any]) -> None:
+        """Update the cache by storing each record with a single unordered `bulk_write` of upserts.
+
+        Args:
+            records (Mapping[str, Any]):
+                A mapping of keys to the Python objects that will be serialized into JSON format and stored.
+
+        Raises:
+            PyMongoError: If an error occur when attempting to insert or update the records
+
+        """
+        try:
+            operations = [
+                UpdateOne({"key": namespace_key}, self._upsert_document(namespace_key, data), upsert=True)
+                for namespace_key, data in ((self._prefix(key), data) for key, data in records.items())
+            ]
+            if operations:
+                with self.lock:
+                    self.collection.bulk_write(operations, ordered=False)
+            logger.debug(f"Cache updated for {len(operations)} keys (namespace = '{self.namespace}')")
+
+        except (PyMongoError, StorageCacheException) as e:
+            msg = f"Error during attempted update of {len(records)} keys (namespace = '{self.namespace}'): {e}"
+            self._handle_storage_exception(
+                exception=e, operation_exception_type=CacheUpdateException if self.raise_on_error else None, msg=msg
+            )
+
+    def _upsert_document(self, namespace_key: str, data: Any) -> Dict[str, Any]:
+        """Helper method that creates the update document used to insert or overwrite the record for a key.
+
+        Data is stored in the binary `payload` field when the current codec is binary and in the `data` field otherwise.
+        The unused field is removed so that overwritten records are never decoded from stale data.
+
+        """
+        if self.codec.is_binary:
+            data_dict: Dict[str, Any] = {"key": namespace_key, "payload": self.codec.encode(data)}
+            unset_fields = {"data": ""}
+        else:
+            data_dict = {"key": namespace_key, "data": data}
+            unset_fields = {"payload": ""}
+
+        if self.ttl is not None:
+            data_dict["expireAt"] = datetime.now(timezone.utc) + timedelta(seconds=self.ttl)
+        else:
+            unset_fields["expireAt"] = ""
+
+        return {"$set": data_dict, "$unset": unset_fields}
+
+    @staticmethod
+    def _load_document(document: Dict[str, Any]) -> Any:
+        """Helper method that decodes the data of a document from its binary `payload` or from its `data` field."""
+        if document.get("payload") is not None:
+            return CacheCodec.decode(document["payload"])
+        return {k: v for k, v in document["data"].items() if k not in ("_id", "key")}
+
     def delete(self, key: str):
         """Delete the value associated with the provided key from cache.
 
@@ -319,6 +472,28 @@ class MongoDBStorage(ABCStorage):
                 exception=e, operation_exception_type=CacheDeletionException if self.raise_on_error else None, msg=msg
             )
 
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete the values associated with each of the provided keys from cache with a single `delete_many` query.
+
+        Args:
+            keys (Iterable[str]): The keys associated with the stored data to remove from the cache.
+
+        Raises:
+            PyMongoError: If there is an error deleting the records
+
+        """
+        keys = list(keys)
+        try:
+            namespace_keys = [self._prefix(key) for key in keys]
+            with self.lock:
+                result = self.collection.delete_many({"key": {"$in": namespace_keys}})
+            logger.debug(f"Deleted {result.deleted_count} of {len(keys)} keys (namespace = '{self.namespace}')")
+        except PyMongoError as e:
+            msg = f"Error during attempted deletion of {len(keys)} keys (namespace = '{self.namespace}'): {e}"
+            self._handle_storage_exception(
+                exception=e, operation_exception_type=CacheDeletionException if self.raise_on_error else None, msg=msg
+            )
+
     def delete_all(self):
         """Delete all records from cache that match the current namespace prefix.
 
@@ -328,9 +503,9 @@ class MongoDBStorage(ABCStorage):
         """
         try:
             with self.lock:
-                result = self.collection.delete_many({})
+                result = self.collection.delete_many(self._namespace_filter())
             if result.deleted_count > 0:
-                logger.debug("Deleted all records.")
+                logger.debug(f"Deleted {result.deleted_count} records.")
             else:
                 logger.warning("No records present to delete")
         except PyMongoError as e:
@@ -358,8 +533,8 @@ class MongoDBStorage(ABCStorage):
 
         try:
             with self.with_raise_on_error():
-                found_data = self.retrieve(key)
-            return found_data is not None
+                is_cached, _ = self.get_if_present(key)
+            return is_cached
         except (PyMongoError, StorageCacheException) as e:
             msg = f"Error during the verification of the existence of key {key} (namespace = '{self.namespace}'): {e}"
             self._handle_storage_exception(
@@ -2,7 +2,7 @@
 """The scholar_flux.data_storage.null_storage module implements a Null (No-Op) Storage that is used to ensure that
 responses are always reprocessed when implemented."""
 from __future__ import annotations
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 from scholar_flux.data_storage.abc_storage import ABCStorage
 
 import logging
@@ -73,6 +73,14 @@ class NullStorage(ABCStorage):
         """Method added for abstract class consistency - no-op"""
         return None
 
+    def get_if_present(self, *args, **kwargs) -> Tuple[bool, Optional[Any]]:
+        """Method added for abstract class consistency - indicates that no record is ever found"""
+        return False, None
+
+    def retrieve_many(self, *args, **kwargs) -> Dict[str, Any]:
+        """Method added for abstract class consistency - returns a dictionary for type consistency"""
+        return {}
+
     def retrieve_all(self, *args, **kwargs) -> Optional[Dict[str, Any]]:
         """Method added for abstract class consistency - returns a dictionary for type consistency"""
         return {}
@@ -85,10 +93,18 @@ class NullStorage(ABCStorage):
         """Method added for abstract class consistency - no-op"""
         pass
 
+    def update_many(self, *args, **kwargs) -> None:
+        """Method added for abstract class consistency - no-op"""
+        pass
+
     def delete(self, *args, **kwargs) -> None:
         """Method added for abstract class consistency - no-op"""
         pass
 
+    def delete_many(self, *args, **kwargs) -> None:
+        """Method added for abstract class consistency - no-op"""
+        pass
+
     def delete_all(self, *args, **kwargs) -> None:
         """Method added for abstract class consistency - no-op"""
         pass
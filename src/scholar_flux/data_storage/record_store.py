@@ -0,0 +1,336 @@
+# /data_storage/record_store.py
+"""The scholar_flux.data_storage.record_store module implements the RecordStore used to deduplicate the records of
+cached pages across pages, queries, and providers.
+
+Each page cached by the DataCacheManager holds the extracted, processed, and normalized records of a response alongside
+the parsed response that the records were extracted from. When queries overlap, the same records are cached once for
+each page they appear in. The RecordStore instead stores each record once under the hash of its content, so that cached
+pages only hold references to their records:
+
+    - Records are addressed by the SHA-256 hash of their canonical JSON representation. Identical records from different
+      pages (or queries) share a single entry, while different representations of the same article (e.g. the extracted
+      and processed forms, or the records of two providers) are never conflated.
+    - The list of extracted records embedded within the parsed response is replaced by a marker and restored from the
+      extracted records when resolved, so records are not duplicated within a page either.
+    - References are resolved in bulk with a single `retrieve_many` lookup for any number of pages.
+
+Records are stored under a separate namespace (`records:<namespace>`) so that they are not listed, iterated, or deleted
+alongside the cached pages of the storage. Records are written whenever a page referencing them is written, which also
+refreshes the expiration of records in storages that use a TTL. Records are not deleted when the pages that reference
+them are deleted: records that are no longer referenced by any page can be removed with `prune`, and cached pages whose
+records can no longer be found are treated as cache misses.
+
+Classes:
+    RecordStore: Stores the records of cached pages by content hash and resolves the references of cached pages.
+
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+import hashlib
+import json
+import logging
+
+from scholar_flux.data_storage.abc_storage import ABCStorage
+from scholar_flux.data_storage.write_behind import WriteBehindQueue
+from scholar_flux.exceptions import StorageCacheException
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+
+logger = logging.getLogger(__name__)
+
+
+class RecordStore:
+    """Stores each record of a cached page once under the hash of its content and resolves the references of pages.
+
+    Args:
+        storage (ABCStorage):
+            The storage used to hold records. When created with `configure`, this is a storage with the configuration of
+            the DataCacheManager's storage that holds records under a separate namespace (see `records_namespace`).
+        key_prefix (Optional[str]):
+            The prefix of the key of each record. Defaults to `RecordStore.DEFAULT_KEY_PREFIX`.
+        write_behind (bool | WriteBehindQueue):
+            Whether to queue the records of cached pages and write them to the storage in batches on a background
+            thread. A preconfigured WriteBehindQueue for the storage can also be provided.
+
+    Examples:
+        >>> from scholar_flux.data_storage import RecordStore, InMemoryStorage
+        >>> store = RecordStore(InMemoryStorage())
+        >>> record = {'doi': '10.1371/journal.pone.0000001', 'title': 'Overlap'}
+        >>> entry = store.deduplicate({'processed_records': [record]})
+        >>> entry
+        # OUTPUT: {'processed_records': ['c3e1...'], 'record_references': ['processed_records']}
+        >>> store.resolve(entry)
+        # OUTPUT: {'processed_records': [{'doi': '10.1371/journal.pone.0000001', 'title': 'Overlap'}]}
+
+    """
+
+    DEFAULT_KEY_PREFIX: str = "record"
+    # the prefix of the namespace that holds the records of the pages cached within a namespace
+    NAMESPACE_PREFIX: str = "records"
+    # the field of a cached page that lists the fields holding references instead of records
+    REFERENCES_FIELD: str = "record_references"
+    # the fields of a cached page that hold lists of records
+    RECORD_FIELDS: Tuple[str, ...] = ("extracted_records", "processed_records", "normalized_records")
+    # marks the location of the extracted records within the parsed response
+    PARSED_RECORDS_MARKER: Dict[str, str] = {"$records": "extracted_records"}
+
+    def __init__(
+        self, storage: ABCStorage, key_prefix: Optional[str] = None, write_behind: bool | WriteBehindQueue = False
+    ) -> None:
+        """Initializes the record store with the storage used to hold records."""
+        if not isinstance(storage, ABCStorage):
+            raise StorageCacheException(f"A RecordStore requires an ABCStorage. Received {type(storage)}")
+        self.storage = storage
+        self.key_prefix = key_prefix or self.DEFAULT_KEY_PREFIX
+        # when configured, records are queued and written to storage by a background thread
+        self.write_behind: Optional[WriteBehindQueue] = WriteBehindQueue.configure(write_behind, storage)
+
+    @classmethod
+    def records_namespace(cls, namespace: Optional[str] = None) -> str:
+        """Creates the namespace that holds the records of the pages cached within a namespace.
+
+        The namespace of records is prefixed rather than suffixed so that storages listing the keys of a namespace by
+        prefix (e.g., `<namespace>:*`) never list records alongside cached pages.
+
+        Args:
+            namespace (Optional[str]): The namespace of the storage holding the cached pages.
+
+        Returns:
+            str: The namespace of the records (e.g., `records:plos`, or `records` for storages without a namespace).
+
+        """
+        return f"{cls.NAMESPACE_PREFIX}:{namespace}" if namespace else cls.NAMESPACE_PREFIX
+
+    @classmethod
+    def configure(
+        cls,
+        record_store: bool | RecordStore | None,
+        storage: ABCStorage,
+        write_behind: Optional[WriteBehindQueue] = None,
+    ) -> Optional[RecordStore]:
+        """Creates a record store for the storage when `record_store` is True, or validates an existing record store.
+
+        Created record stores hold records within a storage that uses the same configuration (and backend) as the
+        storage of cached pages, under the namespace returned by `records_namespace`.
+
+        Args:
+            record_store (bool | RecordStore | None): Whether to deduplicate records, or a preconfigured record store.
+            storage (ABCStorage): The storage of the cached pages whose records should be deduplicated.
+            write_behind (Optional[WriteBehindQueue]):
+                The queue used to write cached pages, if any. Created record stores queue records with a queue of the
+                same configuration.
+
+        Returns:
+            Optional[RecordStore]: The record store to use, or None if records should not be deduplicated.
+
+        Raises:
+            StorageCacheException: If `record_store` is neither a boolean nor a RecordStore
+
+        """
+        if isinstance(record_store, RecordStore):
+            return record_store
+        if record_store is not None and not isinstance(record_store, bool):
+            raise StorageCacheException(f"Expected a boolean or a RecordStore. Received {type(record_store)}")
+        if not record_store:
+            return None
+
+        records_storage = storage.with_namespace(cls.records_namespace(storage.namespace))
+        return cls(records_storage, write_behind=write_behind.clone(records_storage) if write_behind else False)
+
+    @classmethod
+    def record_hash(cls, record: Any) -> str:
+        """Computes the SHA-256 hash of the canonical JSON representation of a record.
+
+        Args:
+            record (Any): The record to hash.
+
+        Returns:
+            str: The hexadecimal digest identifying the content of the record.
+
+        """
+        try:
+            canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=repr)
+        except TypeError:
+            # keys of mixed types cannot be sorted: the representation of the record is used instead
+            canonical = repr(record)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _record_key(self, record_hash: str) -> str:
+        """Helper method that creates the storage key of a record from its hash."""
+        return f"{self.key_prefix}:{record_hash}"
+
+    def is_deduplicated(self, entry: Any) -> bool:
+        """Indicates whether a cached page holds references to records instead of the records themselves."""
+        return isinstance(entry, dict) and bool(entry.get(self.REFERENCES_FIELD))
+
+    def deduplicate(self, entry: Mapping[str, Any]) -> Dict[str, Any]:
+        """Writes the records of a cached page to storage and returns a copy of the page that references each record.
+
+        Args:
+            entry (Mapping[str, Any]): The cached page containing lists of records within its `RECORD_FIELDS`.
+
+        Returns:
+            Dict[str, Any]: A copy of the cached page where each list of records is replaced by the list of hashes.
+
+        """
+        page = dict(entry)
+        records: Dict[str, Any] = {}
+        references: List[str] = []
+
+        extracted_records = entry.get("extracted_records")
+        for field in self.RECORD_FIELDS:
+            field_records = entry.get(field)
+            if not (isinstance(field_records, list) and field_records):
+                continue
+
+            record_hashes = [self.record_hash(record) for record in field_records]
+            records |= {
+                self._record_key(record_hash): record for record_hash, record in zip(record_hashes, field_records)
+            }
+            page[field] = record_hashes
+            references.append(field)
+
+        if not references:
+            return page
+
+        if "extracted_records" in references and entry.get("parsed_response") is not None:
+            page["parsed_response"] = self._substitute(
+                entry["parsed_response"], lambda value: value is extracted_records, dict(self.PARSED_RECORDS_MARKER)
+            )
+
+        if self.write_behind is not None:
+            for record_key, record in records.items():
+                self.write_behind.put(record_key, record)
+        else:
+            self.storage.update_many(records)
+        page[self.REFERENCES_FIELD] = references
+        logger.debug(f"Stored {len(records)} unique records referenced by a cached page")
+        return page
+
+    @classmethod
+    def _substitute(cls, value: Any, is_target: Callable[[Any], bool], replacement: Any) -> Any:
+        """Helper method that replaces each matching value within a nested structure of dictionaries and lists.
+
+        Only the containers along the path to the replaced value are copied, so that the original structure (which may
+        be held by the InMemoryStorage or returned to the caller) is left unchanged.
+
+        """
+        if is_target(value):
+            return replacement
+        if isinstance(value, dict):
+            replaced = {key: cls._substitute(item, is_target, replacement) for key, item in value.items()}
+            return replaced if any(replaced[key] is not item for key, item in value.items()) else value
+        if isinstance(value, list):
+            replaced_list = [cls._substitute(item, is_target, replacement) for item in value]
+            return replaced_list if any(new is not old for new, old in zip(replaced_list, value)) else value
+        return value
+
+    def resolve(self, entry: Any) -> Optional[Any]:
+        """Resolves the references of a cached page into records.
+
+        Args:
+            entry (Any): A cached page. Pages without references are returned as is.
+
+        Returns:
+            Optional[Any]: The cached page with its records, or None if any referenced record could not be found.
+
+        """
+        return self.resolve_many({"entry": entry}).get("entry")
+
+    def resolve_many(self, entries: Mapping[str, Any]) -> Dict[str, Any]:
+        """Resolves the references of several cached pages with a single bulk lookup of their records.
+
+        Args:
+            entries (Mapping[str, Any]): A mapping of cache keys to cached pages.
+
+        Returns:
+            Dict[str, Any]:
+                A mapping of cache keys to the resolved cached pages. Pages referencing records that could not be found
+                are omitted.
+
+        """
+        record_keys = self._referenced_keys(entries.values())
+        # records that are queued but not yet written are resolved without a lookup
+        records = self.write_behind.retrieve_many(record_keys) if self.write_behind is not None and record_keys else {}
+        missing = record_keys.difference(records)
+        records |= self.storage.retrieve_many(missing) if missing else {}
+
+        resolved = {}
+        for cache_key, entry in entries.items():
+            if not self.is_deduplicated(entry):
+                resolved[cache_key] = entry
+                continue
+
+            page = self._resolve_entry(entry, records)
+            if page is None:
+                logger.info(f"Records referenced by the cached page, {cache_key}, could not be found")
+                continue
+            resolved[cache_key] = page
+        return resolved
+
+    def _referenced_keys(self, entries: Iterable[Any]) -> set[str]:
+        """Helper method that lists the keys of each record referenced by the provided cached pages."""
+        return {
+            self._record_key(record_hash)
+            for entry in entries
+            if self.is_deduplicated(entry)
+            for field in entry[self.REFERENCES_FIELD]
+            for record_hash in entry.get(field) or []
+        }
+
+    def prune(self, entries: Iterable[Any]) -> int:
+        """Deletes each stored record that is not referenced by any of the provided cached pages.
+
+        Args:
+            entries (Iterable[Any]): Every cached page that may reference records of the current record store.
+
+        Returns:
+            int: The number of records that were deleted.
+
+        """
+        self.flush()
+        referenced = {self.storage._prefix(record_key) for record_key in self._referenced_keys(entries)}
+        orphaned = [key for key in self.storage.iter_keys() if self.storage._prefix(key) not in referenced]
+        if orphaned:
+            self.storage.delete_many(orphaned)
+        logger.debug(f"Deleted {len(orphaned)} records that are no longer referenced by cached pages")
+        return len(orphaned)
+
+    def flush(self) -> None:
+        """Writes all queued records to the storage on the calling thread when write-behind is enabled."""
+        if self.write_behind is not None:
+            self.write_behind.flush()
+
+    def close(self) -> None:
+        """Writes all queued records and stops the background thread used to write them, if any."""
+        if self.write_behind is not None:
+            self.write_behind.close()
+
+    def _resolve_entry(self, entry: Dict[str, Any], records: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """Helper method that replaces the references of a cached page with records that were retrieved in bulk."""
+        page = {key: value for key, value in entry.items() if key != self.REFERENCES_FIELD}
+        for field in entry[self.REFERENCES_FIELD]:
+            record_keys = [self._record_key(record_hash) for record_hash in entry.get(field) or []]
+            if any(record_key not in records for record_key in record_keys):
+                return None
+            page[field] = [records[record_key] for record_key in record_keys]
+
+        if "extracted_records" in entry[self.REFERENCES_FIELD] and page.get("parsed_response") is not None:
+            page["parsed_response"] = self._substitute(
+                page["parsed_response"], lambda value: value == self.PARSED_RECORDS_MARKER, page["extracted_records"]
+            )
+        return page
+
+    def clone(self, storage: Optional[ABCStorage] = None) -> RecordStore:
+        """Creates a new record store with the same configuration for the current or a different storage."""
+        storage = storage if storage is not None else self.storage
+        write_behind = self.write_behind.clone(storage) if self.write_behind is not None else False
+        return self.__class__(storage, key_prefix=self.key_prefix, write_behind=write_behind)
+
+    def __repr__(self) -> str:
+        """Shows the storage and key prefix of the current record store."""
+        return generate_repr_from_string(
+            self.__class__.__name__, dict(storage=self.storage, key_prefix=self.key_prefix), flatten=True
+        )
+
+
+__all__ = ["RecordStore"]
@@ -20,11 +20,12 @@ from scholar_flux.exceptions import (
     CacheUpdateException,
     CacheDeletionException,
     CacheVerificationException,
+    CacheCodecException,
 )
 from scholar_flux.data_storage.abc_storage import ABCStorage
-from scholar_flux.utils.encoder import JsonDataEncoder
+from scholar_flux.data_storage.cache_codec import CacheCodec
 from scholar_flux.utils import config_settings  # provides the loaded global environment configuration
-from typing import Any, Dict, List, Optional, cast, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, cast, TYPE_CHECKING
 
 import logging
 import threading
@@ -86,6 +87,7 @@ class RedisStorage(ABCStorage):
         "port": config_settings.config.get("SCHOLAR_FLUX_REDIS_PORT") or 6379,
     }
     DEFAULT_RAISE_ON_ERROR: bool = False
+    DEFAULT_BATCH_SIZE: int = 500
 
     def __init__(
         self,
@@ -93,6 +95,7 @@ class RedisStorage(ABCStorage):
         namespace: Optional[str] = None,
         ttl: Optional[int] = None,
         raise_on_error: Optional[bool] = None,
+        codec: Optional[CacheCodec] = None,
         **redis_config,
     ):
         """Initialize the Redis storage backend and connect to the Redis server.
@@ -117,6 +120,11 @@ class RedisStorage(ABCStorage):
             raise_on_error (Optional[bool]):
                 Determines whether an error should be raised when encountering unexpected issues when interacting with
                 Redis. If `None`, the `raise_on_error` attribute defaults to `RedisStorage.DEFAULT_RAISE_ON_ERROR`.
+            codec (Optional[CacheCodec]):
+                The codec used to serialize and optionally compress records before they are stored. Binary codecs
+                (e.g., `CacheCodec(serializer='msgpack', compression='zlib')`) substantially reduce memory use and
+                network transfer for large responses. Defaults to plain JSON strings. Records are always decoded with
+                the format they were written with, so existing records remain readable when the codec changes.
             **redis_config (Optional[Dict[Any, Any]]):
                 Configuration parameters required to connect to the Redis server. Typically includes parameters
                 such as host, port, db, etc.
@@ -146,6 +154,7 @@ class RedisStorage(ABCStorage):
         self._validate_prefix(self.namespace, required=True)
 
         self.ttl = ttl
+        self.codec = codec or CacheCodec()
         self.lock = threading.Lock()
         logger.info("RedisClient initialized and connected.")
 
@@ -157,7 +166,7 @@ class RedisStorage(ABCStorage):
 
         """
         cls = self.__class__
-        return cls(namespace=self.namespace, ttl=self.ttl, **self.config)
+        return cls(namespace=self.namespace, ttl=self.ttl, codec=self.codec, **self.config)
 
     def retrieve(self, key: str) -> Optional[Any]:
         """Retrieve the value associated with the provided key from cache.
@@ -169,25 +178,73 @@ class RedisStorage(ABCStorage):
             Any:
                 The value returned is deserialized JSON object if successful. Returns None if the key does not exist.
 
+        """
+        _, cache_data = self.get_if_present(key)
+        return cache_data
+
+    def get_if_present(self, key: str) -> Tuple[bool, Optional[Any]]:
+        """Retrieve the value associated with the provided key and whether the key exists with a single `GET` command.
+
+        Args:
+            key (str): The key used to fetch the stored data from cache.
+
+        Returns:
+            Tuple[bool, Optional[Any]]:
+                A tuple indicating whether the key was found and the deserialized JSON object if successful.
+
         """
         try:
             namespace_key = self._prefix(key)
             with self.lock:
-                cache_data = cast("Optional[str]", self.client.get(namespace_key))
+                cache_data = cast("Optional[str | bytes]", self.client.get(namespace_key))
             if cache_data is None:
                 logger.info(f"Record for key {key} (namespace = '{self.namespace}') not found...")
-                return None
+                return False, None
 
-            if isinstance(cache_data, bytes):
-                cache_data = cache_data.decode()
-            return JsonDataEncoder.deserialize(cache_data)
+            return True, CacheCodec.decode(cache_data)
 
-        except (RedisError, ConnectionError) as e:
+        except (RedisError, ConnectionError, CacheCodecException) as e:
             msg = f"Error during attempted retrieval of key {key} (namespace = '{self.namespace}'): {e}"
             self._handle_storage_exception(
                 exception=e, operation_exception_type=CacheRetrievalException if self.raise_on_error else None, msg=msg
             )
-        return None
+        return False, None
+
+    def retrieve_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve the values associated with each of the provided keys using `MGET` commands.
+
+        Keys are requested in batches of `RedisStorage.DEFAULT_BATCH_SIZE`, so that most lookups require a single
+        round trip to the Redis server.
+
+        Args:
+            keys (Iterable[str]): The keys used to fetch the stored data from cache.
+
+        Returns:
+            Dict[str, Any]: A dictionary mapping each key that was found to its deserialized JSON object.
+
+        """
+        keys = list(dict.fromkeys(keys))
+        try:
+            namespace_keys = [self._prefix(key) for key in keys]
+            with self.lock:
+                cache_data = self._mget(namespace_keys)
+            return {key: data for key, data in zip(keys, cache_data) if data is not None}
+
+        except (RedisError, ConnectionError, CacheCodecException) as e:
+            msg = f"Error during attempted retrieval of {len(keys)} keys (namespace = '{self.namespace}'): {e}"
+            self._handle_storage_exception(
+                exception=e, operation_exception_type=CacheRetrievalException if self.raise_on_error else None, msg=msg
+            )
+        return {}
+
+    def _mget(self, namespace_keys: List[str]) -> List[Optional[Any]]:
+        """Helper method that retrieves and deserializes the values of namespaced keys in batches with `MGET`."""
+        cache_data: List[Optional[Any]] = []
+        for start in range(0, len(namespace_keys), self.DEFAULT_BATCH_SIZE):
+            batch = namespace_keys[start : start + self.DEFAULT_BATCH_SIZE]
+            for data in self.client.mget(batch):
+                cache_data.append(CacheCodec.decode(data) if data is not None else None)
+        return cache_data
 
     def retrieve_all(self) -> Dict[str, Any]:
         """Retrieve all records from cache that match the current namespace prefix.
@@ -202,10 +259,11 @@ class RedisStorage(ABCStorage):
         """
         try:
             matched_keys = self.retrieve_keys()
-            results = {key: self.retrieve(key) for key in matched_keys}
-            return results
+            with self.lock:
+                cache_data = self._mget(matched_keys)
+            return {key: data for key, data in zip(matched_keys, cache_data) if data is not None}
 
-        except (RedisError, ConnectionError) as e:
+        except (RedisError, ConnectionError, CacheCodecException) as e:
             msg = f"Error during attempted retrieval of records from namespace '{self.namespace}': {e}"
             self._handle_storage_exception(
                 exception=e, operation_exception_type=CacheRetrievalException if self.raise_on_error else None, msg=msg
@@ -254,18 +312,40 @@ class RedisStorage(ABCStorage):
         try:
             with self.lock:
                 namespace_key = self._prefix(key)
-                self.client.set(namespace_key, JsonDataEncoder.serialize(data))
-
-                if self.ttl is not None:
-                    self.client.expire(namespace_key, self.ttl)
+                # the expiration is set with the value to avoid a separate EXPIRE round trip
+                self.client.set(namespace_key, self.codec.encode(data), ex=self.ttl)
                 logger.debug(f"Cache updated for key: '{namespace_key}'")
 
-        except (RedisError, ConnectionError) as e:
+        except (RedisError, ConnectionError, CacheCodecException) as e:
             msg = f"Error during attempted update of key {key} (namespace = '{self.namespace}': {e}"
             self._handle_storage_exception(
                 exception=e, operation_exception_type=CacheUpdateException if self.raise_on_error else None, msg=msg
             )
 
+    def update_many(self, records: Mapping[str, Any]) -> None:
+        """Update the cache by storing each record with a single pipelined round trip.
+
+        Args:
+            records (Mapping[str, Any]):
+                A mapping of keys to the Python objects that will be serialized into JSON format and stored.
+
+        Raises:
+            RedisError: If an error occur when attempting to insert or update the records
+
+        """
+        try:
+            with self.lock, self.client.pipeline(transaction=False) as pipe:
+                for key, data in records.items():
+                    pipe.set(self._prefix(key), self.codec.encode(data), ex=self.ttl)
+                pipe.execute()
+            logger.debug(f"Cache updated for {len(records)} keys (namespace = '{self.namespace}')")
+
+        except (RedisError, ConnectionError, CacheCodecException) as e:
+            msg = f"Error during attempted update of {len(records)} keys (namespace = '{self.namespace}'): {e}"
+            self._handle_storage_exception(
+                exception=e, operation_exception_type=CacheUpdateException if self.raise_on_error else None, msg=msg
+            )
+
     def delete(self, key: str) -> None:
         """Delete the value associated with the provided key from cache.
 
@@ -292,6 +372,33 @@ class RedisStorage(ABCStorage):
                 exception=e, operation_exception_type=CacheDeletionException if self.raise_on_error else None, msg=msg
             )
 
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete the values associated with each of the provided keys from cache with batched `DEL` commands.
+
+        Args:
+            keys (Iterable[str]): The keys associated with the stored data to remove from cache.
+
+        Raises:
+            RedisError: If there is an error deleting the records
+
+        """
+        keys = list(keys)
+        try:
+            namespace_keys = [self._prefix(key) for key in keys]
+            with self.lock:
+                self._delete_batched(namespace_keys)
+
+        except (RedisError, ConnectionError) as e:
+            msg = f"Error during attempted deletion of {len(keys)} keys (namespace = '{self.namespace}'): {e}"
+            self._handle_storage_exception(
+                exception=e, operation_exception_type=CacheDeletionException if self.raise_on_error else None, msg=msg
+            )
+
+    def _delete_batched(self, namespace_keys: List[Any]) -> None:
+        """Helper method that deletes namespaced keys in batches of `DEFAULT_BATCH_SIZE` keys per `DEL` command."""
+        for start in range(0, len(namespace_keys), self.DEFAULT_BATCH_SIZE):
+            self.client.delete(*namespace_keys[start : start + self.DEFAULT_BATCH_SIZE])
+
     def delete_all(self) -> None:
         """Delete all records from cache that match the current namespace prefix.
 
@@ -310,9 +417,7 @@ class RedisStorage(ABCStorage):
 
             with self.lock:
                 matched_keys = list(self.client.scan_iter(f"{self.namespace}:*"))
-
-                for key in matched_keys:
-                    self.client.delete(key)
+                self._delete_batched(matched_keys)
 
         except (RedisError, ConnectionError) as e:
             msg = f"Error during attempted deletion of all records from namespace '{self.namespace}': {e}"
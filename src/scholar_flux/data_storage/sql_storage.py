@@ -17,10 +17,11 @@ Classes:
 """
 from __future__ import annotations
 import logging
-from typing import Any, List, Dict, Optional, TYPE_CHECKING
+from typing import Any, Iterable, Iterator, List, Dict, Mapping, Optional, Tuple, TYPE_CHECKING
 
 from scholar_flux.utils.encoder import JsonDataEncoder
 from scholar_flux.data_storage.abc_storage import ABCStorage
+from scholar_flux.data_storage.cache_codec import CacheCodec
 from scholar_flux.package_metadata import get_default_writable_directory
 from scholar_flux.exceptions import (
     SQLAlchemyImportError,
@@ -29,9 +30,11 @@ from scholar_flux.exceptions import (
     CacheUpdateException,
     CacheDeletionException,
     CacheVerificationException,
+    CacheCodecException,
 )
 
 import cattrs
+import itertools
 import threading
 
 logger = logging.getLogger(__name__)
@@ -39,12 +42,12 @@ logger = logging.getLogger(__name__)
 # SQLAlchemy import logic for type checking and runtime
 if TYPE_CHECKING:
     import sqlalchemy
-    from sqlalchemy import create_engine, Column, String, Integer, JSON, exc
+    from sqlalchemy import create_engine, Column, String, Integer, JSON, LargeBinary, exc, inspect, text
     from sqlalchemy.orm import DeclarativeBase, sessionmaker
 else:
     try:
         import sqlalchemy  # imported for consistent implementation with redis/pymongo, etc.
-        from sqlalchemy import create_engine, Column, String, Integer, JSON, exc
+        from sqlalchemy import create_engine, Column, String, Integer, JSON, LargeBinary, exc, inspect, text
         from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
     except ImportError:
@@ -55,7 +58,7 @@ else:
             """Placeholder function that returned when the sqlalchemy package is not available."""
             pass
 
-        String = Integer = JSON = exc = None
+        String = Integer = JSON = LargeBinary = exc = inspect = text = None
         DeclarativeBase = object  # type: ignore
         sessionmaker = None
         sqlalchemy = None
@@ -75,6 +78,8 @@ if TYPE_CHECKING or sqlalchemy is not None:
         id = Column(Integer, primary_key=True, autoincrement=True)
         key = Column(String, unique=True, nullable=False)
         cache = Column(JSON, nullable=False)
+        namespace = Column(String, index=True, nullable=True)
+        payload = Column(LargeBinary, nullable=True)
 
 else:
     # Runtime stubs so code can be parsed, but will error if actually used
@@ -100,6 +105,14 @@ class SQLAlchemyStorage(ABCStorage):
             The JSON data associated with the record. To store the data, any nested, non-serializable data is first
             encoded before being unstructured and stored. On retrieving the data, the JSON string is decoded and
             restructured in order to return the original object.
+        Namespace:
+            The indexed namespace of the storage that wrote the record. Records are listed, iterated, and deleted by
+            namespace on the database server, so operations on a namespace do not scan the records of other namespaces.
+            Tables created by earlier versions are migrated to include this column when the storage is initialized.
+        Payload:
+            The binary payload of records written with a binary `CacheCodec`. These records store their data in this
+            column instead of the JSON `cache` column, which avoids the base64 encoding of bytes and allows records
+            to be compressed.
 
     The SQLAlchemyStorage can be initialized as follows:
 
@@ -136,6 +149,7 @@ class SQLAlchemyStorage(ABCStorage):
         "echo": False,
     }
     DEFAULT_RAISE_ON_ERROR: bool = False
+    DEFAULT_BATCH_SIZE: int = 500
 
     def __init__(
         self,
@@ -143,6 +157,7 @@ class SQLAlchemyStorage(ABCStorage):
         namespace: Optional[str] = None,
         ttl: None = None,
         raise_on_error: Optional[bool] = False,
+        codec: Optional[CacheCodec] = None,
         **sqlalchemy_config,
     ) -> None:
         """Initialize the SQLAlchemy storage backend and connect to the server indicated via the `url` parameter.
@@ -159,6 +174,9 @@ class SQLAlchemyStorage(ABCStorage):
             raise_on_error (Optional[bool]):
                 Determines whether an error should be raised when encountering unexpected issues when interacting with
                 SQLAlchemy. If `None`, the `raise_on_error` attribute defaults to `SQLAlchemyStorage.DEFAULT_RAISE_ON_ERROR`.
+            codec (Optional[CacheCodec]):
+                The codec used to serialize and optionally compress records. Records written with a binary codec are
+                stored in the `payload` column. Defaults to storing records as JSON in the `cache` column.
             **sqlalchemy_config:
                 Additional SQLAlchemy engine/session options passed to sqlalchemy.create_engine Typical parameters include
                 the following:
@@ -181,10 +199,12 @@ class SQLAlchemyStorage(ABCStorage):
         self.config: dict = sqlalchemy_config
         self.engine = create_engine(**self.config)
         Base.metadata.create_all(self.engine)
+        self._migrate_columns()
         self.Session = sessionmaker(bind=self.engine)
         self.converter = cattrs.Converter()
         self.namespace = namespace or self.DEFAULT_NAMESPACE
         self.raise_on_error = raise_on_error if raise_on_error is not None else self.DEFAULT_RAISE_ON_ERROR
+        self.codec = codec or CacheCodec()
         self.lock = threading.Lock()
 
         if ttl:
@@ -193,6 +213,79 @@ class SQLAlchemyStorage(ABCStorage):
 
         self._validate_prefix(self.namespace, required=False)
 
+    def _migrate_columns(self) -> None:
+        """Adds the columns of the `CacheTable` that are missing from cache tables created by earlier versions.
+
+        The namespace of each existing record is derived from the prefix of its key, while the payload of existing
+        records is left empty, as these records are stored as JSON within the `cache` column. This migration only
+        runs once per database, as the columns already exist for tables created by the current `CacheTable` schema.
+        Columns that are added by another process while the migration runs are treated as successfully added.
+
+        """
+        table = Base.metadata.tables[CacheTable.__tablename__]
+        existing_columns = self._table_columns(table.name)
+        missing_columns = [column for column in table.columns if column.name not in existing_columns]
+        if not missing_columns:
+            return
+
+        column_names = [column.name for column in missing_columns]
+        logger.info(f"Adding the columns, {column_names}, to the existing '{table.name}' table...")
+        for column in missing_columns:
+            column_type = column.type.compile(dialect=self.engine.dialect)
+            try:
+                with self.engine.begin() as connection:
+                    connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+            except (exc.OperationalError, exc.ProgrammingError):
+                # duplicate column errors differ by dialect, so the column is looked up again instead
+                if column.name not in self._table_columns(table.name):
+                    raise
+                logger.info(f"The column, {column.name}, was already added to the '{table.name}' table. Skipping...")
+
+        with self.engine.begin() as connection:
+            for index in table.indexes:
+                index.create(bind=connection, checkfirst=True)
+
+            if "namespace" in column_names:
+                self._backfill_namespaces(connection)
+
+    def _table_columns(self, table_name: str) -> set[str]:
+        """Helper method that retrieves the names of the columns that currently exist within a table."""
+        return {column["name"] for column in inspect(self.engine).get_columns(table_name)}
+
+    @staticmethod
+    def _backfill_namespaces(connection: Any) -> None:
+        """Helper method that populates the namespace of existing records using the prefix of each namespaced key."""
+        records: List[Tuple[Any, Any]] = list(
+            connection.execute(sqlalchemy.select(CacheTable.id, CacheTable.key).where(CacheTable.key.contains(":")))
+        )
+        if records:
+            connection.execute(
+                sqlalchemy.update(CacheTable)
+                .where(CacheTable.id == sqlalchemy.bindparam("record_id"))
+                .values(namespace=sqlalchemy.bindparam("record_namespace")),
+                [{"record_id": record_id, "record_namespace": key.split(":", 1)[0]} for record_id, key in records],
+            )
+
+    def _iter_batches(self, query: Any, batch_size: int) -> Iterator[List[Any]]:
+        """Helper method that fetches the rows of a query in batches while holding the lock of the storage.
+
+        The lock is only held while each batch is fetched and is released before the batch is yielded, so that the
+        storage can be used while iterating without deadlocking.
+
+        """
+        with self.lock:
+            rows = iter(query.yield_per(batch_size))
+        while True:
+            with self.lock:
+                batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _filter_namespace(self, query: Any) -> Any:
+        """Helper method that restricts a query to the records of the current namespace, if one is specified."""
+        return query.filter(CacheTable.namespace == self.namespace) if self.namespace else query
+
     def clone(self) -> SQLAlchemyStorage:
         """Helper method for creating a new SQLAlchemyStorage with the same parameters.
 
@@ -201,7 +294,7 @@ class SQLAlchemyStorage(ABCStorage):
 
         """
         cls = self.__class__
-        return cls(namespace=self.namespace, ttl=self.ttl, **self.config)
+        return cls(namespace=self.namespace, ttl=self.ttl, codec=self.codec, **self.config)
 
     def retrieve(self, key: str) -> Optional[Any]:
         """Retrieve the value associated with the provided key from cache.
@@ -213,52 +306,116 @@ class SQLAlchemyStorage(ABCStorage):
             Any:
                 The value returned is deserialized JSON object if successful. Returns None if the key does not exist.
 
+        """
+        _, cache_data = self.get_if_present(key)
+        return cache_data
+
+    def get_if_present(self, key: str) -> Tuple[bool, Optional[Any]]:
+        """Retrieve the value associated with the provided key and whether the key exists with a single query.
+
+        Args:
+            key (str): The key used to fetch the stored data from cache.
+
+        Returns:
+            Tuple[bool, Optional[Any]]:
+                A tuple indicating whether the key was found and the deserialized JSON object if successful.
+
         """
         with self.Session() as session, self.lock:
             try:
                 namespace_key = self._prefix(key)
                 record = session.query(CacheTable).filter(CacheTable.key == namespace_key).first()
-                structured_data = self._deserialize_data(record.cache) if record else None
                 if record:
-                    return structured_data
+                    return True, self._load_record(record)
 
-            except exc.SQLAlchemyError as e:
+            except (exc.SQLAlchemyError, CacheCodecException) as e:
                 msg = f"Error during attempted retrieval of key {key} (namespace = '{self.namespace}'): {e}"
                 self._handle_storage_exception(
                     exception=e,
                     operation_exception_type=CacheRetrievalException if self.raise_on_error else None,
                     msg=msg,
                 )
-            return None
+            return False, None
+
+    def retrieve_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieve the values associated with each of the provided keys using `IN` queries.
+
+        Keys are queried in batches of `SQLAlchemyStorage.DEFAULT_BATCH_SIZE` to remain within the bound parameter
+        limits of SQL dialects such as SQLite.
+
+        Args:
+            keys (Iterable[str]): The keys used to fetch the stored data from cache.
+
+        Returns:
+            Dict[str, Any]: A dictionary mapping each key that was found to its deserialized JSON object.
+
+        """
+        keys = list(dict.fromkeys(keys))
+        with self.Session() as session, self.lock:
+            try:
+                namespace_keys = {self._prefix(key): key for key in keys}
+                return {
+                    namespace_keys[str(record.key)]: self._load_record(record)
+                    for record in self._query_keys(session, list(namespace_keys))
+                }
+            except (exc.SQLAlchemyError, CacheCodecException) as e:
+                msg = f"Error during attempted retrieval of {len(keys)} keys (namespace = '{self.namespace}'): {e}"
+                self._handle_storage_exception(
+                    exception=e,
+                    operation_exception_type=CacheRetrievalException if self.raise_on_error else None,
+                    msg=msg,
+                )
+            return {}
+
+    def _query_keys(self, session: Any, namespace_keys: List[str]) -> List[Any]:
+        """Helper method that retrieves the records for each namespaced key with batched `IN` queries."""
+        records = []
+        for start in range(0, len(namespace_keys), self.DEFAULT_BATCH_SIZE):
+            batch = namespace_keys[start : start + self.DEFAULT_BATCH_SIZE]
+            records.extend(session.query(CacheTable).filter(CacheTable.key.in_(batch)).all())
+        return records
 
     def retrieve_all(self) -> Dict[str, Any]:
-        """Retrieve all records from cache.
+        """Retrieve all records from cache that match the current namespace.
 
         Returns:
             dict:
                 Dictionary of key-value pairs. Keys are original keys, values are JSON deserialized objects.
 
         """
-        with self.Session() as session, self.lock:
-            cache = {}
+        return dict(self.iter_all())
+
+    def iter_all(self, batch_size: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """Iterate over all records from cache that match the current namespace without loading every record at once.
+
+        Records are filtered by namespace on the database server and fetched with `yield_per`, so memory use remains
+        constant regardless of the number of records in the namespace. The lock of the storage is held while each
+        batch of records is fetched.
+
+        Args:
+            batch_size (Optional[int]):
+                The number of records to fetch from the database at a time. Defaults to `DEFAULT_BATCH_SIZE`.
+
+        Yields:
+            Tuple[str, Any]: The key and JSON deserialized object of each record.
+
+        """
+        with self.Session() as session:
             try:
-                records = session.query(CacheTable).all()
-                cache = {
-                    str(record.key): self._deserialize_data(record.cache) if record else None
-                    for record in records
-                    if not self.namespace or str(record.key).startswith(self.namespace)
-                }
-            except exc.SQLAlchemyError as e:
+                query = self._filter_namespace(session.query(CacheTable))
+                for batch in self._iter_batches(query, batch_size or self.DEFAULT_BATCH_SIZE):
+                    for record in batch:
+                        yield str(record.key), self._load_record(record)
+            except (exc.SQLAlchemyError, CacheCodecException) as e:
                 msg = f"Error during attempted retrieval of records from namespace '{self.namespace}': {e}"
                 self._handle_storage_exception(
                     exception=e,
                     operation_exception_type=CacheRetrievalException if self.raise_on_error else None,
                     msg=msg,
                 )
-            return cache
 
     def retrieve_keys(self) -> List[str]:
-        """Retrieve all keys for records from cache .
+        """Retrieve all keys for records from cache that match the current namespace.
 
         Returns:
             list: A list of all keys saved via SQL.
@@ -267,11 +424,8 @@ class SQLAlchemyStorage(ABCStorage):
 
         with self.Session() as session, self.lock:
             try:
-                keys = [
-                    str(record.key)
-                    for record in session.query(CacheTable).all()
-                    if not self.namespace or str(record.key).startswith(self.namespace)
-                ]
+                query = self._filter_namespace(session.query(CacheTable.key))
+                keys = [str(key) for (key,) in query.all()]
             except exc.SQLAlchemyError as e:
                 msg = f"Error during attempted retrieval of all keys from namespace '{self.namespace}': {e}"
                 self._handle_storage_exception(
@@ -282,6 +436,31 @@ class SQLAlchemyStorage(ABCStorage):
                 keys = []
             return keys
 
+    def iter_keys(self, batch_size: Optional[int] = None) -> Iterator[str]:
+        """Iterate over the keys of all records that match the current namespace, fetching keys in batches.
+
+        Args:
+            batch_size (Optional[int]):
+                The number of keys to fetch from the database at a time. Defaults to `DEFAULT_BATCH_SIZE`.
+
+        Yields:
+            str: The key of each record under the current namespace.
+
+        """
+        with self.Session() as session:
+            try:
+                query = self._filter_namespace(session.query(CacheTable.key))
+                for batch in self._iter_batches(query, batch_size or self.DEFAULT_BATCH_SIZE):
+                    for (key,) in batch:
+                        yield str(key)
+            except exc.SQLAlchemyError as e:
+                msg = f"Error during attempted retrieval of all keys from namespace '{self.namespace}': {e}"
+                self._handle_storage_exception(
+                    exception=e,
+                    operation_exception_type=CacheRetrievalException if self.raise_on_error else None,
+                    msg=msg,
+                )
+
     def update(self, key: str, data: Any) -> None:
         """Update the cache by storing associated value with provided key.
 
@@ -296,23 +475,55 @@ class SQLAlchemyStorage(ABCStorage):
         with self.Session() as session, self.lock:
             try:
                 namespace_key = self._prefix(key)
-                unstructured_data = self._serialize_data(data)
+                record_values = self._record_values(data)
                 record = session.query(CacheTable).filter(CacheTable.key == namespace_key).first()
                 if record:
-                    record.cache = unstructured_data
+                    for attribute, value in record_values.items():
+                        setattr(record, attribute, value)
                 else:
-                    record = CacheTable(key=namespace_key, cache=unstructured_data)
+                    record = CacheTable(key=namespace_key, **record_values)
                     session.add(record)
                     logger.debug(f"Cache updated for key: {namespace_key}")
                 session.commit()
 
-            except exc.SQLAlchemyError as e:
+            except (exc.SQLAlchemyError, CacheCodecException) as e:
                 session.rollback()
                 msg = f"Error during attempted update of key {key} (namespace = '{self.namespace}': {e}"
                 self._handle_storage_exception(
                     exception=e, operation_exception_type=CacheUpdateException if self.raise_on_error else None, msg=msg
                 )
 
+    def update_many(self, records: Mapping[str, Any]) -> None:
+        """Update the cache by storing each record within a single transaction.
+
+        Existing records are retrieved with batched `IN` queries and overwritten, and new records are inserted in bulk.
+
+        Args:
+            records (Mapping[str, Any]):
+                A mapping of keys to the Python objects that will be serialized into JSON format and stored.
+
+        """
+        with self.Session() as session, self.lock:
+            try:
+                serialized_records = {self._prefix(key): self._record_values(data) for key, data in records.items()}
+                for record in self._query_keys(session, list(serialized_records)):
+                    for attribute, value in serialized_records.pop(str(record.key)).items():
+                        setattr(record, attribute, value)
+
+                session.add_all(
+                    CacheTable(key=namespace_key, **record_values)
+                    for namespace_key, record_values in serialized_records.items()
+                )
+                session.commit()
+                logger.debug(f"Cache updated for {len(records)} keys (namespace = '{self.namespace}')")
+
+            except (exc.SQLAlchemyError, CacheCodecException) as e:
+                session.rollback()
+                msg = f"Error during attempted update of {len(records)} keys (namespace = '{self.namespace}'): {e}"
+                self._handle_storage_exception(
+                    exception=e, operation_exception_type=CacheUpdateException if self.raise_on_error else None, msg=msg
+                )
+
     def delete(self, key: str) -> None:
         """Delete the value associated with the provided key from cache.
 
@@ -338,17 +549,40 @@ class SQLAlchemyStorage(ABCStorage):
                     msg=msg,
                 )
 
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Delete the values associated with each of the provided keys from cache with batched `IN` queries.
+
+        Args:
+            keys (Iterable[str]): The keys associated with the stored data to remove from cache.
+
+        """
+        keys = list(keys)
+        with self.Session() as session, self.lock:
+            try:
+                namespace_keys = [self._prefix(key) for key in keys]
+                num_deleted = 0
+                for start in range(0, len(namespace_keys), self.DEFAULT_BATCH_SIZE):
+                    batch = namespace_keys[start : start + self.DEFAULT_BATCH_SIZE]
+                    query = session.query(CacheTable).filter(CacheTable.key.in_(batch))
+                    num_deleted += query.delete(synchronize_session=False)
+                session.commit()
+                logger.debug(f"Deleted {num_deleted} of {len(keys)} keys (namespace = '{self.namespace}')")
+            except exc.SQLAlchemyError as e:
+                session.rollback()
+                msg = f"Error during attempted deletion of {len(keys)} keys (namespace = '{self.namespace}'): {e}"
+                self._handle_storage_exception(
+                    exception=e,
+                    operation_exception_type=CacheDeletionException if self.raise_on_error else None,
+                    msg=msg,
+                )
+
     def delete_all(self) -> None:
         """Delete all records from cache that match the current namespace prefix."""
         with self.Session() as session, self.lock:
             try:
-                if self.namespace:
-                    num_deleted = session.query(CacheTable).filter(CacheTable.key.startswith(self.namespace)).delete()
-                    session.commit()
-                else:
-                    num_deleted = session.query(CacheTable).delete()
-                    session.commit()
-                    logger.debug(f"Deleted {num_deleted} records.")
+                num_deleted = self._filter_namespace(session.query(CacheTable)).delete(synchronize_session=False)
+                session.commit()
+                logger.debug(f"Deleted {num_deleted} records.")
             except exc.SQLAlchemyError as e:
                 msg = f"Error during attempted deletion of all records from namespace '{self.namespace}': {e}"
                 session.rollback()
@@ -361,16 +595,34 @@ class SQLAlchemyStorage(ABCStorage):
     def _serialize_data(self, record_data: Any) -> Any:
         """Helper method for serializing and encoding cached data. The data is first encoded, identifying nested
         structures that need to be encoded recursively. If a value is already in a serializable format, then the record
-        is left as is. The data is finally unstructured and returned.
+        is left as is. The paths of encoded bytes fields are recorded with a schema tag so that only these fields are
+        decoded on retrieval. The data is finally unstructured and returned.
 
         Returns:
             The serialized version of the input data
 
         """
-        encoded_record_data = JsonDataEncoder.encode(record_data)
+        encoded_record_data = JsonDataEncoder.encode_tagged(record_data)
         serialized_data = self.converter.unstructure(encoded_record_data)
         return serialized_data
 
+    def _record_values(self, data: Any) -> Dict[str, Any]:
+        """Helper method that prepares the column values used to insert or overwrite the record for the provided data.
+
+        Data is stored in the binary `payload` column when the current codec is binary and as JSON in the `cache`
+        column otherwise. The unused column is cleared so that overwritten records are never decoded from stale data.
+
+        """
+        if self.codec.is_binary:
+            return {"cache": None, "payload": self.codec.encode(data), "namespace": self.namespace}
+        return {"cache": self._serialize_data(data), "payload": None, "namespace": self.namespace}
+
+    def _load_record(self, record: Any) -> Any:
+        """Helper method that decodes the data of a record from its binary payload or from its JSON `cache` column."""
+        if record.payload is not None:
+            return CacheCodec.decode(record.payload)
+        return self._deserialize_data(record.cache)
+
     def _deserialize_data(self, record_data: Any) -> Any:
         """Handles the serialization and deserialization of the SQLCacheStorage.
 
@@ -390,7 +642,7 @@ class SQLAlchemyStorage(ABCStorage):
 
         structured_record_data = self.converter.structure(record_data, record_type) if record_type else record_data
 
-        deserialized_data = JsonDataEncoder.decode(structured_record_data)
+        deserialized_data = JsonDataEncoder.decode_tagged(structured_record_data)
         return deserialized_data
 
     def verify_cache(self, key: str) -> bool:
@@ -410,7 +662,8 @@ class SQLAlchemyStorage(ABCStorage):
             raise ValueError(f"Key invalid. Received {key} (namespace = '{self.namespace}')")
         try:
             with self.with_raise_on_error():
-                return self.retrieve(key) is not None
+                is_cached, _ = self.get_if_present(key)
+            return is_cached
         except StorageCacheException as e:
             msg = f"Error during the verification of the existence of key {key} (namespace = '{self.namespace}'): {e}"
             self._handle_storage_exception(
@@ -0,0 +1,317 @@
+# /data_storage/tiered_storage.py
+"""The scholar_flux.data_storage.tiered_storage module implements the TieredStorage that places a bounded in-process
+cache (L1) in front of a shared storage backend (L2) such as Redis, MongoDB, or a SQL database.
+
+Each lookup against a remote storage requires a network round trip followed by the deserialization of the cached
+payload. When the same process repeatedly requests the same pages, the TieredStorage instead answers these lookups
+from an `InMemoryStorage` that holds the deserialized records, so that hot-path cache hits only cost a dictionary lookup:
+
+    - Reads are read-through: L1 is checked first, and records found in L2 are promoted into L1.
+    - Writes are write-through: records are written to L1 and then to L2. With `write_behind=True`, L2 writes are
+      instead queued with a `WriteBehindQueue` and written in batches on a background thread.
+    - Deletions remove records from both tiers, while `invalidate` only discards the copy held in L1 (for example, when
+      a ResponseCoordinator finds that a record was cached with a different schema fingerprint).
+
+Classes:
+    TieredStorage: Composes a bounded in-memory L1 cache with any ABCStorage as the L2 cache.
+
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from typing_extensions import Self
+import logging
+
+from scholar_flux.data_storage.abc_storage import ABCStorage
+from scholar_flux.data_storage.in_memory_storage import InMemoryStorage
+from scholar_flux.data_storage.write_behind import WriteBehindQueue
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+from scholar_flux.exceptions import StorageCacheException
+
+logger = logging.getLogger(__name__)
+
+
+class TieredStorage(ABCStorage):
+    """Composes a bounded, in-process L1 storage with a shared L2 storage using read-through/write-through semantics.
+
+    The L2 storage remains the source of truth: operations over all records in a namespace (`retrieve_all`,
+    `retrieve_keys`, `iter_all`, `iter_keys`) first flush queued writes and are then performed against L2 alone.
+    Records are shared by reference with L1, in the same manner as the `InMemoryStorage`, so records retrieved from the
+    cache should not be modified in place.
+
+    Note that L1 is local to each process and is not invalidated when another process writes to L2. With the default
+    `ttl=None`, records never expire from L1, so a process keeps serving its own copy of a page after another process
+    rewrites the page in L2. In multi-process deployments that share an L2 storage, set a finite `ttl` to bound how
+    long each process can serve stale records.
+
+    Args:
+        l2 (ABCStorage): The shared storage backend, such as a RedisStorage, MongoDBStorage, or SQLAlchemyStorage.
+        l1 (Optional[InMemoryStorage]):
+            The in-process storage that holds recently used records. If None, an LRU-bounded InMemoryStorage is
+            created with the namespace of the L2 storage.
+        max_entries (Optional[int]):
+            The maximum number of records held in the default L1 storage. Defaults to
+            `TieredStorage.DEFAULT_L1_MAX_ENTRIES`. Ignored when `l1` is provided.
+        ttl (Optional[int | float]):
+            The number of seconds after which records expire from the default L1 storage, after which they are
+            retrieved from L2 again. Records never expire from L1 if None, which is only appropriate when a single
+            process writes to the L2 storage. Ignored when `l1` is provided.
+        write_behind (bool | WriteBehindQueue):
+            If True, writes to L2 are queued and written in batches on a background thread instead of on the
+            calling thread. Queued writes are visible to lookups from the current process before they are written.
+            A preconfigured `WriteBehindQueue` for the L2 storage can also be provided.
+
+    Examples:
+        >>> from scholar_flux.data_storage import TieredStorage, RedisStorage, DataCacheManager
+        >>> storage = TieredStorage(RedisStorage(namespace='plos'), max_entries=500, ttl=300)
+        >>> storage.update('page_1', {'records': [{'id': 1}]})  # written to L1 and Redis
+        >>> storage.retrieve('page_1')  # answered from L1 without contacting Redis
+        # OUTPUT: {'records': [{'id': 1}]}
+        >>> cache_manager = DataCacheManager.with_storage('tiered', RedisStorage(namespace='plos'), write_behind=True)
+
+    """
+
+    DEFAULT_L1_MAX_ENTRIES: int = 1024
+
+    def __init__(
+        self,
+        l2: ABCStorage,
+        l1: Optional[InMemoryStorage] = None,
+        max_entries: Optional[int] = None,
+        ttl: Optional[int | float] = None,
+        write_behind: bool | WriteBehindQueue = False,
+    ) -> None:
+        """Initializes the tiered storage from an L2 storage and an optional, preconfigured L1 storage."""
+        if not isinstance(l2, ABCStorage) or isinstance(l2, TieredStorage):
+            raise StorageCacheException(
+                f"The L2 storage of a TieredStorage must be a non-tiered ABCStorage. Received {type(l2)}"
+            )
+
+        self.l2 = l2
+        self.l1 = (
+            l1
+            if l1 is not None
+            else InMemoryStorage(
+                namespace=l2.namespace,
+                max_entries=max_entries if max_entries is not None else self.DEFAULT_L1_MAX_ENTRIES,
+                ttl=ttl,
+            )
+        )
+        self.namespace = l2.namespace
+        self.raise_on_error = l2.raise_on_error
+        self.write_behind = WriteBehindQueue.configure(write_behind, l2)
+
+    def retrieve(self, key: str) -> Optional[Any]:
+        """Retrieves a record from L1 if available, and otherwise from L2 before promoting it into L1.
+
+        Args:
+            key (str): The key used to fetch the stored data from cache.
+
+        Returns:
+            Optional[Any]: The cached record if found, otherwise None.
+
+        """
+        return self.get_if_present(key)[1]
+
+    def get_if_present(self, key: str) -> Tuple[bool, Optional[Any]]:
+        """Retrieves a record with a read-through lookup that only contacts L2 when L1 does not hold the record.
+
+        Args:
+            key (str): The key used to fetch the stored data from cache.
+
+        Returns:
+            Tuple[bool, Optional[Any]]: Whether the key exists in either tier and its cached value (or None).
+
+        """
+        is_cached, data = self.l1.get_if_present(key)
+        if is_cached:
+            return is_cached, data
+
+        if self.write_behind is not None:
+            is_pending, data = self.write_behind.get_if_present(key)
+            if is_pending:
+                return is_pending, data
+
+        is_cached, data = self.l2.get_if_present(key)
+        if is_cached:
+            self.l1.update(key, data)
+        return is_cached, data
+
+    def retrieve_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieves several records from L1, and retrieves the remaining records from L2 with a single batched lookup.
+
+        Args:
+            keys (Iterable[str]): The keys used to fetch the stored data from cache.
+
+        Returns:
+            Dict[str, Any]: A dictionary mapping each key that was found in either tier to its cached value.
+
+        """
+        keys = list(dict.fromkeys(keys))
+        records = self.l1.retrieve_many(keys)
+
+        missing = [key for key in keys if key not in records]
+        if missing and self.write_behind is not None:
+            records |= self.write_behind.retrieve_many(missing)
+            missing = [key for key in missing if key not in records]
+
+        if missing:
+            found = self.l2.retrieve_many(missing)
+            self.l1.update_many(found)
+            records |= found
+
+        return {key: records[key] for key in keys if key in records}
+
+    def retrieve_all(self) -> Optional[Dict[str, Any]]:
+        """Retrieves all records within the current namespace from L2 after flushing queued writes."""
+        self.flush()
+        return self.l2.retrieve_all()
+
+    def retrieve_keys(self) -> Optional[List[str]]:
+        """Retrieves all keys within the current namespace from L2 after flushing queued writes."""
+        self.flush()
+        return self.l2.retrieve_keys()
+
+    def iter_all(self, batch_size: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """Iterates over the records within the current namespace in L2 after flushing queued writes."""
+        self.flush()
+        yield from self.l2.iter_all(batch_size)
+
+    def iter_keys(self, batch_size: Optional[int] = None) -> Iterator[str]:
+        """Iterates over the keys within the current namespace in L2 after flushing queued writes."""
+        self.flush()
+        yield from self.l2.iter_keys(batch_size)
+
+    def update(self, key: str, data: Any) -> None:
+        """Writes a record to L1 and then writes (or queues) the record for L2.
+
+        Args:
+            key (str): The key of the key-value pair
+            data (Any): The data to be associated with the key
+
+        """
+        self.update_many({key: data})
+
+    def update_many(self, records: Mapping[str, Any]) -> None:
+        """Writes several records to L1 and then writes (or queues) the records for L2 as a single batch.
+
+        Args:
+            records (Mapping[str, Any]): A mapping of keys to the data that should be stored for each key.
+
+        """
+        records = dict(records)
+        if not records:
+            return
+
+        self.l1.update_many(records)
+
+        if self.write_behind is None:
+            self.l2.update_many(records)
+            return
+
+        for key, data in records.items():
+            self.write_behind.put(key, data)
+
+    def delete(self, key: str) -> None:
+        """Deletes a record from both tiers, discarding any write to L2 that is still queued for the record.
+
+        Args:
+            key (str): The key associated with the record to delete.
+
+        """
+        self.delete_many([key])
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Deletes several records from both tiers, discarding any writes to L2 that are still queued for the records.
+
+        Args:
+            keys (Iterable[str]): The keys associated with the records to delete.
+
+        """
+        keys = list(keys)
+        self.l1.delete_many(keys)
+        if self.write_behind is not None:
+            self.write_behind.delete_many(keys)
+        else:
+            self.l2.delete_many(keys)
+
+    def delete_all(self) -> None:
+        """Deletes all records within the current namespace from both tiers and discards all queued writes."""
+        self.l1.delete_all()
+        if self.write_behind is not None:
+            self.write_behind.delete_all()
+        else:
+            self.l2.delete_all()
+
+    def invalidate(self, key: str) -> None:
+        """Discards the copy of a record held in L1 so that the next lookup retrieves the record from L2.
+
+        Args:
+            key (str): The key associated with the record to discard from L1.
+
+        """
+        self.l1.delete(key)
+
+    def verify_cache(self, key: str) -> bool:
+        """Verifies whether a record exists in either tier, checking L2 only when L1 does not hold the record.
+
+        Args:
+            key (str): The key to lookup in the cache
+
+        Returns:
+            bool: True if the key is found otherwise False.
+
+        """
+        if self.l1.verify_cache(key):
+            return True
+
+        return (self.write_behind is not None and key in self.write_behind) or self.l2.verify_cache(key)
+
+    def flush(self) -> None:
+        """Writes all queued records to L2 on the calling thread.
+
+        When `write_behind=False`, records are written to L2 immediately and this method has no effect.
+
+        """
+        if self.write_behind is not None:
+            self.write_behind.flush()
+
+    @classmethod
+    def is_available(cls, *args, **kwargs) -> bool:
+        """Returns True, as the L1 storage is always available.
+
+        The availability of the L2 storage should be verified with the `is_available` method of its class.
+
+        """
+        return True
+
+    def clone(self) -> Self:
+        """Helper method for creating a new TieredStorage with clones of both tiers and the same configuration."""
+        self.flush()
+        l2 = self.l2.clone()
+        return self.__class__(
+            l2=l2,
+            l1=self.l1.clone(),
+            write_behind=self.write_behind.clone(l2) if self.write_behind is not None else False,
+        )
+
+    def with_namespace(self, namespace: str) -> Self:
+        """Creates a new TieredStorage that stores records under another namespace in both tiers."""
+        l2 = self.l2.with_namespace(namespace)
+        return self.__class__(
+            l2=l2,
+            l1=self.l1.with_namespace(namespace),
+            write_behind=self.write_behind.clone(l2) if self.write_behind is not None else False,
+        )
+
+    def structure(self, flatten: bool = False, show_value_attributes: bool = True) -> str:
+        """Helper method for showing the configuration of both tiers of the current storage."""
+        class_attribute_dict: dict[str, Any] = dict(l1=self.l1, l2=self.l2, write_behind=self.write_behind is not None)
+        return generate_repr_from_string(
+            self.__class__.__name__,
+            attribute_dict=class_attribute_dict,
+            flatten=flatten,
+            show_value_attributes=show_value_attributes,
+        )
+
+
+__all__ = ["TieredStorage"]
@@ -0,0 +1,462 @@
+# /data_storage/write_behind.py
+"""The scholar_flux.data_storage.write_behind module implements the WriteBehindQueue used to move cache writes off of
+the thread that requests and processes responses.
+
+Writing a processed response to a SQL database or MongoDB collection can add tens of milliseconds to the retrieval of
+each page. With a write-behind queue, records are instead queued in memory and written in batches by a background
+thread with the `update_many` bulk operation of the storage (pipelined `SET` commands for Redis, unordered
+`bulk_write` upserts for MongoDB, and bulk inserts for SQL databases):
+
+    - Queued records remain visible to lookups from the current process until they are written.
+    - Records can be queued as factories so that expensive fields (such as the serialized response and its hash) are
+      computed on the background thread instead of the calling thread.
+    - The queue is bounded by `max_queue_size`: once full, callers wait until the background thread makes room.
+    - Queued records are flushed when the queue is closed, including when the interpreter exits. The background
+      thread only holds a weak reference to its queue and stops once the queue is idle or garbage collected.
+    - Written, failed, and queued records are counted in the `statistics` of the queue.
+
+Classes:
+    WriteBehindQueue: Queues cache writes and writes them to a storage in batches on a background thread.
+
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import atexit
+import logging
+import threading
+import time
+import weakref
+
+from scholar_flux.data_storage.abc_storage import ABCStorage
+from scholar_flux.exceptions import StorageCacheException
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+
+logger = logging.getLogger(__name__)
+
+
+class _DeferredRecord:
+    """Wraps the factory of a queued record, computing the record at most once when it is written or looked up."""
+
+    __slots__ = ("factory", "_lock", "_computed", "_record")
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        """Stores the factory used to compute the record when it is written or looked up."""
+        self.factory = factory
+        self._lock = threading.Lock()
+        self._computed = False
+        self._record: Any = None
+
+    def get(self) -> Any:
+        """Computes the record on first use. Concurrent callers wait for the record instead of computing it again."""
+        with self._lock:
+            if not self._computed:
+                self._record = self.factory()
+                self._computed = True
+            return self._record
+
+
+# queues that have started a background thread and are closed (flushed) when the interpreter exits
+_open_queues: weakref.WeakSet[WriteBehindQueue] = weakref.WeakSet()
+
+
+def _close_open_queues() -> None:
+    """Closes every open queue so that queued records are written before the interpreter exits."""
+    for queue in list(_open_queues):
+        queue.close()
+
+
+atexit.register(_close_open_queues)
+
+
+class WriteBehindQueue:
+    """Queues records for a storage and writes them in batches on a background thread.
+
+    Each queued record is keyed by its namespaced cache key, so queuing a key again before it is written replaces the
+    previously queued record. Deletions are performed immediately on the calling thread after discarding queued records
+    for the same keys, and cannot be overwritten by a batch that is being written at the same time.
+
+    Args:
+        storage (ABCStorage): The storage that queued records are written to.
+        max_queue_size (Optional[int]):
+            The maximum number of queued records. Once reached, callers wait until records are written. Defaults to
+            `WriteBehindQueue.DEFAULT_MAX_QUEUE_SIZE`.
+        batch_size (Optional[int]):
+            The maximum number of records written with each call to `update_many`. Defaults to
+            `WriteBehindQueue.DEFAULT_BATCH_SIZE`.
+        flush_interval (Optional[int | float]):
+            The number of seconds that the background thread waits after a record is queued so that records queued in
+            the meantime are written in the same batch. Defaults to `WriteBehindQueue.DEFAULT_FLUSH_INTERVAL`.
+
+    Class Attributes:
+        IDLE_TIMEOUT (float):
+            The number of seconds that the background thread waits for new records before it stops. The thread is
+            restarted when records are queued again.
+
+    Examples:
+        >>> from scholar_flux.data_storage import SQLAlchemyStorage, WriteBehindQueue
+        >>> queue = WriteBehindQueue(SQLAlchemyStorage(namespace='plos'), batch_size=50)
+        >>> queue.put('page_1', {'records': [{'id': 1}]})  # returns immediately
+        >>> queue.get_if_present('page_1')  # queued records are visible before they are written
+        # OUTPUT: (True, {'records': [{'id': 1}]})
+        >>> queue.flush()  # writes all queued records on the calling thread
+        >>> queue.statistics
+        # OUTPUT: {'queued': 1, 'written': 1, 'failed': 0, 'batches': 1, 'errors': 0, 'pending': 0}
+
+    """
+
+    DEFAULT_MAX_QUEUE_SIZE: int = 1000
+    DEFAULT_BATCH_SIZE: int = 100
+    DEFAULT_FLUSH_INTERVAL: float = 0.5
+    IDLE_TIMEOUT: float = 30.0
+
+    def __init__(
+        self,
+        storage: ABCStorage,
+        max_queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[int | float] = None,
+    ) -> None:
+        """Initializes the queue without starting the background thread, which is started when records are queued."""
+        if not isinstance(storage, ABCStorage):
+            raise StorageCacheException(f"A WriteBehindQueue requires an ABCStorage. Received {type(storage)}")
+
+        self.storage = storage
+        self.max_queue_size = self._validate_positive(
+            max_queue_size if max_queue_size is not None else self.DEFAULT_MAX_QUEUE_SIZE,
+            "max_queue_size",
+            integer=True,
+        )
+        self.batch_size = self._validate_positive(
+            batch_size if batch_size is not None else self.DEFAULT_BATCH_SIZE, "batch_size", integer=True
+        )
+        self.flush_interval = self._validate_positive(
+            flush_interval if flush_interval is not None else self.DEFAULT_FLUSH_INTERVAL, "flush_interval"
+        )
+
+        self._pending: OrderedDict[str, Any] = OrderedDict()
+        # the batch that is currently being written, which remains visible to lookups until the write completes
+        self._in_flight: Dict[str, Any] = {}
+        # guards the queued records and counters, and is notified when records are queued or written
+        self._condition = threading.Condition()
+        # held while records are written so that deletions cannot be overwritten by a batch in flight
+        self._flush_lock = threading.RLock()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._queued = self._written = self._failed = self._batches = self._errors = 0
+        self.last_error: Optional[BaseException] = None
+
+    @classmethod
+    def configure(cls, write_behind: bool | WriteBehindQueue | None, storage: ABCStorage) -> Optional[WriteBehindQueue]:
+        """Creates a queue for the storage when `write_behind` is True, or validates an existing queue.
+
+        Args:
+            write_behind (bool | WriteBehindQueue | None): Whether to queue writes, or a preconfigured queue.
+            storage (ABCStorage): The storage that queued records should be written to.
+
+        Returns:
+            Optional[WriteBehindQueue]: The queue to use for the storage, or None if writes should not be queued.
+
+        Raises:
+            StorageCacheException: If a preconfigured queue writes to a different storage
+
+        """
+        if isinstance(write_behind, WriteBehindQueue):
+            if write_behind.storage is not storage:
+                raise StorageCacheException(
+                    f"The WriteBehindQueue must write to the same storage. Expected {storage}, "
+                    f"received {write_behind.storage}"
+                )
+            return write_behind
+        return cls(storage) if write_behind else None
+
+    def clone(self, storage: Optional[ABCStorage] = None) -> WriteBehindQueue:
+        """Creates a new, empty queue with the same configuration for the current or a different storage."""
+        return self.__class__(
+            storage if storage is not None else self.storage,
+            max_queue_size=self.max_queue_size,
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+        )
+
+    @staticmethod
+    def _validate_positive(value: Any, parameter: str, integer: bool = False) -> Any:
+        """Helper method that verifies that sizes (integers) and intervals (seconds) are positive numbers."""
+        is_number = isinstance(value, int) or (isinstance(value, float) and not integer)
+        if not is_number or isinstance(value, bool) or value <= 0:
+            raise StorageCacheException(f"The parameter, `{parameter}` must be a positive number. Received {value}")
+        return value
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """Returns the number of queued, written, and failed records, the number of written and failed batches (errors),
+        and the number of records that are still pending."""
+        with self._condition:
+            return dict(
+                queued=self._queued,
+                written=self._written,
+                failed=self._failed,
+                batches=self._batches,
+                errors=self._errors,
+                pending=len(self._pending),
+            )
+
+    def put(self, key: str, data: Any) -> None:
+        """Queues a record to be written to the storage.
+
+        Args:
+            key (str): The key of the record.
+            data (Any): The record to write to the storage.
+
+        """
+        self._enqueue(key, data)
+
+    def put_deferred(self, key: str, factory: Callable[[], Any]) -> None:
+        """Queues a record that is computed by calling `factory` when it is written or first looked up.
+
+        Args:
+            key (str): The key of the record.
+            factory (Callable[[], Any]): A callable without arguments that returns the record to write.
+
+        """
+        self._enqueue(key, _DeferredRecord(factory))
+
+    def _enqueue(self, key: str, entry: Any) -> None:
+        """Helper method that queues a record, waiting for room in the queue, and wakes the background thread."""
+        if self._closed:
+            # records queued after the queue is closed (e.g. while the interpreter exits) are written immediately
+            self.storage.update(key, self._materialize(entry))
+            return
+
+        namespace_key = self.storage._prefix(key)
+        with self._condition:
+            while namespace_key not in self._pending and len(self._pending) >= self.max_queue_size:
+                self._start_worker()
+                self._condition.notify_all()
+                self._condition.wait(self.flush_interval)
+
+            self._pending.pop(namespace_key, None)
+            self._pending[namespace_key] = entry
+            self._queued += 1
+            self._start_worker()
+            self._condition.notify_all()
+
+    def get_if_present(self, key: str) -> Tuple[bool, Optional[Any]]:
+        """Retrieves a record that is queued but not yet written, computing deferred records if needed.
+
+        Args:
+            key (str): The key of the record.
+
+        Returns:
+            Tuple[bool, Optional[Any]]: Whether a record is queued for the key and the queued record (or None).
+
+        """
+        if not (self._pending or self._in_flight):
+            return False, None
+
+        namespace_key = self.storage._prefix(key)
+        with self._condition:
+            if namespace_key in self._pending:
+                entry = self._pending[namespace_key]
+            elif namespace_key in self._in_flight:
+                entry = self._in_flight[namespace_key]
+            else:
+                return False, None
+
+        # deferred records are computed once: if the batch is being written, the computed record is shared
+        data = self._materialize(entry)
+        if entry is not data:
+            with self._condition:
+                # the computed record replaces its factory unless the key was written or queued again in the meantime
+                if self._pending.get(namespace_key) is entry:
+                    self._pending[namespace_key] = data
+        return True, data
+
+    def retrieve_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Retrieves each record that is queued but not yet written.
+
+        Args:
+            keys (Iterable[str]): The keys of the records.
+
+        Returns:
+            Dict[str, Any]: A dictionary mapping each key that is queued to its record.
+
+        """
+        records = {}
+        for key in keys:
+            is_pending, data = self.get_if_present(key)
+            if is_pending:
+                records[key] = data
+        return records
+
+    def __contains__(self, key: str) -> bool:
+        """Indicates whether a record is queued (or being written) for the key."""
+        if not (self._pending or self._in_flight):
+            return False
+        namespace_key = self.storage._prefix(key)
+        with self._condition:
+            return namespace_key in self._pending or namespace_key in self._in_flight
+
+    def discard(self, keys: Iterable[str]) -> None:
+        """Discards queued records without writing them to the storage.
+
+        Args:
+            keys (Iterable[str]): The keys of the records to discard.
+
+        """
+        with self._condition:
+            for key in keys:
+                self._pending.pop(self.storage._prefix(key), None)
+            self._condition.notify_all()
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Discards queued records and deletes the records from the storage.
+
+        Args:
+            keys (Iterable[str]): The keys of the records to delete.
+
+        """
+        keys = list(keys)
+        with self._flush_lock:
+            self.discard(keys)
+            self.storage.delete_many(keys)
+
+    def delete_all(self) -> None:
+        """Discards all queued records and deletes all records within the namespace of the storage."""
+        with self._flush_lock:
+            with self._condition:
+                self._pending.clear()
+                self._condition.notify_all()
+            self.storage.delete_all()
+
+    def flush(self) -> None:
+        """Writes all queued records to the storage on the calling thread."""
+        with self._flush_lock:
+            while self._write_batch():
+                pass
+
+    def close(self) -> None:
+        """Writes all queued records and stops the background thread. Records queued afterward are written directly."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        worker = self._worker
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+        self.flush()
+        _open_queues.discard(self)
+
+    def _write_batch(self) -> int:
+        """Helper method that writes the oldest batch of queued records, returning the number of records taken."""
+        with self._flush_lock:
+            with self._condition:
+                keys = list(self._pending)[: self.batch_size]
+                batch = {key: self._pending.pop(key) for key in keys}
+                # the batch remains visible to lookups while its records are computed and written
+                self._in_flight = dict(batch)
+                self._condition.notify_all()
+
+            if not batch:
+                return 0
+
+            records = {}
+            for key, entry in batch.items():
+                try:
+                    records[key] = self._materialize(entry)
+                except Exception as e:
+                    self._record_error(e, 1, f"Failed to compute the queued record for the key, {key}: {e}")
+
+            with self._condition:
+                self._in_flight = records
+
+            try:
+                if records:
+                    self.storage.update_many(records)
+            except Exception as e:
+                self._record_error(e, len(records), f"Failed to write {len(records)} queued records: {e}")
+            else:
+                with self._condition:
+                    self._written += len(records)
+                    self._batches += 1
+                logger.debug(f"Wrote {len(records)} queued records to the cache storage")
+            finally:
+                with self._condition:
+                    self._in_flight = {}
+            return len(batch)
+
+    def _record_error(self, exception: Exception, count: int, msg: str) -> None:
+        """Helper method that logs an error and counts the records that could not be written."""
+        with self._condition:
+            self._failed += count
+            self._errors += 1
+            self.last_error = exception
+        self.storage._handle_storage_exception(exception=exception, msg=msg)
+
+    @staticmethod
+    def _materialize(entry: Any) -> Any:
+        """Helper method that computes deferred records and returns other records as is."""
+        return entry.get() if isinstance(entry, _DeferredRecord) else entry
+
+    def _start_worker(self) -> None:
+        """Helper method that starts the background thread if not already running. Must be called with the condition."""
+        if self._closed or (self._worker is not None and self._worker.is_alive()):
+            return
+
+        # the thread only references the queue weakly so that unused queues (and their threads) can be released
+        self._worker = threading.Thread(
+            target=self._run, args=(weakref.ref(self),), name=f"{self.__class__.__name__}Worker", daemon=True
+        )
+        self._worker.start()
+        # queued records are written before the interpreter exits
+        _open_queues.add(self)
+
+    @staticmethod
+    def _run(queue_ref: weakref.ReferenceType[WriteBehindQueue]) -> None:
+        """Writes queued records in batches until the queue is closed, idle, or garbage collected."""
+        while (queue := queue_ref()) is not None:
+            if not queue._wait_for_batch():
+                return
+            while queue._write_batch():
+                pass
+            # releases the queue between batches so that it can be garbage collected
+            del queue
+
+    def _wait_for_batch(self) -> bool:
+        """Helper method that waits up to `flush_interval` seconds for records to accumulate into a batch.
+
+        Returns:
+            bool: True if records are queued, or False if the queue was closed or idle for `IDLE_TIMEOUT` seconds.
+
+        """
+        with self._condition:
+            if not self._pending and not self._closed:
+                self._condition.wait(self.IDLE_TIMEOUT)
+
+            # waits for records to accumulate until a full batch is queued or the flush interval elapses
+            deadline = time.monotonic() + (self.flush_interval or 0)
+            while self._pending and not self._closed and len(self._pending) < min(self.batch_size, self.max_queue_size):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            if self._closed or not self._pending:
+                if self._worker is threading.current_thread():
+                    # the thread is restarted by `_start_worker` when records are queued again
+                    self._worker = None
+                return False
+            return True
+
+    def __repr__(self) -> str:
+        """Shows the storage and the configuration of the current queue."""
+        attributes = dict(
+            storage=self.storage,
+            max_queue_size=self.max_queue_size,
+            batch_size=self.batch_size,
+            flush_interval=self.flush_interval,
+        )
+        return generate_repr_from_string(self.__class__.__name__, attributes, flatten=True)
+
+
+__all__ = ["WriteBehindQueue"]
@@ -69,6 +69,7 @@ from scholar_flux.exceptions.import_exceptions import (
     SQLAlchemyImportError,
     YAMLImportError,
     CryptographyImportError,
+    PyArrowImportError,
 )
 from scholar_flux.exceptions.storage_exceptions import (
     StorageCacheException,
@@ -77,6 +78,7 @@ from scholar_flux.exceptions.storage_exceptions import (
     CacheUpdateException,
     CacheDeletionException,
     CacheVerificationException,
+    CacheCodecException,
 )
 
 from scholar_flux.exceptions.path_exceptions import (
@@ -142,12 +144,14 @@ __all__ = [
     "SQLAlchemyImportError",
     "YAMLImportError",
     "CryptographyImportError",
+    "PyArrowImportError",
     "StorageCacheException",
     "KeyNotFound",
     "CacheRetrievalException",
     "CacheUpdateException",
     "CacheDeletionException",
     "CacheVerificationException",
+    "CacheCodecException",
     "PathUtilsError",
     "InvalidProcessingPathError",
     "InvalidComponentTypeError",
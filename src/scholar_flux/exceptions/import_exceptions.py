@@ -93,6 +93,18 @@ class YAMLImportError(OptionalDependencyImportError):
         super().__init__(message=err)
 
 
+
+class PyArrowImportError(OptionalDependencyImportError):
+    """Exception for pyarrow Dependency Issues."""
+
+    def __init__(self):
+        """Initializes the `pyarrow` import exception for improved logging before the exception is raised."""
+        err = """Optional Dependency: 'pyarrow' is not installed
+        Please install the 'pyarrow' package to use this feature."""
+
+        super().__init__(message=err)
+
+
 __all__ = [
     "OptionalDependencyImportError",
     "ItsDangerousImportError",
@@ -102,4 +114,5 @@ __all__ = [
     "SQLAlchemyImportError",
     "YAMLImportError",
     "CryptographyImportError",
+    "PyArrowImportError",
 ]
@@ -44,6 +44,12 @@ class CacheVerificationException(StorageCacheException):
     pass
 
 
+class CacheCodecException(StorageCacheException):
+    """Exception raised when cached data cannot be encoded or decoded with the configured cache codec."""
+
+    pass
+
+
 __all__ = [
     "StorageCacheException",
     "ConnectionFailed",
@@ -52,4 +58,5 @@ __all__ = [
     "CacheUpdateException",
     "CacheDeletionException",
     "CacheVerificationException",
+    "CacheCodecException",
 ]
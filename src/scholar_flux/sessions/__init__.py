@@ -9,6 +9,8 @@ Classes:
     - CachedSessionManager:
         Creates a requests-cache.CachedSession with configurable options. This implementation uses pydantic for
         configuration to validate the parameters used to create the requests.CachedSession object.
+    - SessionPool:
+        Shares a single session (and its keep-alive connections) between coordinators requesting the same host.
 
 Basic Usage:
     >>> from scholar_flux.api import SearchAPI
@@ -81,12 +83,14 @@ See Also:
 """
 from scholar_flux.sessions.models import BaseSessionManager, CachedSessionConfig
 from scholar_flux.sessions.session_manager import SessionManager, CachedSessionManager
+from scholar_flux.sessions.session_pool import SessionPool
 from scholar_flux.sessions.encryption import EncryptionPipelineFactory
 
 
 __all__ = [
     "SessionManager",
     "CachedSessionManager",
+    "SessionPool",
     "EncryptionPipelineFactory",
     "BaseSessionManager",
     "CachedSessionConfig",
@@ -3,7 +3,8 @@
 each serve as factory methods in the creation of requests.Session objects and requests_cache.CachedSession objects.
 
 By calling the `configure_session` manager class, a new session can be created that implements basic
-or cached sessions depending on which SessionManager was created.
+or cached sessions depending on which SessionManager was created. Both managers can optionally mount `HTTPAdapters`
+with connection pools sized for the number of threads that send requests through the same session.
 
 Classes:
     SessionManager: Base class holding the configuration for non-cached sessions
@@ -13,6 +14,8 @@ Classes:
 import datetime
 import requests
 import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Type, Literal, TYPE_CHECKING, Any
 from pathlib import Path
 import logging
@@ -38,8 +41,23 @@ if TYPE_CHECKING:
 class SessionManager(session_models.BaseSessionManager):
     """Manager that creates a simple requests session using the default settings and the provided User-Agent.
 
+    By default, `requests` keeps up to 10 connections alive per host. When several threads send requests through the
+    same session (e.g., coordinators sharing a session within a `MultiSearchCoordinator`), connections that do not fit
+    in the pool are discarded after each request and must be re-established with a new TCP/TLS handshake. Specifying
+    any of the connection pool options mounts a tuned `HTTPAdapter` for both `http://` and `https://` URLs.
+
     Args:
         user_agent (Optional[str]): The User-Agent to be passed as a parameter in the creation of the session object.
+        pool_connections (Optional[int]): The number of per-host connection pools to cache (one pool per host).
+        pool_maxsize (Optional[int]):
+            The maximum number of connections kept alive for reuse within each host's pool. This value should be at
+            least as large as the number of threads that send requests to the same host through the session.
+        max_retries (Optional[int | Retry]):
+            The number of retries (or urllib3 `Retry` configuration) applied by urllib3 to failed connections. Note
+            that status-based retries are handled separately by the `RetryHandler` of the `SearchCoordinator`.
+        pool_block (bool):
+            Whether threads should wait for a connection to become available when a host's pool is exhausted instead of
+            opening (and later discarding) an additional connection.
 
     Example:
         >>> from scholar_flux.sessions import SessionManager
@@ -54,16 +72,87 @@ class SessionManager(session_models.BaseSessionManager):
         >>> assert isinstance(session, Session)
         # OUTPUT: True
         >>> api = SearchAPI(query='history of software design', session = session)
+        ### Connection pools can be sized for the number of threads that share the session:
+        >>> pooled_session = SessionManager(pool_maxsize=32, pool_block=True).configure_session()
 
     """
 
-    def __init__(self, user_agent: Optional[str] = None) -> None:
-        """Initializes a basic session manager that sets the user agent if provided."""
+    def __init__(
+        self,
+        user_agent: Optional[str] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        max_retries: Optional[int | Retry] = None,
+        pool_block: bool = False,
+    ) -> None:
+        """Initializes a basic session manager that sets the user agent and connection pool options if provided."""
         if user_agent is not None and not (isinstance(user_agent, str) and len(user_agent) > 0):
             raise SessionCreationError(
                 "Error creating the session manager: The provided user_agent parameter is not a string"
             )
         self.user_agent = user_agent
+        self.pool_connections = self._validate_pool_size(pool_connections, "pool_connections")
+        self.pool_maxsize = self._validate_pool_size(pool_maxsize, "pool_maxsize")
+        self.max_retries = max_retries
+        self.pool_block = pool_block
+
+    @staticmethod
+    def _validate_pool_size(value: Optional[int], parameter: str) -> Optional[int]:
+        """Helper method that verifies that connection pool sizes are positive integers when provided."""
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 1):
+            raise SessionCreationError(
+                f"Error creating the session manager: The {parameter} parameter must be a positive integer. "
+                f"Received {value}"
+            )
+        return value
+
+    @property
+    def pool_options(self) -> dict[str, Any]:
+        """The connection pool options that were explicitly specified for the sessions created by the manager."""
+        options = dict(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+            pool_block=self.pool_block or None,
+        )
+        return {option: value for option, value in options.items() if value is not None}
+
+    @classmethod
+    def mount_adapters(
+        cls,
+        session: requests.Session,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        max_retries: Optional[int | Retry] = None,
+        pool_block: bool = False,
+    ) -> requests.Session:
+        """Mounts an `HTTPAdapter` with the specified connection pool settings for `http://` and `https://` URLs.
+
+        Options that are not specified use the defaults of `requests.adapters.HTTPAdapter`.
+
+        Args:
+            session (requests.Session): The session (or CachedSession) to mount the adapter on.
+            pool_connections (Optional[int]): The number of per-host connection pools to cache.
+            pool_maxsize (Optional[int]): The maximum number of connections to keep alive for reuse within each pool.
+            max_retries (Optional[int | Retry]): The number of connection retries applied by urllib3.
+            pool_block (bool): Whether to wait for an available connection when a pool is exhausted.
+
+        Returns:
+            requests.Session: The same session with the tuned adapters mounted.
+
+        """
+        adapter_options: dict[str, Any] = dict(pool_block=pool_block)
+        if pool_connections is not None:
+            adapter_options["pool_connections"] = pool_connections
+        if pool_maxsize is not None:
+            adapter_options["pool_maxsize"] = pool_maxsize
+        if max_retries is not None:
+            adapter_options["max_retries"] = max_retries
+
+        adapter = HTTPAdapter(**adapter_options)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def configure_session(self) -> requests.Session:
         """Configures a basic requests session with the provided user_agent attribute.
@@ -75,18 +164,27 @@ class SessionManager(session_models.BaseSessionManager):
         session = requests.Session()
         if self.user_agent:
             session.headers.update({"User-Agent": self.user_agent})
+        self.configure_adapters(session)
         logger.info("Default session successfully established.")
         return session
 
+    def configure_adapters(self, session: requests.Session) -> requests.Session:
+        """Mounts tuned adapters on an existing session only when connection pool options have been specified."""
+        if self.pool_options:
+            self.mount_adapters(session, **self.pool_options)
+            logger.debug(f"Mounted HTTPAdapters with the following connection pool options: {self.pool_options}")
+        return session
+
     def __repr__(self) -> str:
-        """Creates a string representation of the SessionManager indicating the user agent.
+        """Creates a string representation of the SessionManager indicating the user agent and pool options.
 
         Returns:
             (str): a string representation of the current SessionManager class instance.
 
         """
         nm = __class__.__name__
-        string_representation = f"{nm}(user_agent='{self.user_agent}')"
+        pool_options = "".join(f", {option}={value!r}" for option, value in self.pool_options.items())
+        string_representation = f"{nm}(user_agent='{self.user_agent}'{pool_options})"
         return string_representation
 
 
@@ -127,6 +225,10 @@ class CachedSessionManager(SessionManager):
         ] = None,
         expire_after: Optional[int | float | str | datetime.datetime | datetime.timedelta] = 86400,
         raise_on_error: bool = False,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        max_retries: Optional[int | Retry] = None,
+        pool_block: bool = False,
     ) -> None:
         """The initialization of the CachedSessionManager defines the options that are later passed to the
         self.configure_session method which returns a session object after parameter validation.
@@ -155,11 +257,15 @@ class CachedSessionManager(SessionManager):
             raise_on_error (bool):
                 Whether to raise an error on instantiation if an error is encountered in the creation of a session.
                 If raise_on_error = False, the error is logged, and a requests.Session is created instead.
+            pool_connections (Optional[int]): The number of per-host connection pools to cache.
+            pool_maxsize (Optional[int]): The maximum number of connections to keep alive for reuse per host.
+            max_retries (Optional[int | Retry]): The number of connection retries applied by urllib3.
+            pool_block (bool): Whether to wait for an available connection when a host's pool is exhausted.
 
         """
 
         try:
-            super().__init__(user_agent)
+            super().__init__(user_agent, pool_connections, pool_maxsize, max_retries, pool_block)
 
             cache_directory = self.get_cache_directory(cache_directory, backend)
             self.config = session_models.CachedSessionConfig(
@@ -307,6 +413,7 @@ class CachedSessionManager(SessionManager):
 
             if self.user_agent:
                 cached_session.headers.update({"User-Agent": self.user_agent})
+            self.configure_adapters(cached_session)
 
             logger.info("Cached session (%s) successfully established", self.cache_path)
             logger.info("Cache records expire after: %s seconds.", self.expire_after)
@@ -0,0 +1,206 @@
+# /sessions/session_pool.py
+"""The scholar_flux.sessions.session_pool module implements the SessionPool that shares sessions between coordinators
+sending requests to the same host.
+
+Each `requests.Session` holds its own pool of keep-alive connections. When every coordinator for a provider creates or
+clones a separate session, each one must open new TCP connections (and complete new TLS handshakes) to the same host.
+The `SessionPool` instead hands out a single session per host (and cache backend) so that connections established by
+one coordinator can be reused by all other coordinators requesting resources from the same host.
+
+Classes:
+    SessionPool: A thread-safe registry of sessions keyed by the host they request and the cache backend they use.
+
+"""
+from __future__ import annotations
+from typing import Optional
+from urllib.parse import urlparse
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+import threading
+import copy
+import attrs
+import requests
+import logging
+
+from scholar_flux.sessions.session_manager import SessionManager
+from scholar_flux.exceptions.util_exceptions import SessionCreationError
+from scholar_flux.utils.repr_utils import generate_repr_from_string
+
+logger = logging.getLogger(__name__)
+
+
+class SessionPool:
+    """Thread-safe registry that shares a single session (and its keep-alive connections) per host and cache backend.
+
+    The pool never modifies the sessions it receives. When a host does not yet have a shared session, the pool creates
+    a new session that copies the headers, authentication, cookies, and other settings of the session it received, and
+    connection pool options (when specified) are applied to the copy by mounting tuned `HTTPAdapters`. Copies of cached
+    sessions reuse the same cache backend and cache settings.
+
+    Sessions are pooled by host and by the identity of their cache backend: uncached sessions and cached sessions using
+    different backends are never shared, so sharing a session never changes whether or where a coordinator caches
+    requests. Coordinators sharing a cached session share its response cache just as they did before pooling.
+
+    Args:
+        pool_connections (Optional[int]): The number of per-host connection pools to cache within each shared session.
+        pool_maxsize (Optional[int]):
+            The maximum number of connections kept alive for reuse within each host's pool. This should be at least as
+            large as the number of threads that send requests to the same host.
+        max_retries (Optional[int | Retry]): The number of connection retries applied by urllib3.
+        pool_block (bool): Whether threads wait for an available connection when a host's pool is exhausted.
+
+    Examples:
+        >>> from scholar_flux.sessions import SessionPool
+        >>> session_pool = SessionPool(pool_maxsize=16)
+        >>> session = session_pool.get_or_create('https://api.plos.org/search')
+        >>> # sessions requesting resources from the same host are shared
+        >>> assert session_pool.get_or_create('https://api.plos.org/search?q=genomics') is session
+        >>> session_pool.hosts
+        # OUTPUT: ['https://api.plos.org']
+
+    """
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        max_retries: Optional[int | Retry] = None,
+        pool_block: bool = False,
+    ) -> None:
+        """Initializes an empty session pool with the connection pool options applied to each shared session."""
+        # reuses the validation and option handling of the session manager used to create new sessions
+        self.session_manager = SessionManager(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            pool_block=pool_block,
+        )
+        self._sessions: dict[tuple[str, Optional[int]], requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        """Extracts the scheme and host (including the port) used to group sessions from a URL.
+
+        Args:
+            url (str): The URL (or base URL) that the session is used to request.
+
+        Returns:
+            str: The lowercased scheme and host of the URL (e.g., `https://api.plos.org`)
+
+        Raises:
+            SessionCreationError: If the scheme or host cannot be identified from the URL
+
+        """
+        parsed_url = urlparse(url) if isinstance(url, str) else None
+        if not parsed_url or not parsed_url.scheme or not parsed_url.netloc:
+            raise SessionCreationError(f"Could not identify the host of the URL used to pool sessions: {url}")
+        return f"{parsed_url.scheme}://{parsed_url.netloc}".lower()
+
+    @staticmethod
+    def backend_key(session: Optional[requests.Session] = None) -> Optional[int]:
+        """Identifies the cache backend of a session. Uncached (or missing) sessions are identified by None.
+
+        Args:
+            session (Optional[requests.Session]): The session whose cache backend should be identified.
+
+        Returns:
+            Optional[int]: The identity of the session's cache backend, or None if the session is not cached.
+
+        """
+        return id(session.cache) if isinstance(session, CachedSession) else None
+
+    @property
+    def hosts(self) -> list[str]:
+        """Lists each host that currently has at least one shared session."""
+        return sorted({host for host, _ in self._sessions})
+
+    def get(self, url: str, session: Optional[requests.Session] = None) -> Optional[requests.Session]:
+        """Retrieves the shared session for the host of a URL and the cache backend of a session if registered.
+
+        Args:
+            url (str): The URL (or base URL) used to identify the host.
+            session (Optional[requests.Session]):
+                A session whose cache backend identifies the shared session to retrieve. When not provided, the shared
+                uncached session for the host is retrieved.
+
+        Returns:
+            Optional[requests.Session]: The shared session if available, otherwise None
+
+        """
+        return self._sessions.get((self.host_key(url), self.backend_key(session)))
+
+    def get_or_create(self, url: str, session: Optional[requests.Session] = None) -> requests.Session:
+        """Retrieves the shared session for the host of a URL, creating and registering a new session if needed.
+
+        Args:
+            url (str): The URL (or base URL) used to identify the host.
+            session (Optional[requests.Session]):
+                The session that is currently used for the host. When a shared session using the same cache backend
+                does not yet exist for the host, a copy of this session is registered and returned. The session itself
+                is never modified. When not provided, a new uncached session is created and registered.
+
+        Returns:
+            requests.Session: The session shared by all callers requesting resources from the host.
+
+        """
+        key = (self.host_key(url), self.backend_key(session))
+
+        with self._lock:
+            shared_session = self._sessions.get(key)
+            if shared_session is None:
+                shared_session = (
+                    self.session_manager.configure_adapters(self._copy_session(session))
+                    if session is not None
+                    else self.session_manager.configure_session()
+                )
+                self._sessions[key] = shared_session
+                logger.debug(f"Registered a shared session for the host, {key[0]}")
+            return shared_session
+
+    @staticmethod
+    def _copy_session(session: requests.Session) -> requests.Session:
+        """Helper method that creates a new session with the settings of an existing session.
+
+        Cached sessions are copied into a new `CachedSession` that reuses the same cache backend and cache settings.
+        Adapters are not copied so that the connections of the original session remain owned by its caller.
+
+        Args:
+            session (requests.Session): The session (or CachedSession) to copy.
+
+        Returns:
+            requests.Session: A new session of the same kind with copies of the original session's settings.
+
+        """
+        new_session = (
+            CachedSession(backend=session.cache, **attrs.asdict(session.settings, recurse=False))
+            if isinstance(session, CachedSession)
+            else requests.Session()
+        )
+
+        for attribute in ("headers", "cookies", "auth", "proxies", "hooks", "params", "verify", "cert"):
+            setattr(new_session, attribute, copy.copy(getattr(session, attribute)))
+
+        for attribute in ("stream", "trust_env", "max_redirects"):
+            setattr(new_session, attribute, getattr(session, attribute))
+        return new_session
+
+    def close(self) -> None:
+        """Closes every session created by the pool and its connections and removes all sessions from the pool."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        """Returns the total number of sessions that are currently shared within the pool."""
+        return len(self._sessions)
+
+    def __repr__(self) -> str:
+        """Shows the class name, the hosts with shared sessions, and the connection pool options of the pool."""
+        class_name = self.__class__.__name__
+        attributes = dict(hosts=self.hosts, **self.session_manager.pool_options)
+        return generate_repr_from_string(class_name, attributes, flatten=True)
+
+
+__all__ = ["SessionPool"]
@@ -39,6 +39,9 @@ Modules:
     - repr_utils: Contains a set of helper functions specifically geared toward printing nested objects and
                   compositions of classes into a human readable format to create sensible representations of objects
 
+    - columnar: Contains helpers that convert lists of records into columns of values and, when pyarrow is installed,
+                into Arrow tables
+
 """
 
 from scholar_flux.utils.logger import setup_logging
@@ -108,6 +111,8 @@ from scholar_flux.utils.repr_utils import (
 
 from scholar_flux.utils.response_protocol import ResponseProtocol
 
+from scholar_flux.utils.columnar import records_to_columns, columns_to_arrow
+
 import importlib
 
 _lazy_imports = {("scholar_flux.utils.provider_utils", "ProviderUtils")}
@@ -181,6 +186,8 @@ __all__ = [
     "format_iso_timestamp",
     "parse_iso_timestamp",
     "set_public_api_module",
+    "records_to_columns",
+    "columns_to_arrow",
 ]
 
 
@@ -0,0 +1,90 @@
+# /utils/columnar.py
+"""The scholar_flux.utils.columnar module implements helpers that convert lists of records into columns, where each
+field is mapped to the list of its values across all records.
+
+Columns can be loaded directly into column-oriented tools such as Arrow and Polars (`polars.DataFrame(columns)`)
+without first creating a dictionary for each record. When the optional `pyarrow` package is installed, columns can also
+be converted into an Arrow table.
+
+Functions:
+    records_to_columns: Converts a list of dictionary records into a dictionary of equal-length columns.
+    columns_to_arrow: Converts a dictionary of columns into a `pyarrow.Table`.
+
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, TYPE_CHECKING
+import logging
+
+from scholar_flux.exceptions import PyArrowImportError
+
+if TYPE_CHECKING:  # pragma: no cover
+    pyarrow: Any
+else:
+    try:
+        import pyarrow
+    except ImportError:
+        pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+
+def records_to_columns(
+    records: Sequence[Mapping[Any, Any]], fields: Optional[Iterable[Any]] = None
+) -> Dict[Any, List[Any]]:
+    """Converts a list of dictionary records into a dictionary of equal-length columns.
+
+    Columns are ordered by the first appearance of each field, and records that do not contain a field are assigned
+    None within the column of the field.
+
+    Args:
+        records (Sequence[Mapping[Any, Any]]): The records to convert into columns.
+        fields (Optional[Iterable[Any]]): The fields to convert. If not provided, all fields found in any record are used.
+
+    Returns:
+        Dict[Any, List[Any]]: A dictionary mapping each field to the list of its values across records.
+
+    Examples:
+        >>> from scholar_flux.utils.columnar import records_to_columns
+        >>> records_to_columns([{'id': 1, 'title': 'A'}, {'id': 2, 'doi': '10.1/2'}])
+        # OUTPUT: {'id': [1, 2], 'title': ['A', None], 'doi': [None, '10.1/2']}
+
+    """
+    if fields is None:
+        field_names: Dict[Any, None] = {}
+        for record in records:
+            field_names.update(dict.fromkeys(record))
+        fields = field_names
+
+    return {field: [record.get(field) for record in records] for field in fields}
+
+
+def columns_to_arrow(columns: Mapping[Any, Sequence[Any]]) -> Any:
+    """Converts a dictionary of columns into a `pyarrow.Table`.
+
+    Columns whose values cannot be converted into a single Arrow type (e.g. strings mixed with lists when records are
+    processed without a value delimiter) are converted into columns of strings instead.
+
+    Args:
+        columns (Mapping[Any, Sequence[Any]]): A dictionary mapping each field to a list of values of equal length.
+
+    Returns:
+        pyarrow.Table: A table containing a column for each field.
+
+    Raises:
+        PyArrowImportError: If the optional `pyarrow` package is not installed.
+
+    """
+    if pyarrow is None:
+        raise PyArrowImportError
+
+    arrays = {}
+    for field, values in columns.items():
+        try:
+            arrays[str(field)] = pyarrow.array(values)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+            logger.warning(f"The column, {field}, contains values of mixed types and is converted to strings: {e}")
+            arrays[str(field)] = pyarrow.array([None if value is None else str(value) for value in values])
+    return pyarrow.table(arrays)
+
+
+__all__ = ["records_to_columns", "columns_to_arrow"]
@@ -17,7 +17,7 @@ Classes:
 import base64
 import json
 import binascii
-from typing import Any, Optional
+from typing import Any, List, Optional
 from typing import MutableMapping, MutableSequence
 import logging
 
@@ -33,6 +33,10 @@ class CacheDataEncoder:
     This class is used to serialize json structures when the structure isn't known and contains unpredictable
     elements such as 1) None, 2) bytes, 3) nested lists, 4) Other unpredictable structures typically found in JSON.
 
+    Data can also be encoded with a schema tag that records the path of each bytes field (`encode_tagged`). When
+    decoding tagged data (`decode_tagged`), only the fields known to contain bytes are decoded, which avoids walking
+    and speculatively base64-decoding every string within large cached responses.
+
     Class Attributes:
         DEFAULT_HASH_PREFIX: (Optional[str]):
             An optional indicator of fields to mark fields as bytes for use when decoding. This field defaults to
@@ -42,6 +46,8 @@ class CacheDataEncoder:
           A threshold used to identify previously encoded base64 fields. This proportion is used when a hash prefix that marks
           encoded text is not applied. To test whether a string is an encoded_string, when decoded, a high percentage of
           letters will be nonreadable when decoded. (i.e `CacheDataEncoder.decode('encoders')` ---> b'zw(u\xea\xec'
+        SCHEMA_TAG (str):
+            The key that identifies the list of bytes field paths within data encoded with `encode_tagged`.
 
     Example:
         >>> from scholar_flux.utils import CacheDataEncoder
@@ -60,6 +66,7 @@ class CacheDataEncoder:
 
     DEFAULT_HASH_PREFIX: Optional[str] = "<hashbytes>"
     DEFAULT_NONREADABLE_PROP: float = 0.2
+    SCHEMA_TAG: str = "<bytepaths>"
 
     @classmethod
     def is_base64(cls, s: str | bytes, hash_prefix: Optional[str] = None) -> bool:
@@ -201,6 +208,104 @@ class CacheDataEncoder:
 
         return data  # Return unmodified non-decodable types
 
+    @classmethod
+    def encode_tagged(cls, data: Any, hash_prefix: Optional[str] = None) -> dict:
+        """Encodes data in the same manner as `encode` while recording the path of each field that contains bytes.
+
+        The encoded data is wrapped in a dictionary alongside a schema tag that lists the path (a list of keys and
+        indices) of each encoded bytes field. When decoded with `decode_tagged`, only these paths are decoded.
+
+        Args:
+            data (Any): The input data to recursively encode.
+            hash_prefix (Optional[str]): The prefix to identify hash bytes. Uses the class default prefix <hashbytes>
+                                         but can be turned off if the CacheDataEncoder.DEFAULT_HASH_PREFIX is modified
+                                         or hash_prefix is set to ''.
+
+        Returns:
+            dict: A dictionary containing the schema tag (`SCHEMA_TAG`) and the encoded data (`data`).
+
+        """
+        hash_prefix = hash_prefix if hash_prefix is not None else cls.DEFAULT_HASH_PREFIX
+        byte_paths: List[list] = []
+        encoded = cls._encode_with_paths(data, hash_prefix, [], byte_paths)
+        return {cls.SCHEMA_TAG: byte_paths, "data": encoded}
+
+    @classmethod
+    def is_tagged(cls, data: Any) -> bool:
+        """Indicates whether data was encoded with a schema tag that records the paths of bytes fields."""
+        return (
+            isinstance(data, dict) and len(data) == 2 and isinstance(data.get(cls.SCHEMA_TAG), list) and "data" in data
+        )
+
+    @classmethod
+    def decode_tagged(cls, data: Any, hash_prefix: Optional[str] = None) -> Any:
+        """Decodes data encoded with `encode_tagged` by decoding only the fields recorded in its schema tag.
+
+        The encoded data is decoded in place, as only the listed bytes fields are replaced. Data without a schema tag
+        (e.g., data encoded with `encode`) is decoded with the recursive `decode` method instead.
+
+        Args:
+            data (Any): The tagged data to decode, typically loaded from a JSON string.
+            hash_prefix (Optional[str]): The prefix that identifies hash bytes. Uses the class default prefix
+                                         <hashbytes> if not specified.
+
+        Returns:
+            Any: The original data with each bytes field decoded.
+
+        """
+        if not cls.is_tagged(data):
+            return cls.decode(data, hash_prefix)
+
+        hash_prefix = hash_prefix if hash_prefix is not None else cls.DEFAULT_HASH_PREFIX
+        decoded = data["data"]
+        try:
+            for path in data[cls.SCHEMA_TAG]:
+                if not path:
+                    return cls._decode_tagged_bytes(decoded, hash_prefix)
+
+                container = decoded
+                for key in path[:-1]:
+                    container = container[key]
+                container[path[-1]] = cls._decode_tagged_bytes(container[path[-1]], hash_prefix)
+        except (KeyError, IndexError, TypeError) as e:
+            # non-string keys are coerced into strings when dumped to JSON, so paths might no longer resolve
+            logger.debug(f"Could not resolve a bytes field path ({e}). Falling back to recursive decoding...")
+            return cls.decode(decoded, hash_prefix)
+        return decoded
+
+    @classmethod
+    def _decode_tagged_bytes(cls, data: str | bytes, hash_prefix: Optional[str] = None) -> str | bytes:
+        """Helper method that decodes a value known to be a base64 encoded bytes field without heuristic checks."""
+        if isinstance(data, str):
+            data = data[len(hash_prefix) :] if hash_prefix and data.startswith(hash_prefix) else data
+            return base64.b64decode(data)
+        return data
+
+    @classmethod
+    def _encode_with_paths(cls, data: Any, hash_prefix: Optional[str], path: list, byte_paths: List[list]) -> Any:
+        """Helper method that recursively encodes data and appends the path of each bytes field to `byte_paths`."""
+        match data:
+            case bytes():
+                byte_paths.append(path)
+                return cls._encode_bytes(data, hash_prefix)
+            case data if isinstance(data, MutableMapping):
+                if type(data) is not dict:  # noqa: E721
+                    logger.warning("Non-dictionary mutable mappings are coerced into dictionaries when encoded")
+                return {
+                    key: cls._encode_with_paths(value, hash_prefix, [*path, key], byte_paths)
+                    for key, value in data.items()
+                }
+            case data if isinstance(data, (tuple, MutableSequence, set)):
+                if not isinstance(data, (tuple, list)):
+                    logger.warning("Non-list/tuple mutable sequences are coerced into lists when encoded")
+                encoded = [
+                    cls._encode_with_paths(item, hash_prefix, [*path, index], byte_paths)
+                    for index, item in enumerate(data)
+                ]
+                return tuple(encoded) if isinstance(data, tuple) else encoded
+            case _:
+                return data
+
     @classmethod
     def _encode_bytes(cls, data: bytes, hash_prefix: Optional[str] = None) -> str:
         """Helper method for encoding a bytes objects into strings.
@@ -435,6 +540,41 @@ class JsonDataEncoder(CacheDataEncoder):
         loaded = cls.loads(s, **json_kwargs)
         return cls.decode(loaded)
 
+    @classmethod
+    def serialize_tagged(cls, data: Any, **json_kwargs) -> str:
+        """Class method that encodes data with a schema tag (`encode_tagged`) and serializes it to a JSON string.
+
+        The JSON string wraps the encoded data alongside the path of each bytes field, so it should only be read with
+        `deserialize_tagged`. Use `serialize` when the JSON string is consumed by other readers.
+
+        Args:
+            data (Any): The data to encode and serialize as a json string.
+            **json_kwargs: Additional keyword arguments for json.dumps.
+
+        Returns:
+            str: The JSON string containing the schema tag and the encoded data.
+
+        """
+        encoded = cls.encode_tagged(data)
+        return cls.dumps(encoded, **json_kwargs)
+
+    @classmethod
+    def deserialize_tagged(cls, s: str, **json_kwargs) -> Any:
+        """Class method that deserializes a JSON string and decodes only the bytes fields recorded in its schema tag.
+
+        JSON strings without a schema tag (such as those written by `serialize`) are recursively decoded instead.
+
+        Args:
+            s (str): The JSON string to deserialize and decode.
+            **json_kwargs: Additional keyword arguments for json.loads.
+
+        Returns:
+            Any: The decoded data.
+
+        """
+        loaded = cls.loads(s, **json_kwargs)
+        return cls.decode_tagged(loaded)
+
     @classmethod
     def dumps(cls, data: Any, **json_kwargs) -> str:
         """Convenience method that uses the `json` module to serialize (dump) JSON data into a JSON string.
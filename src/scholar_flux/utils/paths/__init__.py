@@ -8,7 +8,7 @@ Modules:
                               nested path location where terminal values are stored in structured json data consisting of
                               dictionaries, lists, and other nested elements.
     - path_nodes.py:          Implements a PathNode class where processing paths are paired with a `value` at its `path`
-    - path_discoverer.py:     Defines the PathDiscoverer that recursively finds terminal paths up to a specific max depth.
+    - path_discoverer.py:     Defines the PathDiscoverer that iteratively finds terminal paths up to a specific max depth.
                               This implementation is designed to create a dictionary by processing a json data structure to
                               create a new flattened dictionary consisting of terminal ProcessingPaths (keys) and their
                               associated data at these terminal paths (values).
@@ -3,25 +3,110 @@
 facilitates the discovery of nested values within JSON data structures and the terminal path where each value is located
 within the data structure.
 
-This implementation recursively explores the JSON data set and adds to a dictionary of path mappings until the JSON data
-set is fully represented as path-data combinations that facilitate further processing of JSON data structures using
-Trie-based implementations.
+This implementation explores the JSON data set with an explicit stack rather than with recursion, so that deeply nested
+structures (e.g. parsed XML) are not limited by the recursion limit of Python, and adds to a dictionary of path mappings
+until the JSON data set is fully represented as path-data combinations that facilitate further processing of JSON data
+structures using Trie-based implementations.
+
+The traversal can be limited to the subtrees that are needed with `include` and `exclude` key patterns and can be
+truncated at a maximum depth, in which case nested values found at the maximum depth are recorded as terminal values.
 
 """
 from __future__ import annotations
-from typing import Optional, Union, Any, Set, ClassVar, MutableSequence, MutableMapping
+from typing import Optional, Union, Any, Set, ClassVar, Iterable, Iterator, MutableSequence, MutableMapping, Sequence
 from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
 from scholar_flux.exceptions.path_exceptions import PathDiscoveryError
 
 
 from scholar_flux.utils.paths import ProcessingPath
 from scholar_flux.utils import is_nested
 
+import sys
 import logging
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
+# a key pattern is either a delimited string of keys (e.g. `authors.*.name`) or a ProcessingPath
+PathPattern = Union[str, ProcessingPath]
+
+
+class _PathKeyFilter:
+    """Helper class that determines which keys of a nested structure are explored and recorded during path discovery.
+
+    Patterns are matched against the dictionary keys of each path while list indices are ignored, so that the pattern
+    `authors.name` matches both `0.authors.0.name` and `3.authors.1.name`. Each component of a pattern is matched with
+    shell-style wildcards (`*`, `?`, `[seq]`), and a pattern matches every path nested under the keys that it matches.
+
+    """
+
+    __slots__ = ("include", "exclude", "_decisions")
+
+    def __init__(
+        self,
+        include: Optional[Sequence[PathPattern]] = None,
+        exclude: Optional[Sequence[PathPattern]] = None,
+        delimiter: str = ProcessingPath.DEFAULT_DELIMITER,
+    ) -> None:
+        """Splits each include and exclude pattern into the sequence of keys that it matches."""
+        self.include = [self._split(pattern, delimiter) for pattern in include] if include else None
+        self.exclude = [self._split(pattern, delimiter) for pattern in exclude] if exclude else []
+        self._decisions: dict[tuple[tuple[str, ...], bool], bool] = {}
+
+    @classmethod
+    def _split(cls, pattern: PathPattern, delimiter: str) -> tuple[str, ...]:
+        """Helper method that splits a key pattern into its components."""
+        if isinstance(pattern, ProcessingPath):
+            return cls.path_keys(pattern)
+        if not isinstance(pattern, str) or not pattern.strip():
+            raise ValueError(f"Path patterns must be non-empty strings or ProcessingPaths, received {pattern!r}")
+        return tuple(pattern.split(delimiter))
+
+    @staticmethod
+    def path_keys(path: ProcessingPath) -> tuple[str, ...]:
+        """Returns the dictionary keys of a path, omitting list indices."""
+        if path.component_types:
+            return tuple(
+                component
+                for component, component_type in zip(path.components, path.component_types)
+                if component_type != "list"
+            )
+        return tuple(component for component in path.components if component and not component.isdigit())
+
+    @staticmethod
+    def _matches(pattern: tuple[str, ...], keys: tuple[str, ...]) -> bool:
+        """Helper method indicating whether the keys are nested under the keys matched by a pattern."""
+        return len(keys) >= len(pattern) and all(map(fnmatchcase, keys, pattern))
+
+    @staticmethod
+    def _leads_to(pattern: tuple[str, ...], keys: tuple[str, ...]) -> bool:
+        """Helper method indicating whether the keys are a partial match of a pattern that nested keys could match."""
+        return len(keys) < len(pattern) and all(map(fnmatchcase, keys, pattern))
+
+    def allows(self, keys: tuple[str, ...], nested: bool) -> bool:
+        """Indicates whether a value found at the keys should be explored (nested values) or recorded (terminal values).
+
+        Args:
+            keys (tuple[str, ...]): The dictionary keys of the path where the value was found.
+            nested (bool): Whether the value is a nested structure that could contain included keys.
+
+        Returns:
+            bool: True if the value is not excluded and is either included or could contain included keys.
+
+        """
+        decision = self._decisions.get((keys, nested))
+        if decision is None:
+            decision = not any(self._matches(pattern, keys) for pattern in self.exclude) and (
+                self.include is None
+                or any(
+                    self._matches(pattern, keys) or (nested and self._leads_to(pattern, keys))
+                    for pattern in self.include
+                )
+            )
+            self._decisions[(keys, nested)] = decision
+        return decision
+
 
 @dataclass
 class PathDiscoverer:
@@ -36,6 +121,12 @@ class PathDiscoverer:
         records: The input data to be traversed and flattened.
         path_mappings: Holds a dictionary of values mapped to ProcessingPaths after processing
 
+    Examples:
+        >>> from scholar_flux.utils import PathDiscoverer
+        >>> records = [{'id': 1, 'authors': [{'name': 'A', 'orcid': '0000'}], 'refs': [{'doi': '10.1/2'}]}]
+        >>> PathDiscoverer(records).discover_path_elements(include=['id', 'authors.name'])
+        # OUTPUT: {ProcessingPath('0.id'): 1, ProcessingPath('0.authors.0.name'): 'A'}
+
     """
 
     records: Optional[Union[list[dict], dict]] = None
@@ -53,19 +144,26 @@ class PathDiscoverer:
         current_path: Optional[ProcessingPath] = None,
         max_depth: Optional[int] = None,
         inplace: bool = False,
+        include: Optional[Sequence[PathPattern]] = None,
+        exclude: Optional[Sequence[PathPattern]] = None,
     ) -> Optional[dict[ProcessingPath, Any]]:
-        """Recursively traverses records to discover keys, their paths, and terminal status. Uses the private method
-        _discover_path_elements in order to add terminal path value pairs to the path_mappings attribute.
+        """Traverses records to discover keys, their paths, and terminal status. Uses the `iter_path_elements` method
+        in order to add terminal path value pairs to the path_mappings attribute.
 
         Args:
             records (Optional[Union[list[dict], dict]]): A list of dictionaries to be flattened if not already provided.
             current_path (Optional[dict[ProcessingPath, Any]]): The parent path to prefix all subsequent paths with.
                                                                 Is useful when working with a subset of a dict
-            max_depth (Optional[int]): Indicates the times we should recursively attempt to retrieve a terminal path.
-                                       Leaving this at None will traverse all possible nested lists/dictionaries.
+            max_depth (Optional[int]): The maximum depth of discovered paths. Nested values found at the maximum depth
+                                       are recorded as terminal values. Leaving this at None will traverse all possible
+                                       nested lists/dictionaries.
             inplace (bool): Determines whether or not to save the inner state of the PathDiscoverer object.
                             When False: Returns the final object and clears the self.path_mappings attribute.
                             When True: Retains the self.path_mappings attribute and returns None
+            include (Optional[Sequence[PathPattern]]): Key patterns (e.g. `authors.name` or `journal.*`) selecting the
+                                                       only paths to discover. List indices are ignored when matching.
+            exclude (Optional[Sequence[PathPattern]]): Key patterns of paths that are skipped along with their nested
+                                                       values.
 
         """
 
@@ -77,10 +175,12 @@ class PathDiscoverer:
             current_path = current_path or ProcessingPath(delimiter=self.DEFAULT_DELIMITER)
             self.path_mappings[current_path] = None
 
-            # record the next element deep if max_depth has not already been reached
-            recursive = max_depth is None or current_path.depth < max_depth
-            if recursive:
-                self._discover_path_elements(records, current_path, max_depth=max_depth)
+            # the starting path is only terminal when none of its direct children are traversed
+            if self._has_nested_children(records) and (max_depth is None or current_path.depth < max_depth):
+                self.path_mappings.pop(current_path)
+
+            for path, value in self.iter_path_elements(records, current_path, max_depth, include, exclude):
+                self.path_mappings[path] = value
 
             if not inplace:
                 mappings = self.path_mappings.copy()
@@ -97,92 +197,160 @@ class PathDiscoverer:
 
         return None
 
-    def _discover_path_elements(
+    def iter_path_elements(
         self,
-        record: Any,
-        current_path: ProcessingPath,
+        records: Optional[Union[list[dict], dict]] = None,
+        current_path: Optional[ProcessingPath] = None,
         max_depth: Optional[int] = None,
-    ):
-        """
-        Helper function for recursively traversing a dictionary and adding terminal path - value pairs where they exist.
-        In the event that a max depth parameter is specified, the code will attempt to retrieve terminal paths only up
-        to the depth specified by max_depth.
+        include: Optional[Sequence[PathPattern]] = None,
+        exclude: Optional[Sequence[PathPattern]] = None,
+    ) -> Iterator[tuple[ProcessingPath, Any]]:
+        """Lazily traverses records depth-first with an explicit stack and yields each terminal path and its value.
+
+        Paths are yielded in the same order as they are added to `path_mappings` by `discover_path_elements`. Nested
+        values are only explored when they are not excluded and could contain included keys, and closing the iterator
+        early stops the traversal of the remaining records.
 
         Args:
-            records (Optional[list[dict]]): A list of dictionaries to be flattened if not already provided.
-            current_path (Optional[dict[ProcessingPath, Any]]): The parent path to prefix all subsequent paths with.
-                                                                Is useful when working with a subset of a dict.
-            max_depth (Optional[int]): Indicates the times we should recursively attempt to retrieve a terminal path.
-                                       Leaving this at None will traverse all possible nested lists/dictionaries.
+            records (Optional[Union[list[dict], dict]]): A list of dictionaries to be flattened if not already provided.
+            current_path (Optional[ProcessingPath]): The parent path to prefix all subsequent paths with.
+            max_depth (Optional[int]): The maximum depth of discovered paths. Nested values found at the maximum depth
+                                       are yielded as terminal values.
+            include (Optional[Sequence[PathPattern]]): Key patterns selecting the only paths to discover.
+            exclude (Optional[Sequence[PathPattern]]): Key patterns of paths that are skipped.
+
+        Yields:
+            tuple[ProcessingPath, Any]: Each terminal path and the value found at the path.
+
+        Raises:
+            ValueError: If no records are available or if a key pattern is empty.
+            TypeError: If the records or a nested value cannot be traversed.
+
         """
-        try:
-            # continue recursively recording path nodes if we have not exceeded a non-missing max_depth
-            recursive = max_depth is None or current_path.depth <= max_depth
-            if isinstance(record, MutableMapping):
-                for key, value in record.items():
+        records = records or self.records
+        if records is None:
+            raise ValueError("The value provided to 'records' is invalid: No data to process.")
+
+        current_path = current_path or ProcessingPath(delimiter=self.DEFAULT_DELIMITER)
+
+        if max_depth is not None and current_path.depth >= max_depth:
+            self._log_early_stop(current_path, records, max_depth)
+            yield current_path, records
+            return
+
+        key_filter = _PathKeyFilter(include, exclude) if include or exclude else None
+        log_paths = logger.isEnabledFor(logging.DEBUG)
+
+        # each frame holds the path and dictionary keys of a nested structure and an iterator over its children
+        stack = [
+            (
+                current_path,
+                key_filter.path_keys(current_path) if key_filter else (),
+                self._iter_children(records, current_path),
+            )
+        ]
+
+        while stack:
+            parent_path, parent_keys, children = stack[-1]
+
+            for component, component_type, delimiter, value in children:
+                nested = bool(is_nested(value) and value)
+
+                keys = parent_keys
+                if key_filter is not None:
+                    if component_type == "dict":
+                        keys = parent_keys + (component,)
+                    if not key_filter.allows(keys, nested):
+                        continue
+
+                # records the current key or index and the type of its parent structure into a path
+                new_path = self._child_path(parent_path, component, component_type, delimiter)
+
+                if not nested:
+                    if log_paths:
+                        self._log_recorded_paths(new_path, value)
+                    yield new_path, value
+
+                elif max_depth is not None and new_path.depth >= max_depth:
+                    self._log_early_stop(new_path, value, max_depth)
+                    yield new_path, value
 
-                    # records the current key and the type of its value pair into a path
-                    path_node = ProcessingPath(str(key), ("dict",))
+                else:
+                    # continue from the first child of the nested value and return to the parent afterward
+                    stack.append((new_path, keys, self._iter_children(value, new_path)))
+                    break
+            else:
+                stack.pop()
 
-                    # ensure that the first element of a path starts with an indexable key
-                    new_path = current_path / path_node if current_path.depth else path_node
+    def _iter_children(self, record: Any, current_path: ProcessingPath) -> Iterator[tuple[str, str, str, Any]]:
+        """Helper method that returns an iterator over the component, component type, delimiter, and value of each key
+        or index of a nested structure.
 
-                    if is_nested(value) and value:
-                        if recursive:
+        Raises:
+            TypeError: If the record is neither a mapping nor a sequence.
 
-                            # pop a previous path if exists
-                            self.path_mappings.pop(current_path, None)
+        """
+        if isinstance(record, MutableMapping):
+            return ((str(key), "dict", ProcessingPath.DEFAULT_DELIMITER, value) for key, value in record.items())
+        if isinstance(record, MutableSequence):
+            # process lists with indices serving as keys
+            return ((str(index), "list", self.DEFAULT_DELIMITER, item) for index, item in enumerate(record))
 
-                            # keep traversing the structure for a terminal path
-                            self._discover_path_elements(value, new_path, max_depth)
+        logger.error(f"Type error encountered during traversal of the path, {current_path}")
+        raise TypeError(f"The data type for record, '{type(record)}', is unsupported.")
 
-                        else:
-                            self._log_early_stop(new_path, value)
-                    else:
-                        self.path_mappings[new_path] = value
-                        self._log_recorded_paths(new_path, value)
+    @staticmethod
+    def _has_nested_children(record: Any) -> bool:
+        """Helper method indicating whether a structure directly contains non-empty nested values."""
+        values = record.values() if isinstance(record, MutableMapping) else record
+        return isinstance(values, Iterable) and any(is_nested(value) and value for value in values)
+
+    @staticmethod
+    def _child_path(
+        current_path: ProcessingPath, component: str, component_type: str, delimiter: str
+    ) -> ProcessingPath:
+        """Helper method that creates the path of a nested key or list index from the path of its parent.
 
-            elif isinstance(record, MutableSequence):
-                # process lists with indices serving as keys
-                for index, item in enumerate(record):
-                    path_node = ProcessingPath(str(index), ("list",), delimiter=self.DEFAULT_DELIMITER)
-                    new_path = current_path / path_node if current_path.depth else path_node
+        Components that are neither blank nor contain the delimiter are appended to the validated parent path without
+        validating the parent again. Other components are validated as a separate path before concatenation.
 
-                    # determine whether the next value is a nested structure (non-str iterable)
-                    if is_nested(item) and item:
-                        if recursive:
+        Args:
+            current_path (ProcessingPath): The path of the parent structure.
+            component (str): The dictionary key or list index to add to the path.
+            component_type (str): The type of the parent structure (`dict` or `list`).
+            delimiter (str): The delimiter of new paths created from components at the root of the structure.
 
-                            # removes a previous pair if exists
-                            self.path_mappings.pop(current_path, None)
+        Returns:
+            ProcessingPath: The path of the nested key or index.
 
-                            # keep traversing the structure for a terminal path
-                            self._discover_path_elements(item, new_path, max_depth)
-                        else:
-                            self._log_early_stop(new_path, item)
+        """
+        if component.strip() and delimiter not in component:
+            if not current_path.depth:
+                return ProcessingPath._from_validated((sys.intern(component),), (component_type,), delimiter)
+            return current_path.append(component, component_type)
 
-                    else:
-                        self.path_mappings[new_path] = item
-                        self._log_recorded_paths(new_path, item)
-            else:
-                raise TypeError(f"The data type for record, '{type(record)}', is unsupported.")
-        except TypeError as e:
-            logger.error(f"Type error encountered during traversal of the path, {current_path}: {e}")
-            raise
+        path_node = ProcessingPath(component, (component_type,), delimiter=delimiter)
+
+        # ensure that the first element of a path starts with an indexable key
+        return current_path / path_node if current_path.depth else path_node
 
     @staticmethod
     def _log_early_stop(path: ProcessingPath, value: Any, max_depth: Optional[int] = None):
-        """Logs the resulting value after halting the addition of paths early by max depth.
+        """Logs the nested value recorded as a terminal value after reaching the maximum depth of path discovery.
 
         Args:
             path (ProcessingPath): The path where traversal stopped.
-            value (Any): The terminal value at this path.
-            max_depth (Optional[int]): Maximum depth for recursion.
+            value (Any): The nested value recorded at this path.
+            max_depth (Optional[int]): Maximum depth of discovered paths.
 
         """
-        value_str = f"{str(value)[:30]}..." if len(str(value)) > 30 else str(value)
-        logger.warning(
-            f"Max_depth ({max_depth}) of path retrieval exceeded: stopped retrieval of path {path} early. Value ({type(value)}) = {value_str}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            value_str = str(value)
+            value_str = f"{value_str[:30]}..." if len(value_str) > 30 else value_str
+            logger.debug(
+                f"Max_depth ({max_depth}) of path retrieval reached: recorded the nested value at path {path}. "
+                f"Value ({type(value)}) = {value_str}"
+            )
 
     @staticmethod
     def _log_recorded_paths(path: ProcessingPath, value: Any):
@@ -193,8 +361,10 @@ class PathDiscoverer:
             value (Any): The terminal value at this path.
 
         """
-        value_str = f"{str(value)[:30]}..." if len(str(value)) > 30 else str(value)
-        logger.debug(f"Recorded path {path}. Value ({type(value)}) = {value_str}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            value_str = str(value)
+            value_str = f"{value_str[:30]}..." if len(value_str) > 30 else value_str
+            logger.debug(f"Recorded path {path}. Value ({type(value)}) = {value_str}...")
 
     def clear(self):
         """Removes all path-value mappings from the self.path_mappings dictionary."""
@@ -202,4 +372,4 @@ class PathDiscoverer:
         logger.debug("Cleared all paths from the Discoverer...")
 
 
-__all__ = ["PathDiscoverer"]
+__all__ = ["PathDiscoverer", "PathPattern"]
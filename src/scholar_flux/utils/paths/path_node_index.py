@@ -6,25 +6,31 @@ The PathNodeIndex is responsible for orchestrating JSON data discovery, processi
 into path-node pairs indicate the location of terminal values and the path location of the terminal-values within a
 nested JSON data structure.
 
+Large pages can be simplified in parallel with a SimplificationPool that describes the paths of each record in a
+persistent pool of worker processes.
+
 """
 from __future__ import annotations
 import re
-from typing import Optional, Union, Any, ClassVar
+from typing import Optional, Union, Any, ClassVar, Sequence
 from collections import defaultdict
 from dataclasses import dataclass, field
 from scholar_flux.exceptions.path_exceptions import (
     PathNodeIndexError,
     PathNodeMapError,
     PathCombinationError,
+    PathSimplificationError,
 )
 
 from scholar_flux.utils.paths import PathSimplifier
-from multiprocessing import cpu_count, get_context
+from multiprocessing import cpu_count
+import threading
 
 from scholar_flux.utils.paths import ProcessingPath, PathNode
-from scholar_flux.utils.paths.path_discoverer import PathDiscoverer
+from scholar_flux.utils.paths.path_discoverer import PathDiscoverer, PathPattern
 from scholar_flux.utils.paths.path_node_map import PathNodeMap
 from scholar_flux.utils.paths.record_path_chain_map import RecordPathChainMap
+from scholar_flux.utils.paths.simplification_pool import SimplificationPool, describe_path
 from scholar_flux.utils import try_quote_numeric, try_call
 
 import logging
@@ -50,9 +56,10 @@ class PathNodeIndex:
         DEFAULT_DELIMITER (str): A delimiter to use by default when reading JSON structures and transforming the
                                  list of keys used to retrieve a terminal path into a simplified string. Each
                                  individual key is separated by this delimiter.
-        MAX_PROCESSES (int): An optional maximum on the total number of processes to use when simplifying multiple
-                             records into a singular structure in parallel. This can be configured directly
-                             or turned off altogether by setting this class variable to None.
+        MAX_PROCESSES (int): An optional maximum on the total number of processes used by the shared
+                             SimplificationPool when simplifying multiple records into a singular structure in
+                             parallel. This can be configured directly or turned off altogether by setting this class
+                             variable to None.
     Example Usage:
         >>> from scholar_flux.utils import PathNodeIndex
         >>> record_test_json: list[dict] = [
@@ -93,6 +100,8 @@ class PathNodeIndex:
 
     DEFAULT_DELIMITER: ClassVar[str] = ProcessingPath.DEFAULT_DELIMITER
     MAX_PROCESSES: ClassVar[Optional[int]] = 8
+    _default_pool: ClassVar[Optional[SimplificationPool]] = None
+    _default_pool_lock: ClassVar[threading.Lock] = threading.Lock()
     node_map: PathNodeMap | RecordPathChainMap = field(default_factory=PathNodeMap)
     simplifier: PathSimplifier = field(
         default_factory=lambda: PathSimplifier(
@@ -221,42 +230,99 @@ class PathNodeIndex:
         parallel: bool = False,
         max_components: Optional[int] = None,
         remove_noninformative: bool = True,
+        pool: Optional[SimplificationPool] = None,
     ) -> list[dict[str, Any]]:
         """Simplify indexed nodes into a paginated data structure.
 
+        The path of each node is first described with the keys used to sort, group, and name the node. Simplified names
+        are then assigned to each group of paths in sorted order before the values of each record are collected into
+        a single row. When simplifying in parallel, the paths of each record are described by the worker processes of
+        a SimplificationPool, and pages with fewer records than the `min_records` of the pool are described serially.
+
         Args:
             object_delimiter (str): The separator to use when collapsing multiple values into a single string.
             parallel (bool): Whether or not the simplification into a flattened structure should occur in parallel
+            max_components (Optional[int]): The maximum number of informative components to use in simplified names.
+            remove_noninformative (bool): Whether to remove non-informative components when simplifying names.
+            pool (Optional[SimplificationPool]):
+                The pool used to describe paths in parallel. If not provided and `parallel=True`, the pool shared by
+                all indices (`PathNodeIndex.default_pool()`) is used instead.
         Returns:
             list[dict[str, Any]]: A list of dictionaries representing the paginated data structure.
 
         """
-        sorted_nodes = sorted(self.node_map.nodes, key=lambda node: (node.path_keys, node.path))
+        nodes_by_record: dict[int, list[PathNode]] = defaultdict(list)
+        for node in self.node_map.nodes:
+            nodes_by_record[node.record_index].append(node)
+        records = list(nodes_by_record.values())
+
+        if pool is None and parallel:
+            pool = self.default_pool()
+
+        descriptions = (
+            pool.describe([[node.path for node in nodes] for nodes in records])
+            if pool is not None
+            else [[describe_path(node.path) for node in nodes] for nodes in records]
+        )
 
-        self.simplifier.simplify_paths(
-            [node.path_group for node in sorted_nodes],
-            max_components=max_components,
-            remove_noninformative=remove_noninformative,
+        # nodes are sorted by their dictionary keys followed by their full paths, and rows are ordered by the first
+        # sorted node of each record
+        sorted_nodes = sorted(
+            ((keys_key, path_key), group, node)
+            for nodes, described_paths in zip(records, descriptions)
+            for node, (keys_key, path_key, group) in zip(nodes, described_paths)
         )
+        first_keys = [min((keys_key, path_key) for keys_key, path_key, _ in paths) for paths in descriptions]
+
+        # names are assigned to groups in sorted order. Groups that already received a name are skipped, as the
+        # simplifier reuses the name of each group that was previously simplified
+        assigned_names: dict[str, Optional[str]] = {}
+        for _, group, node in sorted_nodes:
+            if not assigned_names.get(group):
+                path_group = node.path_group
+                self.simplifier.simplify_paths(
+                    [path_group], max_components=max_components, remove_noninformative=remove_noninformative
+                )
+                assigned_names[group] = self.simplifier.name_mappings.get(path_group)
+
+        group_names = {str(group): name for group, name in self.simplifier.name_mappings.items()}
+        rows = []
+        for record_position in sorted(range(len(records)), key=first_keys.__getitem__):
+            named_values = []
+            described_nodes = zip(descriptions[record_position], records[record_position])
+            for (_, _, group), node in sorted(described_nodes, key=lambda described_node: described_node[0][1]):
+                unique_name = group_names.get(group)
+                if unique_name is None:
+                    raise PathSimplificationError(f"Original path: {node.path} has no mapping.")
+                named_values.append((unique_name, node.value))
+            rows.append(self.simplifier.to_row(named_values, object_delimiter))
+        return rows
 
-        indexed_nodes = defaultdict(set)
+    @classmethod
+    def default_pool(cls) -> SimplificationPool:
+        """Returns the SimplificationPool shared by indices that simplify records in parallel without a pool of their
+        own. The pool is created on first use with up to `PathNodeIndex.MAX_PROCESSES` worker processes.
 
-        for node in sorted_nodes:
-            indexed_nodes[node.record_index].add(node)
+        Returns:
+            SimplificationPool: The pool shared across all PathNodeIndex instances.
 
-        node_chunks = ((node_chunk, object_delimiter) for node_chunk in indexed_nodes.values())
+        """
+        with cls._default_pool_lock:
+            if cls._default_pool is None:
+                cls._default_pool = SimplificationPool(max_workers=min(cpu_count(), cls.MAX_PROCESSES or cpu_count()))
+            return cls._default_pool
 
-        if not parallel:
-            return [self.simplifier.simplify_to_row(*node_chunk) for node_chunk in node_chunks]
+    @classmethod
+    def close_default_pool(cls) -> None:
+        """Shuts down the worker processes of the SimplificationPool shared by indices, if started.
 
-        # Prepare data for multiprocessing
+        The shared pool remains available afterward and starts its workers again when a large page is simplified in
+        parallel without a pool of its own.
 
-        # Use multiprocessing to process nodes in parallel
-        ctx = get_context("spawn")
-        max_processes = self.MAX_PROCESSES or len(list(node_chunks))
-        with ctx.Pool(processes=min(cpu_count(), max_processes)) as pool:
-            normalized_rows = pool.starmap(self.simplifier.simplify_to_row, node_chunks)
-        return normalized_rows
+        """
+        with cls._default_pool_lock:
+            if cls._default_pool is not None:
+                cls._default_pool.close()
 
     def combine_keys(self, skip_keys: Optional[list] = None) -> None:
         """Combine nodes with values in their paths by updating the paths of count nodes.
@@ -351,6 +417,9 @@ class PathNodeIndex:
         combine_keys: bool = True,
         object_delimiter: Optional[str] = ";",
         parallel: bool = False,
+        pool: Optional[SimplificationPool] = None,
+        include: Optional[Sequence[PathPattern]] = None,
+        exclude: Optional[Sequence[PathPattern]] = None,
     ) -> list[dict[str, Any]]:
         """Full pipeline for processing a loaded JSON structure into a list of dictionaries where each individual list
         element is a processed and normalized record.
@@ -364,6 +433,10 @@ class PathNodeIndex:
                               and how to collapse the list into a singular string. If empty, terminal lists
                               are returned as is.
             parallel (bool): Whether or not the simplification into a flattened structure should occur in parallel
+            pool (Optional[SimplificationPool]): An optional pool used to simplify records in parallel
+            include (Optional[Sequence[PathPattern]]): Key patterns (e.g. `authors.name`) selecting the only fields to
+                                                       normalize. Other subtrees are not traversed during discovery.
+            exclude (Optional[Sequence[PathPattern]]): Key patterns of fields that are skipped during discovery.
         Returns:
             list[dict[str,Any]]:
 
@@ -373,7 +446,11 @@ class PathNodeIndex:
             raise PathNodeIndexError(f"Normalization requires a list or dictionary. Received {type(json_records)}")
 
         record_list = json_records if isinstance(json_records, list) else [json_records]
-        path_mappings = PathDiscoverer(record_list).discover_path_elements() if isinstance(record_list, list) else {}
+        path_mappings = (
+            PathDiscoverer(record_list).discover_path_elements(include=include, exclude=exclude)
+            if isinstance(record_list, list)
+            else {}
+        )
 
         if not isinstance(path_mappings, dict) or not path_mappings:
             logger.warning(
@@ -387,7 +464,9 @@ class PathNodeIndex:
         if combine_keys:
             logger.info("Combining keys..")
             path_node_index.combine_keys()
-        normalized_records = path_node_index.simplify_to_rows(object_delimiter=object_delimiter, parallel=parallel)
+        normalized_records = path_node_index.simplify_to_rows(
+            object_delimiter=object_delimiter, parallel=parallel, pool=pool
+        )
         logger.info(f"Successfully normalized {len(normalized_records)} records")
         return normalized_records
 
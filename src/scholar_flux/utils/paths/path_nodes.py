@@ -11,7 +11,7 @@ from typing import Union
 import logging
 import copy
 from typing import Any, ClassVar
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing_extensions import Self
 from scholar_flux.utils.paths.processing_path import ProcessingPath
 from scholar_flux.exceptions.path_exceptions import (
@@ -23,12 +23,13 @@ from scholar_flux.exceptions.path_exceptions import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PathNode:
     """A dataclass acts as a wrapper for path-terminal value pairs in nested JSON structures.
 
     The PathNode consists of a value of any type and a ProcessingPath instance that indicates where a terminal-value was
-    found. This class simplifies the process of manipulating and flattening data structures originating from JSON data
+    found. This class simplifies the process of manipulating and flattening data structures originating from JSON data.
+    A node is created for each terminal value, so nodes store their path and value in `__slots__` without a `__dict__`.
 
     Attributes:
         path (ProcessingPath): The terminal path where the value was located
@@ -82,7 +83,7 @@ class PathNode:
         """
         Update the parameters of a PathNode by creating a new PathNode instance.
         Note that the original PathNode dataclass is frozen. This method uses
-        the copied dict originating from the dataclass to initialize a new PathNode.
+        the fields of the dataclass to initialize a new PathNode.
         Args:
             **attributes (dict): keyword arguments indicating the attributes of the
             PathNode to update. If a specific key is not provided, then it will not update
@@ -92,8 +93,7 @@ class PathNode:
         Returns:
             A new path with the updated attributes
         """
-        parameter_dict = self.__dict__.copy() | attributes
-        return PathNode(**parameter_dict)
+        return replace(self, **attributes)
 
     @property
     def path_keys(self) -> ProcessingPath:
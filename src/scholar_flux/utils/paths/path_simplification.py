@@ -11,7 +11,7 @@ key (component) length while preventing name collisions from occurring.
 """
 from __future__ import annotations
 import logging
-from typing import Optional, List, Dict, Union, Any, Set
+from typing import Optional, List, Dict, Union, Any, Set, Iterable, Tuple
 from collections import defaultdict
 
 from scholar_flux.exceptions.path_exceptions import PathSimplificationError
@@ -205,7 +205,7 @@ class PathSimplifier:
             )
 
         try:
-            row_dict = defaultdict(list)
+            named_values = []
             for node in sorted(terminal_nodes):
                 if not isinstance(node, PathNode):
                     raise PathSimplificationError(f"Invalid node object: {node}")
@@ -217,12 +217,28 @@ class PathSimplifier:
                 if unique_name is None:
                     raise PathSimplificationError(f"Original path: {original_path} has no mapping.")
 
-                row_dict[unique_name].append(node.value)
+                named_values.append((unique_name, node.value))
 
-            return {k: (self._collapse(v, collapse) if collapse else unlist_1d(v)) for k, v in row_dict.items()}
+            return self.to_row(named_values, collapse)
         except Exception as e:
             raise PathSimplificationError(f"Error simplifying terminal nodes {terminal_nodes}: {e}")
 
+    def to_row(self, named_values: Iterable[Tuple[str, Any]], collapse: Optional[str] = ";") -> Dict[str, Any]:
+        """Groups the values of terminal nodes by their simplified names to create a single row.
+
+        Args:
+            named_values (Iterable[Tuple[str, Any]]): The simplified name and value of each node, in sorted order.
+            collapse (Optional[str]): The separator to use when collapsing multiple values into a single string.
+
+        Returns:
+            Dict[str, Any]: A dictionary mapping unique names to their corresponding values or collapsed strings.
+
+        """
+        row_dict = defaultdict(list)
+        for unique_name, value in named_values:
+            row_dict[unique_name].append(value)
+        return {k: (self._collapse(v, collapse) if collapse else unlist_1d(v)) for k, v in row_dict.items()}
+
     @classmethod
     def _collapse(cls, obj: Any, delimiter: str) -> Any:
         """Helper method for collapsing an item or list of items into a joined string if possible. If an object that is
@@ -5,12 +5,12 @@ By caching terminal paths and their parent paths, the PathProcessingCache class
 filtering, processing, and retrieval of nested JSON data components and structures as represented by path nodes.
 
 For the duration that each path-node combination exists, the cache uses weakly-referenced dictionaries and
-weakly-referenced sets to facilitate indexed trie operations and the process of filtering each path-node combination.
+weak references to facilitate indexed trie operations and the process of filtering each path-node combination. A
+single weak reference is created for each cached path and shared by the entries of all prefixes of the path.
 
 """
 from __future__ import annotations
-from typing import Optional, Set, Literal
-from collections import defaultdict
+from typing import Any, Iterator, Optional, Set, Literal, Union
 from scholar_flux.exceptions.path_exceptions import (
     InvalidProcessingPathError,
     PathCacheError,
@@ -18,13 +18,17 @@ from scholar_flux.exceptions.path_exceptions import (
 
 
 from scholar_flux.utils.paths import ProcessingPath
-from weakref import WeakSet, WeakKeyDictionary
+from weakref import ReferenceType, WeakKeyDictionary, ref
+import copy
 
 import logging
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
+# the weak reference of the only path that begins with a prefix, or a set of references when several paths share it
+PathReferences = Union[ReferenceType[ProcessingPath], set[ReferenceType[ProcessingPath]]]
+
 
 class PathProcessingCache:
     """The PathProcessingCache class implements a method of path caching that enables faster prefix searches. and
@@ -47,9 +51,11 @@ class PathProcessingCache:
         """Initializes the ProcessingCache instance.
 
         Attributes:
-            _cache (defaultdict[str, WeakSet[ProcessingPath]]):
+            _cache (dict[str, PathReferences]):
                 Underlying cache data structure that keeps track of all descendants that begin with the current prefix
-                by mapping path strings to WeakSets that automatically remove ProcessingPaths when garbage collected
+                by mapping path strings to weak references. Prefixes with a single descendant map to the reference of
+                the descendant, and prefixes with several descendants map to a set of references. References to garbage
+                collected ProcessingPaths are pruned on the next update of the cache.
             updates (WeakKeyDictionary[ProcessingPath, Literal['add', 'remove']]):
                 Implements a lazy caching system that only adds elements to the `_cache` when filtering and node
                 retrieval is explicitly required. The implementation uses weakly referenced keys to remove cached paths
@@ -57,21 +63,42 @@ class PathProcessingCache:
 
         """
 
-        self._cache: defaultdict[str, WeakSet[ProcessingPath]] = defaultdict(WeakSet)  # Initialize the cache
+        self._cache: dict[str, PathReferences] = {}  # Initialize the cache
         self.updates: WeakKeyDictionary[ProcessingPath, Literal["add", "remove"]] = WeakKeyDictionary()
+        # the references of cached paths that were garbage collected since the cache was last pruned
+        self._expired: list[ReferenceType[ProcessingPath]] = []
+        self._expire = self._expired.append
 
     @property
-    def path_cache(self) -> defaultdict[str, WeakSet[ProcessingPath]]:
+    def path_cache(self) -> dict[str, set[ProcessingPath]]:
         """Helper method that allows for inspection of the ProcessingCache and automatically updates the node cache
         prior to retrieval.
 
         Returns:
-            defaultdict[str, WeakSet[ProcessingPath]]: The underlying cache used within the ProcessingCache to
-                retrieve a list all currently active terminal nodes.
+            dict[str, set[ProcessingPath]]: The currently active terminal paths that begin with each prefix in the
+                underlying cache used within the ProcessingCache.
 
         """
         self.cache_update()
-        return self._cache
+        return {prefix: self._resolve(references) for prefix, references in self._cache.items()}
+
+    @staticmethod
+    def _resolve(references: Optional[PathReferences]) -> set[ProcessingPath]:
+        """Helper method that retrieves the paths that are still referenced from a cache entry."""
+        if references is None:
+            return set()
+        path_references = (references,) if isinstance(references, ReferenceType) else references
+        return {path for path in (path_reference() for path_reference in path_references) if path is not None}
+
+    @staticmethod
+    def _prefixes(path: ProcessingPath) -> Iterator[str]:
+        """Helper method that generates the string of each ancestor of the path, followed by the path itself."""
+        prefix = path.components[0]
+        for component in path.components[1:]:
+            yield prefix
+            prefix = f"{prefix}{path.delimiter}{component}"
+        # reuses the string of the path that is computed once and retained by the path
+        yield str(path)
 
     def lazy_add(self, path: ProcessingPath) -> None:
         """Add a path to the cache for faster prefix searches.
@@ -107,12 +134,17 @@ class PathProcessingCache:
         """
         if not isinstance(path, ProcessingPath):
             raise PathCacheError(f"path must be a ProcessingPath instance. Received: {path} - type={type(path)}")
-        path_prefixes = path.get_ancestors() + [path]
 
-        for path_prefix in path_prefixes:
-            if path_prefix is None:
-                raise ValueError(f"Invalid path prefix of type {type(path_prefix)}")
-            self._cache[str(path_prefix)].add(path)
+        # the reference is recorded as expired once the path is garbage collected
+        path_reference = ref(path, self._expire)
+        for path_prefix in self._prefixes(path):
+            references = self._cache.get(path_prefix)
+            if references is None:
+                self._cache[path_prefix] = path_reference
+            elif isinstance(references, set):
+                references.add(path_reference)
+            elif references != path_reference:
+                self._cache[path_prefix] = {references, path_reference}
         logger.debug(f"Added path to cache: {path}")
 
     def _remove_from_cache(self, path: ProcessingPath) -> None:
@@ -126,31 +158,43 @@ class PathProcessingCache:
         if not isinstance(path, ProcessingPath):
             raise PathCacheError(f"Path Cache takes a ProcessingPath as input - received {type(path)}")
 
-        path_prefixes = path.get_ancestors() + [path]
-        for path_prefix in path_prefixes:
-            if path_prefix is None:
-                raise ValueError(f"Invalid path prefix of type {type(path_prefix)}")
-            try:
-                path_string = str(path_prefix)
-                self._cache[path_string].remove(path)
-
-            except KeyError:
+        path_reference = ref(path)
+        for path_prefix in self._prefixes(path):
+            references = self._cache.get(path_prefix)
+            if isinstance(references, set) and path_reference in references:
+                references.remove(path_reference)
+                if not references:
+                    self._cache.pop(path_prefix, None)
+            elif references is not None and references == path_reference:
+                self._cache.pop(path_prefix, None)
+            else:
                 logger.debug(f"Path not found in cache: {path}")
                 break
-            else:
-                logger.debug(f"Removed path from cache: {path}")
+            logger.debug(f"Removed path from cache: {path}")
 
     def _prune_cache(self) -> None:
-        """Prunes empty weak-key referenced dictionary key entries from the cache. As the set is cleared.
+        """Prunes the references of garbage collected paths and the resulting empty prefix entries from the cache.
 
         Args:
             path (ProcessingPath): The path to remove from the cache.
 
         """
+        # empty prefix entries are removed along with paths, so the cache is only pruned once paths expire
+        expired_count = len(self._expired)
+        if not expired_count:
+            return None
+
+        expired = set(self._expired[:expired_count])
+        del self._expired[:expired_count]
         for path in list(self._cache.keys()):
-            descendants = self._cache.get(path)
-            if not descendants:
+            descendants = self._cache[path]
+            if isinstance(descendants, set):
+                descendants.difference_update(expired)
+                if not descendants:
+                    self._cache.pop(path, None)
+            elif descendants in expired:
                 self._cache.pop(path, None)
+        return None
 
     def cache_update(self) -> None:
         """Initializes the lazy updates for the cache given the current update instructions."""
@@ -190,13 +234,33 @@ class PathProcessingCache:
 
         terminal_path_list = {
             path
-            for path in self._cache.get(str(prefix), set())
-            if path is not None
-            and (min_depth is None or min_depth <= path.depth)
-            and (max_depth is None or path.depth <= max_depth)
+            for path in self._resolve(self._cache.get(str(prefix)))
+            if (min_depth is None or min_depth <= path.depth) and (max_depth is None or path.depth <= max_depth)
         }
 
         return terminal_path_list
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> PathProcessingCache:
+        """Creates a copy of the cache that references the same paths and tracks the expiration of paths separately.
+
+        ProcessingPaths are immutable and are not copied, so the copied cache shares the weakly referenced paths.
+
+        """
+        path_cache = self.__class__()
+        memo[id(self)] = path_cache
+        path_cache.updates = copy.deepcopy(self.updates, memo)
+
+        # each path is referenced once by the copied cache, as in the current cache
+        copied_references: dict[ProcessingPath, ReferenceType[ProcessingPath]] = {}
+        for prefix, references in self._cache.items():
+            paths = self._resolve(references)
+            for path in paths:
+                if path not in copied_references:
+                    copied_references[path] = ref(path, path_cache._expire)
+            if paths:
+                path_references = {copied_references[path] for path in paths}
+                path_cache._cache[prefix] = path_references.pop() if len(path_references) == 1 else path_references
+        return path_cache
+
 
 __all__ = ["PathProcessingCache"]
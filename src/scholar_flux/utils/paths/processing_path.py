@@ -5,14 +5,21 @@ implementation.
 The ProcessingPath is used to store a path processing representation that allows for extensive flexibility in the
 creation, filtering, and discovery of nested keys in JSON structures.
 
+Because a path is created for each terminal value and each of its ancestors, paths use a compact, immutable
+representation: each path stores its components in `__slots__`, component strings are interned, the tuples of component
+types shared by many paths are stored once, and the string of each path is computed once on first use. Paths
+derived from already validated paths (e.g. parents, groups, and concatenations) are created without repeating
+validation.
+
 """
 from __future__ import annotations
 from typing import Union
 import re
+import sys
 import logging
-from copy import deepcopy
-from typing import Optional, List, Tuple, Pattern, ClassVar
-from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Optional, List, Tuple, Pattern, ClassVar
+from dataclasses import FrozenInstanceError
 from scholar_flux.exceptions.path_exceptions import (
     InvalidProcessingPathError,
     InvalidPathDelimiterError,
@@ -23,8 +30,34 @@ from scholar_flux.exceptions.path_exceptions import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# the shared tuple of each sequence of component types: paths with the same structure reference a single tuple
+_COMPONENT_TYPES: dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+# the maximum number of distinct sequences of component types stored in the shared table
+_MAX_COMPONENT_TYPES = 100_000
+
+# matches components that end in a number, optionally prefixed by letters, to pad numbers for human sorting
+_NUMBERED_COMPONENT_PATTERN = re.compile(r"(^[a-zA-Z_\.\-]*)(\d+)$")
+
+
+def _intern_component_types(component_types: Optional[Tuple[str, ...]]) -> Optional[Tuple[str, ...]]:
+    """Helper function that returns the shared tuple that is equal to the provided tuple of component types."""
+    if component_types is None:
+        return None
+    shared_component_types = _COMPONENT_TYPES.get(component_types)
+    if shared_component_types is None:
+        if len(_COMPONENT_TYPES) >= _MAX_COMPONENT_TYPES:
+            return component_types
+        shared_component_types = _COMPONENT_TYPES.setdefault(component_types, component_types)
+    return shared_component_types
+
+
+@lru_cache(maxsize=65536)
+def _pad_component(component: str, pad: int) -> str:
+    """Helper function that pads the trailing number of a path component with zeros for human sorting."""
+    return _NUMBERED_COMPONENT_PATTERN.sub(lambda x: f"{x.group(1)!r}{x.group(2).zfill(pad)!r}", component)
+
 
-@dataclass(frozen=True)
 class ProcessingPath:
     """A utility class to handle path operations for processing and flattening dictionaries.
 
@@ -57,11 +90,17 @@ class ProcessingPath:
 
     """
 
-    components: Tuple[str, ...] = field(init=False)
-    component_types: Optional[Tuple[str, ...]] = field(init=False, default=None)
-    delimiter: str = field(init=False, default="")
+    __slots__ = ("components", "component_types", "delimiter", "_str", "__weakref__")
+
+    components: Tuple[str, ...]
+    component_types: Optional[Tuple[str, ...]]
+    delimiter: str
+    _str: str  # the string of the path, computed on first use
     DEFAULT_DELIMITER: ClassVar[str] = "."  # Class-level default delimiter
 
+    # delimiters that were previously validated and do not need to be validated again
+    _VALID_DELIMITERS: ClassVar[set[str]] = set()
+
     def __init__(
         self,
         components: Union[str, int, Tuple[str, ...], List[str], List[int], List[str | int]] = (),
@@ -88,7 +127,51 @@ class ProcessingPath:
             self._validate_delimiter(delimiter if delimiter is not None else self.DEFAULT_DELIMITER),
         )
         object.__setattr__(self, "components", self._validate_and_split_path(components))
-        object.__setattr__(self, "component_types", self._validate_component_types(component_types))
+        object.__setattr__(
+            self, "component_types", _intern_component_types(self._validate_component_types(component_types))
+        )
+
+    @classmethod
+    def _from_validated(
+        cls, components: Tuple[str, ...], component_types: Optional[Tuple[str, ...]], delimiter: str
+    ) -> ProcessingPath:
+        """Helper method that creates a path from components, component types, and a delimiter that were already
+        validated, such as the components of existing paths. Validation is skipped to quickly derive new paths.
+
+        Args:
+            components (Tuple[str, ...]): A tuple of valid path components.
+            component_types (Optional[Tuple[str, ...]]): None or a tuple of component types with a matching length.
+            delimiter (str): A previously validated delimiter.
+
+        Returns:
+            ProcessingPath: A new ProcessingPath with the provided components.
+
+        """
+        path = object.__new__(cls)
+        object.__setattr__(path, "delimiter", delimiter)
+        object.__setattr__(path, "components", components or ("",))
+        object.__setattr__(path, "component_types", _intern_component_types(component_types or None))
+        return path
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevents the attributes of the immutable ProcessingPath from being reassigned after initialization."""
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        """Prevents the attributes of the immutable ProcessingPath from being deleted."""
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickles the ProcessingPath using its components, component types, and delimiter."""
+        return self.__class__, (self.components, self.component_types, self.delimiter)
+
+    def __copy__(self) -> ProcessingPath:
+        """Returns the current path: ProcessingPaths are immutable and can be shared instead of copied."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> ProcessingPath:
+        """Returns the current path: ProcessingPaths are immutable and can be shared instead of copied."""
+        return self
 
     @staticmethod
     def _validate_delimiter(delimiter: str) -> str:
@@ -104,6 +187,8 @@ class ProcessingPath:
             InvalidPathDelimiterError: If the delimiter is not a valid string.
 
         """
+        if isinstance(delimiter, str) and delimiter in ProcessingPath._VALID_DELIMITERS:
+            return delimiter
 
         if not isinstance(delimiter, str) or not delimiter:
             raise InvalidPathDelimiterError("Delimiter must be a non-empty string.")
@@ -115,6 +200,7 @@ class ProcessingPath:
             raise InvalidPathDelimiterError(
                 rf"Delimiter must not contain special characters like \ / : % * ? \" |\n received delimiter={delimiter}"
             )
+        ProcessingPath._VALID_DELIMITERS.add(delimiter)
         return delimiter
 
     def _validate_and_split_path(
@@ -161,8 +247,8 @@ class ProcessingPath:
         if any(not p.strip() for p in path[1:] if isinstance(p, str)):
             raise InvalidProcessingPathError("Non-root path components must be non-empty strings.")
 
-        # Return the validated path as a tuple
-        return tuple(str(p) if isinstance(p, int) else p for p in path)
+        # Return the validated path as a tuple of interned components that are shared across paths
+        return tuple(sys.intern(str(p)) if isinstance(p, int) else sys.intern(p) if type(p) is str else p for p in path)
 
     def _validate_component_types(
         self, component_types: Optional[Union[str, Tuple[str, ...], List[str]]] = None
@@ -259,7 +345,7 @@ class ProcessingPath:
 
         """
         validated_delimiter = self._validate_delimiter(new_delimiter)
-        return ProcessingPath(self.components, self.component_types, validated_delimiter)
+        return ProcessingPath._from_validated(self.components, self.component_types, validated_delimiter)
 
     @classmethod
     def to_processing_path(
@@ -345,7 +431,12 @@ class ProcessingPath:
             str: The string representation of the ProcessingPath.
 
         """
-        return self.delimiter.join(self.components)
+        try:
+            return self._str
+        except AttributeError:
+            path_string = self.delimiter.join(self.components)
+            object.__setattr__(self, "_str", path_string)
+            return path_string
 
     def __getitem__(self, index: Union[int, slice]) -> ProcessingPath:
         """Retrieve a subset of the ProcessingPath components using indexing or slicing.
@@ -368,6 +459,13 @@ class ProcessingPath:
             )
         elif isinstance(index, slice):
             start, stop, step = index.indices(len(self.components))
+            if step > 0:
+                # slices that retain the order of components are already valid
+                return ProcessingPath._from_validated(
+                    self.components[start:stop:step],
+                    (self.component_types[start:stop:step] if self.component_types is not None else None),
+                    self.delimiter,
+                )
             return ProcessingPath(
                 self.components[start:stop:step],
                 (self.component_types[start:stop:step] if self.component_types is not None else None),
@@ -395,15 +493,19 @@ class ProcessingPath:
             raise InvalidProcessingPathError(
                 "Component Type must be a non-empty string/type when a pre-existing component type is not None"
             )
-        return ProcessingPath(
-            self.components + (str(component),),
-            (
-                self.component_types + (component_type,)
-                if self.component_types is not None and component_type is not None
-                else None
-            ),
-            self.delimiter,
-        )
+        component = str(component)
+        if self.component_types is not None and component_type is not None:
+            new_component_types: Optional[Tuple[str, ...]] = self.component_types + (component_type,)
+            is_valid = bool(component.strip() and component_type.strip())
+        else:
+            new_component_types = None
+            is_valid = bool(component.strip())
+
+        if is_valid:
+            return ProcessingPath._from_validated(
+                self.components + (sys.intern(component),), new_component_types, self.delimiter
+            )
+        return ProcessingPath(self.components + (component,), new_component_types, self.delimiter)
 
     @property
     def depth(self) -> int:
@@ -547,6 +649,7 @@ class ProcessingPath:
 
         """
         # return hash((self.components, self.delimiter))
+        # the string of the path is computed once, and strings cache their own hash
         return hash(str(self))
 
     def __contains__(self, value: object) -> bool:
@@ -629,7 +732,7 @@ class ProcessingPath:
 
         """
         if isinstance(other, ProcessingPath):
-            return self.components == other.components and self.delimiter == other.delimiter
+            return other is self or (self.components == other.components and self.delimiter == other.delimiter)
         elif isinstance(other, str):
             return self.components == ProcessingPath(other, delimiter=self.delimiter).components
         elif isinstance(other, (tuple, list)):
@@ -688,12 +791,17 @@ class ProcessingPath:
             new_components = self.components + other.components
             if self.component_types and other.component_types:
                 new_component_types = self.component_types + other.component_types
+            # the components of both paths are validated: only the leading component of `other` may be empty
+            is_valid = bool(other.components[0].strip())
         elif isinstance(other, str):
             if other == "":
                 return self.copy()
-            new_components = self.components + (other,)
+            new_components = self.components + (sys.intern(other) if type(other) is str else other,)
+            is_valid = bool(other.strip())
         else:
             raise InvalidProcessingPathError(f"Can only concatenate with a ProcessingPath or string. Received: {other}")
+        if is_valid:
+            return ProcessingPath._from_validated(new_components, new_component_types, self.delimiter)
         return ProcessingPath(new_components, new_component_types, delimiter=self.delimiter)
 
     def sorted(self) -> ProcessingPath:
@@ -734,13 +842,13 @@ class ProcessingPath:
         )
 
     def copy(self) -> ProcessingPath:
-        """Create a copy of the ProcessingPath.
+        """Create a copy of the ProcessingPath. As ProcessingPaths are immutable, the current path is returned.
 
         Returns:
-            ProcessingPath: A new ProcessingPath object with the same components and delimiter.
+            ProcessingPath: A ProcessingPath object with the same components and delimiter.
 
         """
-        return deepcopy(self)
+        return self
 
     def to_string(self) -> str:
         """Get the string representation of the ProcessingPath.
@@ -788,14 +896,7 @@ class ProcessingPath:
 
         """
         try:
-            padded_components = [
-                re.sub(
-                    r"(^[a-zA-Z_\.\-]*)(\d+)$",
-                    lambda x: f"{x.group(1)!r}{x.group(2).zfill(pad)!r}",
-                    comp,
-                )
-                for comp in self.components
-            ]
+            padded_components = [_pad_component(comp, pad) for comp in self.components]
             return self.delimiter.join([str(self.depth)] + padded_components if depth_first else padded_components)
         except Exception as e:
             raise InvalidProcessingPathError(f"Error generating alphanumeric representation for path '{self}': {e}")
@@ -845,7 +946,7 @@ class ProcessingPath:
             filtered_indices, include_matches=False
         )
 
-        return ProcessingPath(tuple(filtered_components), filtered_component_types, self.delimiter)
+        return ProcessingPath._from_validated(tuple(filtered_components), filtered_component_types, self.delimiter)
 
     def replace_indices(self, placeholder: str = "i") -> ProcessingPath:
         """Replace numeric components in the path with a placeholder.
@@ -858,6 +959,8 @@ class ProcessingPath:
 
         """
         new_components = tuple(placeholder if component.isdigit() else component for component in self.components)
+        if isinstance(placeholder, str) and placeholder.strip():
+            return ProcessingPath._from_validated(new_components, self.component_types, self.delimiter)
         return ProcessingPath(new_components, self.component_types, self.delimiter)
 
     def get_parent(self, step: int = 1) -> Optional[ProcessingPath]:
@@ -886,7 +989,7 @@ class ProcessingPath:
             return None
         if step == len(self.components):
             return ProcessingPath([""])
-        return ProcessingPath(
+        return ProcessingPath._from_validated(
             self.components[:-step],
             self.component_types[:-step] if self.component_types else None,
             self.delimiter,
@@ -921,7 +1024,7 @@ class ProcessingPath:
             filtered_indices, include_matches=True
         )
 
-        return ProcessingPath(filtered_components, filtered_component_types, self.delimiter)
+        return ProcessingPath._from_validated(filtered_components, filtered_component_types, self.delimiter)
 
     def remove_by_type(self, removal_list: List[str], raise_on_error: bool = False) -> ProcessingPath:
         """Remove specified component types from the path.
@@ -946,7 +1049,7 @@ class ProcessingPath:
             filtered_indices, include_matches=True
         )
 
-        return ProcessingPath(filtered_components, filtered_component_types, self.delimiter)
+        return ProcessingPath._from_validated(filtered_components, filtered_component_types, self.delimiter)
 
     def info_content(self, non_informative: List[str]) -> int:
         """Calculate the number of informative components in the path.
@@ -971,7 +1074,7 @@ class ProcessingPath:
             ProcessingPath: A new ProcessingPath object representing the generated name.
 
         """
-        return ProcessingPath(
+        return ProcessingPath._from_validated(
             self.components[-max_components:],
             (self.component_types[-max_components:] if self.component_types is not None else None),
             self.delimiter,
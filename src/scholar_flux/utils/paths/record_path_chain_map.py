@@ -375,11 +375,11 @@ class RecordPathChainMap(UserDict[int, RecordPathNodeMap]):
 
             elif isinstance(value, PathNode):
                 record_index = cls._extract_record_index(value.path)
-                (
-                    mapped_groups.setdefault(
-                        record_index, RecordPathNodeMap(record_index=record_index, use_cache=use_cache)
-                    ).add(value)
-                )
+
+                # the map of each record is only created once for the first node of the record
+                if record_index not in mapped_groups:
+                    mapped_groups[record_index] = RecordPathNodeMap(record_index=record_index, use_cache=use_cache)
+                mapped_groups[record_index].add(value)
 
             else:
                 raise RecordPathChainMapError(
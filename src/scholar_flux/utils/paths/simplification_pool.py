@@ -0,0 +1,197 @@
+# /utils/paths/simplification_pool.py
+"""The scholar_flux.utils.paths.simplification_pool module implements the SimplificationPool that the PathNodeIndex uses
+to simplify large pages of records into rows with a persistent pool of worker processes.
+
+Most of the time spent in simplifying a page of records is spent in describing each terminal path: the sortable
+alphanumeric representation of the path and of its dictionary keys, and the group of the path that is later mapped to a
+simplified column name. These descriptions only depend on the path of each node and are independent across records, so
+the SimplificationPool computes them for batches of records in worker processes while the values of each node remain in
+the parent process. Each path is sent to workers as a compact tuple of its components, component types, and delimiter
+rather than as a pickled PathNode.
+
+The pool is created on first use and reused across pages. Pages with fewer records than `min_records` (or pools limited
+to a single worker) are described within the current process using the same logic, so serial and parallel
+simplification produce the same rows.
+
+Classes:
+    SimplificationPool: A persistent pool of worker processes that describes the paths of large pages in batches.
+
+"""
+from __future__ import annotations
+from typing import Any, ClassVar, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count, get_context
+import threading
+import logging
+
+from scholar_flux.exceptions.path_exceptions import PathSimplificationError
+from scholar_flux.utils.paths import ProcessingPath
+
+logger = logging.getLogger(__name__)
+
+# the alphanumeric representation of the dictionary keys of a path, of the full path, and the group of the path
+PathDescription = tuple[str, str, str]
+
+# the components, component types, and delimiter of a path, sent to worker processes in place of the path
+CompactPath = tuple[tuple[str, ...], Optional[tuple[str, ...]], str]
+
+
+def describe_path(path: ProcessingPath) -> PathDescription:
+    """Describes a terminal path with the keys used to sort, group, and name the node found at the path.
+
+    Args:
+        path (ProcessingPath): The path of a terminal node.
+
+    Returns:
+        PathDescription:
+            A tuple containing the sortable representation of the dictionary keys of the path, the sortable
+            representation of the full path, and the string of the group that the path belongs to.
+
+    """
+    return path.remove_indices()._to_alphanum(), path._to_alphanum(), str(path.group())
+
+
+def _describe_compact_batch(compact_records: Sequence[Sequence[CompactPath]]) -> list[list[PathDescription]]:
+    """Helper function run by worker processes that rebuilds the paths of each record to describe them."""
+    # the components of each path were validated when the path was created in the parent process
+    return [
+        [describe_path(ProcessingPath._from_validated(*compact_path)) for compact_path in paths]
+        for paths in compact_records
+    ]
+
+
+class SimplificationPool:
+    """A persistent pool of worker processes used to describe the terminal paths of large pages of records in batches.
+
+    The underlying process pool is only started when a page with at least `min_records` records is described and is
+    reused for each subsequent page until the pool is closed. Each batch holds the paths of up to `batch_size` records.
+
+    Args:
+        max_workers (Optional[int]):
+            The number of worker processes to start. Defaults to the number of CPUs.
+        min_records (Optional[int]):
+            The minimum number of records in a page before paths are described in worker processes. Smaller pages are
+            described within the current process. Defaults to `SimplificationPool.DEFAULT_MIN_RECORDS`.
+        batch_size (Optional[int]):
+            The number of records whose paths are sent to a worker process in each batch. Defaults to
+            `SimplificationPool.DEFAULT_BATCH_SIZE`.
+        mp_context (str): The multiprocessing start method used to start workers (`spawn` by default).
+
+    Raises:
+        PathSimplificationError: If `max_workers` or `batch_size` is not a positive integer.
+
+    Examples:
+        >>> from scholar_flux.utils import PathNodeIndex
+        >>> from scholar_flux.utils.paths.simplification_pool import SimplificationPool
+        >>> with SimplificationPool(max_workers=4) as pool:
+        ...     rows = PathNodeIndex.normalize_records(records, parallel=True, pool=pool)
+
+    """
+
+    DEFAULT_MIN_RECORDS: ClassVar[int] = 1000
+    DEFAULT_BATCH_SIZE: ClassVar[int] = 250
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        min_records: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        mp_context: str = "spawn",
+    ) -> None:
+        """Initializes the configuration of the pool without starting worker processes."""
+        if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+            raise PathSimplificationError(f"max_workers must be a positive integer, received {max_workers}")
+        if batch_size is not None and (not isinstance(batch_size, int) or batch_size < 1):
+            raise PathSimplificationError(f"batch_size must be a positive integer, received {batch_size}")
+
+        self.max_workers = max_workers or cpu_count()
+        self.min_records = min_records if min_records is not None else self.DEFAULT_MIN_RECORDS
+        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        self.mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Indicates whether worker processes have been started and not yet shut down."""
+        return self._executor is not None
+
+    def uses_workers(self, record_count: int) -> bool:
+        """Indicates whether the paths of a page with the given number of records are described in worker processes."""
+        return self.max_workers > 1 and record_count >= max(self.min_records, 1)
+
+    def describe(self, records: Sequence[Sequence[ProcessingPath]]) -> list[list[PathDescription]]:
+        """Describes the terminal paths of each record, using worker processes when the page is large enough.
+
+        Args:
+            records (Sequence[Sequence[ProcessingPath]]): The terminal paths found within each record of a page.
+
+        Returns:
+            list[list[PathDescription]]: The description of each path, in the same order as the paths of each record.
+
+        """
+        if not self.uses_workers(len(records)):
+            return [[describe_path(path) for path in paths] for paths in records]
+
+        compact_records = [
+            [(path.components, path.component_types, path.delimiter) for path in paths] for paths in records
+        ]
+        batches = [
+            compact_records[start : start + self.batch_size]
+            for start in range(0, len(compact_records), self.batch_size)
+        ]
+
+        logger.debug(f"Describing the paths of {len(records)} records in {len(batches)} batches")
+        executor = self._get_executor()
+        described_batches = executor.map(_describe_compact_batch, batches)
+        return [described for batch in described_batches for described in batch]
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Helper method that starts the worker processes on first use and returns the running executor."""
+        with self._lock:
+            if self._executor is None:
+                logger.debug(f"Starting a simplification pool with {self.max_workers} workers")
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=get_context(self.mp_context)
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shuts down the worker processes of the pool. The pool restarts its workers if used again afterward."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self) -> SimplificationPool:
+        """Returns the pool for use within a context manager that closes the pool on exit."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Shuts down the worker processes of the pool."""
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Retains the configuration of the pool when pickled or copied. Worker processes are not shared by copies."""
+        return {
+            "max_workers": self.max_workers,
+            "min_records": self.min_records,
+            "batch_size": self.batch_size,
+            "mp_context": self.mp_context,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restores the configuration of the pool without starting worker processes."""
+        self.__dict__.update(state)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Shows the configuration of the pool and whether its workers are running."""
+        return (
+            f"{self.__class__.__name__}(max_workers={self.max_workers}, min_records={self.min_records}, "
+            f"batch_size={self.batch_size}, running={self.running})"
+        )
+
+
+__all__ = ["SimplificationPool", "describe_path"]
@@ -0,0 +1,237 @@
+import asyncio
+import time
+import re
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+from scholar_flux.api import (
+    SearchAPI,
+    AsyncSearchAPI,
+    SearchCoordinator,
+    AsyncSearchCoordinator,
+    AsyncMultiSearchCoordinator,
+    MultiSearchCoordinator,
+    APIParameterMap,
+    RateLimiter,
+    ThreadedRateLimiter,
+    RetryHandler,
+)
+from scholar_flux.api.models import ProcessedResponse, ErrorResponse, NonResponse, SearchResultList
+from scholar_flux.exceptions import InvalidCoordinatorParameterException
+from scholar_flux.sessions import SessionPool
+
+
+@pytest.fixture
+def pause_rate_limiting():
+    """Temporarily removes the default rate limit applied to unknown providers by multi-search coordinators."""
+    default_rate_limit = MultiSearchCoordinator.DEFAULT_THREADED_REQUEST_DELAY
+    MultiSearchCoordinator.DEFAULT_THREADED_REQUEST_DELAY = 0
+    yield
+    MultiSearchCoordinator.DEFAULT_THREADED_REQUEST_DELAY = default_rate_limit
+
+
+@pytest.fixture
+def mock_provider_pages() -> dict[str, dict[int, bytes]]:
+    """Maps each mock provider to the content of each of its pages from the mocked paginated records directory."""
+    directory = Path(__file__).parent.parent / "mocks" / "mocked_paginated_records"
+    provider_pages: dict[str, dict[int, bytes]] = {}
+    for path in directory.iterdir():
+        if match := re.match(r"(api-[a-z]+)-example-page-(\d+)\.json", path.name):
+            provider_pages.setdefault(match.group(1), {})[int(match.group(2))] = path.read_bytes()
+    return provider_pages
+
+
+@pytest.fixture
+def async_coordinators(mock_provider_pages) -> list[SearchCoordinator]:
+    """Creates a SearchCoordinator for each mock provider using a page-based parameter map."""
+    parameter_map = APIParameterMap(query="q", start="page", auto_calculate_page=False, records_per_page="pagesize")
+    return [
+        SearchCoordinator(
+            SearchAPI(
+                query="quantum-computing",
+                base_url=f"https://example.async-{provider_name}.com",
+                provider_name=f"async-{provider_name}",
+                parameter_config=parameter_map,
+                request_delay=0,
+                records_per_page=3,
+            )
+        )
+        for provider_name in mock_provider_pages
+    ]
+
+
+def mock_coordinator_pages(mocker: requests_mock.Mocker, coordinator: SearchCoordinator, pages: dict[int, bytes]):
+    """Registers the mocked content of each page for the provider of the current coordinator."""
+    for page, content in pages.items():
+        url = str(coordinator.api.prepare_search(page=page).url)
+        mocker.get(url, content=content, headers={"Content-Type": "application/json"}, status_code=200)
+
+
+@pytest.mark.parametrize("Limiter", (RateLimiter, ThreadedRateLimiter))
+def test_async_wait_reserves_slots(Limiter):
+    """Verifies that concurrent coroutines sharing a limiter are spaced by at least `min_interval` seconds."""
+    limiter = Limiter(0.05)
+    timestamps: list[float] = []
+
+    async def call():
+        """Awaits the limiter and records when the call was allowed to proceed."""
+        async with limiter:
+            timestamps.append(time.time())
+
+    async def main():
+        """Runs several rate-limited calls concurrently."""
+        await asyncio.gather(*(call() for _ in range(4)))
+
+    asyncio.run(main())
+    timestamps.sort()
+    assert all(b - a >= 0.045 for a, b in zip(timestamps, timestamps[1:]))
+    # the rate limiter should retain the interval used across calls
+    assert limiter.min_interval == 0.05
+
+
+def test_async_rate_does_not_modify_interval():
+    """Verifies that `async_rate` uses a temporary interval without changing the limiter's `min_interval`."""
+    limiter = RateLimiter(5)
+
+    async def main():
+        """Uses the temporary interval within the async context manager."""
+        async with limiter.async_rate(0) as current_limiter:
+            assert current_limiter is limiter
+
+    asyncio.run(main())
+    assert limiter.min_interval == 5
+
+
+def test_async_retry(mock_rate_limit_exceeded_response, mock_successful_response):
+    """Verifies that the asynchronous retry loop awaits retries and returns the first valid response."""
+    responses = iter([mock_rate_limit_exceeded_response, mock_successful_response])
+
+    async def request_func():
+        """Returns a rate-limited response followed by a successful response."""
+        return next(responses)
+
+    retry_handler = RetryHandler(max_retries=2, backoff_factor=0)
+    response = asyncio.run(retry_handler.aexecute_with_retry(request_func))
+    assert response is mock_successful_response
+
+
+def test_async_search_api_conversion(plos_search_api):
+    """Verifies that updating from a SearchAPI retains the configuration while producing an AsyncSearchAPI."""
+    async_api = AsyncSearchAPI.update(plos_search_api)
+    assert isinstance(async_api, AsyncSearchAPI)
+    assert async_api.config == plos_search_api.config
+    assert async_api.session is plos_search_api.session
+    assert async_api._rate_limiter is plos_search_api._rate_limiter
+    # the original class is retained when updating the synchronous SearchAPI
+    assert type(SearchAPI.update(plos_search_api)) is SearchAPI
+    # updates through the base class retain the AsyncSearchAPI (e.g., when assigning shared rate limiters)
+    assert type(SearchAPI.update(async_api, request_delay=2)) is AsyncSearchAPI
+
+
+def test_async_coordinator_search(plos_search_api, plos_page_1_url, plos_page_1_data, plos_headers):
+    """Verifies that `asearch` retrieves, processes, and caches a response identically to `search`."""
+    coordinator = AsyncSearchCoordinator(search_api=plos_search_api, request_delay=0)
+    assert isinstance(coordinator.api, AsyncSearchAPI)
+
+    with requests_mock.Mocker() as m:
+        m.get(plos_page_1_url, json=plos_page_1_data, headers=plos_headers, status_code=200)
+        response = asyncio.run(coordinator.asearch(page=1))
+
+        assert isinstance(response, ProcessedResponse)
+        assert coordinator.last_response is response
+        assert coordinator.response_coordinator.cache_manager.verify_cache(response.cache_key)
+
+        sync_response = SearchCoordinator(search_api=plos_search_api, request_delay=0).search(page=1)
+        assert isinstance(sync_response, ProcessedResponse)
+        assert sync_response.data == response.data
+
+        search_result = asyncio.run(coordinator.asearch_page(page=1))
+        assert search_result.page == 1 and search_result.provider_name == "plos"
+        assert isinstance(search_result.response_result, ProcessedResponse)
+
+
+def test_async_coordinator_error(plos_search_api, plos_page_1_url, plos_headers):
+    """Verifies that non-retryable error codes are returned as an ErrorResponse and halt page iteration."""
+    coordinator = AsyncSearchCoordinator(search_api=plos_search_api, request_delay=0)
+
+    async def collect():
+        """Collects all pages yielded by the asynchronous page iterator."""
+        return [result async for result in coordinator.aiter_pages(pages=range(1, 4))]
+
+    with requests_mock.Mocker() as m:
+        m.get(plos_page_1_url, status_code=401, headers=plos_headers)
+        results = asyncio.run(collect())
+
+    assert len(results) == 1
+    assert isinstance(results[0].response_result, ErrorResponse)
+    assert not isinstance(results[0].response_result, NonResponse)
+
+
+def test_async_coordinator_invalid_api():
+    """Verifies that an AsyncSearchCoordinator requires an AsyncSearchAPI when assigned directly."""
+    coordinator = AsyncSearchCoordinator(query="a valid query")
+    with pytest.raises(InvalidCoordinatorParameterException):
+        coordinator.search_api = SearchAPI(query="a valid query")  # type: ignore
+
+
+def test_async_multisearch(async_coordinators, mock_provider_pages, pause_rate_limiting):
+    """Verifies that the asynchronous multi-search coordinator retrieves the same pages as the threaded coordinator."""
+    total_pages = sum(len(pages) for pages in mock_provider_pages.values())
+    page_range = range(1, max(max(pages) for pages in mock_provider_pages.values()) + 1)
+
+    async_multisearch_coordinator = AsyncMultiSearchCoordinator()
+    async_multisearch_coordinator.add_coordinators(async_coordinators)
+    assert all(isinstance(c, AsyncSearchCoordinator) for c in async_multisearch_coordinator.coordinators)
+
+    multisearch_coordinator = MultiSearchCoordinator()
+    multisearch_coordinator.add_coordinators(async_coordinators)
+
+    with requests_mock.Mocker() as m:
+        for coordinator in async_multisearch_coordinator.coordinators:
+            provider_name = coordinator.api.provider_name.replace("async-", "")
+            mock_coordinator_pages(m, coordinator, mock_provider_pages[provider_name])
+
+        async_results = asyncio.run(async_multisearch_coordinator.asearch_pages(pages=page_range))
+        threaded_results = multisearch_coordinator.search_pages(pages=page_range)
+
+    assert isinstance(async_results, SearchResultList)
+    assert len(async_results) == len(async_results.filter()) == len(threaded_results) == total_pages
+    assert sorted(async_results.join(), key=str) == sorted(threaded_results.join(), key=str)
+
+
+def test_async_multisearch_shared_sessions(async_coordinators):
+    """Verifies that assigning pooled sessions retains the AsyncSearchAPI of each coordinator."""
+    session_pool = SessionPool()
+    async_multisearch_coordinator = AsyncMultiSearchCoordinator(session_pool=session_pool)
+    async_multisearch_coordinator.add_coordinators(async_coordinators)
+
+    for coordinator in async_multisearch_coordinator.coordinators:
+        assert isinstance(coordinator.api, AsyncSearchAPI)
+        assert coordinator.api.session is session_pool.get_or_create(coordinator.api.base_url)
+    session_pool.close()
+
+
+def test_async_multisearch_early_exit(async_coordinators, mock_provider_pages, pause_rate_limiting):
+    """Verifies that closing the async generator early cancels the remaining provider tasks."""
+    async_multisearch_coordinator = AsyncMultiSearchCoordinator()
+    async_multisearch_coordinator.add_coordinators(async_coordinators)
+
+    async def first_result():
+        """Retrieves only the first result before closing the generator."""
+        generator = async_multisearch_coordinator.aiter_pages(pages=range(1, 5), max_concurrency=1)
+        result = await generator.__anext__()
+        await generator.aclose()
+        return result
+
+    with requests_mock.Mocker() as m:
+        for coordinator in async_multisearch_coordinator.coordinators:
+            provider_name = coordinator.api.provider_name.replace("async-", "")
+            mock_coordinator_pages(m, coordinator, mock_provider_pages[provider_name])
+        result = asyncio.run(first_result())
+
+    assert isinstance(result.response_result, ProcessedResponse)
+
+    with pytest.raises(InvalidCoordinatorParameterException):
+        asyncio.run(async_multisearch_coordinator.asearch_pages(pages=[1], max_concurrency=0))
@@ -0,0 +1,167 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+from redis.exceptions import ResponseError
+
+from scholar_flux.api import RedisRateLimiter, SQLiteRateLimiter, SearchAPI
+from scholar_flux.exceptions import APIParameterException
+
+
+@pytest.fixture
+def fake_redis_client():
+    """Creates an in-memory Redis client shared by the distributed rate limiters in the current test."""
+    return fakeredis.FakeRedis(server=fakeredis.FakeServer())
+
+
+@pytest.fixture
+def rate_limit_db(tmp_path) -> Path:
+    """Defines the path of a temporary SQLite database shared by the multi-process rate limiters in the current test."""
+    return tmp_path / "rate_limits.sqlite"
+
+
+def record_calls(limiters: list, calls_per_limiter: int) -> list[float]:
+    """Sends rate-limited calls from one thread per limiter and returns the sorted time at which each call proceeded."""
+    timestamps: list[float] = []
+
+    def call(limiter):
+        """Waits for each reserved slot and records when the call was allowed to proceed."""
+        for _ in range(calls_per_limiter):
+            limiter.wait()
+            timestamps.append(time.time())
+
+    threads = [threading.Thread(target=call, args=(limiter,)) for limiter in limiters]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(timestamps)
+
+
+def sqlite_worker(db_path: str, calls: int, queue) -> None:
+    """Sends rate-limited calls from a separate process and reports the time at which each call proceeded."""
+    limiter = SQLiteRateLimiter("shared-provider", min_interval=0.1, db_path=db_path)
+    for _ in range(calls):
+        limiter.wait()
+        queue.put(time.time())
+
+
+def test_redis_limiters_share_reservations(fake_redis_client):
+    """Verifies that separate RedisRateLimiter instances using the same key are spaced by the shared `min_interval`."""
+    limiters = [RedisRateLimiter("shared-provider", 0.1, redis_client=fake_redis_client) for _ in range(3)]
+    timestamps = record_calls(limiters, calls_per_limiter=2)
+    assert len(timestamps) == 6
+    assert all(b - a >= 0.09 for a, b in zip(timestamps, timestamps[1:]))
+    assert fake_redis_client.exists(limiters[0].key)
+    assert all(limiter.min_interval == 0.1 for limiter in limiters)
+
+
+def test_redis_limiter_rate_and_expiration(fake_redis_client):
+    """Verifies that temporary intervals are reserved per call and that reservations expire after they have passed."""
+    limiter = RedisRateLimiter("expiring-provider", 5, redis_client=fake_redis_client)
+    other_limiter = RedisRateLimiter("another-provider", 5, redis_client=fake_redis_client)
+
+    with patch("scholar_flux.api.rate_limiting.rate_limiter.time.sleep") as mock_sleep:
+        limiter.wait()
+        other_limiter.wait()  # keys are independent, so neither call sleeps
+        mock_sleep.assert_not_called()
+
+        with limiter.rate(2):
+            pass
+        sleep_arg = mock_sleep.call_args[0][0]
+        assert 1.9 < sleep_arg <= 2
+
+    assert limiter.min_interval == 5
+    ttl = fake_redis_client.pttl(limiter.key)
+    assert 0 < ttl <= 2000 + 2000 + limiter.EXPIRATION_MARGIN
+
+    limiter.reset()
+    assert not fake_redis_client.exists(limiter.key)
+
+
+def test_redis_limiter_uses_script(fake_redis_client):
+    """Verifies that reservations are computed with the Lua script rather than the transaction fallback."""
+    limiter = RedisRateLimiter("scripted-provider", 0.1, redis_client=fake_redis_client)
+
+    with patch.object(limiter, "_reserve_with_transaction") as mock_transaction:
+        asyncio.run(limiter.async_wait())
+        limiter.wait()
+        mock_transaction.assert_not_called()
+
+    assert limiter._use_script is True
+    assert limiter._script is not None
+    assert fake_redis_client.exists(limiter.key)
+
+
+def test_redis_limiter_script_fallback(fake_redis_client):
+    """Verifies that transactions are used when the Redis server does not support Lua scripting."""
+    limiter = RedisRateLimiter("unscripted-provider", 0, redis_client=fake_redis_client)
+
+    with patch.object(fake_redis_client, "register_script", side_effect=ResponseError("unknown command 'EVALSHA'")):
+        asyncio.run(limiter.async_wait())
+        limiter.wait()
+
+    assert limiter._use_script is False
+    assert fake_redis_client.exists(limiter.key)
+
+
+def test_redis_limiter_validation(fake_redis_client):
+    """Verifies that the limiter requires a name and a Redis client or installed redis dependency."""
+    with pytest.raises(APIParameterException):
+        RedisRateLimiter("", 1, redis_client=fake_redis_client)
+
+    limiter = RedisRateLimiter("plos", 1, redis_client=fake_redis_client)
+    assert repr(limiter) == "RedisRateLimiter(key='SFAPI:rate_limit:plos', min_interval=1)"
+
+    api = SearchAPI.update(SearchAPI(query="distributed rate limiting", request_delay=1), rate_limiter=limiter)
+    assert api._rate_limiter is limiter
+
+
+def test_sqlite_limiters_share_reservations(rate_limit_db):
+    """Verifies that separate SQLiteRateLimiter instances using the same file are spaced by the shared interval."""
+    limiters = [SQLiteRateLimiter("shared-provider", 0.1, db_path=rate_limit_db) for _ in range(3)]
+    timestamps = record_calls(limiters, calls_per_limiter=2)
+
+    assert len(timestamps) == 6
+    assert all(b - a >= 0.09 for a, b in zip(timestamps, timestamps[1:]))
+    assert rate_limit_db.exists()
+
+    # a limiter for a different resource does not wait behind the reservations of the shared provider
+    with patch("scholar_flux.api.rate_limiting.rate_limiter.time.sleep") as mock_sleep:
+        SQLiteRateLimiter("another-provider", 5, db_path=rate_limit_db).wait()
+        mock_sleep.assert_not_called()
+
+
+def test_sqlite_limiter_across_processes(rate_limit_db):
+    """Verifies that calls from separate processes sharing a SQLite database are spaced by `min_interval` seconds."""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    processes = [context.Process(target=sqlite_worker, args=(str(rate_limit_db), 2, queue)) for _ in range(2)]
+    for process in processes:
+        process.start()
+    timestamps = sorted(queue.get(timeout=60) for _ in range(4))
+    for process in processes:
+        process.join(timeout=60)
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert all(b - a >= 0.09 for a, b in zip(timestamps, timestamps[1:]))
+
+
+def test_sqlite_limiter_reset(rate_limit_db):
+    """Verifies that resetting a limiter removes its reservation and that invalid names raise an error."""
+    limiter = SQLiteRateLimiter("plos", 5, db_path=rate_limit_db)
+    with patch("scholar_flux.api.rate_limiting.rate_limiter.time.sleep") as mock_sleep:
+        limiter.wait()
+        limiter.reset()
+        SQLiteRateLimiter("plos", 5, db_path=rate_limit_db).wait()
+        mock_sleep.assert_not_called()
+
+    assert repr(limiter).startswith("SQLiteRateLimiter(name='plos'")
+
+    with pytest.raises(APIParameterException):
+        SQLiteRateLimiter("  ", 5, db_path=rate_limit_db)
@@ -1,18 +1,22 @@
 from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from scholar_flux.api import SearchAPI, SearchCoordinator, APIParameterMap, MultiSearchCoordinator
 from scholar_flux.exceptions import InvalidCoordinatorParameterException
 from scholar_flux.utils import parse_iso_timestamp
 from scholar_flux.api.rate_limiting import ThreadedRateLimiter, threaded_rate_limiter_registry
 from scholar_flux.api.models import SearchResultList, ProcessedResponse, ErrorResponse, PageListInput
+from scholar_flux.sessions import SessionPool
 from unittest.mock import patch
 from warnings import warn
-from typing import Any
+from typing import Any, Optional
 from pathlib import Path
 import requests_mock
 import pytest
-from time import time
+from time import time, sleep
 from datetime import datetime
 import re
+import json
+import threading
 
 
 @pytest.fixture
@@ -739,3 +743,126 @@ def test_error_response(
         # breaks if a non-retryable status code is encountered.
         assert len(search_results_list) == 3
         assert not search_results_list.filter()
+
+
+def test_threaded_streaming_backpressure(coordinator_dict, path_component_dict, initialize_mocker, pause_rate_limiting):
+    """Verifies that `iter_pages_threaded` streams results through a bounded queue.
+
+    Workers should pause once the queue is full rather than retrieving every page before the consumer receives the
+    first result, and closing the generator early should halt all remaining retrieval.
+
+    """
+    multisearch_coordinator = MultiSearchCoordinator()
+    multisearch_coordinator.add_coordinators(coordinator_dict.values())
+    total_pages = len(path_component_dict)
+    workers = len(multisearch_coordinator.group_by_provider())
+
+    with initialize_mocker() as m:
+        iter_pages = multisearch_coordinator.iter_pages_threaded(pages=range(1, 5), max_buffered_results=1)
+        first_result = next(iter_pages)
+        assert isinstance(first_result.response_result, ProcessedResponse)
+
+        # allows workers to fill the queue: each worker can hold at most one additional page while blocked
+        sleep(0.3)
+        assert m.call_count <= 1 + 1 + workers < total_pages
+
+        iter_pages.close()
+        retrieved_pages = m.call_count
+        sleep(0.3)
+        assert m.call_count == retrieved_pages
+
+        # a full iteration should still retrieve every page regardless of the size of the buffer
+        result_list = SearchResultList(
+            multisearch_coordinator.iter_pages_threaded(pages=range(1, 5), max_buffered_results=1)
+        )
+        assert len(result_list) == len(result_list.filter()) == total_pages
+
+    with pytest.raises(InvalidCoordinatorParameterException) as excinfo:
+        _ = list(multisearch_coordinator.iter_pages_threaded(pages=[1], max_buffered_results=0))
+    assert "Expected max_buffered_results to be a positive integer" in str(excinfo.value)
+
+
+@pytest.fixture
+def local_http_server():
+    """Starts a local HTTP/1.1 server with keep-alive support that counts each TCP connection that it accepts."""
+
+    class CountingHandler(BaseHTTPRequestHandler):
+        """Responds with a page of three records and records each new connection established by a client."""
+
+        protocol_version = "HTTP/1.1"
+        connections: list[tuple[str, int]] = []
+
+        def setup(self):
+            """Records the address of the client each time that a new connection is established."""
+            super().setup()
+            self.connections.append(self.client_address)
+
+        def do_GET(self):
+            """Returns a JSON response with a Content-Length header so that the connection can be kept alive."""
+            body = json.dumps({"records": [{"id": i, "title": "Pooled connections"} for i in range(3)]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            """Silences the default request logging to stderr."""
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, CountingHandler.connections
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_pool_reuses_connections(local_http_server, parameter_map, pause_rate_limiting):
+    """Verifies that coordinators sharing a pooled session reuse keep-alive connections to the same host.
+
+    Without a SessionPool, each coordinator opens its own connection (and would complete its own TLS handshake with
+    HTTPS providers). With a SessionPool, all queries to the same host are sent over a single connection.
+
+    """
+    server, connections = local_http_server
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/search"
+
+    def create_multisearch_coordinator(session_pool: Optional[SessionPool]) -> MultiSearchCoordinator:
+        """Creates a MultiSearchCoordinator with coordinators that each retrieve a different query from the server."""
+        multisearch_coordinator = MultiSearchCoordinator(session_pool=session_pool)
+        multisearch_coordinator.add_coordinators(
+            SearchCoordinator(
+                SearchAPI(
+                    query=query,
+                    base_url=base_url,
+                    provider_name="local-api",
+                    parameter_config=parameter_map,
+                    request_delay=0.01,
+                    records_per_page=3,
+                ),
+                cache_results=False,
+            )
+            for query in ("pooling", "keep-alive", "handshakes", "throughput")
+        )
+        return multisearch_coordinator
+
+    unpooled_coordinator = create_multisearch_coordinator(None)
+    assert len({coordinator.api.session for coordinator in unpooled_coordinator.coordinators}) == 4
+    unpooled_results = unpooled_coordinator.search(page=1, multithreading=False)
+    unpooled_connections = len(connections)
+
+    connections.clear()
+    session_pool = SessionPool(pool_maxsize=4)
+    pooled_coordinator = create_multisearch_coordinator(session_pool)
+    assert len({coordinator.api.session for coordinator in pooled_coordinator.coordinators}) == 1
+    pooled_results = pooled_coordinator.search(page=1, multithreading=False)
+    pooled_connections = len(connections)
+    session_pool.close()
+
+    assert len(unpooled_results.filter()) == len(pooled_results.filter()) == 4
+    assert unpooled_connections == 4
+    assert pooled_connections == 1
+
+    with pytest.raises(InvalidCoordinatorParameterException):
+        MultiSearchCoordinator(session_pool="shared")  # type: ignore
@@ -467,3 +467,22 @@ def test_get_incorrect_api_key(default_api_parameter_config, caplog):
     msg = "An API key is required but not provided"
     assert msg in str(excinfo.value)
     assert msg in caplog.text
+
+
+def test_cursor_parameter_building():
+    """Verifies that cursors replace the start index when building parameters for cursor-paginated APIs."""
+    crossref_config = APIParameterConfig.from_defaults("crossref")
+    assert crossref_config.map.cursor == "cursor" and crossref_config.map.initial_cursor == "*"
+    assert "initial_cursor" not in crossref_config.show_parameters()
+
+    offset_parameters = crossref_config.build_parameters(query="ml", page=3, records_per_page=20)
+    assert offset_parameters == {"query": "ml", "offset": 41, "rows": 20}
+
+    cursor_parameters = crossref_config.build_parameters(query="ml", page=3, records_per_page=20, cursor="*")
+    assert cursor_parameters == {"query": "ml", "rows": 20, "cursor": "*"}
+
+    page_config = APIParameterConfig(
+        APIParameterMap(query="q", start="page", records_per_page="pagesize", auto_calculate_page=False)
+    )
+    with pytest.raises(APIParameterException):
+        page_config.build_parameters(query="ml", page=1, records_per_page=20, cursor="*")
@@ -0,0 +1,291 @@
+import pytest
+import time
+import requests
+import requests_mock
+from typing import Optional
+from unittest.mock import patch
+
+from scholar_flux.api import (
+    ProviderConfig,
+    APIParameterMap,
+    RateLimitConfig,
+    SearchAPI,
+    TokenBucketRateLimiter,
+    SlidingWindowRateLimiter,
+    DailyQuotaRateLimiter,
+    ReservationRateLimiter,
+    AdaptiveRateLimiter,
+    ThreadedRateLimiter,
+    RateLimiter,
+)
+from scholar_flux.api.providers import provider_registry
+from scholar_flux.api.rate_limiting import RateLimiterRegistry
+from scholar_flux.exceptions import APIParameterException, RateLimitExceededException
+
+
+@pytest.fixture
+def burst_provider_config():
+    """Registers a temporary provider that allows 10 requests per second with bursts of up to 10 requests."""
+    provider_config = ProviderConfig(
+        provider_name="burst_provider",
+        base_url="https://burst-provider.com/search",
+        parameter_map=APIParameterMap(query="q", start="page", records_per_page="size", auto_calculate_page=False),
+        request_delay=0.1,
+        rate_limit=RateLimitConfig(strategy="token_bucket", burst=10, daily_limit=1000),
+    )
+    provider_registry.add(provider_config)
+    yield provider_config
+    provider_registry.remove(provider_config.provider_name)
+
+
+def sleep_times(limiter: RateLimiter, calls: int) -> list[float]:
+    """Calls `wait()` several times with `time.sleep` patched and returns the duration of each requested sleep."""
+    with patch("scholar_flux.api.rate_limiting.rate_limiter.time.sleep") as mock_sleep:
+        for _ in range(calls):
+            limiter.wait()
+        return [call.args[0] for call in mock_sleep.call_args_list]
+
+
+def test_token_bucket_burst():
+    """Verifies that the token bucket allows `burst` calls without waiting before enforcing the sustained rate."""
+    limiter = TokenBucketRateLimiter.from_rate(max_requests=4, period=1)
+    assert limiter.min_interval == 0.25 and limiter.burst == 4
+
+    # the first four calls consume the tokens in the bucket, and the remaining calls wait for each new token
+    waits = sleep_times(limiter, 6)
+    assert len(waits) == 2
+    assert 0.2 < waits[0] <= 0.25 and 0.45 < waits[1] <= 0.5
+    assert repr(limiter) == "TokenBucketRateLimiter(min_interval=0.25, burst=4, daily_limit=None)"
+
+
+def test_token_bucket_per_call_interval():
+    """Verifies that the interval used with `rate()` replenishes tokens without modifying `min_interval`."""
+    limiter = TokenBucketRateLimiter(5, burst=2)
+    with patch("scholar_flux.api.rate_limiting.rate_limiter.time.sleep") as mock_sleep:
+        for _ in range(3):
+            with limiter.rate(0.1):
+                pass
+        assert mock_sleep.call_count == 1 and mock_sleep.call_args[0][0] <= 0.1
+    assert limiter.min_interval == 5
+
+
+def test_sliding_window():
+    """Verifies that the sliding window allows up to `max_requests` calls within each window."""
+    limiter = SlidingWindowRateLimiter.from_rate(max_requests=3, period=0.3)
+    assert limiter.window == pytest.approx(0.3)
+
+    waits = sleep_times(limiter, 5)
+    assert len(waits) == 2
+    assert all(0.25 < wait <= 0.3 for wait in waits)
+
+    # once the window has passed, calls can proceed without waiting
+    time.sleep(0.35)
+    assert sleep_times(limiter, 1) == []
+
+
+@pytest.mark.parametrize(
+    "limiter",
+    (
+        DailyQuotaRateLimiter(0, daily_limit=3),
+        TokenBucketRateLimiter(0, burst=5, daily_limit=3),
+        SlidingWindowRateLimiter(0, max_requests=5, daily_limit=3),
+    ),
+)
+def test_daily_quota(limiter):
+    """Verifies that each limiter raises a RateLimitExceededException once the daily quota is exhausted."""
+    for _ in range(3):
+        limiter.wait()
+    assert limiter.remaining_quota == 0
+
+    with pytest.raises(RateLimitExceededException):
+        limiter.wait()
+
+    # the quota resets on the following (UTC) day
+    limiter._quota_date = limiter._quota_date.replace(year=2000)
+    assert limiter.remaining_quota == 3
+    limiter.wait()
+    assert limiter.remaining_quota == 2
+
+
+def test_sliding_window_default_interval():
+    """Verifies that the window is derived from the default interval when `min_interval` is not provided."""
+    limiter = SlidingWindowRateLimiter(max_requests=2)
+    assert limiter.window == 2 * SlidingWindowRateLimiter.DEFAULT_MIN_INTERVAL
+
+
+@pytest.mark.parametrize("limiter_type", (TokenBucketRateLimiter, SlidingWindowRateLimiter, AdaptiveRateLimiter))
+def test_strategies_share_reservation_base(limiter_type):
+    """Verifies that alternative strategies reuse the reservation base class rather than the daily quota limiter."""
+    limiter = limiter_type(1)
+    assert isinstance(limiter, ReservationRateLimiter)
+    assert not isinstance(limiter, DailyQuotaRateLimiter)
+
+
+@pytest.mark.parametrize("invalid_value", (0, -1, 1.5, "10", True))
+def test_invalid_limits(invalid_value):
+    """Verifies that burst sizes, window sizes, and quotas must be positive integers."""
+    with pytest.raises(APIParameterException):
+        TokenBucketRateLimiter(1, burst=invalid_value)
+    with pytest.raises(APIParameterException):
+        SlidingWindowRateLimiter(1, max_requests=invalid_value)
+    with pytest.raises(APIParameterException):
+        DailyQuotaRateLimiter(1, daily_limit=invalid_value)
+
+
+@pytest.mark.parametrize(
+    ("rate_limit", "threaded", "expected_type"),
+    (
+        (RateLimitConfig(), False, RateLimiter),
+        (RateLimitConfig(), True, ThreadedRateLimiter),
+        (RateLimitConfig(daily_limit=10), False, DailyQuotaRateLimiter),
+        (RateLimitConfig(strategy="token_bucket", burst=3), False, TokenBucketRateLimiter),
+        (RateLimitConfig(strategy="sliding_window", burst=3), True, SlidingWindowRateLimiter),
+    ),
+)
+def test_rate_limit_config(rate_limit, threaded, expected_type):
+    """Verifies that each strategy creates the expected rate limiter with the provided interval."""
+    limiter = rate_limit.create_rate_limiter(0.5, threaded=threaded)
+    assert type(limiter) is expected_type
+    assert limiter.min_interval == 0.5
+
+
+def test_registry_creates_strategy(burst_provider_config):
+    """Verifies that registries and the SearchAPI build the rate limiting strategy defined by the ProviderConfig."""
+    for threaded in (False, True):
+        registry = RateLimiterRegistry(threaded=threaded)
+        limiter = registry.get_or_create("burst_provider")
+        assert isinstance(limiter, TokenBucketRateLimiter)
+        assert limiter.min_interval == 0.1 and limiter.burst == 10 and limiter.daily_limit == 1000
+        assert registry.get_or_create("burst_provider") is limiter
+
+        registry = RateLimiterRegistry.from_defaults(threaded=threaded)
+        assert isinstance(registry["burst_provider"], TokenBucketRateLimiter)
+
+    api = SearchAPI(query="test", provider_name="burst_provider")
+    assert isinstance(api._rate_limiter, TokenBucketRateLimiter)
+    assert api.config.request_delay == 0.1
+
+    # the request delay of the SearchAPI overrides the request delay of the provider
+    delayed_api = SearchAPI(query="test", provider_name="burst_provider", request_delay=0.5)
+    assert isinstance(delayed_api._rate_limiter, TokenBucketRateLimiter) and delayed_api._rate_limiter.min_interval == 0.5
+    assert burst_provider_config.create_rate_limiter(min_interval=0.5).min_interval == 0.5
+
+    # unknown providers and explicit rate limiters are unaffected
+    assert type(RateLimiterRegistry().get_or_create("unknown_provider", 2)) is RateLimiter
+    assert type(SearchAPI(query="test", provider_name="plos")._rate_limiter) is RateLimiter
+
+
+def mock_response(status_code: int = 200, headers: Optional[dict] = None) -> requests.Response:
+    """Creates a response with the provided status code and headers to simulate feedback from a provider."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+def test_adaptive_aimd():
+    """Verifies that 429 responses multiplicatively tighten the interval while successes additively relax it."""
+    limiter = AdaptiveRateLimiter(2, lower_bound=0.5, upper_bound=5, decrease_step=0.5)
+
+    limiter.observe(mock_response(200))
+    limiter.observe(mock_response(200))
+    assert limiter.min_interval == 1
+
+    limiter.observe(mock_response(429))
+    assert limiter.min_interval == 2 and limiter.throttled_responses == 1
+
+    # the interval never exceeds the upper bound or falls below the lower bound
+    for _ in range(3):
+        limiter.observe(mock_response(429))
+    assert limiter.min_interval == 5
+
+    for _ in range(20):
+        limiter.observe(mock_response(200))
+    assert limiter.min_interval == 0.5
+
+    # server errors and missing responses do not change the interval
+    limiter.observe(mock_response(500))
+    limiter.observe(None)
+    assert limiter.min_interval == 0.5
+
+
+def test_adaptive_backoff_from_zero_interval():
+    """Verifies that 429 responses back off from a non-zero floor when the limiter starts without an interval."""
+    limiter = AdaptiveRateLimiter(0, lower_bound=0, upper_bound=5)
+    assert limiter.decrease_step == 0
+
+    limiter.observe(mock_response(429))
+    assert limiter.min_interval == pytest.approx(AdaptiveRateLimiter.DEFAULT_BACKOFF_STEP * limiter.increase_factor)
+
+    for _ in range(10):
+        limiter.observe(mock_response(429))
+    assert limiter.min_interval == 5
+
+
+def test_adaptive_rate_limit_headers():
+    """Verifies that `X-RateLimit-*` headers pace the remaining quota and pause calls once the quota is exhausted."""
+    limiter = AdaptiveRateLimiter(6.1, lower_bound=0, upper_bound=10)
+
+    headers = {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "10"}
+    limiter.observe(mock_response(200, headers))
+    assert limiter.min_interval == pytest.approx(0.2) and limiter.limit == 100
+
+    # epoch timestamps are converted into the number of seconds remaining until the reset
+    reset = time.time() + 20
+    limiter.observe(mock_response(200, {"ratelimit-remaining": "10", "ratelimit-reset": str(reset)}))
+    assert limiter.min_interval == pytest.approx(2, abs=0.05)
+
+    limiter.observe(mock_response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"}))
+    assert limiter._blocked_until is not None and limiter._blocked_until > time.time() + 2
+
+    waits = sleep_times(limiter, 1)
+    assert len(waits) == 1 and 2 < waits[0] <= 3
+
+
+def test_adaptive_retry_after():
+    """Verifies that a `Retry-After` header pauses subsequent calls regardless of the current interval."""
+    limiter = AdaptiveRateLimiter(0, lower_bound=0)
+    limiter.wait()
+    limiter.observe(mock_response(503, {"Retry-After": "2"}))
+
+    waits = sleep_times(limiter, 1)
+    assert len(waits) == 1 and 1.5 < waits[0] <= 2
+
+
+def test_adaptive_search_api():
+    """Verifies that the SearchAPI reports each response to an adaptive rate limiter and ignores the request delay."""
+    limiter = RateLimitConfig(strategy="adaptive", min_request_delay=0.1, max_request_delay=4).create_rate_limiter(1)
+    assert isinstance(limiter, AdaptiveRateLimiter)
+    assert limiter.lower_bound == 0.1 and limiter.upper_bound == 4
+
+    api = SearchAPI.update(SearchAPI(query="test", provider_name="plos"), rate_limiter=limiter)
+    assert api._rate_limiter is limiter
+    with requests_mock.Mocker() as m:
+        m.get(
+            api.prepare_search(page=1).url,
+            status_code=200,
+            headers={"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "1"},
+            json={},
+        )
+        with patch("scholar_flux.api.rate_limiting.rate_limiter.time.sleep") as mock_sleep:
+            api.search(page=1)
+            assert limiter.min_interval == pytest.approx(0.2)
+            api.search(page=1, request_delay=10)
+            # the adaptive interval is used in place of the provided request delay
+            assert mock_sleep.call_args[0][0] <= 0.2
+
+
+def test_adaptive_search_api_rate_limiter_override():
+    """Verifies that a per-request rate limiter override, rather than the SearchAPI rate limiter, adapts to responses."""
+    api_limiter = AdaptiveRateLimiter(0, lower_bound=0)
+    override_limiter = AdaptiveRateLimiter(0, lower_bound=0)
+    api = SearchAPI.update(SearchAPI(query="test", provider_name="plos"), rate_limiter=api_limiter)
+
+    with requests_mock.Mocker() as m:
+        m.get(api.base_url, status_code=429, json={})
+        with patch("scholar_flux.api.rate_limiting.rate_limiter.time.sleep"):
+            api.search(page=1, rate_limiter=override_limiter)
+            api.search(parameters={"q": "test"}, rate_limiter=override_limiter)
+
+    assert override_limiter.throttled_responses == 2 and override_limiter.min_interval > 0
+    assert api_limiter.throttled_responses == 0 and api_limiter.min_interval == 0
@@ -1,6 +1,7 @@
 import pytest
 from scholar_flux.api import RateLimiter, ThreadedRateLimiter
 import time
+import threading
 
 from unittest.mock import patch
 from scholar_flux.exceptions import APIParameterException
@@ -130,3 +131,50 @@ def test_rate_limiter_representation():
     """Tests the RateLimiter __repr__ method to ensure that it returns a readable representation of the class."""
     assert repr(RateLimiter(min_interval=5)) == "RateLimiter(min_interval=5)"
     assert repr(ThreadedRateLimiter(min_interval=5)) == "ThreadedRateLimiter(min_interval=5)"
+
+
+def test_threaded_reservations_release_lock():
+    """Verifies that threads sleeping until their reserved slot do not hold the lock of the ThreadedRateLimiter.
+
+    While one thread waits for its slot, the lock should remain available to other threads, and concurrent calls should
+    still be spaced by at least `min_interval` seconds.
+
+    """
+    limiter = ThreadedRateLimiter(0.1)
+    timestamps: list[float] = []
+
+    def call():
+        """Waits for the next available slot and records when the call was allowed to proceed."""
+        limiter.wait()
+        timestamps.append(time.time())
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(0.05)
+    # the remaining threads are sleeping until their reserved slots, so the lock should be free
+    assert limiter._lock.acquire(timeout=0.01)
+    limiter._lock.release()
+
+    for thread in threads:
+        thread.join()
+
+    timestamps.sort()
+    assert all(b - a >= 0.09 for a, b in zip(timestamps, timestamps[1:]))
+    assert timestamps[-1] - timestamps[0] < 0.3 + 0.1
+
+
+@pytest.mark.parametrize("Limiter", (RateLimiter, ThreadedRateLimiter))
+def test_rate_does_not_modify_shared_interval(Limiter):
+    """Verifies that per-call intervals used with `rate()` are never assigned to the shared `min_interval`."""
+    limiter = Limiter(5)
+    with patch("scholar_flux.api.rate_limiting.rate_limiter.time.sleep") as mock_sleep:
+        with limiter.rate(0) as current_limiter:
+            assert current_limiter.min_interval == 5
+        with limiter.rate(2):
+            assert limiter.min_interval == 5
+        # the second call reserves a slot two seconds after the first
+        sleep_arg = mock_sleep.call_args[0][0]
+        assert 1.9 < sleep_arg <= 2
+    assert limiter.min_interval == 5
@@ -1,6 +1,6 @@
 from scholar_flux import ResponseCoordinator, DataCacheManager
 from scholar_flux.api import ResponseValidator
-from scholar_flux.data_storage import InMemoryStorage
+from scholar_flux.data_storage import InMemoryStorage, RedisStorage
 from scholar_flux.api.models import ErrorResponse, ReconstructedResponse
 from scholar_flux.exceptions import StorageCacheException, InvalidResponseException
 import pytest
@@ -39,7 +39,7 @@ def test_plos_handling(plos_page_1_response, monkeypatch, caplog):
     record_list = response_coordinator.handle_response_data(plos_page_1_response, cache_key="test_cache_key")
     assert isinstance(record_list, list) and all(isinstance(record, dict) for record in record_list)
 
-    monkeypatch.setattr(response_coordinator.cache_manager, "retrieve", lambda *args, **kwargs: None)
+    monkeypatch.setattr(response_coordinator.cache_manager, "get_if_present", lambda *args, **kwargs: (False, None))
 
     assert response_coordinator._from_cache(response=plos_page_1_response) is None
     assert response_coordinator._from_cache(response=plos_page_1_response, cache_key="test_cache_key") is None
@@ -57,6 +57,34 @@ def test_plos_handling(plos_page_1_response, monkeypatch, caplog):
     )
 
 
+def test_single_round_trip_cache_lookup(plos_page_1_response, monkeypatch):
+    """Verifies that retrieving a cached response from Redis requires only a single command per page lookup."""
+    fakeredis = pytest.importorskip("fakeredis")
+    storage = RedisStorage(namespace="single-round-trip-test")
+    storage.client = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+    response_coordinator = ResponseCoordinator.build(cache_manager=DataCacheManager(storage), cache_results=True)
+
+    processed_response = response_coordinator.handle_response(plos_page_1_response, cache_key="test_cache_key")
+    assert processed_response and storage.verify_cache("test_cache_key")
+
+    commands: list[str] = []
+    execute_command = storage.client.execute_command
+
+    def count_commands(*args, **kwargs):
+        """Records the name of each command sent to the fake Redis server."""
+        commands.append(args[0])
+        return execute_command(*args, **kwargs)
+
+    monkeypatch.setattr(storage.client, "execute_command", count_commands)
+    cached_response = response_coordinator._from_cache(cache_key="test_cache_key", response=plos_page_1_response)
+    assert cached_response is not None and cached_response.data == processed_response.data
+    assert commands == ["GET"]
+
+    commands.clear()
+    assert response_coordinator._from_cache(cache_key="missing_cache_key", response=plos_page_1_response) is None
+    assert commands == ["GET"]
+
+
 def test_error_handling(plos_page_1_response, monkeypatch):
     """Test whether errors in responses are handled as intended to aid the creation of an ErrorResponse when
     encountering errors at any point in the response handling process.
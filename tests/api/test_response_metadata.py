@@ -1,5 +1,5 @@
 import pytest
-from scholar_flux.api.models import ResponseMetadataMap
+from scholar_flux.api.models import ResponseMetadataMap, CursorMetadataMap
 from scholar_flux.utils import PathUtils
 from typing import Any, Optional
 from pydantic import ValidationError
@@ -153,3 +153,20 @@ def test_pages_remaining(page: int, total_query_hits: int, records_per_page: int
         )
         == expected_pages_remaining
     )
+
+
+def test_next_cursor_extraction(nested_metadata_dict: dict[str, Any]):
+    """Verifies that cursors are extracted as strings and recorded in processed metadata by the CursorMetadataMap."""
+    cursor_map = CursorMetadataMap(total_query_hits="statistics.Hits", next_cursor="meta.next_cursor")
+    metadata = nested_metadata_dict | {"meta": {"next_cursor": "IlsxMDAuMDE0Nl0i"}}
+
+    assert cursor_map.calculate_next_cursor(metadata) == "IlsxMDAuMDE0Nl0i"
+    assert cursor_map.process_metadata(metadata) == {
+        "total_query_hits": 27,
+        "records_per_page": None,
+        "next_cursor": "IlsxMDAuMDE0Nl0i",
+    }
+    # missing and empty cursors signal that no further pages are available
+    assert cursor_map.calculate_next_cursor(nested_metadata_dict | {"meta": {"next_cursor": None}}) is None
+    assert CursorMetadataMap(next_cursor="next-cursor").calculate_next_cursor({"next-cursor": ""}) is None
+    assert "next_cursor" not in ResponseMetadataMap(total_query_hits="statistics.Hits").process_metadata(metadata)
@@ -603,6 +603,24 @@ def test_processed_response_properties():
     assert api_response.error is None
 
 
+@pytest.mark.parametrize("deep", [False, True])
+def test_processed_response_model_copy(deep):
+    """Verifies that `model_copy` assigns updated stages to the copy without modifying the original response."""
+    processed_response = ProcessedResponse(
+        parsed_response={"docs": [{"id": 1}]}, extracted_records=[{"id": 1}], processed_records=[{"id": 1}]
+    )
+    copied_response = processed_response.model_copy(
+        update={"parsed_response": {"docs": []}, "normalized_records": [{"id": "1"}], "message": "copied"}, deep=deep
+    )
+
+    assert copied_response.parsed_response == {"docs": []} and copied_response.normalized_records == [{"id": "1"}]
+    assert copied_response.extracted_records == [{"id": 1}] and copied_response.message == "copied"
+    assert copied_response.model_dump()["parsed_response"] == {"docs": []}
+
+    assert processed_response.parsed_response == {"docs": [{"id": 1}]}
+    assert processed_response.normalized_records is None and processed_response.message is None
+
+
 def test_serialization(caplog):
     """Verifies that attempting to serialize an invalid response type logs an error and returns None."""
     response = {"url": "https://my-url.com"}
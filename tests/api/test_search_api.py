@@ -12,7 +12,14 @@ from math import ceil
 from time import time, sleep
 
 from scholar_flux.api.validators import validate_and_process_url, validate_url
-from scholar_flux.api import SearchAPI, APIParameterMap, SearchAPIConfig, APIParameterConfig, provider_registry
+from scholar_flux.api import (
+    SearchAPI,
+    APIParameterMap,
+    SearchAPIConfig,
+    APIParameterConfig,
+    ThreadedRateLimiter,
+    provider_registry,
+)
 from scholar_flux.security import SecretUtils
 from scholar_flux.utils import config_settings
 
@@ -903,6 +910,20 @@ def test_rate_limited_searches(monkeypatch, mock_successful_response):
     assert TOLERANCE * seconds_interval < minimum_request_delay
 
 
+def test_search_rate_limiter_override(monkeypatch, mock_successful_response):
+    """Verifies that a rate limiter passed to `search` throttles the current request without replacing the default."""
+    api = SearchAPI.from_defaults(provider_name="plos", query="test", request_delay=0.5)
+    default_rate_limiter = api._rate_limiter
+    override_rate_limiter = MagicMock(wraps=ThreadedRateLimiter(0))
+    monkeypatch.setattr(api.session, "send", lambda *args, **kwargs: mock_successful_response)
+
+    api.search(page=1, rate_limiter=override_rate_limiter)
+    api.search(parameters={"mock_parameter": True}, rate_limiter=override_rate_limiter)
+
+    assert override_rate_limiter.rate.call_count == 2
+    assert api._rate_limiter is default_rate_limiter and default_rate_limiter._last_call is None
+
+
 @pytest.mark.parametrize(
     "provider_name",
     [
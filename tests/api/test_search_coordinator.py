@@ -1,11 +1,14 @@
 import pytest
 from unittest.mock import MagicMock
 import re
+import threading
+import time
 import requests_mock
 
 from requests import Response
 from requests_cache import CachedResponse
-from scholar_flux.api import SearchAPI, BaseCoordinator, SearchCoordinator, ResponseCoordinator
+from scholar_flux.api import SearchAPI, BaseCoordinator, SearchCoordinator, ResponseCoordinator, APIParameterMap
+from scholar_flux.data_storage import DataCacheManager, RedisStorage
 import datetime
 from scholar_flux.api.workflows import BaseWorkflow, BaseWorkflowStep, SearchWorkflow, WorkflowStep, StepContext
 from scholar_flux.api.rate_limiting import threaded_rate_limiter_registry
@@ -808,3 +811,250 @@ def test_respect_retry_after_malformed(retry_after_value):
 
     # Assert _wait was not called
     assert not coordinator.api._rate_limiter._wait.called
+
+
+@pytest.fixture
+def pipelined_coordinator() -> SearchCoordinator:
+    """Creates a SearchCoordinator for a mock provider that returns three records per page without caching results."""
+    parameter_map = APIParameterMap(query="q", start="page", auto_calculate_page=False, records_per_page="pagesize")
+    api = SearchAPI(
+        query="pipelined retrieval",
+        base_url="https://example.pipelined.com",
+        provider_name="pipelined",
+        parameter_config=parameter_map,
+        request_delay=0.01,
+        records_per_page=3,
+    )
+    return SearchCoordinator(api, cache_results=False)
+
+
+def mock_pipelined_pages(mocker: requests_mock.Mocker, coordinator: SearchCoordinator, last_page: int, events: list):
+    """Registers pages of three records up to `last_page`, followed by short pages that signal the end of retrieval."""
+    for page in range(1, last_page + 3):
+        record_count = 3 if page <= last_page else 1
+
+        def respond(request, context, page=page, record_count=record_count):
+            """Records the request for the current page before returning its records."""
+            events.append(f"request {page}")
+            context.headers["Content-Type"] = "application/json"
+            return {"records": [{"id": f"{page}-{i}", "title": "Pipelines"} for i in range(record_count)]}
+
+        mocker.get(str(coordinator.api.prepare_search(page=page).url), json=respond)
+
+
+def test_iter_pages_prefetch(pipelined_coordinator):
+    """Verifies that prefetching requests the next page while the previous page is processed in the background.
+
+    Results should be yielded in page order, identical to serial retrieval, and the pages requested after a short page
+    should be discarded rather than yielded.
+
+    """
+    events: list[str] = []
+    handle_response = pipelined_coordinator.response_coordinator.handle_response
+
+    def slow_handle_response(response, cache_key, *args, **kwargs):
+        """Delays processing so that upcoming requests can be sent while the current page is processed."""
+        time.sleep(0.1)
+        processed_response = handle_response(response, cache_key, *args, **kwargs)
+        events.append(f"processed {cache_key.split('_')[-2]}")
+        return processed_response
+
+    with requests_mock.Mocker() as m:
+        mock_pipelined_pages(m, pipelined_coordinator, last_page=3, events=events)
+        serial_results = pipelined_coordinator.search_pages(pages=range(1, 7))
+        assert m.call_count == 4
+
+        events.clear()
+        m.reset_mock()
+        pipelined_coordinator.response_coordinator.handle_response = slow_handle_response  # type: ignore
+        pipelined_results = pipelined_coordinator.search_pages(pages=range(1, 7), prefetch=2)
+
+    assert [result.page for result in pipelined_results] == [result.page for result in serial_results] == [1, 2, 3, 4]
+    assert pipelined_results.join() == serial_results.join()
+    # the request for page 2 is sent before the processing of page 1 completes
+    assert events.index("request 2") < events.index("processed 1")
+    # at most `prefetch` pages are requested after the short page and none of them are yielded
+    assert 4 < m.call_count <= 6
+
+
+def test_iter_pages_prefetch_early_exit(pipelined_coordinator):
+    """Verifies that closing the pipelined generator early stops further requests and that prefetch is validated."""
+    events: list[str] = []
+    with requests_mock.Mocker() as m:
+        mock_pipelined_pages(m, pipelined_coordinator, last_page=10, events=events)
+        generator = pipelined_coordinator.iter_pages(pages=range(1, 11), prefetch=1)
+        first_result = next(generator)
+        generator.close()
+        call_count = m.call_count
+
+    assert first_result.page == 1 and isinstance(first_result.response_result, ProcessedResponse)
+    assert call_count <= 2
+
+    with pytest.raises(InvalidCoordinatorParameterException):
+        list(pipelined_coordinator.iter_pages(pages=[1], prefetch=-1))
+
+
+def test_search_pages_fan_out():
+    """Verifies that the page fan-out only requests pages that contain records based on the total hits of page 1.
+
+    Pages are processed concurrently while the rate limiter spaces each request, and results are returned in page order.
+
+    """
+    api = SearchAPI.from_defaults(provider_name="plos", query="fan out", records_per_page=3, request_delay=0.01)
+    coordinator = SearchCoordinator(api, cache_results=False)
+    rate_limiter = coordinator.api._rate_limiter
+    handle_response = coordinator.response_coordinator.handle_response
+    # the three remaining pages must be processed at the same time for every worker to pass the barrier
+    barrier = threading.Barrier(3, timeout=5)
+    rate_limiters_in_use: list = []
+
+    def concurrent_handle_response(*args, **kwargs):
+        """Waits for the remaining pages at a barrier, which only succeeds when pages are processed concurrently."""
+        rate_limiters_in_use.append(coordinator.api._rate_limiter)
+        if threading.current_thread() is not threading.main_thread():
+            barrier.wait()
+        return handle_response(*args, **kwargs)
+
+    with requests_mock.Mocker() as m:
+        for page in range(1, 6):
+            records = [{"id": f"{page}-{i}", "title_display": "Fan-out"} for i in range(3 if page < 4 else 1)]
+            m.get(
+                str(coordinator.api.prepare_search(page=page).url),
+                json={"response": {"numFound": 10, "start": 0, "docs": records}},
+                headers={"Content-Type": "application/json"},
+            )
+
+        coordinator.response_coordinator.handle_response = concurrent_handle_response  # type: ignore
+        results = coordinator.search_pages(pages=range(1, 10), fan_out=True, max_workers=4)
+
+        # only the four pages containing the 10 records are requested
+        assert m.call_count == 4
+
+    assert [result.page for result in results] == [1, 2, 3, 4]
+    assert len(results.join()) == 10
+    # page 1 is processed before the remaining pages, which pass the barrier only when processed concurrently
+    assert not barrier.broken
+    # the threaded rate limiter is passed to each request: the SearchAPI's rate limiter is never replaced
+    assert all(rate_limiter_in_use is rate_limiter for rate_limiter_in_use in rate_limiters_in_use)
+    assert coordinator.api._rate_limiter is rate_limiter and rate_limiter._last_call is not None
+
+    with pytest.raises(InvalidCoordinatorParameterException):
+        coordinator.search_pages(pages=[1, 2], fan_out=True, max_workers=0)
+
+
+def test_search_pages_fan_out_without_total_hits(pipelined_coordinator):
+    """Verifies that the remaining pages are retrieved in sequence when the total number of hits is unavailable."""
+    events: list[str] = []
+    with requests_mock.Mocker() as m:
+        mock_pipelined_pages(m, pipelined_coordinator, last_page=3, events=events)
+        results = pipelined_coordinator.search_pages(pages=range(1, 7), fan_out=True)
+
+    assert [result.page for result in results] == [1, 2, 3, 4]
+    assert events == ["request 1", "request 2", "request 3", "request 4"]
+
+
+def test_search_pages_by_cursor():
+    """Verifies that cursor pagination sends the cursor of each previous page instead of an offset.
+
+    Retrieval should start from the provider's initial cursor, record the cursor used for each page, and stop once
+    the total number of query hits has been retrieved.
+
+    """
+    api = SearchAPI.from_defaults(provider_name="crossref", query="cursors", records_per_page=3, request_delay=0.01)
+    coordinator = SearchCoordinator(api, cache_results=False)
+    next_cursors = {"*": "c2", "c2": "c3", "c3": "c4"}
+
+    def respond(request, context):
+        """Returns three records per page until the last cursor, followed by a short page."""
+        assert "offset" not in request.qs
+        cursor = request.qs["cursor"][0]
+        context.headers["Content-Type"] = "application/json"
+        return {
+            "status": "ok",
+            "message": {
+                "next-cursor": next_cursors.get(cursor, "c5"),
+                "total-results": 10,
+                "items-per-page": 3,
+                "items": [
+                    {"DOI": f"10.1/{cursor}-{i}", "title": ["Cursors"]} for i in range(3 if cursor != "c4" else 1)
+                ],
+            },
+        }
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=respond)
+        results = coordinator.search_pages(range(1, 10), use_cursor=True)
+
+    assert m.call_count == 4
+    assert [result.page for result in results] == [1, 2, 3, 4]
+    assert [result.cursor for result in results] == ["*", "c2", "c3", "c4"]
+    assert [result.next_cursor for result in results] == ["c2", "c3", "c4", "c5"]
+    assert len(results.filter().join()) == 10
+
+
+def test_cursor_page_cache_keys():
+    """Verifies that cursor pages are cached by their cursor so that resumed searches never reuse other pages."""
+    api = SearchAPI.from_defaults(provider_name="crossref", query="cursors", records_per_page=3, request_delay=0.01)
+    coordinator = SearchCoordinator(api, cache_results=True)
+
+    offset_key = coordinator._create_cache_key(page=1)
+    assert coordinator._create_cache_key(page=1, cursor="*").startswith(offset_key)
+    cursor_keys = {coordinator._create_cache_key(page=1, cursor="*"), coordinator._create_cache_key(page=1, cursor="c3")}
+    assert len(cursor_keys) == 2 and offset_key not in cursor_keys
+
+    def respond(request, context):
+        """Returns a full page of records labelled by the cursor of the request."""
+        cursor = request.qs["cursor"][0]
+        context.headers["Content-Type"] = "application/json"
+        items = [{"DOI": f"10.1/{cursor}-{i}", "title": ["Cursors"]} for i in range(3)]
+        return {"status": "ok", "message": {"next-cursor": f"{cursor}+", "total-results": 100, "items": items}}
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=respond)
+        coordinator.search_pages(range(1, 3), use_cursor=True)
+        resumed_results = coordinator.search_pages(range(1, 3), cursor="c3", from_request_cache=False)
+
+    # the first page of the resumed search is labelled page 1 but is requested and cached with its own cursor
+    assert m.call_count == 4
+    resumed_response = resumed_results[0].response_result
+    assert resumed_response is not None and resumed_response.cache_key == coordinator._create_cache_key(1, None, "c3")
+    assert resumed_response.data and resumed_response.data[0]["DOI"] == "10.1/c3-0"
+
+
+def test_iter_pages_by_cursor_validation(pipelined_coordinator):
+    """Verifies that cursor pagination raises an error when the provider does not support cursors."""
+    with pytest.raises(InvalidCoordinatorParameterException):
+        list(pipelined_coordinator.iter_pages(range(1, 3), use_cursor=True))
+
+    with pytest.raises(InvalidCoordinatorParameterException):
+        list(pipelined_coordinator.iter_pages(range(1, 3), cursor="*"))
+
+
+def test_search_pages_batched_cache_lookups(pipelined_coordinator, monkeypatch):
+    """Verifies that replaying cached pages looks up the processing cache for all pages with a single batched command."""
+    fakeredis = pytest.importorskip("fakeredis")
+    storage = RedisStorage(namespace="batched-lookup-test")
+    storage.client = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+    coordinator = SearchCoordinator(pipelined_coordinator.api, cache_manager=DataCacheManager(storage))
+
+    with requests_mock.Mocker() as m:
+        mock_pipelined_pages(m, coordinator, last_page=3, events=[])
+        results = coordinator.search_pages(pages=range(1, 5))
+        assert len(storage.retrieve_keys()) == 4
+
+        commands: list[str] = []
+        execute_command = storage.client.execute_command
+
+        def count_commands(*args, **kwargs):
+            """Records the name of each command sent to the fake Redis server."""
+            commands.append(args[0])
+            return execute_command(*args, **kwargs)
+
+        monkeypatch.setattr(storage.client, "execute_command", count_commands)
+        cached_results = coordinator.search_pages(pages=range(1, 5))
+
+    assert [result.page for result in cached_results] == [1, 2, 3, 4]
+    assert cached_results.join() == results.join()
+    assert commands == ["MGET"]
+    # unused prefetched lookups are discarded once the pages have been retrieved
+    assert not coordinator.response_coordinator.cache_manager._prefetched
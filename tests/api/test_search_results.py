@@ -4,6 +4,8 @@ from scholar_flux.api.models import (
     SearchResult,
     SearchResultList,
 )
+from scholar_flux.exceptions import PyArrowImportError
+import scholar_flux.utils.columnar as columnar
 from typing import Any
 import pytest
 
@@ -258,3 +260,32 @@ def test_search_result_selection():
         )
 
         assert len(filtered_search_result) == 1 and filtered_search_result[0] == search_result
+
+
+def test_search_list_columns(search_result_success, search_result_error, search_result_none, monkeypatch):
+    """Verifies that `SearchResultList.to_columns` holds the same records as `SearchResultList.join`."""
+    second_page = SearchResult(
+        provider_name="test-provider",
+        query="test-query",
+        page=2,
+        response_result=ProcessedResponse(processed_records=[{"record": 4, "doi": "10.1/4"}, {}]),
+    )
+    result_list = SearchResultList([search_result_success, search_result_error, second_page, search_result_none])
+
+    for include in (None, {"query", "page"}, set()):
+        joined_records = result_list.join(include=include)  # type: ignore
+        columns = result_list.to_columns(include=include)  # type: ignore
+        assert all(len(column) == len(joined_records) for column in columns.values())
+        assert [
+            {field: columns[field][i] for field in record} for i, record in enumerate(joined_records)
+        ] == joined_records
+
+    columns = result_list.to_columns()
+    assert list(columns) == ["record", "data", "doi", "provider_name", "page"]
+    assert columns["page"] == [1, 1, 1, 2] and columns["doi"] == [None, None, None, "10.1/4"]
+
+    assert SearchResultList().to_columns() == {"page": [], "provider_name": []}
+
+    monkeypatch.setattr(columnar, "pyarrow", None)
+    with pytest.raises(PyArrowImportError):
+        result_list.to_arrow()
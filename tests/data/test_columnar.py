@@ -0,0 +1,76 @@
+import pytest
+from scholar_flux.data import DataProcessor, NormalizingDataProcessor, PassThroughDataProcessor
+from scholar_flux.exceptions import PyArrowImportError
+from scholar_flux.utils import records_to_columns, columns_to_arrow
+import scholar_flux.utils.columnar as columnar
+
+
+RECORDS: list = [
+    {"id": 1, "title": "Columns", "school": {"department": "Mathematics"}},
+    {"id": 2, "authors": ["A. Author", "B. Author"]},
+    {"id": 3, "title": "Rows", "school": {"department": "History"}},
+]
+
+
+def test_records_to_columns():
+    """Verifies that records are converted into equal-length columns ordered by the first appearance of each field."""
+    columns = records_to_columns([{"id": 1, "title": "A"}, {"id": 2, "doi": "10.1/2"}, {}])
+    assert columns == {"id": [1, 2, None], "title": ["A", None, None], "doi": [None, "10.1/2", None]}
+    assert list(columns) == ["id", "title", "doi"]
+
+    assert records_to_columns([{"id": 1, "title": "A"}], fields=["title", "year"]) == {"title": ["A"], "year": [None]}
+    assert records_to_columns([]) == {}
+
+
+def test_process_columns():
+    """Verifies that processors return columns matching the processed records of each page."""
+    processor = DataProcessor(record_keys=["id", "title", "school.department", "authors"], value_delimiter=None)
+    processed_records = processor.process_page(RECORDS)
+    columns = processor.process_columns(RECORDS)
+    assert isinstance(columns, dict)
+    assert columns == records_to_columns(processed_records)
+    assert columns["school.department"] == ["Mathematics", None, "History"]
+
+    # processors with known record keys produce the same columns when pages are empty
+    assert processor.process_columns([]) == {key: [] for key in processor.record_keys}
+
+    # processors without record keys infer the columns from the fields of the processed records
+    pass_through_columns = PassThroughDataProcessor().process_columns(RECORDS)
+    assert list(pass_through_columns) == ["id", "title", "school", "authors"]
+    assert pass_through_columns["authors"] == [None, ["A. Author", "B. Author"], None]
+
+
+@pytest.mark.parametrize("processor_type", [DataProcessor, NormalizingDataProcessor])
+@pytest.mark.parametrize("value_delimiter", [None, "; "])
+def test_process_columns_match_processed_records(processor_type, value_delimiter):
+    """Verifies that columns filled while records are processed match the transposed records of `process_page`."""
+    processor = processor_type(
+        record_keys=["id", "title", "school.department", "authors"], value_delimiter=value_delimiter
+    )
+    for kwargs in ({}, {"keep_keys": ["title"]}, {"ignore_keys": ["authors"]}):
+        expected = records_to_columns(processor.process_page(RECORDS, **kwargs), fields=processor.record_keys)
+        assert processor.process_columns(RECORDS, **kwargs) == expected
+
+    assert processor.process_columns(RECORDS, keep_keys=["title"])["id"] == [1, 3]
+
+
+def test_missing_pyarrow(monkeypatch):
+    """Verifies that a PyArrowImportError is raised when Arrow tables are requested without pyarrow."""
+    monkeypatch.setattr(columnar, "pyarrow", None)
+    with pytest.raises(PyArrowImportError):
+        columns_to_arrow({"id": [1, 2]})
+
+    with pytest.raises(PyArrowImportError):
+        DataProcessor(record_keys=["id"]).process_columns(RECORDS, arrow=True)
+
+
+def test_process_columns_arrow():
+    """Verifies that columns are converted into an Arrow table, converting columns of mixed types into strings."""
+    pyarrow = pytest.importorskip("pyarrow")
+    processor = DataProcessor(record_keys=["id", "title", "authors"], value_delimiter=None)
+    table = processor.process_columns(RECORDS, arrow=True)
+    assert isinstance(table, pyarrow.Table) and table.column_names == ["id", "title", "authors"]
+    assert table.num_rows == len(RECORDS) and table.column("id").to_pylist() == [1, 2, 3]
+
+    mixed_table = columns_to_arrow({"value": [1, "one", None]})
+    assert mixed_table.column("value").to_pylist() == ["1", "one", None]
@@ -0,0 +1,72 @@
+import pytest
+from types import MappingProxyType
+from scholar_flux.data import DataProcessor, ExtractionPlan, NormalizingDataProcessor
+
+
+RECORD_KEYS: dict = {
+    "id": ["id"],
+    "title": ["title"],
+    "department": ["school", "department"],
+    "organization": ["school", "organization"],
+    "first_author": ["authors", 0, "name"],
+    "affiliation": ["authors", "affiliation", "name"],
+    "issn": ["journal", "issn"],
+    "deeply_nested": ["a", "b", "c", "d"],
+    "missing": ["not", "found"],
+}
+
+RECORDS: list = [
+    {"id": 1, "title": "Nested", "school": {"department": "Mathematics", "organization": ["NYU", "CUNY"]}},
+    # single-element lists of dictionaries are unwrapped before segments that are not list indices
+    {"id": 2, "authors": [{"name": "A. Author", "affiliation": [{"name": "GSU"}]}], "journal": [{"issn": "1234"}]},
+    # flattened keys take precedence over nested paths
+    {"id": 3, "school.department": "History", "school": {"department": "Ignored"}, "authors.0.name": None},
+    # intermediate values that are not dictionaries or lists
+    {"id": None, "school": "Not a dictionary", "authors": [], "a": {"b": [{"c": {"d": []}}]}},
+    {"id": [], "school": {}, "authors": [{"name": "B. Author"}, {"name": "C. Author"}], "journal": [{}, {}]},
+    {"a": MappingProxyType({"b": {"c": {"d": "read-only mapping"}}})},
+    {},
+    [],
+    None,
+]
+
+
+@pytest.mark.parametrize("record", RECORDS)
+def test_extraction_plan_matches_extract_key(record):
+    """Verifies that a single walk with the compiled plan extracts the same values as extracting each key separately."""
+    plan = ExtractionPlan(RECORD_KEYS)
+    expected = {key: DataProcessor.extract_key(record, path[-1], path[:-1]) for key, path in RECORD_KEYS.items()}
+    extracted = plan(record)
+    assert extracted == expected and list(extracted) == list(RECORD_KEYS)
+
+
+def test_processor_compiles_plan_once():
+    """Verifies that processors reuse the compiled plan and recompile it when the record keys change."""
+    processor = DataProcessor(record_keys=RECORD_KEYS)
+    fingerprint = repr(processor)
+
+    processed_records = processor.process_page(RECORDS[:5])
+    plan = processor.extraction_plan
+    assert processor.process_page(RECORDS[:5]) == processed_records and processor.extraction_plan is plan
+    assert processed_records[0]["organization"] == "NYU; CUNY" and processed_records[2]["department"] == "History"
+
+    # the compiled plan does not alter the representation used to fingerprint processing configurations
+    assert repr(processor) == fingerprint
+
+    processor.record_keys["id"] = ["title"]
+    assert processor.extraction_plan is not plan and processor.process_record(RECORDS[0])["id"] == "Nested"
+
+    processor.update_record_keys(["school.department"])
+    assert processor.process_record(RECORDS[0]) == {"school.department": "Mathematics"}
+
+
+def test_normalizing_processor_reuses_plan():
+    """Verifies that the NormalizingDataProcessor uses the flattened keys compiled within the extraction plan."""
+    processor = NormalizingDataProcessor(record_keys={"first_author": ["authors", 0, "name"], "id": ["id"]})
+    plan = processor.extraction_plan
+    assert plan.flat_keys == {
+        key: NormalizingDataProcessor._as_normalized_key(path) for key, path in processor.record_keys.items()
+    }
+
+    result = processor.process_page([{"id": 1, "authors": [{"name": "A. Author"}]}])
+    assert result == [{"first_author": "A. Author", "id": 1}] and processor.extraction_plan is plan
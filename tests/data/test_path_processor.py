@@ -28,3 +28,20 @@ def test_path_data_processor(sample_json):
 
     records_removed = processor.process_page(ignore_keys=["name"])
     assert records_kept != records_removed
+
+
+def test_path_data_processor_prunes_filtered_records():
+    """Verifies that records dropped by `keep_keys` and `ignore_keys` are pruned during the discovery of a new page
+    while the processed records match the records filtered after loading the full page."""
+    records = [
+        {"id": index, "authors": [{"name": f"Author {index}"}], **({"retracted": True} if index % 2 else {})}
+        for index in range(6)
+    ] + [{"id": 6, "title": "No authors"}]
+
+    processor = PathDataProcessor(ignore_keys=["retracted"], keep_keys=["authors"])
+    processed_records = processor.process_page(records)
+    assert [record["id"] for record in processed_records] == ["0", "2", "4"]
+    assert not any(key.startswith(("1.", "6.")) for key in processor.discover_keys() or {})
+
+    unpruned_processor = PathDataProcessor(records)
+    assert unpruned_processor.process_page(ignore_keys=["retracted"], keep_keys=["authors"]) == processed_records
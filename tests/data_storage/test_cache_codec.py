@@ -0,0 +1,120 @@
+import pytest
+from unittest.mock import patch
+
+from scholar_flux.data_storage import CacheCodec, RedisStorage, SQLAlchemyStorage
+from scholar_flux.exceptions import CacheCodecException, OptionalDependencyImportError
+from scholar_flux.utils import JsonDataEncoder
+
+# the optional packages required by each serializer and compression
+OPTIONAL_PACKAGES = {"orjson": "orjson", "msgpack": "msgpack", "zstd": "zstandard"}
+
+
+@pytest.fixture
+def cached_page() -> dict:
+    """Mocks a large processed response containing raw XML content and repetitive processed records."""
+    return {
+        "content": b"<article><title>Genomics</title></article>" * 500,
+        "processed_records": [{"title": "Genomics", "abstract": "A study of genes " * 20, "id": i} for i in range(50)],
+        "metadata": {"numFound": 50, "start": 0},
+    }
+
+
+@pytest.mark.parametrize(
+    ("serializer", "compression"),
+    [("json", None), ("json", "zlib"), ("json", "lzma"), ("orjson", "zlib"), ("msgpack", "zlib"), ("msgpack", "zstd")],
+)
+def test_codec_round_trip(serializer, compression, cached_page):
+    """Verifies that each serializer and compression produces payloads that decode into the original data."""
+    for option in (serializer, compression):
+        if option in OPTIONAL_PACKAGES:
+            pytest.importorskip(OPTIONAL_PACKAGES[option])
+
+    codec = CacheCodec(serializer=serializer, compression=compression)
+    payload = codec.encode(cached_page)
+    assert CacheCodec.decode(payload) == cached_page
+
+    if isinstance(payload, bytes):
+        assert CacheCodec.parse_header(payload) == (CacheCodec.VERSION, serializer, compression or "none")
+        assert len(payload) < len(JsonDataEncoder.serialize(cached_page)) / 4
+    else:
+        # plain JSON codecs write the same JSON strings as previous versions
+        assert payload == JsonDataEncoder.serialize(cached_page)
+
+
+def test_codec_compression_threshold():
+    """Verifies that payloads smaller than `min_compress_size` are written without compression."""
+    codec = CacheCodec(compression="zlib", min_compress_size=1024)
+    small_payload = codec.encode({"page": 1})
+    assert isinstance(small_payload, bytes)
+    assert CacheCodec.parse_header(small_payload)[2] == "none"
+    assert CacheCodec.decode(small_payload) == {"page": 1}
+    assert CacheCodec.decode(bytearray(small_payload)) == {"page": 1}
+
+
+def test_codec_legacy_and_invalid_payloads():
+    """Verifies that plain JSON payloads remain readable and that unsupported payloads and options raise errors."""
+    legacy_payload = JsonDataEncoder.serialize({"content": b"bytes", "page": 1})
+    assert CacheCodec.decode(legacy_payload) == {"content": b"bytes", "page": 1}
+    assert CacheCodec.decode(legacy_payload.encode()) == {"content": b"bytes", "page": 1}
+
+    payload = CacheCodec(compression="zlib", min_compress_size=0).encode({"page": 1})
+    assert isinstance(payload, bytes)
+    header_length = len(CacheCodec.MAGIC)
+
+    future_payload = CacheCodec.MAGIC + bytes([CacheCodec.VERSION + 1]) + payload[header_length + 1 :]
+    with pytest.raises(CacheCodecException, match="version"):
+        CacheCodec.decode(future_payload)
+
+    with pytest.raises(CacheCodecException, match="unknown serializer"):
+        CacheCodec.decode(CacheCodec.MAGIC + bytes([CacheCodec.VERSION, 99, 0]) + b"{}")
+
+    with pytest.raises(CacheCodecException, match="Could not decode"):
+        CacheCodec.decode(payload[:-4])
+
+    with pytest.raises(CacheCodecException, match="Unknown compression"):
+        CacheCodec(compression="brotli")
+
+    with patch("scholar_flux.data_storage.cache_codec.msgpack", None), pytest.raises(OptionalDependencyImportError):
+        CacheCodec(serializer="msgpack")
+
+
+def test_redis_storage_codec(cached_page):
+    """Verifies that Redis stores compressed payloads and reads records written with other codecs."""
+    fakeredis = pytest.importorskip("fakeredis")
+    storage = RedisStorage(namespace="codec_test", codec=CacheCodec(compression="zlib"))
+    storage.client = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+
+    storage.update("page_1", cached_page)
+    assert storage.client.strlen("codec_test:page_1") < len(JsonDataEncoder.serialize(cached_page)) / 4
+    assert storage.retrieve("page_1") == cached_page
+
+    # records written with the plain JSON format remain readable after changing codecs
+    storage.client.set("codec_test:page_2", JsonDataEncoder.serialize({"page": 2}))
+    storage.update_many({"page_3": {"page": 3}})
+    assert storage.retrieve_many(["page_1", "page_2", "page_3"]) == {
+        "page_1": cached_page,
+        "page_2": {"page": 2},
+        "page_3": {"page": 3},
+    }
+    assert storage.clone().codec == storage.codec
+
+
+def test_sql_storage_codec(tmp_path, cached_page):
+    """Verifies that SQL storages write binary payloads and overwrite records written with other codecs."""
+    pytest.importorskip("sqlalchemy")
+    url = f"sqlite:///{tmp_path / 'codec_cache.sqlite'}"
+    json_storage = SQLAlchemyStorage(url, namespace="codec_test")
+    storage = SQLAlchemyStorage(url, namespace="codec_test", codec=CacheCodec(compression="zlib"))
+
+    json_storage.update("page_1", {"page": 1})
+    storage.update("page_2", cached_page)
+    storage.update_many({"page_3": {"page": 3}})
+    assert storage.retrieve_all() == {
+        "codec_test:page_1": {"page": 1},
+        "codec_test:page_2": cached_page,
+        "codec_test:page_3": {"page": 3},
+    }
+
+    # overwriting a binary record with the plain JSON format clears the previous payload
+    json_storage.update("page_2", {"page": 2})
+    assert storage.retrieve("page_2") == {"page": 2}
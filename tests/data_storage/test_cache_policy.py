@@ -0,0 +1,97 @@
+import pickle
+import pytest
+from copy import deepcopy
+from unittest.mock import patch
+from requests import Response
+
+from scholar_flux.api import ResponseCoordinator, ProcessedResponse
+from scholar_flux.data import DataParser, PassThroughDataProcessor
+from scholar_flux.data_storage import CachePolicy, DataCacheManager, InMemoryStorage
+from scholar_flux.exceptions import StorageCacheException
+
+
+@pytest.fixture
+def mock_response() -> Response:
+    """Creates a minimal JSON response for processing and caching."""
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"docs": [{"id": 1, "title": "Slim caching"}, {"id": 2, "title": "Lazy stages"}]}'
+    response.url = "https://api.example.com/search?q=slim"
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def test_cache_policy_configuration():
+    """Verifies the validation of cache policies and the omission of stages from cached pages."""
+    assert CachePolicy().stages == CachePolicy.STAGES and not CachePolicy().omitted_stages
+    assert CachePolicy.configure(["parsed_response"]).stages == ("parsed_response", "processed_records")
+    assert CachePolicy.configure("normalized_records") == CachePolicy(["processed_records", "normalized_records"])
+
+    cache_policy = CachePolicy.records_only()
+    assert CachePolicy.configure(cache_policy) is cache_policy and cache_policy.persists("normalized_records")
+
+    cache_record: dict = {"raw_response": b"{}", "parsed_response": {}, "processed_records": [], "normalized_records": None}
+    slim_record = cache_policy.apply(cache_record)
+    assert slim_record == {
+        "processed_records": [],
+        "normalized_records": None,
+        "omitted_stages": ["raw_response", "parsed_response"],
+    }
+    assert CachePolicy.omitted(slim_record) == ("raw_response", "parsed_response") and CachePolicy.omitted(None) == ()
+
+    with pytest.raises(StorageCacheException):
+        CachePolicy(["processed_response"])
+
+    with pytest.raises(StorageCacheException):
+        DataCacheManager(cache_policy=1)  # type: ignore
+
+
+def test_cache_policy_lazy_stages(mock_response):
+    """Verifies that omitted stages are only recomputed from the cached response when first accessed."""
+    storage = InMemoryStorage()
+    cache_manager = DataCacheManager(storage, cache_policy=CachePolicy.records_only())
+    response_coordinator = ResponseCoordinator.build(processor=PassThroughDataProcessor(), cache_manager=cache_manager)
+
+    processed_response = response_coordinator.handle_response(mock_response, cache_key="slim_page")
+    assert isinstance(processed_response, ProcessedResponse)
+
+    cached = storage.retrieve("slim_page") or {}
+    assert {"raw_response", "parsed_response", "extracted_records"}.isdisjoint(cached)
+    assert cached["omitted_stages"] == ["raw_response", "parsed_response", "extracted_records"]
+    assert cached["serialized_response"] and cached["processed_records"] == processed_response.processed_records
+
+    # the response is not parsed until an omitted stage is accessed, and is parsed once for all omitted stages
+    with patch.object(DataParser, "parse", wraps=response_coordinator.parser.parse) as parse:
+        cached_response = response_coordinator._from_cache(cache_key="slim_page")
+        assert cached_response is not None and cached_response.processed_records == processed_response.processed_records
+        assert cached_response.deferred_stages == {"parsed_response", "extracted_records"}
+        parse.assert_not_called()
+
+        assert cached_response.extracted_records == processed_response.extracted_records
+        assert cached_response.parsed_response == processed_response.parsed_response
+        assert parse.call_count == 1 and not cached_response.deferred_stages
+
+    # copies recompute deferred stages when accessed, while pickled responses recompute them beforehand
+    for copy_response in (deepcopy, lambda response: pickle.loads(pickle.dumps(response))):
+        rebuilt_response = response_coordinator._from_cache(cache_key="slim_page")
+        assert rebuilt_response is not None and rebuilt_response.deferred_stages
+        assert copy_response(rebuilt_response).extracted_records == processed_response.extracted_records
+
+    rebuilt_response = response_coordinator._from_cache(cache_key="slim_page")
+    assert rebuilt_response is not None and rebuilt_response.model_dump()["parsed_response"]
+
+    assert "cache_policy" in repr(cache_manager) and "cache_policy" not in repr(DataCacheManager())
+    assert cache_manager.clone().cache_policy == cache_manager.cache_policy
+
+
+def test_deferred_stages_without_response():
+    """Verifies that deferred stages remain unavailable when the response cannot be reconstructed."""
+    response_coordinator = ResponseCoordinator.build()
+    recomputed = response_coordinator._recompute_stages(None, ["parsed_response"])
+    assert recomputed == {}
+
+    processed_response = ProcessedResponse(processed_records=[{"id": 1}], parsed_response={"assigned": True})
+    processed_response.defer_stages(["parsed_response", "processed_records"], lambda: {"parsed_response": {}})
+    assert processed_response.deferred_stages == {"parsed_response"}
+    # stages assigned after they were deferred are left unchanged
+    assert processed_response.parsed_response == {"assigned": True} and not processed_response.deferred_stages
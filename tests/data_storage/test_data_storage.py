@@ -2,9 +2,11 @@ import pytest
 from scholar_flux.data_storage import DataCacheManager
 from scholar_flux.data_storage.in_memory_storage import InMemoryStorage
 from scholar_flux.data_storage.null_storage import NullStorage
+from scholar_flux.exceptions import StorageCacheException
 from datetime import datetime, timezone
 from time import sleep
 import re
+import threading
 
 
 @pytest.mark.parametrize(
@@ -57,6 +59,10 @@ def test_basic_cache_manager_operations(
     assert retrieved["parsed_response"] == mock_cache_storage_data["parsed_response"]
     assert retrieved["processed_records"] == mock_cache_storage_data["processed_records"]
 
+    # Test fused existence checks and retrieval
+    assert storage.get_if_present(cache_key) == (True, retrieved)
+    assert storage.get_if_present("nonexistent_key") == (False, None)
+
     # Test delete
     storage.delete(cache_key)
     assert storage.verify_cache(cache_key) is False
@@ -99,6 +105,7 @@ def test_null_storage_behavior(mock_response, null_test_storage):
 
     # Retrieve should still return None
     assert null_test_storage.retrieve(cache_key) is None
+    assert null_test_storage.get_if_present(cache_key) == (False, None)
 
 
 @pytest.mark.parametrize(
@@ -172,6 +179,36 @@ def test_cache_retrieval_with_none_data(request, mock_response, storage_type, db
     assert retrieved["processed_records"] == {}
 
 
+@pytest.mark.parametrize(
+    "storage_type",
+    [
+        "redis_test_storage",
+        "mongo_test_storage",
+        "sqlite_nm_test_storage",
+        "in_memory_nm_test_storage",
+        "null_test_storage",
+    ],
+)
+def test_batched_cache_operations(request, storage_type, db_dependency_unavailable):
+    """Verifies that records can be updated, retrieved, and deleted in batches with each storage backend."""
+    dependency_name = storage_type.split("_")[0] if not storage_type.startswith("sql") else "sqlalchemy"
+    if db_dependency_unavailable(dependency_name):
+        pytest.skip()
+
+    storage = request.getfixturevalue(storage_type)
+    storage.delete_all()
+    records = {f"batched_page_{page}": {"page": page, "processed_records": [{"id": page}]} for page in range(1, 4)}
+
+    storage.update_many(records)
+    storage.update_many({"batched_page_1": {"page": 1, "processed_records": []}})
+    expected = records | {"batched_page_1": {"page": 1, "processed_records": []}} if storage else {}
+    assert storage.retrieve_many([*records, "batched_page_1", "missing_page"]) == expected
+
+    storage.delete_many(["batched_page_1", "batched_page_2", "missing_page"])
+    assert storage.retrieve_many(records) == ({"batched_page_3": records["batched_page_3"]} if storage else {})
+    storage.delete_all()
+
+
 def test_redis_expiration(redis_test_storage):
     """Verifies that cached Redis records successfully remove expired records after a certain interval of time."""
     key = "some_temp_key"
@@ -214,10 +251,119 @@ def test__memory_storage_initialization(caplog):
     namespace = "mem"
     memory_storage = InMemoryStorage(namespace=namespace, ttl=1000, raise_on_error=True)  # type:ignore
     assert memory_storage.namespace == namespace
-    assert not memory_storage.ttl and not memory_storage.raise_on_error
+    assert memory_storage.ttl == 1000 and not memory_storage.raise_on_error
 
     assert "The parameter, `raise_on_error` is not enforced in InMemoryStorage. Skipping." in caplog.text
-    assert "The parameter, `ttl` is not enforced in InMemoryStorage. Skipping." in caplog.text
+
+
+def test_bounded_memory_storage_lru_eviction():
+    """Verifies that the least recently used entries are evicted once `max_entries` is exceeded."""
+    memory_storage = InMemoryStorage(namespace="lru", max_entries=2)
+    memory_storage.update("page_1", {"records": [1]})
+    memory_storage.update("page_2", {"records": [2]})
+    assert memory_storage.retrieve("page_1") == {"records": [1]}  # page_1 is now the most recently used entry
+
+    memory_storage.update("page_3", {"records": [3]})
+    assert memory_storage.retrieve_keys() == ["lru:page_1", "lru:page_3"]
+    assert memory_storage.retrieve("page_2") is None
+    assert memory_storage.statistics == dict(hits=1, misses=1, evictions=1, expirations=0, entries=2, bytes=0)
+    assert "max_entries=2" in repr(memory_storage) and "eviction_policy='lru'" in repr(memory_storage)
+
+
+def test_bounded_memory_storage_lfu_eviction():
+    """Verifies that the least frequently used entries are evicted first, using recency to break ties."""
+    memory_storage = InMemoryStorage(max_entries=3, eviction_policy="lfu")
+    for page in range(1, 4):
+        memory_storage.update(f"page_{page}", page)
+
+    for _ in range(3):
+        memory_storage.retrieve("page_1")
+    memory_storage.retrieve("page_2")
+    memory_storage.retrieve("page_3")
+
+    memory_storage.update("page_4", 4)  # page_2 and page_3 are tied, but page_2 was used less recently
+    assert sorted(memory_storage.retrieve_keys() or []) == ["page_1", "page_3", "page_4"]
+
+    memory_storage.update("page_5", 5)  # page_4 is the least frequently used entry
+    assert sorted(memory_storage.retrieve_keys() or []) == ["page_1", "page_3", "page_5"]
+    assert memory_storage.statistics["evictions"] == 2
+
+
+def test_bounded_memory_storage_max_bytes(caplog):
+    """Verifies that entries are evicted once the estimated size of all entries exceeds `max_bytes`."""
+    entry = {"records": ["x" * 400]}
+    entry_size = InMemoryStorage._estimate_size(entry)
+    memory_storage = InMemoryStorage(max_bytes=entry_size * 2)
+
+    for page in range(1, 4):
+        memory_storage.update(f"page_{page}", entry)
+    assert memory_storage.retrieve_keys() == ["page_2", "page_3"]
+    assert memory_storage.statistics["bytes"] == entry_size * 2
+
+    memory_storage.update("oversized_page", {"records": ["x" * entry_size * 3]})
+    assert not memory_storage.verify_cache("oversized_page")
+    assert "exceeds the max_bytes limit of the in-memory cache" in caplog.text
+
+    memory_storage.delete("page_2")
+    assert memory_storage.statistics["bytes"] == entry_size
+
+
+def test_memory_storage_ttl_expiration(monkeypatch):
+    """Verifies that entries expire lazily on access and periodically on writes once the TTL has elapsed."""
+    current_time = [1000.0]
+    monkeypatch.setattr("scholar_flux.data_storage.in_memory_storage.time.monotonic", lambda: current_time[0])
+
+    cache_manager = DataCacheManager.with_storage("memory", ttl=10, cleanup_interval=30)
+    memory_storage = cache_manager.cache_storage
+    assert isinstance(memory_storage, InMemoryStorage) and memory_storage.ttl == 10
+
+    memory_storage.update("page_1", 1)
+    memory_storage.update("page_2", 2)
+    current_time[0] += 5
+    assert memory_storage.retrieve("page_1") == 1
+
+    current_time[0] += 6  # both entries have now expired
+    assert memory_storage.retrieve("page_1") is None  # lazily expired on access
+    assert memory_storage.statistics["expirations"] == 1 and "page_2" in memory_storage.memory_cache
+
+    current_time[0] += 30  # the cleanup interval has elapsed, so the next write removes all expired entries
+    memory_storage.update("page_3", 3)
+    assert list(memory_storage.memory_cache) == ["page_3"]
+    assert memory_storage.statistics["expirations"] == 2
+
+    current_time[0] += 11
+    assert memory_storage.retrieve_all() == {}
+    assert memory_storage.purge_expired() == 0
+
+    with pytest.raises(StorageCacheException):
+        InMemoryStorage(ttl=-1)
+
+    with pytest.raises(StorageCacheException):
+        InMemoryStorage(max_entries=10, eviction_policy="fifo")  # type: ignore
+
+
+def test_bounded_memory_storage_threads():
+    """Verifies that concurrent writes and reads never exceed the limits of a bounded storage."""
+    memory_storage = InMemoryStorage(max_entries=25, eviction_policy="lfu")
+    clone = memory_storage.clone()
+    assert clone.max_entries == 25 and clone.eviction_policy == "lfu"
+
+    def write_pages(offset: int):
+        """Writes and reads pages from a separate thread."""
+        for page in range(100):
+            memory_storage.update(f"page_{offset}_{page}", page)
+            memory_storage.retrieve(f"page_{offset}_{page // 2}")
+
+    threads = [threading.Thread(target=write_pages, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    statistics = memory_storage.statistics
+    assert statistics["entries"] == 25
+    assert statistics["evictions"] == 400 - 25
+    assert statistics["hits"] + statistics["misses"] == 400
 
 
 def test_memory_cache_deletion_edge_case(caplog):
@@ -60,7 +60,7 @@ def test_mongo_retrieve_keys_error(mongo_test_storage, monkeypatch, caplog):
     """Tests multi-key retrieval edge cases with MongoDB."""
     e = "DB error"
     msg = f"Error during attempted retrieval of all keys from namespace '{mongo_test_storage.namespace}"
-    monkeypatch.setattr(mongo_test_storage.collection, "distinct", raise_error(PyMongoError, e))
+    monkeypatch.setattr(mongo_test_storage.collection, "find", raise_error(PyMongoError, e))
     keys = mongo_test_storage.retrieve_keys()
     assert keys == []
     assert msg in caplog.text
@@ -0,0 +1,146 @@
+import pytest
+from unittest.mock import patch
+from requests import Response
+
+from scholar_flux.api import ResponseCoordinator
+from scholar_flux.data import PassThroughDataProcessor
+from scholar_flux.data_storage import (
+    DataCacheManager,
+    InMemoryStorage,
+    RecordStore,
+    SQLAlchemyStorage,
+    WriteBehindQueue,
+)
+from scholar_flux.exceptions import StorageCacheException
+
+
+def create_page(ids: list[int]) -> dict:
+    """Creates a parsed page and the records extracted and processed from the page."""
+    docs = [{"id": f"10.1371/journal.{i}", "title": f"Article {i}", "authors": ["A. Author"]} for i in ids]
+    parsed_response = {"response": {"numFound": 100, "docs": docs}}
+    processed_records = [dict(doc, authors="A. Author") for doc in docs]
+    return dict(parsed_response=parsed_response, extracted_records=docs, processed_records=processed_records)
+
+
+def test_record_store_round_trip():
+    """Verifies that pages reference each record by content hash and are restored to their original structure."""
+    store = RecordStore(InMemoryStorage())
+    page = create_page([1, 2]) | {"metadata": {"numFound": 100}}
+
+    entry = store.deduplicate(page)
+    assert entry[RecordStore.REFERENCES_FIELD] == ["extracted_records", "processed_records"]
+    assert entry["processed_records"] == [store.record_hash(record) for record in page["processed_records"]]
+    assert entry["parsed_response"] == {"response": {"numFound": 100, "docs": RecordStore.PARSED_RECORDS_MARKER}}
+
+    # the original page is left unchanged, and identical records are stored once
+    assert page["parsed_response"]["response"]["docs"] is page["extracted_records"]
+    assert len(store.storage.retrieve_keys() or []) == 4
+
+    resolved = store.resolve(entry)
+    assert resolved == page
+    assert resolved is not None and resolved["parsed_response"]["response"]["docs"] is resolved["extracted_records"]
+
+    # pages without records are stored as is, while pages with missing records cannot be resolved
+    assert store.deduplicate({"processed_records": []}) == {"processed_records": []}
+    store.storage.delete(f"{store.key_prefix}:{entry['processed_records'][0]}")
+    assert store.resolve(entry) is None
+    assert store.resolve_many({"page_1": entry, "page_2": {"metadata": {}}}) == {"page_2": {"metadata": {}}}
+
+    with pytest.raises(StorageCacheException):
+        DataCacheManager(record_store="yes")  # type: ignore
+
+
+def test_cache_manager_record_deduplication(tmp_path):
+    """Verifies that overlapping pages share records and are resolved with a single bulk lookup."""
+    pytest.importorskip("sqlalchemy")
+    storage = SQLAlchemyStorage(f"sqlite:///{tmp_path / 'records.sqlite'}", namespace="overlap")
+    cache_manager = DataCacheManager(storage, record_store=True)
+
+    response = Response()
+    response.status_code = 200
+    response._content = b"{}"
+
+    pages = {f"page_{page}": create_page(list(range(page, page + 10))) for page in range(5)}
+    for cache_key, page in pages.items():
+        cache_manager.update_cache(cache_key, response, **page)
+
+    # 14 distinct articles with an extracted and a processed form each are stored apart from the 5 pages
+    record_store = cache_manager.record_store
+    assert record_store is not None and record_store.storage.namespace == "records:overlap"
+    assert sorted(storage.retrieve_keys() or []) == [f"overlap:page_{page}" for page in range(5)]
+    assert len(dict(storage.iter_all())) == 5
+    assert len(record_store.storage.retrieve_keys() or []) == 14 * 2
+
+    is_cached, cached_page = cache_manager.get_if_present("page_3")
+    assert is_cached and cached_page is not None
+    assert {field: cached_page[field] for field in pages["page_3"]} == pages["page_3"]
+
+    records_storage = record_store.storage
+    with (
+        patch.object(storage, "retrieve_many", wraps=storage.retrieve_many) as retrieve_pages,
+        patch.object(records_storage, "retrieve_many", wraps=records_storage.retrieve_many) as retrieve_records,
+    ):
+        cached_pages = cache_manager.retrieve_many(list(pages))
+    assert retrieve_pages.call_count == 1 and retrieve_records.call_count == 1
+    assert all(cached_pages[key]["processed_records"] == page["processed_records"] for key, page in pages.items())
+
+    # pages referencing records that are no longer available are cache misses
+    record_store.storage.delete(f"record:{RecordStore.record_hash(pages['page_0']['processed_records'][0])}")
+    assert cache_manager.get_if_present("page_0") == (False, None)
+    assert cache_manager.retrieve("page_0") == {}
+    assert cache_manager.clone().record_store is not None
+
+    # records that are only referenced by deleted pages are removed when pruned
+    cache_manager.delete("page_0")
+    # only the extracted form of article 0 remains, as its processed form was deleted above
+    assert cache_manager.prune_records() == 1
+    assert cache_manager.prune_records() == 0
+    assert len(record_store.storage.retrieve_keys() or []) == 13 * 2
+
+
+def test_record_store_write_behind():
+    """Verifies that records are queued alongside cached pages and resolved before they are written."""
+    storage = InMemoryStorage(namespace="queued")
+    write_behind = WriteBehindQueue(storage, flush_interval=60)
+    cache_manager = DataCacheManager(storage, write_behind=write_behind, record_store=True)
+    record_store = cache_manager.record_store
+    assert record_store is not None and record_store.write_behind is not None
+    assert record_store.write_behind.storage is record_store.storage
+
+    response = Response()
+    response.status_code = 200
+    response._content = b"{}"
+    page = create_page([1, 2])
+    cache_manager.update_cache("page_1", response, **page)
+
+    # writing the page queues its records instead of writing them directly
+    with patch.object(record_store.storage, "update_many") as update_many:
+        assert cache_manager.write_behind is not None
+        cache_manager.write_behind.flush()
+        update_many.assert_not_called()
+    assert record_store.write_behind.statistics["pending"] == 4
+    assert (cache_manager.retrieve("page_1") or {})["processed_records"] == page["processed_records"]
+
+    cache_manager.flush()
+    assert record_store.write_behind.statistics["written"] == 4
+    assert len(record_store.storage.retrieve_keys() or []) == 4
+    cache_manager.close()
+
+
+def test_response_coordinator_record_store():
+    """Verifies that processed responses rebuilt from deduplicated pages contain their records."""
+    cache_manager = DataCacheManager(InMemoryStorage(), record_store=True)
+    response_coordinator = ResponseCoordinator.build(processor=PassThroughDataProcessor(), cache_manager=cache_manager)
+
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"docs": [{"id": 1, "title": "Deduplicated"}, {"id": 2, "title": "Records"}]}'
+    response.url = "https://api.example.com/search?q=records"
+    response.headers["Content-Type"] = "application/json"
+
+    processed_response = response_coordinator.handle_response(response, cache_key="records_page")
+    cached_response = response_coordinator._from_cache(response=response, cache_key="records_page")
+    assert cached_response is not None and processed_response.processed_records
+    assert cached_response.processed_records == processed_response.processed_records
+    assert cached_response.extracted_records == processed_response.extracted_records
+    assert cached_response.parsed_response == processed_response.parsed_response
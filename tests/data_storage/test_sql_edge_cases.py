@@ -1,7 +1,8 @@
 import pytest
 import re
 from unittest.mock import patch, MagicMock
-from scholar_flux.data_storage.sql_storage import SQLAlchemyStorage, SQLAlchemyImportError, exc
+from scholar_flux.data_storage import sql_storage
+from scholar_flux.data_storage.sql_storage import SQLAlchemyStorage, SQLAlchemyImportError, exc, sqlalchemy
 from tests.testing_utilities import raise_error
 from scholar_flux.exceptions import (
     CacheRetrievalException,
@@ -174,3 +175,110 @@ def test_sqlalchemy_server_unavailable(sqlite_test_storage, caplog):
 
     with patch("scholar_flux.data_storage.sql_storage.create_engine", raise_error(exc.SQLAlchemyError, msg)):
         assert not sqlite_test_storage.is_available()
+
+
+def test_sqlalchemy_namespace_filtering(tmp_path):
+    """Verifies that records are listed, streamed, and deleted by namespace without affecting other namespaces."""
+    url = f"sqlite:///{tmp_path / 'namespaced_cache.sqlite'}"
+    storage = SQLAlchemyStorage(url, namespace="plos")
+    other_storage = SQLAlchemyStorage(url, namespace="crossref")
+
+    storage.update_many({f"page_{page}": {"page": page} for page in range(5)})
+    other_storage.update("page_0", {"page": 0})
+
+    assert sorted(storage.retrieve_keys()) == sorted(f"plos:page_{page}" for page in range(5))
+    assert list(storage.iter_keys(batch_size=2)) == storage.retrieve_keys()
+    assert dict(storage.iter_all(batch_size=2)) == storage.retrieve_all()
+    assert other_storage.retrieve_all() == {"crossref:page_0": {"page": 0}}
+
+    with storage.Session() as session:
+        assert {record.namespace for record in session.query(sql_storage.CacheTable)} == {"plos", "crossref"}
+
+    storage.delete_all()
+    assert storage.retrieve_keys() == []
+    assert other_storage.retrieve_keys() == ["crossref:page_0"]
+
+
+def test_sqlalchemy_namespace_migration(tmp_path):
+    """Verifies that cache tables created without the namespace column are migrated and backfilled on initialization."""
+    url = f"sqlite:///{tmp_path / 'legacy_cache.sqlite'}"
+    engine = sqlalchemy.create_engine(url)
+    with engine.begin() as connection:
+        connection.execute(
+            sqlalchemy.text("CREATE TABLE cache (id INTEGER PRIMARY KEY, key VARCHAR UNIQUE NOT NULL, cache JSON)")
+        )
+        connection.execute(
+            sqlalchemy.text("INSERT INTO cache (key, cache) VALUES ('plos:page_1', '{\"page\": 1}'), ('page_2', '{}')")
+        )
+
+    storage = SQLAlchemyStorage(url, namespace="plos")
+    assert "namespace" in {column["name"] for column in sqlalchemy.inspect(storage.engine).get_columns("cache")}
+    assert storage.retrieve_keys() == ["plos:page_1"]
+    assert storage.retrieve_all() == {"plos:page_1": {"page": 1}}
+    assert sorted(SQLAlchemyStorage(url).retrieve_keys()) == ["page_2", "plos:page_1"]
+
+
+
+def test_sqlalchemy_concurrent_namespace_migration(tmp_path):
+    """Verifies that columns added by another process after the table is inspected are treated as migrated."""
+    url = f"sqlite:///{tmp_path / 'legacy_cache.sqlite'}"
+    engine = sqlalchemy.create_engine(url)
+    with engine.begin() as connection:
+        connection.execute(
+            sqlalchemy.text("CREATE TABLE cache (id INTEGER PRIMARY KEY, key VARCHAR UNIQUE NOT NULL, cache JSON)")
+        )
+        connection.execute(sqlalchemy.text("INSERT INTO cache (key, cache) VALUES ('plos:page_1', '{\"page\": 1}')"))
+        # another process adds the columns of the current schema after the table was first inspected
+        connection.execute(sqlalchemy.text("ALTER TABLE cache ADD COLUMN namespace VARCHAR"))
+        connection.execute(sqlalchemy.text("ALTER TABLE cache ADD COLUMN payload BLOB"))
+
+    table_columns = SQLAlchemyStorage._table_columns
+
+    def stale_table_columns(storage: SQLAlchemyStorage, table_name: str) -> set[str]:
+        """Reports the columns of the legacy table on the first inspection and the current columns afterward."""
+        return {"id", "key", "cache"} if mock_table_columns.call_count == 1 else table_columns(storage, table_name)
+
+    with patch.object(
+        SQLAlchemyStorage, "_table_columns", autospec=True, side_effect=stale_table_columns
+    ) as mock_table_columns:
+        storage = SQLAlchemyStorage(url, namespace="plos")
+
+    # the table is inspected once, then again after each failed attempt to add a column
+    assert mock_table_columns.call_count == 3
+    assert storage.retrieve_all() == {"plos:page_1": {"page": 1}}
+
+    with patch.object(SQLAlchemyStorage, "_table_columns", autospec=True, return_value={"id", "key", "cache"}):
+        with pytest.raises(exc.OperationalError):
+            SQLAlchemyStorage(url, namespace="plos")
+
+
+class CountingLock:
+    """Wraps a lock to count the number of times that the lock is acquired."""
+
+    def __init__(self, lock):
+        """Initializes the wrapper with the lock to count acquisitions of."""
+        self.lock = lock
+        self.acquisitions = 0
+
+    def __enter__(self):
+        """Acquires the wrapped lock."""
+        self.acquisitions += 1
+        return self.lock.__enter__()
+
+    def __exit__(self, *args):
+        """Releases the wrapped lock."""
+        return self.lock.__exit__(*args)
+
+
+def test_sqlalchemy_iteration_lock(sqlite_test_storage):
+    """Verifies that the lock is held while records are fetched but is released before each batch is yielded."""
+    sqlite_test_storage.update_many({f"page_{i}": {"page": i} for i in range(5)})
+    lock = sqlite_test_storage.lock = CountingLock(sqlite_test_storage.lock)
+
+    # the storage can be read while iterating without deadlocking
+    records = {key: sqlite_test_storage.retrieve(key) for key in sqlite_test_storage.iter_keys(batch_size=2)}
+    assert records == {f"page_{i}": {"page": i} for i in range(5)}
+
+    # the query and each of the four batches (including the final, empty batch) are fetched with the lock
+    assert lock.acquisitions == 5 + len(records)
+    assert dict(sqlite_test_storage.iter_all(batch_size=2)) == sqlite_test_storage.retrieve_all() == records
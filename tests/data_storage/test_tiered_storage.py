@@ -0,0 +1,115 @@
+import pytest
+import time
+from unittest.mock import patch
+from requests import Response
+
+from scholar_flux.api import ResponseCoordinator
+from scholar_flux.data import PassThroughDataProcessor
+from scholar_flux.data_storage import DataCacheManager, InMemoryStorage, RedisStorage, TieredStorage, WriteBehindQueue
+from scholar_flux.exceptions import StorageCacheException
+
+
+@pytest.fixture
+def redis_l2():
+    """Creates a RedisStorage backed by an in-process fake redis server."""
+    fakeredis = pytest.importorskip("fakeredis")
+    storage = RedisStorage(namespace="tiered_test")
+    storage.client = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+    return storage
+
+
+def test_tiered_read_through_write_through(redis_l2):
+    """Verifies that writes reach both tiers and that L1 hits do not contact the L2 storage."""
+    storage = TieredStorage(redis_l2, max_entries=2)
+    storage.update("page_1", {"page": 1})
+    assert redis_l2.retrieve("page_1") == {"page": 1}
+
+    with patch.object(redis_l2, "get_if_present") as l2_lookup, patch.object(redis_l2, "retrieve_many") as l2_batch:
+        assert storage.get_if_present("page_1") == (True, {"page": 1})
+        assert storage.retrieve_many(["page_1"]) == {"page_1": {"page": 1}}
+        assert storage.verify_cache("page_1")
+    l2_lookup.assert_not_called()
+    l2_batch.assert_not_called()
+
+    # records written by other processes are promoted into L1 on first retrieval
+    redis_l2.update_many({"page_2": {"page": 2}, "page_3": {"page": 3}})
+    assert storage.retrieve("page_2") == {"page": 2}
+    assert storage.retrieve_many(["page_1", "page_3", "page_4"]) == {"page_1": {"page": 1}, "page_3": {"page": 3}}
+    assert storage.l1.retrieve_keys() == ["tiered_test:page_1", "tiered_test:page_3"]
+    assert storage.get_if_present("page_4") == (False, None)
+
+    assert sorted(storage.retrieve_keys() or []) == ["tiered_test:page_1", "tiered_test:page_2", "tiered_test:page_3"]
+
+    storage.delete("page_1")
+    assert not storage.verify_cache("page_1") and not redis_l2.verify_cache("page_1")
+
+    # invalidated records are only discarded from L1
+    storage.invalidate("page_3")
+    assert not storage.l1.verify_cache("page_3") and storage.retrieve("page_3") == {"page": 3}
+
+    storage.delete_all()
+    assert storage.retrieve_all() == {} and storage.l1.retrieve_keys() == []
+
+
+def test_tiered_write_behind(redis_l2):
+    """Verifies that queued writes are visible before they are flushed and are not resurrected after deletion."""
+    write_behind = WriteBehindQueue(redis_l2, flush_interval=60)
+    storage = TieredStorage(redis_l2, l1=InMemoryStorage(max_entries=1), write_behind=write_behind)
+    storage.update_many({"page_1": {"page": 1}, "page_2": {"page": 2}})
+
+    # page_1 was evicted from L1 but remains readable from the write-behind queue
+    assert not redis_l2.verify_cache("page_1")
+    assert storage.get_if_present("page_1") == (True, {"page": 1})
+    assert storage.retrieve_many(["page_1", "page_2"]) == {"page_1": {"page": 1}, "page_2": {"page": 2}}
+
+    storage.delete("page_2")
+    storage.flush()
+    assert redis_l2.retrieve_all() == {"tiered_test:page_1": {"page": 1}}
+
+    # the background thread flushes queued writes after the flush interval
+    background_storage = TieredStorage(redis_l2, write_behind=WriteBehindQueue(redis_l2, flush_interval=0.01))
+    background_storage.update("page_3", {"page": 3})
+    for _ in range(100):
+        if redis_l2.verify_cache("page_3"):
+            break
+        time.sleep(0.01)
+    assert redis_l2.retrieve("page_3") == {"page": 3}
+
+    clone = storage.clone()
+    assert clone.write_behind is not None and clone.write_behind.storage is clone.l2 and clone.l1 is not storage.l1
+    assert "TieredStorage(" in repr(storage)
+
+
+def test_tiered_storage_configuration(redis_l2):
+    """Verifies the default L1 configuration, the DataCacheManager factory, and validation of the L2 storage."""
+    storage = TieredStorage(redis_l2, ttl=30)
+    assert storage.namespace == "tiered_test" and storage.l1.namespace == "tiered_test"
+    assert storage.l1.max_entries == TieredStorage.DEFAULT_L1_MAX_ENTRIES and storage.l1.ttl == 30
+
+    cache_manager = DataCacheManager.with_storage("tiered", redis_l2, max_entries=10)
+    assert isinstance(cache_manager.cache_storage, TieredStorage) and cache_manager.cache_storage.l1.max_entries == 10
+
+    with pytest.raises(StorageCacheException):
+        TieredStorage(storage)
+
+    with pytest.raises(StorageCacheException):
+        TieredStorage(redis_l2, write_behind=WriteBehindQueue(redis_l2.clone()))
+
+
+def test_tiered_schema_invalidation(redis_l2):
+    """Verifies that records cached with another schema fingerprint are discarded from L1 on retrieval."""
+    storage = TieredStorage(redis_l2)
+    cache_manager = DataCacheManager(storage)
+    response_coordinator = ResponseCoordinator.build(processor=PassThroughDataProcessor(), cache_manager=cache_manager)
+
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"docs": []}'
+    response.url = "https://api.example.com/search?q=tiered"
+
+    cache_manager.update_cache("tiered_key", response, processed_records=[], schema="outdated schema")
+    assert storage.l1.verify_cache("tiered_key")
+
+    assert response_coordinator._from_cache(response=response, cache_key="tiered_key") is None
+    assert not storage.l1.verify_cache("tiered_key")
+    assert redis_l2.verify_cache("tiered_key")
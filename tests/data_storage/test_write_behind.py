@@ -0,0 +1,207 @@
+import gc
+import pytest
+import threading
+import time
+import weakref
+from unittest.mock import patch
+from requests import Response
+
+from scholar_flux.api import ResponseCoordinator
+from scholar_flux.data import PassThroughDataProcessor
+from scholar_flux.data_storage import DataCacheManager, InMemoryStorage, SQLAlchemyStorage, WriteBehindQueue
+from scholar_flux.exceptions import StorageCacheException
+
+
+@pytest.fixture
+def mock_response() -> Response:
+    """Creates a minimal JSON response for processing and caching."""
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"docs": [{"id": 1, "title": "Write-behind caching"}]}'
+    response.url = "https://api.example.com/search?q=write-behind"
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    """Polls a condition until it is satisfied or the timeout elapses."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_write_behind_batches(tmp_path):
+    """Verifies that queued records are visible before they are written and are written in batches."""
+    pytest.importorskip("sqlalchemy")
+    storage = SQLAlchemyStorage(f"sqlite:///{tmp_path / 'write_behind.sqlite'}", namespace="queued")
+    queue = WriteBehindQueue(storage, batch_size=2, flush_interval=60)
+
+    calls = []
+
+    def compute_record() -> dict:
+        calls.append(1)
+        return {"page": 1}
+
+    # a single queued record is below the batch size and remains queued until the flush interval elapses
+    queue.put_deferred("page_1", compute_record)
+    assert "page_1" in queue and not storage.verify_cache("page_1")
+
+    # deferred records are computed once, when first looked up
+    assert queue.get_if_present("page_1") == (True, {"page": 1})
+    assert queue.retrieve_many(["page_1", "page_4"]) == {"page_1": {"page": 1}}
+
+    queue.put("page_2", {"page": 2})
+    queue.put("page_3", {"page": 3})
+
+    # full batches are written by the background thread without waiting for the flush interval
+    queue.flush()
+    assert calls == [1]
+    assert storage.retrieve_all() == {
+        "queued:page_1": {"page": 1},
+        "queued:page_2": {"page": 2},
+        "queued:page_3": {"page": 3},
+    }
+    assert queue.statistics == dict(queued=3, written=3, failed=0, batches=2, errors=0, pending=0)
+
+    # deletions discard queued records so that they are not written afterward
+    queue.put("page_1", {"page": 10})
+    queue.delete_many(["page_1"])
+    queue.flush()
+    assert not storage.verify_cache("page_1") and queue.get_if_present("page_1") == (False, None)
+
+
+def test_write_behind_errors_and_close():
+    """Verifies that failures are counted, that the background thread writes records, and that close flushes."""
+    storage = InMemoryStorage(namespace="queued")
+    queue = WriteBehindQueue(storage, flush_interval=60)
+
+    def fail():
+        raise ValueError("Could not compute the record")
+
+    queue.put_deferred("page_1", fail)
+    queue.put("page_2", {"page": 2})
+    with patch.object(storage, "update_many", side_effect=ConnectionError("Unavailable")):
+        queue.put("page_3", {"page": 3})
+        queue.flush()
+
+    assert queue.statistics == dict(queued=3, written=0, failed=3, batches=0, errors=2, pending=0)
+    assert isinstance(queue.last_error, ConnectionError)
+
+    # the background thread writes records once the flush interval elapses
+    background_queue = WriteBehindQueue(storage, max_queue_size=1, flush_interval=0.01)
+    for page in range(3):
+        background_queue.put(f"page_{page}", {"page": page})
+    assert wait_for(lambda: background_queue.statistics["written"] == 3)
+
+    # records are flushed when the queue is closed and are written directly afterward
+    queue.put("page_4", {"page": 4})
+    queue.close()
+    assert storage.retrieve("page_4") == {"page": 4}
+    queue.put("page_5", {"page": 5})
+    assert storage.retrieve("page_5") == {"page": 5} and queue._worker is None
+
+    with pytest.raises(StorageCacheException):
+        WriteBehindQueue(storage, batch_size=0)
+
+
+def test_write_behind_in_flight_lookup():
+    """Verifies that records remain visible to other threads while the batch containing them is being computed."""
+    storage = InMemoryStorage(namespace="queued")
+    queue = WriteBehindQueue(storage, flush_interval=60)
+    started, release = threading.Event(), threading.Event()
+
+    def compute_record() -> dict:
+        started.set()
+        release.wait(2)
+        return {"page": 1}
+
+    queue.put_deferred("page_1", compute_record)
+    flush_thread = threading.Thread(target=queue.flush)
+    flush_thread.start()
+    assert started.wait(2)
+
+    # the batch was taken from the queue, but the record is still found (and computed once) while it is written
+    lookup: dict = {}
+    lookup_thread = threading.Thread(target=lambda: lookup.update(result=queue.get_if_present("page_1")))
+    lookup_thread.start()
+    assert "page_1" in queue and not storage.verify_cache("page_1")
+    release.set()
+    lookup_thread.join(2)
+    flush_thread.join(2)
+
+    assert lookup["result"] == (True, {"page": 1})
+    assert storage.retrieve("page_1") == {"page": 1}
+
+
+def test_write_behind_worker_lifecycle():
+    """Verifies that the background thread stops when idle and does not keep unused queues alive."""
+    storage = InMemoryStorage(namespace="queued")
+    with patch.object(WriteBehindQueue, "IDLE_TIMEOUT", 0.01):
+        queue = WriteBehindQueue(storage, flush_interval=0.01)
+        queue.put("page_1", {"page": 1})
+        worker = queue._worker
+        assert worker is not None and wait_for(lambda: not worker.is_alive())
+        assert storage.retrieve("page_1") == {"page": 1} and queue._worker is None
+
+        # the thread is restarted when records are queued again
+        queue.put("page_2", {"page": 2})
+        assert wait_for(lambda: storage.verify_cache("page_2"))
+
+        # queues are only referenced weakly by their thread and by the hook that flushes queues at exit
+        queue_ref = weakref.ref(queue)
+        del queue
+        assert wait_for(lambda: gc.collect() >= 0 and queue_ref() is None)
+
+
+def test_cache_manager_write_behind(tmp_path, mock_response):
+    """Verifies that processed responses are cached off of the request thread and remain retrievable meanwhile."""
+    pytest.importorskip("sqlalchemy")
+    storage = SQLAlchemyStorage(f"sqlite:///{tmp_path / 'write_behind.sqlite'}", namespace="processed")
+    cache_manager = DataCacheManager(storage, write_behind=WriteBehindQueue(storage, flush_interval=60))
+    response_coordinator = ResponseCoordinator.build(processor=PassThroughDataProcessor(), cache_manager=cache_manager)
+
+    # the response is only serialized and hashed once the queued record is written
+    with patch.object(DataCacheManager, "generate_response_hash") as generate_response_hash:
+        processed_response = response_coordinator.handle_response(mock_response, cache_key="page_1")
+        generate_response_hash.assert_not_called()
+    assert processed_response and processed_response.processed_records
+    assert not storage.verify_cache("page_1") and cache_manager.verify_cache("page_1")
+
+    cached_response = response_coordinator._from_cache(response=mock_response, cache_key="page_1")
+    assert cached_response is not None and cached_response.processed_records == processed_response.processed_records
+    assert cache_manager.retrieve_many(["page_1"])["page_1"]["serialized_response"]
+
+    cache_manager.flush()
+    assert (storage.retrieve("page_1") or {})["processed_records"] == processed_response.processed_records
+
+    clone = cache_manager.clone()
+    assert clone.write_behind is not None and clone.write_behind.storage is clone.cache_storage
+    assert "write_behind" in repr(cache_manager) and "write_behind" not in repr(DataCacheManager(storage))
+
+    cache_manager.update_cache("page_2", mock_response, processed_records=[])
+    cache_manager.delete("page_2")
+    cache_manager.close()
+    assert not storage.verify_cache("page_2")
+
+
+def test_cache_manager_write_behind_snapshots(mock_response):
+    """Verifies that changes made to the cached fields after queuing a cache update are not written to the cache."""
+    storage = InMemoryStorage(namespace="processed")
+    cache_manager = DataCacheManager(storage, write_behind=WriteBehindQueue(storage, flush_interval=60))
+
+    records = [{"id": 1, "title": "Write-behind caching"}]
+    metadata = {"total": 1}
+    cache_manager.update_cache("page_1", mock_response, processed_records=records, metadata=metadata)
+
+    records[0]["title"] = "Modified"
+    records.append({"id": 2})
+    metadata["total"] = 2
+    cache_manager.flush()
+
+    cached_response = storage.retrieve("page_1") or {}
+    assert cached_response["processed_records"] == [{"id": 1, "title": "Write-behind caching"}]
+    assert cached_response["metadata"] == {"total": 1}
+    cache_manager.close()
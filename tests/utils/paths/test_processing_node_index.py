@@ -1,4 +1,6 @@
 import re
+import sys
+from typing import Any
 from scholar_flux import DataExtractor
 from scholar_flux.utils import (
     PathSimplifier,
@@ -166,3 +168,44 @@ def test_index_parallel_normalization(extracted_records, caplog):
     assert "Created path index successfully from the provided path mappings" in caplog.text
     assert "Combining keys.." in caplog.text
     assert f"Successfully normalized {len(normalized_records)} records" in caplog.text
+
+
+def test_pruned_and_truncated_path_discovery():
+    """Verifies that path discovery only traverses included subtrees, skips excluded subtrees, truncates nested values
+    at the maximum depth, and traverses structures nested deeper than the recursion limit."""
+    records = [
+        {
+            "id": index,
+            "authors": [{"name": f"Author {index}", "orcid": "0000"}],
+            "journal": {"name": "PLOS ONE", "publisher": {"name": "PLOS"}},
+        }
+        for index in range(2)
+    ]
+    discoverer = PathDiscoverer(records)
+
+    included = discoverer.discover_path_elements(include=["id", "authors.name"]) or {}
+    assert [str(path) for path in included] == ["0.id", "0.authors.0.name", "1.id", "1.authors.0.name"]
+
+    excluded = discoverer.discover_path_elements(exclude=["authors", "journal.publisher"]) or {}
+    assert [str(path) for path in excluded] == ["0.id", "0.journal.name", "1.id", "1.journal.name"]
+    assert list(discoverer.iter_path_elements(exclude=["authors", "journal.publisher"])) == list(excluded.items())
+
+    wildcard = discoverer.discover_path_elements(include=[ProcessingPath("journal.*")]) or {}
+    assert [str(path) for path in wildcard][:2] == ["0.journal.name", "0.journal.publisher.name"]
+
+    truncated = discoverer.discover_path_elements(max_depth=2) or {}
+    assert max(path.depth for path in truncated) == 2
+    assert truncated[ProcessingPath("0.journal")] == records[0]["journal"]
+
+    normalized_records = PathNodeIndex.normalize_records(records, include=["id", "journal.name"])
+    assert normalized_records == [{"id": "0", "journal.name": "PLOS ONE"}, {"id": "1", "journal.name": "PLOS ONE"}]
+
+    deeply_nested: dict[str, Any] = {}
+    nested = deeply_nested
+    for _ in range(sys.getrecursionlimit() + 10):
+        nested["child"] = nested = {}
+    nested["value"] = 1
+
+    deep_path_mappings = PathDiscoverer([deeply_nested]).discover_path_elements() or {}
+    assert list(deep_path_mappings.values()) == [1]
+    assert next(iter(deep_path_mappings)).depth == sys.getrecursionlimit() + 12
@@ -1,4 +1,6 @@
 from typing import MutableMapping, Generator
+from copy import deepcopy
+import gc
 import pytest
 from scholar_flux.utils import PathNode, PathNodeMap, ProcessingPath
 from scholar_flux.exceptions import PathNodeMapError
@@ -140,3 +142,22 @@ def test_map_cache_autoclear(ref_test_nodes):
     mapping = PathNodeMap(ref_test_nodes)
     mapping.clear()
     assert not mapping._cache.path_cache and not mapping._cache.updates
+
+
+def test_cache_prunes_expired_paths():
+    """Verifies that the cache removes the references of paths that are garbage collected without being removed."""
+    mapping = PathNodeMap(use_cache=True)
+    mapping.add(PathNode.to_path_node("0.a.b", 1))
+    mapping.add(PathNode.to_path_node("0.a.c", 2))
+    assert mapping.filter(ProcessingPath("0.a"), from_cache=True)
+
+    # copies share the immutable paths of the map and track their expiration separately
+    copied_mapping = deepcopy(mapping)
+    assert copied_mapping._cache.path_cache == mapping._cache.path_cache
+    del copied_mapping
+
+    # removes the node without notifying the cache: the cache is pruned once the path is garbage collected
+    mapping.data.pop(ProcessingPath("0.a.b"))
+    gc.collect()
+    assert set(mapping._cache.path_cache) == {"0", "0.a", "0.a.c"}
+    assert list(mapping.filter(ProcessingPath("0"), from_cache=True)) == [ProcessingPath("0.a.c")]
@@ -1,4 +1,7 @@
-from scholar_flux.utils.paths import ProcessingPath
+import pickle
+from copy import deepcopy
+from dataclasses import FrozenInstanceError
+from scholar_flux.utils.paths import ProcessingPath, PathNode
 from scholar_flux.exceptions.path_exceptions import (
     InvalidProcessingPathError,
     InvalidPathDelimiterError,
@@ -309,3 +312,30 @@ def test_keep_descendants():
     )
 
     assert all(path in descendants for path in paths)
+
+
+def test_compact_path_representation():
+    """Verifies that paths are immutable, share interned components and component types, and survive copies."""
+    path = ProcessingPath("0.authors.1.name", ("list", "dict", "list", "dict"))
+    assert not hasattr(path, "__dict__") and not hasattr(PathNode(path, 1), "__dict__")
+
+    with pytest.raises(FrozenInstanceError):
+        path.delimiter = "/"  # type: ignore[misc]
+
+    other_path = ProcessingPath(["0", "authors", "2", "name"], ["list", "dict", "list", "dict"])
+    assert path.component_types is other_path.component_types
+    assert path.components[1] is other_path.components[1]
+
+    # paths derived from validated paths are equal to paths created with validation
+    assert path.group() == ProcessingPath("i.authors.i.name")
+    assert path.get_parent() == ProcessingPath("0.authors.1") and path[1:3] == ProcessingPath("authors.1")
+    assert (path / "value").component_types is None and path.append("value", "dict").depth == 5
+    assert hash(path) == hash(str(path)) == hash("0.authors.1.name")
+
+    # invalid components are still validated when joined to an existing path
+    with pytest.raises(InvalidProcessingPathError):
+        path / " "
+
+    assert deepcopy(path) is path and path.copy() is path
+    pickled_path = pickle.loads(pickle.dumps(path))
+    assert pickled_path == path and pickled_path.component_types == path.component_types
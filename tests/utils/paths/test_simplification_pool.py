@@ -0,0 +1,80 @@
+import pickle
+import pytest
+from copy import deepcopy
+from scholar_flux import DataExtractor
+from scholar_flux.data import PathDataProcessor
+from scholar_flux.exceptions import PathSimplificationError
+from scholar_flux.utils import PathDiscoverer, PathNodeIndex
+from scholar_flux.utils.paths.simplification_pool import SimplificationPool
+
+
+@pytest.fixture
+def extracted_records(mock_academic_json) -> list[dict]:
+    """Extracts the records of the `mock_academic_json` along with nested and list-valued records for simplification."""
+    records, _ = DataExtractor().extract(mock_academic_json)
+    nested_records = [
+        {"id": index, "authors": [{"name": f"Author {index}"}, {"name": "Co-Author"}], "value": {"count": index}}
+        for index in range(12)
+    ]
+    return (records or []) + nested_records
+
+
+def create_index(records: list[dict]) -> PathNodeIndex:
+    """Creates a record-indexed PathNodeIndex from a list of records."""
+    return PathNodeIndex.from_path_mappings(PathDiscoverer(records).discover_path_elements() or {}, chain_map=True)
+
+
+def test_pool_configuration():
+    """Verifies the validation of pool settings and the threshold that determines when worker processes are used."""
+    pool = SimplificationPool(max_workers=2, min_records=10)
+    assert not pool.uses_workers(9) and pool.uses_workers(10) and not pool.running
+    assert not SimplificationPool(max_workers=1, min_records=0).uses_workers(10_000)
+
+    with pytest.raises(PathSimplificationError):
+        SimplificationPool(max_workers=0)
+
+    with pytest.raises(PathSimplificationError):
+        SimplificationPool(batch_size=-1)
+
+    assert PathNodeIndex.default_pool() is PathNodeIndex.default_pool()
+    PathNodeIndex.close_default_pool()
+    assert not PathNodeIndex.default_pool().running
+
+
+def test_parallel_simplification_matches_serial(extracted_records):
+    """Verifies that the rows simplified with worker processes match serially simplified rows, in the same order."""
+    serial_rows = create_index(extracted_records).simplify_to_rows()
+    assert len(serial_rows) == len(extracted_records)
+
+    with SimplificationPool(max_workers=2, min_records=1, batch_size=4) as pool:
+        parallel_rows = create_index(extracted_records).simplify_to_rows(pool=pool)
+        assert pool.running
+
+        # the running pool is reused for each subsequent page
+        executor = pool._executor
+        assert create_index(extracted_records).simplify_to_rows(pool=pool, object_delimiter=None)
+        assert pool._executor is executor
+
+        # copies retain the configuration of the pool without sharing its worker processes
+        for copied_pool in (deepcopy(pool), pickle.loads(pickle.dumps(pool))):
+            assert repr(copied_pool) == repr(pool).replace("running=True", "running=False")
+
+    assert not pool.running
+    assert parallel_rows == serial_rows
+    assert [list(row) for row in parallel_rows] == [list(row) for row in serial_rows]
+
+
+def test_parallel_path_data_processor(extracted_records):
+    """Verifies that processors created with `parallel=True` own a pool and process pages as serial processors do."""
+    processor = PathDataProcessor(parallel=True)
+    assert isinstance(processor.simplification_pool, SimplificationPool)
+    assert "simplification_pool" not in processor.structure()
+
+    processor.simplification_pool = SimplificationPool(max_workers=2, min_records=1)
+    with processor:
+        assert processor.process_page(extracted_records) == PathDataProcessor().process_page(extracted_records)
+        assert processor.simplification_pool.running
+
+    # the worker processes of the pool are shut down when the processor is closed
+    assert not processor.simplification_pool.running
+    PathDataProcessor().close()
@@ -298,3 +298,59 @@ def test_decode_string_exception(monkeypatch, caplog):
     assert value == bytes_object
     assert f"Failed to decode a value of type {type(bytes_object)} as bytes" in caplog.text
     assert "Returning original input" in caplog.text
+
+
+@pytest.mark.parametrize("hash_prefix", (None, ""))
+def test_tagged_roundtrip(hash_prefix, mock_academic_json, monkeypatch):
+    """Verifies that data encoded with a schema tag is decoded by only visiting the recorded bytes fields."""
+    data = {
+        "raw_response": b"<xml>content</xml>",
+        "records": [{"id": 1, "pdf": b"%PDF-1.4"}, {"id": 2, "pdf": None}],
+        "pair": (b"first", "second"),
+        "parsed_response": mock_academic_json,
+    }
+    encoded = CacheDataEncoder.encode_tagged(data, hash_prefix=hash_prefix)
+    assert CacheDataEncoder.is_tagged(encoded)
+    assert encoded[CacheDataEncoder.SCHEMA_TAG] == [["raw_response"], ["records", 0, "pdf"], ["pair", 0]]
+
+    # strings are never probed as base64 when decoding tagged data
+    monkeypatch.setattr(CacheDataEncoder, "_decode_string", raise_decode_error)
+    decoded = CacheDataEncoder.decode_tagged(json.loads(json.dumps(encoded)), hash_prefix=hash_prefix)
+    assert decoded == {**data, "pair": [b"first", "second"]}
+
+    assert CacheDataEncoder.decode_tagged(CacheDataEncoder.encode_tagged(b"bytes")) == b"bytes"
+
+
+def raise_decode_error(*args, **kwargs):
+    """Helper function that indicates that a string was unexpectedly probed as a possible base64 encoded string."""
+    raise AssertionError("Strings should not be probed when decoding tagged data")
+
+
+def test_tagged_decoding_compatibility(turn_off_hash_prefix):
+    """Verifies that untagged JSON strings remain readable and that tagged decoding avoids heuristic misclassification.
+
+    Without a hash prefix, recursive decoding classifies readable base64 strings such as 'TWFu' as bytes (b'Man'), while
+    tagged decoding only decodes fields that were originally bytes.
+
+    """
+    data = {"title": "TWFu", "content": b"Man", 1: b"integer key"}
+    legacy_string = JsonDataEncoder.serialize(data)
+    assert JsonDataEncoder.deserialize_tagged(legacy_string) == {
+        "title": b"Man",
+        "content": b"Man",
+        "1": b"integer key",
+    }
+
+    # non-string keys are coerced into strings by JSON, so unresolved paths fall back to recursive decoding
+    assert JsonDataEncoder.deserialize_tagged(JsonDataEncoder.serialize_tagged(data))["1"] == b"integer key"
+
+    tagged_data = {"title": "TWFu", "content": b"Man"}
+    assert JsonDataEncoder.deserialize_tagged(JsonDataEncoder.serialize_tagged(tagged_data)) == tagged_data
+
+
+def test_serialize_is_untagged():
+    """Verifies that `serialize` writes the encoded data without a schema tag so that existing readers are unaffected."""
+    data = {"content": b"bytes", "page": 1}
+    assert JsonDataEncoder.serialize(data) == json.dumps(CacheDataEncoder.encode(data))
+    assert JsonDataEncoder.deserialize(JsonDataEncoder.serialize(data)) == data
+    assert CacheDataEncoder.SCHEMA_TAG in json.loads(JsonDataEncoder.serialize_tagged(data))
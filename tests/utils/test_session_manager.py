@@ -1,5 +1,7 @@
 import pytest
 import requests
+from typing import Any
+from requests.adapters import HTTPAdapter
 from requests_cache import CachedSession
 from pathlib import Path
 import os
@@ -9,6 +11,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 import scholar_flux.sessions.session_manager as sm
+from scholar_flux.sessions import SessionPool
 from scholar_flux.utils import config_settings
 from scholar_flux.data_storage import RedisStorage, MongoDBStorage
 from scholar_flux.exceptions.util_exceptions import SessionCreationError
@@ -204,3 +207,90 @@ def test_get_cache_directory_package_with_env(monkeypatch, tmp_path):
 
     result = sm.CachedSessionManager.get_cache_directory()
     assert result is not None and result == Path(tmp_path)
+
+
+def get_pool_settings(session: requests.Session, url: str) -> dict[str, Any]:
+    """Retrieves the connection pool settings of the HTTPAdapter mounted on a session for the specified URL."""
+    adapter = session.get_adapter(url)
+    assert isinstance(adapter, HTTPAdapter)
+    return {setting: getattr(adapter, f"_{setting}") for setting in ("pool_connections", "pool_maxsize", "pool_block")}
+
+
+def test_session_manager_connection_pool_options():
+    """Verifies that connection pool options mount tuned adapters while sessions otherwise keep the default adapters."""
+    default_session = sm.SessionManager().configure_session()
+    default_settings = get_pool_settings(default_session, "https://api.plos.org")
+    assert default_settings["pool_maxsize"] == requests.adapters.DEFAULT_POOLSIZE
+
+    mgr = sm.SessionManager(user_agent="ua", pool_connections=4, pool_maxsize=32, max_retries=2, pool_block=True)
+    assert repr(mgr) == (
+        "SessionManager(user_agent='ua', pool_connections=4, pool_maxsize=32, max_retries=2, pool_block=True)"
+    )
+
+    session = mgr()
+    for url in ("https://api.plos.org", "http://export.arxiv.org"):
+        assert get_pool_settings(session, url) == dict(pool_connections=4, pool_maxsize=32, pool_block=True)
+        assert session.adapters["https://"].max_retries.total == 2  # type: ignore[attr-defined]
+
+    cached_mgr = sm.CachedSessionManager(user_agent="ua", backend="memory", pool_maxsize=16)
+    cached_session = cached_mgr()
+    assert isinstance(cached_session, CachedSession)
+    assert get_pool_settings(cached_session, "https://api.crossref.org")["pool_maxsize"] == 16
+
+    with pytest.raises(SessionCreationError):
+        sm.SessionManager(pool_maxsize=0)
+
+
+def test_session_pool_shares_sessions_by_host():
+    """Verifies that the SessionPool shares one session per host while keeping cached and uncached sessions apart."""
+    session_pool = SessionPool(pool_maxsize=12)
+    session = session_pool.get_or_create("https://api.plos.org/search")
+    assert session_pool.get_or_create("https://API.plos.org/search?q=genomics", requests.Session()) is session
+    assert get_pool_settings(session, "https://api.plos.org")["pool_maxsize"] == 12
+
+    cached_session = sm.CachedSessionManager(backend="memory", expire_after=30)()
+    shared_cached_session = session_pool.get_or_create("https://api.plos.org/search", cached_session)
+    assert isinstance(cached_session, CachedSession) and isinstance(shared_cached_session, CachedSession)
+    assert shared_cached_session is not cached_session
+    assert shared_cached_session.cache is cached_session.cache
+    assert shared_cached_session.settings.expire_after == 30
+    assert session_pool.get("https://api.plos.org", cached_session) is shared_cached_session
+    assert session_pool.get_or_create("https://api.crossref.org/works") is not session
+
+    assert session_pool.hosts == ["https://api.crossref.org", "https://api.plos.org"]
+    assert len(session_pool) == 3
+    assert repr(session_pool).startswith("SessionPool(hosts=")
+
+    with pytest.raises(SessionCreationError):
+        session_pool.get_or_create("not-a-url")
+
+    session_pool.close()
+    assert len(session_pool) == 0
+
+
+def test_session_pool_copies_sessions():
+    """Verifies that the SessionPool copies the sessions it receives and pools sessions by cache backend."""
+    session_pool = SessionPool(pool_maxsize=12)
+    session = requests.Session()
+    session.headers["X-API-Key"] = "pooled"
+    default_adapter = session.get_adapter("https://api.plos.org")
+
+    shared_session = session_pool.get_or_create("https://api.plos.org/search", session)
+    assert shared_session is not session and shared_session.headers["X-API-Key"] == "pooled"
+    # the caller's session is left untouched
+    assert session.get_adapter("https://api.plos.org") is default_adapter
+    assert get_pool_settings(shared_session, "https://api.plos.org")["pool_maxsize"] == 12
+
+    first_cached_session = sm.CachedSessionManager(backend="memory")()
+    second_cached_session = sm.CachedSessionManager(backend="memory")()
+    first_shared_session = session_pool.get_or_create("https://api.plos.org", first_cached_session)
+    second_shared_session = session_pool.get_or_create("https://api.plos.org", second_cached_session)
+
+    # sessions using different cache backends are never shared
+    assert isinstance(first_cached_session, CachedSession) and isinstance(second_cached_session, CachedSession)
+    assert isinstance(first_shared_session, CachedSession) and isinstance(second_shared_session, CachedSession)
+    assert first_shared_session is not second_shared_session
+    assert first_shared_session.cache is first_cached_session.cache
+    assert second_shared_session.cache is second_cached_session.cache
+    assert session_pool.get_or_create("https://api.plos.org", first_cached_session) is first_shared_session
+    session_pool.close()